@@ -18,14 +18,18 @@ Safety Priority Rules:
 3. Business vs Business: Balance operational impact
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timezone
 import boto3
 from botocore.exceptions import ClientError
+from pydantic import ValidationError
 
 from langchain_aws import ChatBedrock
 from langchain_core.messages import HumanMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
 
 # Import arbitrator schemas from centralized schemas module
 from agents.schemas import (
@@ -47,6 +51,11 @@ from agents.scoring import score_solution
 # Import knowledge base client for historical precedent
 from agents.arbitrator.knowledge_base import get_knowledge_base_client
 
+# Model health registry for fallback without probe calls
+from model.health import ModelHealthCallback, get_model_health_registry
+from utils.metrics import UsageMetricsCallback, metric_labels
+from utils.tool_calling import cached_system_message
+
 logger = logging.getLogger(__name__)
 
 # Knowledge Base ID for historical disruption data
@@ -78,10 +87,6 @@ ARBITRATOR_MODEL_PRIORITY = [
     }
 ]
 
-# Cache for tested models
-_arbitrator_tested_models = {}
-
-
 # ============================================================================
 # System Prompt for Arbitrator
 # ============================================================================
@@ -338,110 +343,35 @@ CRITICAL: You MUST provide a complete, valid solution. Do not return null or emp
 # ============================================================================
 
 
-def _test_arbitrator_model(model_id: str) -> bool:
-    """
-    Test if a model is available and not throttled for arbitrator use.
-    
-    Args:
-        model_id: The model ID to test
-        
-    Returns:
-        bool: True if model is available and working, False otherwise
-    """
-    # Check cache first
-    if model_id in _arbitrator_tested_models:
-        return _arbitrator_tested_models[model_id]
-    
-    try:
-        logger.info(f"Testing arbitrator model availability: {model_id}")
-        
-        # Create a minimal test client
-        test_client = ChatBedrock(
-            model_id=model_id,
-            model_kwargs={
-                "temperature": 0.1,
-                "max_tokens": 10,  # Minimal tokens for test
-            },
-        )
-        
-        # Make a minimal test call
-        test_client.invoke("test")
-        
-        logger.info(f"✅ Arbitrator model {model_id} is available and working")
-        _arbitrator_tested_models[model_id] = True
-        return True
-        
-    except ClientError as e:
-        error_message = str(e)
-        
-        if 'ThrottlingException' in error_message or 'Too many tokens' in error_message:
-            logger.warning(f"⚠️ Arbitrator model {model_id} is throttled (quota exceeded)")
-        elif 'ValidationException' in error_message or 'not found' in error_message.lower():
-            logger.warning(f"⚠️ Arbitrator model {model_id} is not available in this region")
-        else:
-            logger.warning(f"⚠️ Arbitrator model {model_id} test failed: {error_message}")
-        
-        _arbitrator_tested_models[model_id] = False
-        return False
-        
-    except Exception as e:
-        logger.warning(f"⚠️ Arbitrator model {model_id} test failed with unexpected error: {e}")
-        _arbitrator_tested_models[model_id] = False
-        return False
-
-
 def _load_opus_model() -> ChatBedrock:
     """
     Load best available model for arbitrator with intelligent fallback.
     
-    Tries models in priority order:
+    Uses the first model of ARBITRATOR_MODEL_PRIORITY that the model health
+    registry has in rotation:
     1. Claude Opus 4.5 (best reasoning)
     2. Claude Sonnet 4.5 (excellent reasoning)
-    3. Claude Haiku 4.5 (fast and cost-effective)
-    4. Amazon Nova Premier (no throttling)
-    5. Amazon Nova Pro (cost-effective fallback)
     
     Returns:
         ChatBedrock: Best available model instance
-        
-    Raises:
-        RuntimeError: If no models are available
     """
     logger.info("Loading arbitrator model with intelligent fallback...")
     
-    for model_config in ARBITRATOR_MODEL_PRIORITY:
-        model_id = model_config["id"]
-        model_name = model_config["name"]
-        
-        logger.info(f"Trying {model_name} for arbitrator ({model_id})...")
-        
-        # Test if model is available
-        if _test_arbitrator_model(model_id):
-            logger.info(f"✅ Using {model_name} for arbitrator: {model_config['reason']}")
-            
-            return ChatBedrock(
-                model_id=model_id,
-                model_kwargs={
-                    "temperature": model_config["temperature"],
-                    "max_tokens": model_config["max_tokens"],
-                },
-            )
-        else:
-            logger.warning(f"❌ {model_name} not available for arbitrator, trying next model...")
-    
-    # If we get here, no models worked
-    error_msg = "❌ CRITICAL: No arbitrator models available! All models failed or are throttled."
-    logger.error(error_msg)
-    logger.error("Available arbitrator models tried:")
-    for model_config in ARBITRATOR_MODEL_PRIORITY:
-        logger.error(f"  - {model_config['name']}: {model_config['id']}")
-    
-    raise RuntimeError(
-        "No Bedrock models available for arbitrator. Please check:\n"
-        "1. AWS credentials and permissions\n"
-        "2. Model access in AWS Bedrock console\n"
-        "3. Daily token quotas (may need to wait or request increase)\n"
-        "4. Region availability (us-east-1 recommended)"
+    # Health comes from real calls and background probes (see model.health);
+    # selecting a model makes no calls
+    model_id = get_model_health_registry().select([config["id"] for config in ARBITRATOR_MODEL_PRIORITY])
+    model_config = next(config for config in ARBITRATOR_MODEL_PRIORITY if config["id"] == model_id)
+    logger.info(f"✅ Using {model_config['name']} for arbitrator: {model_config['reason']}")
+    
+    return ChatBedrock(
+        model_id=model_id,
+        model_kwargs={
+            "temperature": model_config["temperature"],
+            "max_tokens": model_config["max_tokens"],
+        },
+        # Streaming clients parse structured output incrementally (see _astream_decision)
+        streaming=True,
+        callbacks=[ModelHealthCallback(model_id), UsageMetricsCallback(model_id)],
     )
 
 
@@ -1287,6 +1217,128 @@ def _generate_minimal_solution(
     )
 
 
+# ============================================================================
+# Streamed Structured Output
+# ============================================================================
+
+# Receives partial arbitration events ("arbitration_decision", "arbitration_solution")
+PartialCallback = Callable[[Dict[str, Any]], None]
+
+
+@lru_cache(maxsize=1)
+def _arbitrator_output_schema() -> Dict[str, Any]:
+    """
+    JSON schema tool definition for ArbitratorOutput.
+
+    Structured output bound to a JSON schema (rather than the Pydantic class)
+    is parsed incrementally while streaming, yielding growing partial dicts;
+    the Pydantic parser only yields once the whole object validates.
+    """
+    return convert_to_openai_tool(ArbitratorOutput)
+
+
+class _PartialDecisionEmitter:
+    """
+    Publish the parts of a streamed ArbitratorOutput as they complete.
+
+    A field of a partial dict is complete once a later field has started
+    (the model emits fields in schema order), so the final decision is
+    published as soon as the model moves past it and each RecoverySolution
+    once the next one starts.
+    """
+
+    def __init__(self, callback: Optional[PartialCallback], attempt: int):
+        self._callback = callback
+        self._attempt = attempt
+        self._decision_sent = False
+        self._solutions_sent = 0
+
+    def update(self, partial: Dict[str, Any], complete: bool = False) -> None:
+        """
+        Publish newly completed parts of a partial output.
+
+        Args:
+            partial: Partial ArbitratorOutput dict parsed from the stream so far
+            complete: True once the stream has ended
+        """
+        if self._callback is None:
+            return
+        keys = list(partial)
+
+        if not self._decision_sent and "final_decision" in partial:
+            if complete or keys[-1] != "final_decision":
+                self._decision_sent = True
+                self._publish({
+                    "type": "arbitration_decision",
+                    "final_decision": partial["final_decision"],
+                    "confidence": partial.get("confidence"),
+                })
+
+        solutions = partial.get("solution_options") or []
+        finished = len(solutions) if complete or keys[-1] != "solution_options" else len(solutions) - 1
+        while self._solutions_sent < finished:
+            index = self._solutions_sent
+            self._solutions_sent += 1
+            try:
+                solution = RecoverySolution.model_validate(solutions[index])
+            except ValidationError as e:
+                logger.debug(f"Skipping partial solution {index + 1}: {e}")
+                continue
+            self._publish({
+                "type": "arbitration_solution",
+                "index": index,
+                "solution": solution.model_dump(),
+            })
+
+    def _publish(self, event: Dict[str, Any]) -> None:
+        event["attempt"] = self._attempt
+        try:
+            self._callback(event)
+        except Exception as e:
+            logger.warning(f"Partial arbitration callback failed: {e}")
+
+
+async def _astream_decision(
+    llm: Any,
+    messages: List[Dict[str, str]],
+    on_partial: Optional[PartialCallback] = None,
+    attempt: int = 1
+) -> ArbitratorOutput:
+    """
+    Run the arbitrator model asynchronously, streaming its structured output.
+
+    The event loop stays free for other disruptions while the model generates;
+    completed parts of the output are passed to on_partial as they arrive.
+
+    Args:
+        llm: Arbitrator chat model
+        messages: System and user messages
+        on_partial: Optional callback for partial arbitration events
+        attempt: Attempt number attached to partial events (2 for the retry)
+
+    Returns:
+        ArbitratorOutput: The validated final output
+
+    Raises:
+        ValueError: If the model returned no structured output
+        ValidationError: If the final output does not match ArbitratorOutput
+    """
+    structured_llm = llm.with_structured_output(_arbitrator_output_schema())
+    emitter = _PartialDecisionEmitter(on_partial, attempt)
+
+    output = None
+    with metric_labels(iteration=attempt):
+        async for partial in structured_llm.astream(messages):
+            if isinstance(partial, dict) and partial:
+                output = partial
+                emitter.update(output)
+
+    if output is None:
+        raise ValueError("Arbitrator model returned no structured output")
+    emitter.update(output, complete=True)
+    return ArbitratorOutput.model_validate(output)
+
+
 # ============================================================================
 # Main Arbitration Function
 # ============================================================================
@@ -1295,7 +1347,8 @@ def _generate_minimal_solution(
 async def arbitrate(
     revised_recommendations: dict,
     llm_opus: Optional[Any] = None,
-    initial_recommendations: Optional[dict] = None
+    initial_recommendations: Optional[dict] = None,
+    on_partial: Optional[PartialCallback] = None
 ) -> dict:
     """
     Resolve conflicts and make final decision.
@@ -1327,6 +1380,11 @@ async def arbitrate(
         initial_recommendations: Optional dict containing Phase 1 (initial) agent responses.
             When provided, enables phase evolution analysis showing how recommendations
             changed between Phase 1 and Phase 2. Format same as revised_recommendations.
+        on_partial: Optional callback receiving partial results while the model
+            streams: an "arbitration_decision" event once the final decision is
+            written, then an "arbitration_solution" event per completed
+            RecoverySolution. Events carry an "attempt" number; attempt 2 events
+            come from the simplified retry and supersede earlier ones.
     
     Returns:
         Dict containing:
@@ -1405,7 +1463,7 @@ async def arbitrate(
     model_used = None
     if llm_opus is None:
         try:
-            llm_opus = _load_opus_model()
+            llm_opus = await asyncio.to_thread(_load_opus_model)
             # Determine which model was actually loaded
             model_id = getattr(llm_opus, 'model_id', 'unknown')
             model_used = model_id
@@ -1572,14 +1630,12 @@ CRITICAL: solution_options MUST NOT be null or empty. You MUST generate at least
 {"EVOLUTION_WEIGHT:converge=high|diverge=investigate|stable=confident" if phase_comparison else ""}"""
     
     try:
-        # Use structured output to get arbitrator decision with multiple solutions
-        structured_llm = llm_opus.with_structured_output(ArbitratorOutput)
-        
-        logger.info("Invoking arbitrator model with structured output for multi-solution generation")
-        decision = structured_llm.invoke([
-            {"role": "system", "content": ARBITRATOR_SYSTEM_PROMPT},
+        # Stream structured output to get arbitrator decision with multiple solutions
+        logger.info("Streaming arbitrator model with structured output for multi-solution generation")
+        decision = await _astream_decision(llm_opus, [
+            cached_system_message(ARBITRATOR_SYSTEM_PROMPT),
             {"role": "user", "content": prompt}
-        ])
+        ], on_partial)
         
         # Populate backward-compatible fields from recommended solution
         decision = _populate_backward_compatible_fields(decision)
@@ -1647,12 +1703,12 @@ Based on the above context, generate ONE complete RecoverySolution that addresse
 You MUST provide all required fields. Do not return null or empty values.
 """
 
-            # Use the same structured LLM for retry
+            # Use the same model for retry
             logger.info("Retrying arbitration with simplified prompt...")
-            retry_decision = structured_llm.invoke([
+            retry_decision = await _astream_decision(llm_opus, [
                 {"role": "system", "content": "You are an airline disruption arbitrator. You MUST generate a valid recovery solution. Do not return null or empty for solution_options."},
                 {"role": "user", "content": simplified_retry_prompt}
-            ])
+            ], on_partial, attempt=2)
 
             # Populate backward-compatible fields
             retry_decision = _populate_backward_compatible_fields(retry_decision)
@@ -16,6 +16,8 @@ import os
 import logging
 from typing import Optional, List, Dict, Any
 
+from database.async_dynamodb import run_blocking
+
 logger = logging.getLogger(__name__)
 
 # Default Knowledge Base ID for SkyMarshal operational documentation
@@ -117,8 +119,9 @@ Please provide:
             logger.info(f"Querying knowledge base for operational procedures...")
             logger.debug(f"Query: {query[:200]}...")
             
-            # Use retrieve API to get relevant documents
-            response = self.client.retrieve(
+            # Use retrieve API to get relevant documents (off the event loop)
+            response = await run_blocking(
+                self.client.retrieve,
                 knowledgeBaseId=self.knowledge_base_id,
                 retrievalQuery={
                     'text': query
@@ -3,14 +3,16 @@
 import logging
 import json
 from typing import Any, Optional, Dict, List
-import boto3
 from datetime import datetime, timezone
 
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 
 from utils.tool_calling import invoke_with_tools
+from database.dynamodb import DynamoDBClient, get_dynamodb_resource
+from database.pagination import query_all
 from database.table_config import get_table_name
+from database.tool_output import to_tool_json
 from database.constants import (
     FLIGHT_NUMBER_DATE_INDEX,
     FLIGHT_LOADING_INDEX,
@@ -55,12 +57,13 @@ def query_flight(flight_number: str, date: str) -> str:
         JSON string containing flight record or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         flights_table = dynamodb.Table(get_table_name("flights"))
         
         logger.info(f"Querying flight: {flight_number} on {date}")
         
-        response = flights_table.query(
+        items = query_all(
+            flights_table,
             IndexName=FLIGHT_NUMBER_DATE_INDEX,
             KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
             ExpressionAttributeValues={
@@ -69,10 +72,9 @@ def query_flight(flight_number: str, date: str) -> str:
             },
         )
         
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found flight: {items[0].get('flight_id')}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"Flight not found: {flight_number} on {date}")
             return json.dumps({"error": "FLIGHT_NOT_FOUND", "message": f"Flight {flight_number} on {date} not found"})
@@ -97,14 +99,15 @@ def query_cargo_manifest(flight_id: str) -> str:
         JSON string containing list of cargo shipment records
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         # Use cargo_shipments_v2 table with first-leg-flight-index GSI
         # V1 CargoFlightAssignments uses numeric flight_id, V2 uses string format
         shipments_table = dynamodb.Table(get_table_name("cargo_shipments"))
 
         logger.info(f"Querying cargo manifest for flight: {flight_id}")
 
-        response = shipments_table.query(
+        items = query_all(
+            shipments_table,
             IndexName=FIRST_LEG_FLIGHT_INDEX,
             KeyConditionExpression="first_leg_flight_id = :fid",
             ExpressionAttributeValues={
@@ -112,15 +115,40 @@ def query_cargo_manifest(flight_id: str) -> str:
             },
         )
 
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} cargo shipments for flight {flight_id}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(f"Error querying cargo manifest: {e}")
         return json.dumps({"error": type(e).__name__, "message": str(e)})
 
 
+@tool
+def summarize_flight_cargo(flight_id: str, include_records: bool = False) -> str:
+    """Summarize the cargo on a flight: total weight, commodities and cold chain load.
+
+    Weight by commodity, temperature-controlled count/weight, revenue and
+    declared value are computed exactly from every shipment on the flight.
+    Call this before query_cargo_manifest; set include_records only when
+    individual shipments are needed for the offload list.
+
+    Args:
+        flight_id: Unique flight identifier (e.g., "FLT-2001")
+        include_records: Also return the raw shipment records (default False)
+
+    Returns:
+        JSON string containing the cargo summary
+    """
+    try:
+        summary = DynamoDBClient().summarize_flight_cargo(flight_id, include_records)
+        logger.info(f"Summarized {summary['shipment_count']} cargo shipments for flight {flight_id}")
+        return to_tool_json(summary)
+
+    except Exception as e:
+        logger.error(f"Error summarizing cargo: {e}")
+        return json.dumps({"error": type(e).__name__, "message": str(e)})
+
+
 @tool
 def query_shipment_details(shipment_id: str) -> str:
     """Query detailed shipment information by shipment ID.
@@ -135,7 +163,7 @@ def query_shipment_details(shipment_id: str) -> str:
         JSON string containing shipment record or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         shipments_table = dynamodb.Table(get_table_name("cargo_shipments"))
         
         logger.info(f"Querying shipment details: {shipment_id}")
@@ -147,7 +175,7 @@ def query_shipment_details(shipment_id: str) -> str:
         item = response.get("Item")
         if item:
             logger.info(f"Found shipment: {shipment_id}")
-            return json.dumps(item, default=str)
+            return to_tool_json(item)
         else:
             logger.warning(f"Shipment not found: {shipment_id}")
             return json.dumps({"error": "SHIPMENT_NOT_FOUND", "message": f"Shipment {shipment_id} not found"})
@@ -171,13 +199,14 @@ def query_shipment_by_awb(awb_number: str) -> str:
         JSON string containing shipment record or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         shipments_table = dynamodb.Table(get_table_name("cargo_shipments"))
 
         logger.info(f"Querying shipment by AWB: {awb_number}")
 
         # Use awb-index GSI for efficient lookup instead of table scan
-        response = shipments_table.query(
+        items = query_all(
+            shipments_table,
             IndexName=AWB_INDEX,
             KeyConditionExpression="awb_number = :awb",
             ExpressionAttributeValues={
@@ -185,10 +214,9 @@ def query_shipment_by_awb(awb_number: str) -> str:
             },
         )
 
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found shipment with AWB {awb_number}: {items[0].get('shipment_id')}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"Shipment not found with AWB: {awb_number}")
             return json.dumps({"error": "SHIPMENT_NOT_FOUND", "message": f"Shipment with AWB {awb_number} not found"})
@@ -212,22 +240,22 @@ def query_cold_chain_facilities(airport_code: str) -> str:
         JSON string containing cold chain facility details
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         facilities_table = dynamodb.Table(get_table_name("cold_chain_facilities"))
 
         logger.info(f"Querying cold chain facilities at: {airport_code}")
 
         # Use airport-index GSI - table PK is facility_id, not airport_code
-        response = facilities_table.query(
+        items = query_all(
+            facilities_table,
             IndexName=AIRPORT_INDEX,
             KeyConditionExpression="airport_code = :ac",
             ExpressionAttributeValues={":ac": airport_code}
         )
 
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found {len(items)} cold chain facilities at {airport_code}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"No cold chain facilities found at {airport_code}")
             return json.dumps({
@@ -257,12 +285,13 @@ def query_ground_equipment(airport_code: str, equipment_type: str) -> str:
         JSON string containing ground equipment availability
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         equipment_table = dynamodb.Table(get_table_name("ground_equipment"))
 
         logger.info(f"Querying ground equipment: {equipment_type} at {airport_code}")
 
-        response = equipment_table.query(
+        items = query_all(
+            equipment_table,
             IndexName=EQUIPMENT_AIRPORT_TYPE_INDEX,
             KeyConditionExpression="airport_code = :ac AND equipment_type = :et",
             ExpressionAttributeValues={
@@ -271,15 +300,14 @@ def query_ground_equipment(airport_code: str, equipment_type: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} {equipment_type} equipment records at {airport_code}")
-        return json.dumps({
+        return to_tool_json({
             "airport_code": airport_code,
             "equipment_type": equipment_type,
             "equipment": items,
             "total_available": len(items),
             "data_source": "ground_equipment_v2"
-        }, default=str)
+        })
 
     except Exception as e:
         logger.error(f"Error querying ground equipment: {e}")
@@ -300,7 +328,7 @@ ON_DATA_GAP: report_error|return_error_status
 
 <workflow>
   <step>extract: flight_number, date, event</step>
-  <step>query: flight → cargo_manifest → shipment_details</step>
+  <step>query: flight → cargo_summary → cargo_manifest (if needed) → shipment_details</step>
   <step>classify: cold_chain, hazmat, perishable, high_value, live_animals</step>
   <step>assess: delay_tolerance, offload_priority, rebooking_options</step>
   <step>return: cargo_impact + offload_recommendations</step>
@@ -394,9 +422,10 @@ async def analyze_cargo(payload: dict, llm: Any, mcp_tools: list) -> dict:
         # Step 1: Extract flight information using structured output
         logger.info("Extracting flight information from natural language prompt")
         try:
-            from utils.extraction import extract_with_fallback
+            from utils.extraction import format_flight_record, resolve_flight_info
             # Note: cargo agent uses sync invoke, need to make it async
-            flight_info = await extract_with_fallback(llm, FlightInfo, user_prompt)
+            flight_info = await resolve_flight_info(llm, FlightInfo, user_prompt, payload)
+            flight_record = format_flight_record(payload)
             logger.info(f"Extracted flight info: {flight_info.flight_number} on {flight_info.date}")
         except Exception as e:
             logger.error(f"Failed to extract flight information: {e}")
@@ -417,6 +446,7 @@ async def analyze_cargo(payload: dict, llm: Any, mcp_tools: list) -> dict:
         # Step 2: Define cargo-specific DynamoDB tools
         cargo_tools = [
             query_flight,
+            summarize_flight_cargo,
             query_cargo_manifest,
             query_shipment_details,
             query_shipment_by_awb,
@@ -447,7 +477,7 @@ async def analyze_cargo(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-  <other_agents>
+{flight_record}  <other_agents>
 {other_recs_xml if other_recs_xml else "    <none/>"}
   </other_agents>
 </input>
@@ -466,13 +496,14 @@ async def analyze_cargo(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-</input>
+{flight_record}</input>
 <action>
-1. query_flight("{flight_info.flight_number}", "{flight_info.date}")
-2. query_cargo_manifest(flight_id)
-3. query_shipment_details(shipment_id) for special handling
-4. Assess cold chain, perishables, high-value cargo
-5. Return AgentResponse with cargo_at_risk, offload_list
+1. query_flight("{flight_info.flight_number}", "{flight_info.date}") (skip if <flight_record> given)
+2. summarize_flight_cargo(flight_id) → weight, commodities, cold chain load
+3. query_cargo_manifest(flight_id) only if shipment-level offload list needed
+4. query_shipment_details(shipment_id) for special handling
+5. Assess cold chain, perishables, high-value cargo
+6. Return AgentResponse with cargo_at_risk, offload_list
 </action>"""
 
         # Step 4: Run agent with custom tool calling (avoids Bedrock API validation errors)
@@ -1,5 +1,6 @@
 """Crew Compliance Agent Module"""
 
 from .agent import analyze_crew_compliance
+from .fdp import evaluate_crew_fdp
 
-__all__ = ["analyze_crew_compliance"]
+__all__ = ["analyze_crew_compliance", "evaluate_crew_fdp"]
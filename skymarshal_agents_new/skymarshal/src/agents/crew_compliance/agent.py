@@ -3,14 +3,16 @@
 import json
 import logging
 from typing import Any
-import boto3
 from datetime import datetime, timezone
 
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 
 from utils.tool_calling import invoke_with_tools
+from database.dynamodb import batch_get_all_sync, get_dynamodb_resource
+from database.pagination import query_all
 from database.table_config import get_table_name
+from database.tool_output import to_tool_json
 from database.constants import (
     FLIGHT_NUMBER_DATE_INDEX,
     FLIGHT_POSITION_INDEX,
@@ -18,6 +20,7 @@ from database.constants import (
     RESERVE_BASE_STATUS_INDEX,
 )
 from agents.schemas import FlightInfo, AgentResponse
+from agents.crew_compliance.fdp import evaluate_crew_fdp, is_long_haul
 
 logger = logging.getLogger(__name__)
 
@@ -34,22 +37,20 @@ ON_DATA_GAP: report_error|return_error_status
 <constraints type="binding">fdp_limits, rest_requirements, qualifications</constraints>
 
 <workflow>
-  <step>extract: flight_number, date, event</step>
-  <step>query: flight → crew_roster → crew_members</step>
-  <step>calculate: fdp = duty_end - duty_start + delays</step>
-  <step>validate: fdp ≤ max_fdp, rest ≥ min_rest, quals_current</step>
-  <step>assess: risk = (fdp / max_fdp) × 100</step>
+  <step>extract: flight_number, date, event, delay</step>
+  <step>query: flight → calculate_crew_fdp(flight_id, delay_minutes, aircraft_type, positioning)</step>
+  <step>use tool results as-is: fdp, max_fdp, margin, risk_band, min_rest, issues (never recalculate)</step>
   <step>return: APPROVED|DENIED|CREW_CHANGE + constraints</step>
 </workflow>
 
 <fdp_limits>
-Single/two-pilot: 13h | Three-pilot: 16h | Four-pilot: 18h
-Risk: 0-70% LOW | 71-85% MODERATE | 86-95% HIGH | 96-100% CRITICAL | >100% VIOLATION
+Computed by calculate_crew_fdp per EASA/FAA FTL: 13h (2 pilots) | 16h (3) | 18h (4)
+Risk bands: LOW | MODERATE | HIGH | CRITICAL | VIOLATION (>100% = binding)
 </fdp_limits>
 
 <rest_requirements>
-After FDP ≤10h: min 12h | After FDP >10h: min rest = FDP (1:1)
-Long-haul: min 18h | Positioning: min 10h before duty
+Computed by calculate_crew_fdp: After FDP ≤10h: min 12h | After FDP >10h: min rest = FDP (1:1)
+Long-haul (block >6h, from flight): min 18h | Positioning (positioning=true): min 10h before duty
 </rest_requirements>
 
 <qualifications>
@@ -63,11 +64,11 @@ Standby: 0-30min | Home base: 60-90min | Outstation: 2-6h | Rest/leave: NOT AVAI
 
 <rules>
 - Query tools BEFORE analysis (never assume)
-- Calculate FDP including ALL duty time
+- FDP/rest/qualification results come from calculate_crew_fdp (exact)
 - Safety constraints NON-NEGOTIABLE
 - Tool failure → error response
-- >50% crew issues → CREW CHANGE all
-- Captain/Senior cabin issues → MANDATORY replacement
+- summary.crew_change_required → CREW CHANGE all
+- summary.mandatory_replacements → MANDATORY replacement
 </rules>
 
 <output_format>
@@ -125,10 +126,11 @@ def query_flight(flight_number: str, date: str) -> str:
         '1'
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         flights_table = dynamodb.Table(get_table_name("flights"))
         
-        response = flights_table.query(
+        items = query_all(
+            flights_table,
             IndexName=FLIGHT_NUMBER_DATE_INDEX,
             KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
             ExpressionAttributeValues={
@@ -137,7 +139,6 @@ def query_flight(flight_number: str, date: str) -> str:
             },
         )
         
-        items = response.get("Items", [])
         if not items:
             logger.warning(f"Flight not found: {flight_number} on {date}")
             return json.dumps({
@@ -151,7 +152,7 @@ def query_flight(flight_number: str, date: str) -> str:
         flight = items[0]
         logger.info(f"Retrieved flight {flight_number} on {date}: flight_id={flight.get('flight_id')}")
         # Convert Decimal types to native Python types for JSON serialization
-        return json.dumps(flight, default=str)
+        return to_tool_json(flight)
         
     except Exception as e:
         logger.error(f"Error querying flight {flight_number} on {date}: {e}")
@@ -191,16 +192,16 @@ def query_crew_roster(flight_id: str) -> str:
         'Captain'
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         crew_roster_table = dynamodb.Table(get_table_name("crew_roster"))
         
-        response = crew_roster_table.query(
+        items = query_all(
+            crew_roster_table,
             IndexName=FLIGHT_POSITION_INDEX,
             KeyConditionExpression="flight_id = :fid",
             ExpressionAttributeValues={":fid": flight_id}
         )
         
-        items = response.get("Items", [])
         
         if not items:
             logger.warning(f"No crew roster found for flight {flight_id}")
@@ -212,7 +213,7 @@ def query_crew_roster(flight_id: str) -> str:
             }])
         
         logger.info(f"Retrieved {len(items)} crew members for flight {flight_id}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
         
     except Exception as e:
         logger.error(f"Error querying crew roster for flight {flight_id}: {e}")
@@ -251,7 +252,7 @@ def query_crew_members(crew_id: str) -> str:
         ['A380', 'A350']
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         crew_members_table = dynamodb.Table(get_table_name("crew_members"))
         
         response = crew_members_table.get_item(
@@ -269,7 +270,7 @@ def query_crew_members(crew_id: str) -> str:
             })
         
         logger.info(f"Retrieved crew member {crew_id}: {item.get('crew_name')}")
-        return json.dumps(item, default=str)
+        return to_tool_json(item)
         
     except Exception as e:
         logger.error(f"Error querying crew member {crew_id}: {e}")
@@ -305,11 +306,12 @@ def query_reserve_crew(base: str, role: str) -> str:
         3
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         reserve_table = dynamodb.Table(get_table_name("reserve_crew"))
 
         # Query using base-status-index GSI
-        response = reserve_table.query(
+        items = query_all(
+            reserve_table,
             IndexName=RESERVE_BASE_STATUS_INDEX,
             KeyConditionExpression="base = :b AND availability_status = :s",
             FilterExpression="crew_role = :r",
@@ -320,7 +322,6 @@ def query_reserve_crew(base: str, role: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
 
         if not items:
             logger.info(f"No reserve {role} available at {base}")
@@ -333,13 +334,13 @@ def query_reserve_crew(base: str, role: str) -> str:
             })
 
         logger.info(f"Found {len(items)} reserve {role}(s) available at {base}")
-        return json.dumps({
+        return to_tool_json({
             "base": base,
             "role": role,
             "available_crew": items,
             "total_available": len(items),
             "data_source": "reserve_crew_v2"
-        }, default=str)
+        })
 
     except Exception as e:
         logger.error(f"Error querying reserve crew at {base} for {role}: {e}")
@@ -351,6 +352,101 @@ def query_reserve_crew(base: str, role: str) -> str:
         })
 
 
+@tool
+def calculate_crew_fdp(
+    flight_id: str,
+    delay_minutes: float = 0,
+    aircraft_type: str = "",
+    positioning: bool = False
+) -> str:
+    """Calculate FDP, rest and qualification compliance for a flight's crew.
+    
+    This tool loads the flight, its crew roster and crew member records and
+    evaluates every crew member deterministically: FDP including the delay,
+    max FDP for the flight deck size, margin, risk band, minimum rest before
+    and after duty and qualification issues. Long-haul rest (18h) applies when
+    the flight's scheduled block time exceeds 6h. Use its results instead of
+    calculating.
+    
+    Args:
+        flight_id: Unique flight identifier
+        delay_minutes: Expected delay in minutes added to each crew member's FDP
+        aircraft_type: Aircraft type for type rating checks (e.g., A380), optional
+        positioning: Whether the crew positioned before this duty (min 10h rest before duty)
+    
+    Returns:
+        str: JSON string with per-crew fdp_hours, max_fdp_hours, margin_hours, risk_band,
+             min_rest_after_hours, issues, status and a summary
+             Returns JSON with 'error' key if the roster cannot be loaded
+    
+    Example:
+        >>> result = calculate_crew_fdp("1", 180, "A380")
+        >>> data = json.loads(result)
+        >>> print(data["summary"]["worst_risk_band"])
+        'VIOLATION'
+    """
+    try:
+        dynamodb = get_dynamodb_resource()
+        crew_roster_table = dynamodb.Table(get_table_name("crew_roster"))
+        
+        roster = query_all(
+            crew_roster_table,
+            IndexName=FLIGHT_POSITION_INDEX,
+            KeyConditionExpression="flight_id = :fid",
+            ExpressionAttributeValues={":fid": flight_id}
+        )
+        
+        if not roster:
+            logger.warning(f"No crew roster found for flight {flight_id}")
+            return json.dumps({
+                "error": "crew_roster_not_found",
+                "message": f"No crew roster found for flight {flight_id}. The flight may not have crew assigned yet.",
+                "flight_id": flight_id,
+                "suggestion": "Verify the flight_id is correct or check if crew assignments have been made for this flight."
+            })
+        
+        # Long-haul rest applies by the flight's scheduled block time
+        flights_table = dynamodb.Table(get_table_name("flights"))
+        flight = flights_table.get_item(Key={"flight_id": flight_id}).get("Item")
+        if not flight:
+            logger.warning(f"Flight {flight_id} not found; long-haul rest not applied")
+        
+        # Fetch crew member records in one batch for qualification checks
+        crew_table_name = get_table_name("crew_members")
+        crew_ids = list(dict.fromkeys(item["crew_id"] for item in roster if item.get("crew_id")))
+        crew_members = {
+            member["crew_id"]: member
+            for member in batch_get_all_sync(
+                dynamodb.batch_get_item,
+                crew_table_name,
+                [{"crew_id": crew_id} for crew_id in crew_ids]
+            )
+        }
+        
+        result = evaluate_crew_fdp(
+            roster,
+            delay_minutes=delay_minutes,
+            crew_members=crew_members,
+            aircraft_type=aircraft_type or None,
+            long_haul=is_long_haul(flight),
+            positioning=positioning
+        )
+        result["flight_id"] = flight_id
+        logger.info(f"Calculated FDP for {len(roster)} crew on flight {flight_id}")
+        return to_tool_json(result)
+        
+    except Exception as e:
+        logger.error(f"Error calculating crew FDP for flight {flight_id}: {e}")
+        logger.exception("Full traceback:")
+        return json.dumps({
+            "error": "calculation_failed",
+            "message": f"FDP calculation failed for flight {flight_id}: {str(e)}",
+            "flight_id": flight_id,
+            "error_type": type(e).__name__,
+            "suggestion": "This may be a temporary database issue. Please try again or contact support if the problem persists."
+        })
+
+
 async def analyze_crew_compliance(payload: dict, llm: Any, mcp_tools: list) -> dict:
     """
     Crew Compliance agent analysis function with natural language input processing.
@@ -406,8 +502,9 @@ async def analyze_crew_compliance(payload: dict, llm: Any, mcp_tools: list) -> d
         
         # Step 1: Extract flight information using LangChain structured output with fallback
         try:
-            from utils.extraction import extract_with_fallback
-            flight_info = await extract_with_fallback(llm, FlightInfo, user_prompt)
+            from utils.extraction import format_flight_record, resolve_flight_info
+            flight_info = await resolve_flight_info(llm, FlightInfo, user_prompt, payload)
+            flight_record = format_flight_record(payload)
             
             logger.info(f"Extracted flight info: {flight_info}")
             
@@ -486,7 +583,9 @@ async def analyze_crew_compliance(payload: dict, llm: Any, mcp_tools: list) -> d
         
         # Step 2: Define agent-specific tools
         # These are the DynamoDB query tools defined above
-        agent_tools = [query_flight, query_crew_roster, query_crew_members, query_reserve_crew]
+        agent_tools = [
+            query_flight, calculate_crew_fdp, query_crew_roster, query_crew_members, query_reserve_crew
+        ]
         
         # Combine with MCP tools if provided
         all_tools = agent_tools + (mcp_tools if mcp_tools else [])
@@ -504,14 +603,12 @@ async def analyze_crew_compliance(payload: dict, llm: Any, mcp_tools: list) -> d
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-</input>
+{flight_record}</input>
 <action>
-1. query_flight("{flight_info.flight_number}", "{flight_info.date}")
-2. query_crew_roster(flight_id)
-3. query_crew_members(crew_id) for each crew
-4. Calculate FDP, validate limits, assess risk
-5. If crew change needed → query_reserve_crew(base, role)
-6. Return AgentResponse
+1. query_flight("{flight_info.flight_number}", "{flight_info.date}") (skip if <flight_record> given)
+2. calculate_crew_fdp(flight_id, delay_minutes, aircraft_type)
+3. If crew change needed → query_reserve_crew(base, role)
+4. Return AgentResponse
 </action>"""
 
         else:  # revision phase
@@ -536,14 +633,14 @@ async def analyze_crew_compliance(payload: dict, llm: Any, mcp_tools: list) -> d
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-  <other_agents>
+{flight_record}  <other_agents>
 {other_recs_xml if other_recs_xml else "    <none/>"}
   </other_agents>
 </input>
 <action>
 1. Review other agents' recommendations
 2. Decide: REVISE | CONFIRM | STRENGTHEN
-3. If timing changed → recalculate FDP
+3. If timing changed → calculate_crew_fdp with the new delay
 4. Return AgentResponse with revision_status
 </action>"""
         
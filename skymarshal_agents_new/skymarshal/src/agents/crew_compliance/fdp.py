@@ -0,0 +1,303 @@
+"""Deterministic FDP, rest and qualification evaluation for crew compliance.
+
+Implements the <fdp_limits> and <rest_requirements> tables from the crew
+compliance SYSTEM_PROMPT so that per-crew FDP, limit, margin and risk band are
+computed exactly instead of by the LLM. All crew on a roster are evaluated in
+one vectorized pass.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Max FDP (hours) by number of pilots on the flight deck
+FDP_LIMITS_BY_PILOTS = {2: 13.0, 3: 16.0, 4: 18.0}
+
+# Risk bands by FDP utilization (fdp / max_fdp x 100), upper bound inclusive
+RISK_BANDS = [
+    (70.0, "LOW"),
+    (85.0, "MODERATE"),
+    (95.0, "HIGH"),
+    (100.0, "CRITICAL"),
+]
+VIOLATION_BAND = "VIOLATION"
+RISK_ORDER = ["LOW", "MODERATE", "HIGH", "CRITICAL", VIOLATION_BAND]
+
+# Rest requirements (hours)
+MIN_REST_SHORT_FDP = 12.0      # After FDP <= 10h
+SHORT_FDP_THRESHOLD = 10.0     # Above this, min rest = FDP (1:1)
+MIN_REST_LONG_HAUL = 18.0
+MIN_REST_POSITIONING = 10.0    # Before duty after positioning
+
+# Long-haul: scheduled block time above this many hours (min 18h rest)
+LONG_HAUL_BLOCK_HOURS = 6.0
+
+# V1 rosters carry a numeric position_id instead of a position name
+POSITION_ROLES = {
+    1: "Captain",
+    2: "First Officer",
+    3: "Cabin Manager",
+    4: "Senior FA",
+    5: "Flight Attendant",
+    6: "Purser",
+    7: "Relief Pilot",
+    8: "Check Captain",
+}
+
+# Normalized role names (lowercase, single spaces)
+PILOT_ROLES = {
+    "captain", "capt", "first officer", "fo", "second officer", "so",
+    "relief pilot", "cruise relief pilot", "check captain", "pilot",
+}
+SENIOR_ROLES = {
+    "captain", "capt", "check captain",
+    "cabin manager", "cabin service manager", "csm", "purser", "senior purser", "senior fa",
+}
+
+ROSTER_FIELDS = {
+    "duty_start": ("duty_start_utc", "duty_start"),
+    "duty_end": ("duty_end_utc", "duty_end"),
+    "previous_duty_end": ("previous_duty_end_utc", "previous_duty_end"),
+    "position": ("position", "position_id", "role", "crew_role"),
+}
+
+FLIGHT_FIELDS = {
+    "departure": ("scheduled_departure_utc", "scheduled_departure"),
+    "arrival": ("scheduled_arrival_utc", "scheduled_arrival"),
+}
+
+
+def _field(record: Dict[str, Any], name: str, fields: Dict[str, tuple] = ROSTER_FIELDS) -> Any:
+    """Get a roster (or flight) field, accepting the V1 and V2 attribute names."""
+    for key in fields[name]:
+        if record.get(key) not in (None, ""):
+            return record[key]
+    return None
+
+
+def _to_epoch_hours(value: Any) -> float:
+    """Convert an ISO 8601 (or V1 '%Y-%m-%d %H:%M:%S') timestamp to hours since epoch (NaN if missing/invalid)."""
+    if not value:
+        return np.nan
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return np.nan
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp() / 3600.0
+
+
+def position_role(position: Any) -> Optional[str]:
+    """Get the role name for a roster position (V1 position_id or V2 role name)."""
+    if position is None or position == "":
+        return None
+    if not isinstance(position, str) or position.strip().isdigit():
+        try:
+            return POSITION_ROLES.get(int(position), str(position))
+        except (TypeError, ValueError):
+            pass
+    return str(position).strip()
+
+
+def _role_key(position: Any) -> str:
+    """Normalize a position to a role key, e.g. 7 / "Relief_Pilot" -> "relief pilot"."""
+    role = position_role(position) or ""
+    return " ".join(role.lower().replace("_", " ").replace("-", " ").split())
+
+
+def is_pilot(position: Any) -> bool:
+    """Check whether a roster position is a flight deck position."""
+    return _role_key(position) in PILOT_ROLES
+
+
+def is_senior(position: Any) -> bool:
+    """Check whether a roster position is a Captain or senior cabin position."""
+    return _role_key(position) in SENIOR_ROLES
+
+
+def is_long_haul(flight: Optional[Dict[str, Any]]) -> bool:
+    """Check whether a flight's scheduled block time makes it long-haul."""
+    if not flight:
+        return False
+    block_hours = (
+        _to_epoch_hours(_field(flight, "arrival", FLIGHT_FIELDS))
+        - _to_epoch_hours(_field(flight, "departure", FLIGHT_FIELDS))
+    )
+    return bool(block_hours > LONG_HAUL_BLOCK_HOURS)
+
+
+def get_max_fdp_hours(pilot_count: int) -> float:
+    """Get the max FDP for a flight deck of the given size (single/two-pilot: 13h)."""
+    if pilot_count >= 4:
+        return FDP_LIMITS_BY_PILOTS[4]
+    return FDP_LIMITS_BY_PILOTS.get(pilot_count, FDP_LIMITS_BY_PILOTS[2])
+
+
+def _check_qualifications(
+    member: Optional[Dict[str, Any]],
+    aircraft_type: Optional[str],
+    reference_time: datetime
+) -> List[str]:
+    """Check type rating and medical validity for one crew member."""
+    if not member:
+        return []
+    issues = []
+    if aircraft_type:
+        ratings = member.get("type_ratings") or member.get("qualifications") or []
+        if isinstance(ratings, str):
+            ratings = [r.strip() for r in ratings.replace(";", ",").split(",")]
+        if ratings and aircraft_type.upper() not in {str(r).upper() for r in ratings}:
+            issues.append(f"No {aircraft_type} type rating")
+
+    medical_status = str(member.get("medical_certificate_status") or "").lower()
+    if medical_status in ("expired", "invalid", "suspended"):
+        issues.append(f"Medical certificate {medical_status}")
+    medical_expiry = _to_epoch_hours(member.get("medical_expiry") or member.get("medical_expiry_date"))
+    if not np.isnan(medical_expiry) and medical_expiry < reference_time.timestamp() / 3600.0:
+        issues.append("Medical certificate expired")
+    return issues
+
+
+def evaluate_crew_fdp(
+    roster: List[Dict[str, Any]],
+    delay_minutes: float = 0.0,
+    crew_members: Optional[Dict[str, Dict[str, Any]]] = None,
+    aircraft_type: Optional[str] = None,
+    long_haul: bool = False,
+    positioning: bool = False,
+    reference_time: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Evaluate FDP, rest and qualifications for every crew member on a roster.
+
+    FDP = duty_end - duty_start + delay. The limit depends on the number of
+    pilots on the roster; risk = FDP / limit x 100, banded per <fdp_limits>.
+    Required rest after duty follows <rest_requirements>.
+
+    Args:
+        roster: Crew roster items (as returned by query_crew_roster)
+        delay_minutes: Disruption delay added to every crew member's FDP
+        crew_members: Optional crew member records keyed by crew_id, for qualification checks
+        aircraft_type: Optional aircraft type for the type rating check (e.g., "A380")
+        long_haul: Whether the flight is long-haul (min 18h rest)
+        positioning: Whether crew position before duty (min 10h rest before duty)
+        reference_time: Time used for medical expiry checks (defaults to now, UTC)
+
+    Returns:
+        dict: Per-crew results plus a summary with worst risk band, crew change
+            flag and mandatory (Captain/Senior cabin) replacements
+
+    Example:
+        >>> result = evaluate_crew_fdp(
+        ...     [{"crew_id": "C1", "position": "Captain",
+        ...       "duty_start_utc": "2026-01-20T06:00:00Z", "duty_end_utc": "2026-01-20T16:00:00Z"}],
+        ...     delay_minutes=120
+        ... )
+        >>> result["crew"][0]["fdp_hours"], result["crew"][0]["risk_band"]
+        (12.0, 'HIGH')
+    """
+    reference_time = reference_time or datetime.now(timezone.utc)
+    crew_members = crew_members or {}
+    roster = [item for item in roster if isinstance(item, dict) and "error" not in item]
+
+    positions = [position_role(_field(item, "position")) for item in roster]
+    pilot_count = sum(1 for position in positions if is_pilot(position))
+    max_fdp = get_max_fdp_hours(pilot_count)
+    delay_hours = float(delay_minutes or 0) / 60.0
+
+    # Vectorized FDP, margin, utilization and rest over the whole roster
+    starts = np.array([_to_epoch_hours(_field(item, "duty_start")) for item in roster], dtype=float)
+    ends = np.array([_to_epoch_hours(_field(item, "duty_end")) for item in roster], dtype=float)
+    previous_ends = np.array(
+        [_to_epoch_hours(_field(item, "previous_duty_end")) for item in roster], dtype=float
+    )
+
+    fdp = ends - starts + delay_hours
+    margin = max_fdp - fdp
+    utilization = fdp / max_fdp * 100.0
+
+    band_conditions = [utilization <= upper for upper, _ in RISK_BANDS]
+    bands = np.select(band_conditions, [band for _, band in RISK_BANDS], default=VIOLATION_BAND)
+
+    min_rest_after = np.where(fdp <= SHORT_FDP_THRESHOLD, MIN_REST_SHORT_FDP, fdp)
+    if long_haul:
+        min_rest_after = np.maximum(min_rest_after, MIN_REST_LONG_HAUL)
+
+    rest_before = starts - previous_ends
+    min_rest_before = MIN_REST_POSITIONING if positioning else MIN_REST_SHORT_FDP
+
+    crew = []
+    for i, item in enumerate(roster):
+        crew_id = item.get("crew_id")
+        issues = []
+        if np.isnan(fdp[i]):
+            entry = {
+                "crew_id": crew_id,
+                "position": positions[i],
+                "status": "DATA_GAP",
+                "issues": ["Missing or invalid duty_start/duty_end"],
+            }
+            crew.append(entry)
+            continue
+
+        if bands[i] == VIOLATION_BAND:
+            issues.append(f"FDP {fdp[i]:.2f}h exceeds {max_fdp:.0f}h limit")
+
+        rest_before_hours = None if np.isnan(rest_before[i]) else round(float(rest_before[i]), 2)
+        if rest_before_hours is not None and rest_before_hours < min_rest_before:
+            issues.append(f"Rest before duty {rest_before_hours}h below {min_rest_before:.0f}h minimum")
+
+        issues.extend(_check_qualifications(crew_members.get(crew_id), aircraft_type, reference_time))
+
+        crew.append({
+            "crew_id": crew_id,
+            "position": positions[i],
+            "fdp_hours": round(float(fdp[i]), 2),
+            "max_fdp_hours": max_fdp,
+            "margin_hours": round(float(margin[i]), 2),
+            "utilization_pct": round(float(utilization[i]), 1),
+            "risk_band": str(bands[i]),
+            "min_rest_after_hours": round(float(min_rest_after[i]), 2),
+            "rest_before_hours": rest_before_hours,
+            "min_rest_before_hours": min_rest_before,
+            "issues": issues,
+            "status": "NON_COMPLIANT" if issues else "COMPLIANT",
+        })
+
+    evaluated = [c for c in crew if c["status"] != "DATA_GAP"]
+    non_compliant = [c for c in evaluated if c["status"] == "NON_COMPLIANT"]
+    mandatory_replacements = [
+        c["crew_id"] for c in non_compliant if is_senior(c.get("position"))
+    ]
+    worst_band = max(
+        (c["risk_band"] for c in evaluated), key=RISK_ORDER.index, default=None
+    )
+
+    logger.info(
+        f"FDP evaluation: {len(crew)} crew, {pilot_count} pilots, max FDP {max_fdp}h, "
+        f"worst band {worst_band}, {len(non_compliant)} non-compliant"
+    )
+
+    return {
+        "delay_minutes": delay_minutes,
+        "pilot_count": pilot_count,
+        "max_fdp_hours": max_fdp,
+        "long_haul": long_haul,
+        "positioning": positioning,
+        "crew": crew,
+        "summary": {
+            "crew_count": len(crew),
+            "evaluated_count": len(evaluated),
+            "data_gaps": len(crew) - len(evaluated),
+            "non_compliant_count": len(non_compliant),
+            "worst_risk_band": worst_band,
+            # >50% crew issues -> crew change all; Captain/Senior cabin issues -> replacement
+            "crew_change_required": bool(evaluated) and len(non_compliant) > len(evaluated) / 2,
+            "mandatory_replacements": mandatory_replacements,
+        },
+    }
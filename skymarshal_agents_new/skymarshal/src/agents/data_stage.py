@@ -0,0 +1,81 @@
+"""Shared data stage for the agents of one disruption
+
+The orchestrator does not access DynamoDB itself. The data work it schedules
+around the agents goes through this module, next to the shared flight lookup
+in agents.flight_context:
+
+- the request-scoped read cache the agents' tools share for one disruption
+- the prefetch of the disruption's data bundle into that cache
+- the container-start table warmup and reference data preload
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Dict, Optional
+
+from database.dynamodb import warm_table_handles
+from database.prefetch import PREFETCH_ENABLED, prefetch_disruption_bundle
+from database.reference_cache import get_reference_cache, preload_reference_tables
+from database.request_cache import RequestCache, bind_request_cache
+
+logger = logging.getLogger(__name__)
+
+# Bulk-load reference tables (compensation rules, MCTs, curfews, ...) at container start
+REFERENCE_CACHE_PRELOAD_ENABLED = os.getenv("REFERENCE_CACHE_PRELOAD", "true").lower() == "true"
+
+# Resolve and describe the agents' DynamoDB tables at container start
+TABLE_WARMUP_ENABLED = os.getenv("DYNAMODB_TABLE_WARMUP", "true").lower() == "true"
+
+
+def bind_shared_reads(thread_id: str) -> RequestCache:
+    """
+    Create the disruption's read cache and bind it in the current context.
+
+    Run it in the context the orchestration stages are started from, so every
+    agent tool call of the disruption shares the cache.
+
+    Args:
+        thread_id: Orchestration thread ID
+
+    Returns:
+        RequestCache: The bound cache (for its stats)
+    """
+    request_cache = RequestCache(thread_id)
+    bind_request_cache(request_cache)
+    return request_cache
+
+
+def start_prefetch(flight_context: Optional[Dict[str, Any]]) -> Optional[Awaitable[Dict[str, Any]]]:
+    """
+    Get the prefetch of the disruption's data bundle for a resolved flight.
+
+    Args:
+        flight_context: Result of resolve_flight_context() (None if extraction failed)
+
+    Returns:
+        Awaitable prefetch stats, or None if prefetch is disabled or the flight is unresolved
+    """
+    if not PREFETCH_ENABLED or not flight_context or not flight_context.get("flight"):
+        return None
+    return prefetch_disruption_bundle(flight_context["flight_info"], flight_context["flight"])
+
+
+def data_cache_stats(request_cache: RequestCache) -> Dict[str, Any]:
+    """Stats of the disruption's read cache and the process-level reference cache."""
+    return {
+        "request_cache": request_cache.get_stats(),
+        "reference_cache": get_reference_cache().get_stats(),
+    }
+
+
+def start_data_warmup() -> None:
+    """Warm table handles and reference data at container start, in background threads."""
+    if TABLE_WARMUP_ENABLED:
+        threading.Thread(target=warm_table_handles, name="table-warmup", daemon=True).start()
+
+    if REFERENCE_CACHE_PRELOAD_ENABLED:
+        # Warm reference data in the background so startup is not delayed
+        threading.Thread(
+            target=preload_reference_tables, name="reference-preload", daemon=True
+        ).start()
@@ -3,14 +3,16 @@
 import logging
 import json
 from typing import Any, Optional, Dict, List
-import boto3
 from datetime import datetime, timezone
 
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 
 from utils.tool_calling import invoke_with_tools
+from database.dynamodb import DynamoDBClient, get_dynamodb_resource
+from database.pagination import query_all, scan_all
 from database.table_config import get_table_name
+from database.tool_output import to_tool_json
 from database.constants import (
     FLIGHT_NUMBER_DATE_INDEX,
     FLIGHT_ID_INDEX,
@@ -58,12 +60,13 @@ def query_flight(flight_number: str, date: str) -> str:
         JSON string containing flight record or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         flights_table = dynamodb.Table(get_table_name("flights"))
         
         logger.info(f"Querying flight: {flight_number} on {date}")
         
-        response = flights_table.query(
+        items = query_all(
+            flights_table,
             IndexName=FLIGHT_NUMBER_DATE_INDEX,
             KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
             ExpressionAttributeValues={
@@ -72,10 +75,9 @@ def query_flight(flight_number: str, date: str) -> str:
             },
         )
         
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found flight: {items[0].get('flight_id')}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"Flight not found: {flight_number} on {date}")
             return json.dumps({"error": "FLIGHT_NOT_FOUND", "message": f"Flight {flight_number} on {date} not found"})
@@ -100,14 +102,15 @@ def query_passenger_bookings(flight_id: str) -> str:
         JSON string containing list of passenger records
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         # Use passengers_v2 table with first-leg-flight-index GSI
         # V1 bookings table uses numeric flight_id, V2 uses string format
         passengers_table = dynamodb.Table(get_table_name("passengers"))
 
         logger.info(f"Querying passengers for flight: {flight_id}")
 
-        response = passengers_table.query(
+        items = query_all(
+            passengers_table,
             IndexName=FIRST_LEG_FLIGHT_INDEX,
             KeyConditionExpression="first_leg_flight_id = :fid",
             ExpressionAttributeValues={
@@ -115,9 +118,8 @@ def query_passenger_bookings(flight_id: str) -> str:
             },
         )
 
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} passengers for flight {flight_id}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(f"Error querying passengers: {e}")
@@ -139,14 +141,15 @@ def query_cargo_revenue(flight_id: str) -> str:
         JSON string containing list of cargo shipment records
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         # Use cargo_shipments_v2 table with first-leg-flight-index GSI
         # V1 CargoFlightAssignments uses numeric flight_id, V2 uses string format
         shipments_table = dynamodb.Table(get_table_name("cargo_shipments"))
 
         logger.info(f"Querying cargo revenue for flight: {flight_id}")
 
-        response = shipments_table.query(
+        items = query_all(
+            shipments_table,
             IndexName=FIRST_LEG_FLIGHT_INDEX,
             KeyConditionExpression="first_leg_flight_id = :fid",
             ExpressionAttributeValues={
@@ -154,15 +157,65 @@ def query_cargo_revenue(flight_id: str) -> str:
             },
         )
 
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} cargo shipments for flight {flight_id}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(f"Error querying cargo revenue: {e}")
         return json.dumps({"error": type(e).__name__, "message": str(e)})
 
 
+@tool
+def summarize_flight_passengers(flight_id: str, include_records: bool = False) -> str:
+    """Summarize passenger revenue for a flight: fare totals by cabin class and counts.
+
+    Fare revenue, passenger counts and connection figures are computed exactly
+    from every passenger record on the flight. Prefer this over
+    query_passenger_bookings for revenue calculations; set include_records
+    only when individual bookings are needed.
+
+    Args:
+        flight_id: Unique flight identifier (e.g., "FLT-2001")
+        include_records: Also return the raw passenger records (default False)
+
+    Returns:
+        JSON string containing the passenger summary
+    """
+    try:
+        summary = DynamoDBClient().summarize_flight_passengers(flight_id, include_records)
+        logger.info(f"Summarized {summary['passenger_count']} passengers for flight {flight_id}")
+        return to_tool_json(summary)
+
+    except Exception as e:
+        logger.error(f"Error summarizing passengers: {e}")
+        return json.dumps({"error": type(e).__name__, "message": str(e)})
+
+
+@tool
+def summarize_flight_cargo(flight_id: str, include_records: bool = False) -> str:
+    """Summarize cargo revenue for a flight: weight, commodities, revenue and declared value.
+
+    Totals are computed exactly from every cargo shipment on the flight.
+    Prefer this over query_cargo_revenue for revenue calculations; set
+    include_records only when individual shipments are needed.
+
+    Args:
+        flight_id: Unique flight identifier (e.g., "FLT-2001")
+        include_records: Also return the raw shipment records (default False)
+
+    Returns:
+        JSON string containing the cargo summary
+    """
+    try:
+        summary = DynamoDBClient().summarize_flight_cargo(flight_id, include_records)
+        logger.info(f"Summarized {summary['shipment_count']} cargo shipments for flight {flight_id}")
+        return to_tool_json(summary)
+
+    except Exception as e:
+        logger.error(f"Error summarizing cargo: {e}")
+        return json.dumps({"error": type(e).__name__, "message": str(e)})
+
+
 @tool
 def query_maintenance_costs(aircraft_registration: str) -> str:
     """Query maintenance work orders for cost analysis using GSI.
@@ -177,12 +230,13 @@ def query_maintenance_costs(aircraft_registration: str) -> str:
         JSON string containing list of maintenance work order records
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         maintenance_table = dynamodb.Table(get_table_name("maintenance_work_orders"))
         
         logger.info(f"Querying maintenance costs for aircraft: {aircraft_registration}")
         
-        response = maintenance_table.query(
+        items = query_all(
+            maintenance_table,
             IndexName=AIRCRAFT_REGISTRATION_INDEX,
             KeyConditionExpression="aircraftRegistration = :ar",
             ExpressionAttributeValues={
@@ -190,9 +244,8 @@ def query_maintenance_costs(aircraft_registration: str) -> str:
             },
         )
         
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} maintenance work orders for aircraft {aircraft_registration}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
         
     except Exception as e:
         logger.error(f"Error querying maintenance costs: {e}")
@@ -233,22 +286,22 @@ def query_financial_parameters(parameter_type: str) -> str:
         JSON string containing financial parameters or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         params_table = dynamodb.Table(get_table_name("financial_parameters"))
 
         logger.info(f"Querying financial parameters: {parameter_type}")
 
         # Table PK is parameter_id, not parameter_type
         # Use scan with filter since there's no GSI for parameter_type
-        response = params_table.scan(
+        items = scan_all(
+            params_table,
             FilterExpression="parameter_type = :pt",
             ExpressionAttributeValues={":pt": parameter_type}
         )
 
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found financial parameters for {parameter_type}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"Financial parameters not found for {parameter_type}")
             return json.dumps({
@@ -278,13 +331,14 @@ def query_recovery_cost_matrix(scenario_type: str, aircraft_type: str) -> str:
         JSON string containing cost matrix data or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         cost_table = dynamodb.Table(get_table_name("recovery_cost_matrix"))
 
         logger.info(f"Querying recovery cost matrix: {scenario_type} for {aircraft_type}")
 
         # Table PK is matrix_id, use scenario-type-index GSI with filter on aircraft_type
-        response = cost_table.query(
+        items = query_all(
+            cost_table,
             IndexName=SCENARIO_TYPE_INDEX,
             KeyConditionExpression="scenario_type = :st",
             FilterExpression="aircraft_type = :at",
@@ -294,10 +348,9 @@ def query_recovery_cost_matrix(scenario_type: str, aircraft_type: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found cost matrix for {scenario_type}/{aircraft_type}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"Cost matrix not found for {scenario_type}/{aircraft_type}")
             return json.dumps({
@@ -326,14 +379,15 @@ def query_compensation_rules(regulation: str, delay_category: str) -> str:
         JSON string containing compensation rules or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         rules_table = dynamodb.Table(get_table_name("compensation_rules"))
 
         logger.info(f"Querying compensation rules: {regulation} / {delay_category}")
 
         # Use regulation-index GSI with filter on delay_category
         # Table PK is rule_id, so we must use GSI for regulation lookup
-        response = rules_table.query(
+        items = query_all(
+            rules_table,
             IndexName=REGULATION_INDEX,
             KeyConditionExpression="regulation = :reg",
             FilterExpression="delay_category = :dc",
@@ -343,10 +397,9 @@ def query_compensation_rules(regulation: str, delay_category: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found compensation rules for {regulation}/{delay_category}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"Compensation rules not found for {regulation}/{delay_category}")
             return json.dumps({
@@ -374,7 +427,7 @@ ON_DATA_GAP: report_error|return_error_status
 
 <workflow>
   <step>extract: flight_number, date, event</step>
-  <step>query: flight → bookings → cargo_assignments</step>
+  <step>query: flight → passenger_summary → cargo_summary</step>
   <step>calculate: passenger_revenue, cargo_revenue, crew_costs, maintenance_costs</step>
   <step>compare: delay_cost vs cancel_cost vs aircraft_swap_cost</step>
   <step>return: cost_breakdown + scenario_comparison + recommended_scenario</step>
@@ -456,6 +509,8 @@ async def analyze_finance(payload: dict, llm: Any, mcp_tools: list) -> dict:
         # Define DynamoDB query tools for Finance Agent
         db_tools = [
             query_flight,
+            summarize_flight_passengers,
+            summarize_flight_cargo,
             query_passenger_bookings,
             query_cargo_revenue,
             query_maintenance_costs,
@@ -473,8 +528,9 @@ async def analyze_finance(payload: dict, llm: Any, mcp_tools: list) -> dict:
         # Extract flight information using structured output
         logger.info("Extracting flight information from natural language prompt")
         try:
-            from utils.extraction import extract_with_fallback
-            flight_info = await extract_with_fallback(llm, FlightInfo, user_prompt)
+            from utils.extraction import format_flight_record, resolve_flight_info
+            flight_info = await resolve_flight_info(llm, FlightInfo, user_prompt, payload)
+            flight_record = format_flight_record(payload)
             logger.info(f"Extracted flight info: {flight_info.flight_number} on {flight_info.date}")
         except Exception as e:
             logger.error(f"Failed to extract flight information: {e}")
@@ -508,7 +564,7 @@ async def analyze_finance(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-  <other_agents>
+{flight_record}  <other_agents>
 {other_recs_xml if other_recs_xml else "    <none/>"}
   </other_agents>
 </input>
@@ -527,11 +583,11 @@ async def analyze_finance(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-</input>
+{flight_record}</input>
 <action>
-1. query_flight("{flight_info.flight_number}", "{flight_info.date}")
-2. query_passenger_bookings(flight_id)
-3. query_cargo_revenue(flight_id)
+1. query_flight("{flight_info.flight_number}", "{flight_info.date}") (skip if <flight_record> given)
+2. summarize_flight_passengers(flight_id) → fare revenue by cabin class
+3. summarize_flight_cargo(flight_id) → cargo revenue and declared value
 4. query_maintenance_costs(aircraft_registration)
 5. Calculate: delay_cost, cancel_cost, swap_cost
 6. Compare minimum 3 scenarios, rank by net impact
@@ -0,0 +1,65 @@
+"""Shared flight context for the agents of one disruption
+
+The flight a disruption is about is the same for all seven agents, in both
+Phase 1 and Phase 2. Instead of every agent run extracting it from the prompt
+and looking the flight record up again, the orchestrator resolves it once
+through resolve_flight_context() and passes the result in the agent payloads
+("flight_info", "flight").
+"""
+
+import json
+import logging
+from typing import Any, Optional
+
+from agents.schemas import FlightInfo
+from database.async_dynamodb import get_async_dynamodb_client
+from database.dynamodb import DecimalEncoder
+from utils.extraction import extract_with_fallback
+from utils.metrics import metric_labels
+
+logger = logging.getLogger(__name__)
+
+
+async def resolve_flight_context(user_prompt: str, llm: Any) -> Optional[dict]:
+    """
+    Shared extraction stage: resolve flight info and flight record once per disruption.
+
+    Runs structured-output extraction a single time, validates it through
+    FlightInfo and looks up the flight record, so the 14 agent runs in
+    Phase 1 and Phase 2 can skip their own extraction round-trips.
+
+    Failures are non-fatal: returning None makes agents fall back to
+    extracting flight info themselves.
+
+    Args:
+        user_prompt: Original natural language prompt from user
+        llm: Model instance used for extraction
+
+    Returns:
+        dict with "flight_info" (validated FlightInfo as dict) and "flight"
+        (flight record or None), or None if extraction failed
+    """
+    try:
+        with metric_labels(agent="extraction", phase="extraction"):
+            extracted = await extract_with_fallback(llm, FlightInfo, user_prompt)
+        flight_info = FlightInfo.model_validate(
+            extracted.model_dump() if isinstance(extracted, FlightInfo) else extracted
+        )
+    except Exception as e:
+        logger.warning(f"⚠️  Shared flight extraction failed, agents will extract individually: {e}")
+        return None
+
+    logger.info(f"✈️  Resolved flight info: {flight_info.flight_number} on {flight_info.date}")
+
+    flight = await get_async_dynamodb_client().get_flight_by_number_and_date(
+        flight_info.flight_number,
+        flight_info.date,
+    )
+    if flight is None:
+        logger.warning(f"   Flight record not resolved for {flight_info.flight_number} on {flight_info.date}")
+    else:
+        # Normalize Decimal values so the record is JSON/checkpoint safe
+        flight = json.loads(json.dumps(flight, cls=DecimalEncoder))
+        logger.info(f"   Flight record resolved: flight_id={flight.get('flight_id')}")
+
+    return {"flight_info": flight_info.model_dump(), "flight": flight}
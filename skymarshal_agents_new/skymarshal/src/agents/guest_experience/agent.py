@@ -1,13 +1,15 @@
 """Guest Experience Agent for SkyMarshal"""
 
-import boto3
 import json
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 
 from utils.tool_calling import invoke_with_tools
 from agents.schemas import GuestExperienceOutput, FlightInfo
+from database.dynamodb import DynamoDBClient, get_dynamodb_resource
+from database.pagination import query_all
 from database.table_config import get_table_name
+from database.tool_output import to_tool_json
 from database.constants import (
     FLIGHT_NUMBER_DATE_INDEX,
     FLIGHT_ID_INDEX,
@@ -27,7 +29,7 @@ from decimal import Decimal
 logger = logging.getLogger(__name__)
 
 # Initialize DynamoDB resource
-dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+dynamodb = get_dynamodb_resource()
 
 # System Prompt for Guest Experience Agent - UPDATED for Multi-Round Orchestration
 SYSTEM_PROMPT = """
@@ -41,7 +43,7 @@ ON_DATA_GAP: report_error|return_error_status
 
 <workflow>
 1. Extract: flight_number, date, event from user prompt
-2. Query: query_flight() → passenger_manifest, then segment passengers by tier/connection status
+2. Query: query_flight() → summarize_flight_passengers() for counts by tier/connection status
 3. Segment: High-value (elite status), connections, special needs
 4. Calculate: Impact severity (delay hours × pax count × tier multiplier)
 5. Estimate: Compensation costs (EU261, DOT, Etihad policy)
@@ -142,19 +144,19 @@ def query_flight(flight_number: str, date: str) -> str:
     try:
         flights_table = dynamodb.Table(get_table_name("flights"))
 
-        response = flights_table.query(
+        items = query_all(
+            flights_table,
             IndexName=FLIGHT_NUMBER_DATE_INDEX,
             KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
             ExpressionAttributeValues={":fn": flight_number, ":sd": date},
         )
 
-        items = response.get("Items", [])
         if items:
             result = _convert_decimals(items[0])
             logger.info(
                 f"Found flight {flight_number} on {date}: flight_id={result.get('flight_id')}"
             )
-            return json.dumps(result, default=str)
+            return to_tool_json(result)
         else:
             logger.warning(f"Flight {flight_number} on {date} not found")
             return json.dumps({"error": "FLIGHT_NOT_FOUND", "message": f"Flight {flight_number} on {date} not found"})
@@ -183,21 +185,48 @@ def query_bookings_by_flight(flight_id: str) -> str:
         # V1 bookings table uses numeric flight_id, but V2 passengers_v2 uses string format
         passengers_table = dynamodb.Table(get_table_name("passengers"))
 
-        response = passengers_table.query(
+        items = query_all(
+            passengers_table,
             IndexName=FIRST_LEG_FLIGHT_INDEX,
             KeyConditionExpression="first_leg_flight_id = :fid",
             ExpressionAttributeValues={":fid": flight_id},
         )
 
-        items = _convert_decimals(response.get("Items", []))
+        items = _convert_decimals(items)
         logger.info(f"Found {len(items)} passengers for flight {flight_id}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(f"Error querying passengers for flight {flight_id}: {e}")
         return json.dumps({"error": type(e).__name__, "message": str(e)})
 
 
+@tool
+def summarize_flight_passengers(flight_id: str, include_records: bool = False) -> str:
+    """Summarize all passengers on a flight: counts by cabin class, tier and status.
+
+    Aggregates are computed from every passenger record on the flight, so the
+    counts, connection figures and fare revenue are exact. Prefer this over
+    query_bookings_by_flight for impact assessment; set include_records only
+    when individual passengers must be listed.
+
+    Args:
+        flight_id: Unique flight identifier (e.g., "FLT-2001")
+        include_records: Also return the raw passenger records (default False)
+
+    Returns:
+        JSON string containing the passenger summary
+    """
+    try:
+        summary = DynamoDBClient().summarize_flight_passengers(flight_id, include_records)
+        logger.info(f"Summarized {summary['passenger_count']} passengers for flight {flight_id}")
+        return to_tool_json(summary)
+
+    except Exception as e:
+        logger.error(f"Error summarizing passengers for flight {flight_id}: {e}")
+        return json.dumps({"error": type(e).__name__, "message": str(e)})
+
+
 @tool
 def query_bookings_by_passenger(passenger_id: str, flight_id: Optional[str] = None) -> str:
     """Query passenger bookings by passenger ID using GSI (Priority 1).
@@ -216,21 +245,23 @@ def query_bookings_by_passenger(passenger_id: str, flight_id: Optional[str] = No
         bookings_table = dynamodb.Table(get_table_name("bookings"))
 
         if flight_id:
-            response = bookings_table.query(
+            items = query_all(
+                bookings_table,
                 IndexName=PASSENGER_FLIGHT_INDEX,
                 KeyConditionExpression="passenger_id = :pid AND flight_id = :fid",
                 ExpressionAttributeValues={":pid": passenger_id, ":fid": flight_id},
             )
         else:
-            response = bookings_table.query(
+            items = query_all(
+                bookings_table,
                 IndexName=PASSENGER_FLIGHT_INDEX,
                 KeyConditionExpression="passenger_id = :pid",
                 ExpressionAttributeValues={":pid": passenger_id},
             )
 
-        items = _convert_decimals(response.get("Items", []))
+        items = _convert_decimals(items)
         logger.info(f"Found {len(items)} bookings for passenger {passenger_id}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(f"Error querying bookings for passenger {passenger_id}: {e}")
@@ -254,17 +285,18 @@ def query_bookings_by_status(flight_id: str, booking_status: str) -> str:
     try:
         bookings_table = dynamodb.Table(get_table_name("bookings"))
 
-        response = bookings_table.query(
+        items = query_all(
+            bookings_table,
             IndexName=FLIGHT_STATUS_INDEX,
             KeyConditionExpression="flight_id = :fid AND booking_status = :status",
             ExpressionAttributeValues={":fid": flight_id, ":status": booking_status},
         )
 
-        items = _convert_decimals(response.get("Items", []))
+        items = _convert_decimals(items)
         logger.info(
             f"Found {len(items)} {booking_status} bookings for flight {flight_id}"
         )
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(
@@ -289,15 +321,16 @@ def query_baggage_by_booking(booking_id: str) -> str:
     try:
         baggage_table = dynamodb.Table(get_table_name("baggage"))
 
-        response = baggage_table.query(
+        items = query_all(
+            baggage_table,
             IndexName=BOOKING_INDEX,
             KeyConditionExpression="booking_id = :bid",
             ExpressionAttributeValues={":bid": booking_id},
         )
 
-        items = _convert_decimals(response.get("Items", []))
+        items = _convert_decimals(items)
         logger.info(f"Found {len(items)} baggage items for booking {booking_id}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(f"Error querying baggage for booking {booking_id}: {e}")
@@ -322,7 +355,8 @@ def query_baggage_by_location(current_location: str, baggage_status: Optional[st
         baggage_table = dynamodb.Table(get_table_name("baggage"))
 
         if baggage_status:
-            response = baggage_table.query(
+            items = query_all(
+                baggage_table,
                 IndexName=LOCATION_STATUS_INDEX,
                 KeyConditionExpression="current_location = :loc AND baggage_status = :status",
                 ExpressionAttributeValues={
@@ -331,18 +365,19 @@ def query_baggage_by_location(current_location: str, baggage_status: Optional[st
                 },
             )
         else:
-            response = baggage_table.query(
+            items = query_all(
+                baggage_table,
                 IndexName=LOCATION_STATUS_INDEX,
                 KeyConditionExpression="current_location = :loc",
                 ExpressionAttributeValues={":loc": current_location},
             )
 
-        items = _convert_decimals(response.get("Items", []))
+        items = _convert_decimals(items)
         logger.info(
             f"Found {len(items)} baggage items at {current_location}"
             + (f" with status {baggage_status}" if baggage_status else "")
         )
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(f"Error querying baggage at {current_location}: {e}")
@@ -371,7 +406,7 @@ def query_passenger(passenger_id: str) -> str:
         if item:
             result = _convert_decimals(item)
             logger.info(f"Found passenger {passenger_id}")
-            return json.dumps(result, default=str)
+            return to_tool_json(result)
         else:
             logger.warning(f"Passenger {passenger_id} not found")
             return json.dumps({"error": "PASSENGER_NOT_FOUND", "message": f"Passenger {passenger_id} not found"})
@@ -399,7 +434,8 @@ def query_elite_passengers(frequent_flyer_tier: str, booking_date_from: Optional
         passengers_table = dynamodb.Table(get_table_name("passengers"))
 
         if booking_date_from:
-            response = passengers_table.query(
+            items = query_all(
+                passengers_table,
                 IndexName=PASSENGER_ELITE_TIER_INDEX,
                 KeyConditionExpression="frequent_flyer_tier = :tier AND passenger_id >= :date",
                 ExpressionAttributeValues={
@@ -408,15 +444,16 @@ def query_elite_passengers(frequent_flyer_tier: str, booking_date_from: Optional
                 },
             )
         else:
-            response = passengers_table.query(
+            items = query_all(
+                passengers_table,
                 IndexName=PASSENGER_ELITE_TIER_INDEX,
                 KeyConditionExpression="frequent_flyer_tier = :tier",
                 ExpressionAttributeValues={":tier": frequent_flyer_tier},
             )
 
-        items = _convert_decimals(response.get("Items", []))
+        items = _convert_decimals(items)
         logger.info(f"Found {len(items)} passengers with tier {frequent_flyer_tier}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
 
     except Exception as e:
         logger.error(f"Error querying elite passengers with tier {frequent_flyer_tier}: {e}")
@@ -444,7 +481,8 @@ def query_compensation_rules(regulation: str, delay_category: str) -> str:
 
         # Use regulation-index GSI with filter on delay_category
         # Table PK is rule_id, so we must use GSI for regulation lookup
-        response = comp_table.query(
+        items = query_all(
+            comp_table,
             IndexName=REGULATION_INDEX,
             KeyConditionExpression="regulation = :reg",
             FilterExpression="delay_category = :dc",
@@ -454,11 +492,10 @@ def query_compensation_rules(regulation: str, delay_category: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
         if items:
             result = _convert_decimals(items[0])
             logger.info(f"Found compensation rules for {regulation}/{delay_category}")
-            return json.dumps(result, default=str)
+            return to_tool_json(result)
         else:
             logger.warning(f"Compensation rules not found for {regulation}/{delay_category}")
             return json.dumps({
@@ -492,7 +529,8 @@ def query_oal_flights(origin: str, destination: str, date: str) -> str:
 
         logger.info(f"Querying OAL flights: {origin} → {destination} on {date}")
 
-        response = oal_table.query(
+        items = query_all(
+            oal_table,
             IndexName=ROUTE_INDEX,
             KeyConditionExpression="origin = :o AND destination = :d",
             FilterExpression="flight_date = :fd",
@@ -503,16 +541,16 @@ def query_oal_flights(origin: str, destination: str, date: str) -> str:
             }
         )
 
-        items = _convert_decimals(response.get("Items", []))
+        items = _convert_decimals(items)
         logger.info(f"Found {len(items)} OAL flights for {origin}-{destination}")
-        return json.dumps({
+        return to_tool_json({
             "origin": origin,
             "destination": destination,
             "date": date,
             "oal_flights": items,
             "total_options": len(items),
             "data_source": "oal_flights_v2"
-        }, default=str)
+        })
 
     except Exception as e:
         logger.error(f"Error querying OAL flights: {e}")
@@ -551,6 +589,7 @@ async def analyze_guest_experience(payload: dict, llm: Any, mcp_tools: list) ->
         # Define agent-specific DynamoDB query tools
         db_tools = [
             query_flight,
+            summarize_flight_passengers,
             query_bookings_by_flight,
             query_bookings_by_passenger,
             query_bookings_by_status,
@@ -569,9 +608,10 @@ async def analyze_guest_experience(payload: dict, llm: Any, mcp_tools: list) ->
 
         # Step 1: Extract flight info
         try:
-            from utils.extraction import extract_with_fallback
+            from utils.extraction import format_flight_record, resolve_flight_info
             from agents.schemas import FlightInfo
-            flight_info = await extract_with_fallback(llm, FlightInfo, user_prompt)
+            flight_info = await resolve_flight_info(llm, FlightInfo, user_prompt, payload)
+            flight_record = format_flight_record(payload)
             extracted_flight_info = {
                 "flight_number": flight_info.flight_number,
                 "date": flight_info.date,
@@ -598,11 +638,11 @@ async def analyze_guest_experience(payload: dict, llm: Any, mcp_tools: list) ->
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-</input>
+{flight_record}</input>
 <action>
-1. query_flight("{flight_info.flight_number}", "{flight_info.date}")
-2. query_bookings_by_flight(flight_id)
-3. Segment passengers: elite tier, connections, special needs
+1. query_flight("{flight_info.flight_number}", "{flight_info.date}") (skip if <flight_record> given)
+2. summarize_flight_passengers(flight_id) → counts by tier, cabin, connections
+3. Segment passengers: elite tier, connections, special needs (query_bookings_by_flight only for named passengers)
 4. Calculate impact_severity, estimate compensation
 5. Return AgentResponse
 </action>"""
@@ -627,7 +667,7 @@ async def analyze_guest_experience(payload: dict, llm: Any, mcp_tools: list) ->
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-  <other_agents>
+{flight_record}  <other_agents>
 {other_recs_xml if other_recs_xml else "    <none/>"}
   </other_agents>
 </input>
@@ -3,14 +3,16 @@
 import logging
 import json
 from typing import Any
-import boto3
 from datetime import datetime, timezone
 
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 
 from utils.tool_calling import invoke_with_tools
+from database.dynamodb import get_dynamodb_resource
+from database.pagination import query_all
 from database.table_config import get_table_name
+from database.tool_output import to_tool_json
 from database.constants import (
     FLIGHT_NUMBER_DATE_INDEX,
     AIRCRAFT_REGISTRATION_INDEX,
@@ -123,15 +125,15 @@ def query_flight(flight_number: str, date: str) -> str:
         JSON string containing flight record or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         flights = dynamodb.Table(get_table_name("flights"))
 
-        response = flights.query(
+        items = query_all(
+            flights,
             IndexName=FLIGHT_NUMBER_DATE_INDEX,
             KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
             ExpressionAttributeValues={":fn": flight_number, ":sd": date}
         )
-        items = response.get("Items", [])
         
         if not items:
             logger.warning(f"No flight found for {flight_number} on {date}")
@@ -142,7 +144,7 @@ def query_flight(flight_number: str, date: str) -> str:
                 "date": date
             })
         
-        return json.dumps(items[0], default=str)
+        return to_tool_json(items[0])
         
     except Exception as e:
         error_type = type(e).__name__
@@ -177,21 +179,21 @@ def query_maintenance_work_orders(aircraft_registration: str) -> str:
         JSON string containing list of maintenance work orders
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         work_orders = dynamodb.Table(get_table_name("maintenance_work_orders"))
 
-        response = work_orders.query(
+        items = query_all(
+            work_orders,
             IndexName=AIRCRAFT_REGISTRATION_INDEX,
             KeyConditionExpression="aircraft_registration = :ar",
             ExpressionAttributeValues={":ar": aircraft_registration}
         )
-        items = response.get("Items", [])
         
         if not items:
             logger.info(f"No maintenance work orders found for aircraft {aircraft_registration}")
             return json.dumps([])  # Empty list is valid - aircraft may have no work orders
         
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
         
     except Exception as e:
         error_type = type(e).__name__
@@ -225,7 +227,7 @@ def query_maintenance_staff(staff_id: str) -> str:
         JSON string containing staff member details or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         staff_table = dynamodb.Table(get_table_name("maintenance_staff"))
 
         response = staff_table.get_item(Key={"staff_id": staff_id})
@@ -239,7 +241,7 @@ def query_maintenance_staff(staff_id: str) -> str:
                 "staff_id": staff_id
             })
         
-        return json.dumps(item, default=str)
+        return to_tool_json(item)
         
     except Exception as e:
         error_type = type(e).__name__
@@ -273,21 +275,21 @@ def query_maintenance_roster(workorder_id: str) -> str:
         JSON string containing list of staff assignments
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         roster = dynamodb.Table(get_table_name("maintenance_roster"))
 
-        response = roster.query(
+        items = query_all(
+            roster,
             IndexName=WORKORDER_SHIFT_INDEX,
             KeyConditionExpression="workorder_id = :wid",
             ExpressionAttributeValues={":wid": workorder_id}
         )
-        items = response.get("Items", [])
         
         if not items:
             logger.info(f"No roster entries found for work order {workorder_id}")
             return json.dumps([])  # Empty list is valid - work order may have no staff assigned yet
         
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
         
     except Exception as e:
         error_type = type(e).__name__
@@ -322,7 +324,7 @@ def query_aircraft_availability(aircraft_registration: str, valid_from: str) ->
         JSON string containing aircraft availability record or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         availability = dynamodb.Table(get_table_name("aircraft"))
 
         response = availability.get_item(
@@ -342,7 +344,7 @@ def query_aircraft_availability(aircraft_registration: str, valid_from: str) ->
                 "valid_from": valid_from
             })
         
-        return json.dumps(item, default=str)
+        return to_tool_json(item)
         
     except Exception as e:
         error_type = type(e).__name__
@@ -379,26 +381,26 @@ def query_maintenance_constraints(aircraft_registration: str) -> str:
         JSON string containing maintenance constraints or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         constraints_table = dynamodb.Table(get_table_name("maintenance_constraints"))
 
         logger.info(f"Querying maintenance constraints for: {aircraft_registration}")
 
-        response = constraints_table.query(
+        items = query_all(
+            constraints_table,
             IndexName=CONSTRAINT_AIRCRAFT_INDEX,
             KeyConditionExpression="aircraft_registration = :ar",
             ExpressionAttributeValues={":ar": aircraft_registration}
         )
 
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found {len(items)} maintenance constraints for {aircraft_registration}")
-            return json.dumps({
+            return to_tool_json({
                 "aircraft_registration": aircraft_registration,
                 "constraints": items,
                 "total_constraints": len(items),
                 "data_source": "maintenance_constraints_v2"
-            }, default=str)
+            })
         else:
             return json.dumps({
                 "aircraft_registration": aircraft_registration,
@@ -432,12 +434,13 @@ def query_ground_equipment(airport_code: str, equipment_type: str) -> str:
         JSON string containing ground equipment availability
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         equipment_table = dynamodb.Table(get_table_name("ground_equipment"))
 
         logger.info(f"Querying ground equipment: {equipment_type} at {airport_code}")
 
-        response = equipment_table.query(
+        items = query_all(
+            equipment_table,
             IndexName=EQUIPMENT_AIRPORT_TYPE_INDEX,
             KeyConditionExpression="airport_code = :ac AND equipment_type = :et",
             ExpressionAttributeValues={
@@ -446,15 +449,14 @@ def query_ground_equipment(airport_code: str, equipment_type: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} {equipment_type} at {airport_code}")
-        return json.dumps({
+        return to_tool_json({
             "airport_code": airport_code,
             "equipment_type": equipment_type,
             "equipment": items,
             "total_available": len(items),
             "data_source": "ground_equipment_v2"
-        }, default=str)
+        })
 
     except Exception as e:
         logger.error(f"Error querying ground equipment: {e}")
@@ -503,8 +505,9 @@ async def analyze_maintenance(payload: dict, llm: Any, mcp_tools: list) -> dict:
         logger.info(f"Extracting flight info from prompt: {user_prompt}")
         
         try:
-            from utils.extraction import extract_with_fallback
-            flight_info = await extract_with_fallback(llm, FlightInfo, user_prompt)
+            from utils.extraction import format_flight_record, resolve_flight_info
+            flight_info = await resolve_flight_info(llm, FlightInfo, user_prompt, payload)
+            flight_record = format_flight_record(payload)
             logger.info(f"Extracted flight info: {flight_info}")
             
             # Validate extracted data
@@ -588,9 +591,9 @@ async def analyze_maintenance(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-</input>
+{flight_record}</input>
 <action>
-1. query_flight("{flight_info.flight_number}", "{flight_info.date}")
+1. query_flight("{flight_info.flight_number}", "{flight_info.date}") (skip if <flight_record> given)
 2. query_maintenance_work_orders(aircraft_registration)
 3. query_aircraft_availability(aircraft_registration, valid_from)
 4. Assess MEL status, cumulative restrictions, airworthiness
@@ -619,7 +622,7 @@ async def analyze_maintenance(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-  <other_agents>
+{flight_record}  <other_agents>
 {other_recs_xml if other_recs_xml else "    <none/>"}
   </other_agents>
 </input>
@@ -3,14 +3,16 @@
 import logging
 import json
 from typing import Any, Optional, Dict, List
-import boto3
 from datetime import datetime, timezone
 
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 
 from utils.tool_calling import invoke_with_tools
+from database.dynamodb import get_dynamodb_resource
+from database.pagination import query_all
 from database.table_config import get_table_name
+from database.tool_output import to_tool_json
 from database.constants import (
     FLIGHT_NUMBER_DATE_INDEX,
     AIRCRAFT_REGISTRATION_INDEX,
@@ -54,12 +56,13 @@ def query_flight(flight_number: str, date: str) -> str:
         JSON string containing flight record or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         flights_table = dynamodb.Table(get_table_name("flights"))
         
         logger.info(f"Querying flight: {flight_number} on {date}")
         
-        response = flights_table.query(
+        items = query_all(
+            flights_table,
             IndexName=FLIGHT_NUMBER_DATE_INDEX,
             KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
             ExpressionAttributeValues={
@@ -68,10 +71,9 @@ def query_flight(flight_number: str, date: str) -> str:
             },
         )
         
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found flight: {items[0].get('flight_id')}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"Flight not found: {flight_number} on {date}")
             return json.dumps({"error": "FLIGHT_NOT_FOUND", "message": f"Flight {flight_number} on {date} not found"})
@@ -98,12 +100,13 @@ def query_aircraft_rotation(aircraft_registration: str, start_date: str, end_dat
         JSON string containing list of flight records ordered by scheduled_departure
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         flights_table = dynamodb.Table(get_table_name("flights"))
         
         logger.info(f"Querying aircraft rotation: {aircraft_registration} from {start_date} to {end_date}")
         
-        response = flights_table.query(
+        items = query_all(
+            flights_table,
             IndexName=AIRCRAFT_ROTATION_INDEX,
             KeyConditionExpression="aircraft_registration = :ar AND scheduled_departure_utc BETWEEN :start AND :end",
             ExpressionAttributeValues={
@@ -113,12 +116,11 @@ def query_aircraft_rotation(aircraft_registration: str, start_date: str, end_dat
             },
         )
         
-        items = response.get("Items", [])
         # Sort by scheduled_departure_utc to ensure correct rotation order
         items.sort(key=lambda x: x.get("scheduled_departure_utc", ""))
         
         logger.info(f"Found {len(items)} flights in rotation for {aircraft_registration}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
         
     except Exception as e:
         logger.error(f"Error querying aircraft rotation: {e}")
@@ -139,12 +141,13 @@ def query_flights_by_aircraft(aircraft_registration: str) -> str:
         JSON string containing list of flight records
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         flights_table = dynamodb.Table(get_table_name("flights"))
         
         logger.info(f"Querying flights for aircraft: {aircraft_registration}")
         
-        response = flights_table.query(
+        items = query_all(
+            flights_table,
             IndexName=AIRCRAFT_REGISTRATION_INDEX,
             KeyConditionExpression="aircraft_registration = :ar",
             ExpressionAttributeValues={
@@ -152,9 +155,8 @@ def query_flights_by_aircraft(aircraft_registration: str) -> str:
             },
         )
         
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} flights for aircraft {aircraft_registration}")
-        return json.dumps(items, default=str)
+        return to_tool_json(items)
         
     except Exception as e:
         logger.error(f"Error querying flights by aircraft: {e}")
@@ -176,13 +178,14 @@ def query_aircraft_availability(aircraft_registration: str, date: str) -> str:
         JSON string containing aircraft availability record or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         availability_table = dynamodb.Table(get_table_name("aircraft"))
         
         logger.info(f"Querying aircraft availability: {aircraft_registration} on {date}")
         
         # Query using composite key (aircraft_registration, valid_from)
-        response = availability_table.query(
+        items = query_all(
+            availability_table,
             KeyConditionExpression="aircraft_registration = :ar AND valid_from <= :date",
             FilterExpression="valid_to >= :date",
             ExpressionAttributeValues={
@@ -191,10 +194,9 @@ def query_aircraft_availability(aircraft_registration: str, date: str) -> str:
             },
         )
         
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found availability for {aircraft_registration}: {items[0].get('status')}")
-            return json.dumps(items[0], default=str)
+            return to_tool_json(items[0])
         else:
             logger.warning(f"No availability record found for {aircraft_registration} on {date}")
             return json.dumps({"error": "AVAILABILITY_NOT_FOUND", "message": f"No availability record for {aircraft_registration} on {date}"})
@@ -220,12 +222,13 @@ def query_oal_flights(origin: str, destination: str, date: str) -> str:
         JSON string containing list of OAL flight options or error
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         oal_table = dynamodb.Table(get_table_name("oal_flights"))
 
         logger.info(f"Querying OAL flights: {origin} → {destination} on {date}")
 
-        response = oal_table.query(
+        items = query_all(
+            oal_table,
             IndexName=ROUTE_INDEX,
             KeyConditionExpression="origin = :o AND destination = :d",
             FilterExpression="flight_date = :fd",
@@ -236,16 +239,15 @@ def query_oal_flights(origin: str, destination: str, date: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} OAL flights for {origin}-{destination}")
-        return json.dumps({
+        return to_tool_json({
             "origin": origin,
             "destination": destination,
             "date": date,
             "oal_flights": items,
             "total_options": len(items),
             "data_source": "oal_flights_v2"
-        }, default=str)
+        })
 
     except Exception as e:
         logger.error(f"Error querying OAL flights: {e}")
@@ -267,12 +269,13 @@ def query_airport_slots(airport_code: str, flight_date: str) -> str:
         JSON string containing slot availability data
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         slots_table = dynamodb.Table(get_table_name("airport_slots"))
 
         logger.info(f"Querying airport slots: {airport_code} on {flight_date}")
 
-        response = slots_table.query(
+        items = query_all(
+            slots_table,
             IndexName=SLOT_AIRPORT_INDEX,
             KeyConditionExpression="airport_code = :ac",
             FilterExpression="slot_date = :sd",
@@ -282,15 +285,14 @@ def query_airport_slots(airport_code: str, flight_date: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
         logger.info(f"Found {len(items)} slots at {airport_code}")
-        return json.dumps({
+        return to_tool_json({
             "airport_code": airport_code,
             "date": flight_date,
             "slots": items,
             "total_slots": len(items),
             "data_source": "airport_slots_v2"
-        }, default=str)
+        })
 
     except Exception as e:
         logger.error(f"Error querying airport slots: {e}")
@@ -311,7 +313,7 @@ def query_minimum_connection_times(airport_code: str, connection_type: str) -> s
         JSON string containing MCT data
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         mct_table = dynamodb.Table(get_table_name("minimum_connection_times"))
 
         logger.info(f"Querying MCT: {airport_code} / {connection_type}")
@@ -323,7 +325,7 @@ def query_minimum_connection_times(airport_code: str, connection_type: str) -> s
         item = response.get("Item")
         if item:
             logger.info(f"Found MCT for {airport_code}/{connection_type}")
-            return json.dumps(item, default=str)
+            return to_tool_json(item)
         else:
             return json.dumps({
                 "airport_code": airport_code,
@@ -351,25 +353,25 @@ def query_interline_agreements(partner_airline: str) -> str:
         JSON string containing interline agreement details
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         agreements_table = dynamodb.Table(get_table_name("interline_agreements"))
 
         logger.info(f"Querying interline agreement with: {partner_airline}")
 
-        response = agreements_table.query(
+        items = query_all(
+            agreements_table,
             IndexName=PARTNER_AIRLINE_INDEX,
             KeyConditionExpression="partner_airline = :pa",
             ExpressionAttributeValues={":pa": partner_airline}
         )
 
-        items = response.get("Items", [])
         if items:
             logger.info(f"Found interline agreement with {partner_airline}")
-            return json.dumps({
+            return to_tool_json({
                 "partner_airline": partner_airline,
                 "agreements": items,
                 "data_source": "interline_agreements_v2"
-            }, default=str)
+            })
         else:
             return json.dumps({
                 "partner_airline": partner_airline,
@@ -520,8 +522,9 @@ async def analyze_network(payload: dict, llm: Any, mcp_tools: list) -> dict:
         
         # Step 1: Extract flight info
         try:
-            from utils.extraction import extract_with_fallback
-            flight_info = await extract_with_fallback(llm, FlightInfo, user_prompt)
+            from utils.extraction import format_flight_record, resolve_flight_info
+            flight_info = await resolve_flight_info(llm, FlightInfo, user_prompt, payload)
+            flight_record = format_flight_record(payload)
             extracted_flight_info = {
                 "flight_number": flight_info.flight_number,
                 "date": flight_info.date,
@@ -550,9 +553,9 @@ async def analyze_network(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-</input>
+{flight_record}</input>
 <action>
-1. query_flight("{flight_info.flight_number}", "{flight_info.date}")
+1. query_flight("{flight_info.flight_number}", "{flight_info.date}") (skip if <flight_record> given)
 2. query_aircraft_rotation(aircraft_registration, start_date, end_date)
 3. Calculate propagation_impact, identify connections at risk
 4. Generate recovery_scenarios with scores
@@ -579,7 +582,7 @@ async def analyze_network(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-  <other_agents>
+{flight_record}  <other_agents>
 {other_recs_xml if other_recs_xml else "    <none/>"}
   </other_agents>
 </input>
@@ -1,5 +1,6 @@
 """Regulatory Agent Module"""
 
 from .agent import analyze_regulatory
+from .curfew import evaluate_curfew, evaluate_curfew_batch
 
-__all__ = ["analyze_regulatory"]
+__all__ = ["analyze_regulatory", "evaluate_curfew", "evaluate_curfew_batch"]
@@ -2,21 +2,24 @@
 
 import logging
 import json
-from typing import Any
-import boto3
+from typing import Any, List
 from datetime import datetime, timezone
 
 from langchain_core.tools import tool
 from langchain_core.messages import HumanMessage
 
 from utils.tool_calling import invoke_with_tools
+from database.dynamodb import get_dynamodb_resource
+from database.pagination import query_all
 from database.table_config import get_table_name
+from database.tool_output import to_tool_json
 from database.constants import (
     FLIGHT_NUMBER_DATE_INDEX,
     AIRCRAFT_REGISTRATION_INDEX,
     SLOT_AIRPORT_INDEX,
 )
 from agents.schemas import FlightInfo, RegulatoryOutput
+from agents.regulatory.curfew import evaluate_curfew, evaluate_curfew_batch
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +52,7 @@ QWELW: Weather warning | QOBXX: Obstacle | QFAXX: Aerodrome closed
 <curfew_rules>
 LHR: 23:00-06:00 local (no arrivals/departures, emergency only)
 FRA: 23:00-05:00 local (noise restrictions)
-Calculate: UTC → local timezone, apply 15min buffer
+Curfew tools convert UTC → local and apply the 15min buffer: use their compliance as-is
 Violation: Arrival after curfew start = BINDING constraint
 </curfew_rules>
 
@@ -76,7 +79,7 @@ Cabotage: Domestic carriage prohibited without rights
 - Regulatory constraints NON-NEGOTIABLE
 - Tool failure → error response
 - Multi-violations: Report ALL (blocking + advisory)
-- Timezone conversions: UTC → local for curfews
+- Compare delay options with query_curfew_status_batch (one call)
 </rules>
 
 <output_format>
@@ -123,15 +126,15 @@ def query_flight_regulatory(flight_number: str, date: str) -> str:
     """
     try:
         import json
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         flights_table = dynamodb.Table(get_table_name("flights"))
 
-        response = flights_table.query(
+        items = query_all(
+            flights_table,
             IndexName=FLIGHT_NUMBER_DATE_INDEX,
             KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
             ExpressionAttributeValues={":fn": flight_number, ":sd": date},
         )
-        items = response.get("Items", [])
 
         if not items:
             return json.dumps({
@@ -141,7 +144,7 @@ def query_flight_regulatory(flight_number: str, date: str) -> str:
                 "date": date
             })
 
-        return json.dumps(items[0], default=str)
+        return to_tool_json(items[0])
     except Exception as e:
         logger.error(f"Error in query_flight_regulatory: {e}")
         return json.dumps({"error": type(e).__name__, "message": str(e)})
@@ -160,7 +163,7 @@ def query_weather_forecast(airport_code: str, forecast_time: str) -> str:
     """
     try:
         import json
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         weather_table = dynamodb.Table(get_table_name("weather"))
 
         response = weather_table.get_item(
@@ -173,7 +176,7 @@ def query_weather_forecast(airport_code: str, forecast_time: str) -> str:
                 "message": f"Weather data not found for {airport_code} at {forecast_time}"
             })
 
-        return json.dumps(response["Item"], default=str)
+        return to_tool_json(response["Item"])
     except Exception as e:
         logger.error(f"Error in query_weather_forecast: {e}")
         return json.dumps({"error": type(e).__name__, "message": str(e)})
@@ -200,25 +203,47 @@ def query_notams(airport_code: str) -> str:
     })
 
 
+def _get_curfew(airport_code: str) -> dict:
+    """Load an airport's curfew record (empty dict when the airport has no curfew)."""
+    dynamodb = get_dynamodb_resource()
+    curfews_table = dynamodb.Table(get_table_name("airport_curfews"))
+    response = curfews_table.get_item(Key={"airport_code": airport_code})
+    return response.get("Item") or {}
+
+
+def _curfew_summary(airport_code: str, curfew: dict) -> dict:
+    """Common curfew fields returned by the curfew tools."""
+    return {
+        "airport": airport_code,
+        "curfew_start_local": curfew.get("curfew_start", "N/A"),
+        "curfew_end_local": curfew.get("curfew_end", "N/A"),
+        "timezone": curfew.get("timezone", "UTC"),
+        "curfew_type": curfew.get("curfew_type", "STANDARD"),
+        "exceptions": curfew.get("exceptions", []),
+        "data_source": "airport_curfews_v2"
+    }
+
+
 @tool
-def query_curfew_status(airport_code: str, arrival_time_utc: str) -> str:
+def query_curfew_status(airport_code: str, arrival_time_utc: str, operation_type: str = "") -> str:
     """Check curfew compliance for arrival time by querying airport_curfews_v2 table.
 
+    Converts the arrival to airport local time and checks it against the curfew
+    window (including overnight windows, the 15min buffer and curfew exceptions).
+
     Args:
         airport_code: Airport IATA code (e.g., LHR) or ICAO code (e.g., EGLL)
         arrival_time_utc: Arrival time in ISO format UTC
+        operation_type: Optional operation category matched against curfew exceptions (e.g., emergency)
 
     Returns:
-        JSON string with curfew compliance status from database
+        JSON string with definitive compliance (COMPLIANT|VIOLATION), local arrival time
+        and margin_minutes before curfew start (negative when inside the curfew)
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-        curfews_table = dynamodb.Table(get_table_name("airport_curfews"))
-
-        # Query by airport code
-        response = curfews_table.get_item(Key={"airport_code": airport_code})
+        curfew = _get_curfew(airport_code)
 
-        if "Item" not in response:
+        if not curfew:
             # No curfew record means no restrictions
             return json.dumps({
                 "airport": airport_code,
@@ -228,19 +253,9 @@ def query_curfew_status(airport_code: str, arrival_time_utc: str) -> str:
                 "data_source": "airport_curfews_v2"
             })
 
-        curfew = response["Item"]
-        return json.dumps({
-            "airport": airport_code,
-            "curfew_start_local": curfew.get("curfew_start", "N/A"),
-            "curfew_end_local": curfew.get("curfew_end", "N/A"),
-            "timezone": curfew.get("timezone", "UTC"),
-            "arrival_utc": arrival_time_utc,
-            "curfew_type": curfew.get("curfew_type", "STANDARD"),
-            "exceptions": curfew.get("exceptions", []),
-            "compliance": "CHECK_REQUIRED",
-            "message": "Convert UTC to local time and verify against curfew window",
-            "data_source": "airport_curfews_v2"
-        }, default=str)
+        result = _curfew_summary(airport_code, curfew)
+        result.update(evaluate_curfew(curfew, arrival_time_utc, operation_type or None))
+        return to_tool_json(result)
 
     except Exception as e:
         logger.error(f"Error querying curfew status: {e}")
@@ -251,6 +266,53 @@ def query_curfew_status(airport_code: str, arrival_time_utc: str) -> str:
         })
 
 
+@tool
+def query_curfew_status_batch(
+    airport_code: str, arrival_times_utc: List[str], operation_type: str = ""
+) -> str:
+    """Check curfew compliance for several candidate arrival times in one call.
+
+    Use this to compare delay options: each arrival is evaluated like
+    query_curfew_status against a single curfew lookup.
+
+    Args:
+        airport_code: Airport IATA code (e.g., LHR) or ICAO code (e.g., EGLL)
+        arrival_times_utc: Candidate arrival times in ISO format UTC
+        operation_type: Optional operation category matched against curfew exceptions (e.g., emergency)
+
+    Returns:
+        JSON string with per-arrival compliance and margin_minutes, counts and the
+        latest compliant arrival
+    """
+    try:
+        curfew = _get_curfew(airport_code)
+
+        if not curfew:
+            return json.dumps({
+                "airport": airport_code,
+                "curfew": "NONE",
+                "results": [
+                    {"arrival_utc": arrival, "compliance": "COMPLIANT"} for arrival in arrival_times_utc
+                ],
+                "compliant_count": len(arrival_times_utc),
+                "violation_count": 0,
+                "message": "No curfew restrictions found for this airport",
+                "data_source": "airport_curfews_v2"
+            })
+
+        result = _curfew_summary(airport_code, curfew)
+        result.update(evaluate_curfew_batch(curfew, arrival_times_utc, operation_type or None))
+        return to_tool_json(result)
+
+    except Exception as e:
+        logger.error(f"Error querying curfew status batch: {e}")
+        return json.dumps({
+            "error": type(e).__name__,
+            "message": f"Failed to query curfew data: {str(e)}",
+            "airport": airport_code
+        })
+
+
 @tool
 def query_airport_slots(airport_code: str, flight_date: str) -> str:
     """Query airport slot availability for coordinated airports (Level 3).
@@ -263,11 +325,12 @@ def query_airport_slots(airport_code: str, flight_date: str) -> str:
         JSON string with slot availability and coordination requirements
     """
     try:
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb = get_dynamodb_resource()
         slots_table = dynamodb.Table(get_table_name("airport_slots"))
 
         # Query slots by airport and date using GSI
-        response = slots_table.query(
+        items = query_all(
+            slots_table,
             IndexName=SLOT_AIRPORT_INDEX,
             KeyConditionExpression="airport_code = :ac",
             FilterExpression="slot_date = :sd",
@@ -277,7 +340,6 @@ def query_airport_slots(airport_code: str, flight_date: str) -> str:
             }
         )
 
-        items = response.get("Items", [])
 
         if not items:
             return json.dumps({
@@ -289,13 +351,13 @@ def query_airport_slots(airport_code: str, flight_date: str) -> str:
                 "data_source": "airport_slots_v2"
             })
 
-        return json.dumps({
+        return to_tool_json({
             "airport": airport_code,
             "date": flight_date,
             "slots": items,
             "total_slots": len(items),
             "data_source": "airport_slots_v2"
-        }, default=str)
+        })
 
     except Exception as e:
         logger.error(f"Error querying airport slots: {e}")
@@ -339,8 +401,9 @@ async def analyze_regulatory(payload: dict, llm: Any, mcp_tools: list) -> dict:
 
         # Extract flight info
         try:
-            from utils.extraction import extract_with_fallback
-            flight_info = await extract_with_fallback(llm, FlightInfo, user_prompt)
+            from utils.extraction import format_flight_record, resolve_flight_info
+            flight_info = await resolve_flight_info(llm, FlightInfo, user_prompt, payload)
+            flight_record = format_flight_record(payload)
             extracted_flight_info = {
                 "flight_number": flight_info.flight_number,
                 "date": flight_info.date,
@@ -365,6 +428,7 @@ async def analyze_regulatory(payload: dict, llm: Any, mcp_tools: list) -> dict:
             query_weather_forecast,
             query_notams,
             query_curfew_status,
+            query_curfew_status_batch,
             query_airport_slots
         ]
 
@@ -378,9 +442,9 @@ async def analyze_regulatory(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-</input>
+{flight_record}</input>
 <action>
-1. query_flight_regulatory("{flight_info.flight_number}", "{flight_info.date}")
+1. query_flight_regulatory("{flight_info.flight_number}", "{flight_info.date}") (skip if <flight_record> given)
 2. query_notams(destination_icao)
 3. query_curfew_status(destination_iata, arrival_utc)
 4. query_airport_slots(destination_iata, "{flight_info.date}")
@@ -407,14 +471,14 @@ async def analyze_regulatory(payload: dict, llm: Any, mcp_tools: list) -> dict:
     <date>{flight_info.date}</date>
     <event>{flight_info.disruption_event}</event>
   </extracted>
-  <other_agents>
+{flight_record}  <other_agents>
 {other_recs_xml if other_recs_xml else "    <none/>"}
   </other_agents>
 </input>
 <action>
 1. Review other agents' recommendations
 2. Decide: REVISE | CONFIRM | STRENGTHEN
-3. If timing changed → recalculate curfew compliance
+3. If timing changed → query_curfew_status with the new arrival time
 4. Return AgentResponse with revision_status
 </action>"""
 
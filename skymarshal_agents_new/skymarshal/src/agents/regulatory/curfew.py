@@ -0,0 +1,204 @@
+"""Deterministic curfew compliance evaluation for the regulatory agent.
+
+Converts UTC arrival times to the airport's local time and checks them against
+the curfew window from airport_curfews_v2 (including overnight windows, the
+<curfew_rules> buffer and the exceptions list), so compliance is decided
+exactly instead of by the LLM.
+"""
+
+import logging
+import re
+from datetime import datetime, time, timedelta, timezone, tzinfo
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger(__name__)
+
+# Arrivals within this many minutes of curfew start count as violations
+CURFEW_BUFFER_MINUTES = 15
+
+_UTC_OFFSET_PATTERN = re.compile(r"^(?:UTC|GMT)?\s*([+-])(\d{1,2})(?::?(\d{2}))?$", re.IGNORECASE)
+
+
+def resolve_timezone(name: Optional[str]) -> tzinfo:
+    """
+    Resolve an airport timezone.
+
+    Accepts IANA names (e.g., "Europe/London") and fixed offsets
+    (e.g., "UTC+4", "+05:30"). Missing values default to UTC.
+
+    Raises:
+        ValueError: If the timezone cannot be resolved
+    """
+    if not name or str(name).strip().upper() in ("UTC", "GMT", "Z"):
+        return timezone.utc
+    name = str(name).strip()
+    match = _UTC_OFFSET_PATTERN.match(name)
+    if match:
+        sign, hours, minutes = match.groups()
+        offset = timedelta(hours=int(hours), minutes=int(minutes or 0))
+        return timezone(-offset if sign == "-" else offset)
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise ValueError(f"Unknown timezone: {name}") from e
+
+
+def _parse_local_time(value: Any) -> time:
+    """Parse a curfew boundary such as "23:00", "2300" or "23:00:00"."""
+    text = str(value).strip()
+    if re.fullmatch(r"\d{4}", text):
+        text = f"{text[:2]}:{text[2:]}"
+    return time.fromisoformat(text)
+
+
+def _parse_utc(value: str) -> datetime:
+    """Parse an ISO 8601 UTC timestamp (naive values are treated as UTC)."""
+    dt = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _matching_exception(exceptions: Any, operation_type: Optional[str]) -> Optional[str]:
+    """Find a curfew exception covering the operation type (e.g., "emergency")."""
+    if not operation_type or not exceptions:
+        return None
+    if isinstance(exceptions, (str, dict)):
+        exceptions = [exceptions]
+    wanted = operation_type.strip().lower()
+    for exception in exceptions:
+        if isinstance(exception, dict):
+            label = exception.get("type") or exception.get("category") or exception.get("name") or ""
+        else:
+            label = exception
+        if wanted and wanted in str(label).lower():
+            return str(label)
+    return None
+
+
+def evaluate_curfew(
+    curfew: Dict[str, Any],
+    arrival_time_utc: str,
+    operation_type: Optional[str] = None,
+    buffer_minutes: int = CURFEW_BUFFER_MINUTES
+) -> Dict[str, Any]:
+    """
+    Evaluate one arrival time against an airport curfew record.
+
+    The curfew window [curfew_start, curfew_end) is in local time and may wrap
+    midnight (e.g., 23:00-06:00). margin_minutes is the time from arrival to the
+    next curfew start (negative when arriving inside the window). Arrivals inside
+    the window, or less than buffer_minutes before it, are violations unless
+    operation_type matches an entry in the curfew's exceptions list.
+
+    Args:
+        curfew: airport_curfews_v2 item with curfew_start, curfew_end, timezone, exceptions
+        arrival_time_utc: Arrival time in ISO 8601 UTC
+        operation_type: Optional operation category checked against exceptions (e.g., "emergency")
+        buffer_minutes: Required margin before curfew start
+
+    Returns:
+        dict: Arrival in UTC and local time, compliance (COMPLIANT|VIOLATION),
+            margin_minutes, minutes_until_curfew_end and any exception applied
+
+    Raises:
+        ValueError: If the arrival time, curfew times or timezone cannot be parsed
+
+    Example:
+        >>> evaluate_curfew(
+        ...     {"curfew_start": "23:00", "curfew_end": "06:00", "timezone": "Europe/London"},
+        ...     "2026-01-20T22:30:00Z"
+        ... )["margin_minutes"]
+        30
+    """
+    tz = resolve_timezone(curfew.get("timezone"))
+    start = _parse_local_time(curfew["curfew_start"])
+    end = _parse_local_time(curfew["curfew_end"])
+    arrival_local = _parse_utc(arrival_time_utc).astimezone(tz)
+
+    # Curfew start on the arrival's local date and the window containing/after it
+    day = arrival_local.date()
+    window_start = datetime.combine(day, start, tzinfo=tz)
+    overnight = end <= start
+    if overnight and arrival_local.time() < end:
+        # Early-morning arrival: inside the window that started the previous evening
+        window_start -= timedelta(days=1)
+    window_end = datetime.combine(window_start.date(), end, tzinfo=tz)
+    if overnight:
+        window_end += timedelta(days=1)
+    if arrival_local >= window_end:
+        # After today's window closed: the next curfew starts tomorrow
+        window_start += timedelta(days=1)
+        window_end += timedelta(days=1)
+
+    # Compare in UTC: aware datetimes sharing a tzinfo subtract as wall-clock time (DST)
+    arrival_utc = arrival_local.astimezone(timezone.utc)
+    window_start_utc = window_start.astimezone(timezone.utc)
+    window_end_utc = window_end.astimezone(timezone.utc)
+    in_curfew = window_start_utc <= arrival_utc < window_end_utc
+    margin = int((window_start_utc - arrival_utc).total_seconds() // 60)
+    minutes_until_end = int((window_end_utc - arrival_utc).total_seconds() // 60) if in_curfew else 0
+
+    exception = _matching_exception(curfew.get("exceptions"), operation_type)
+    violation = in_curfew or margin < buffer_minutes
+    if violation and exception:
+        compliance = "COMPLIANT"
+        reason = f"Curfew exception applies: {exception}"
+    elif in_curfew:
+        compliance = "VIOLATION"
+        reason = (
+            f"Arrival {arrival_local:%H:%M} local is inside curfew "
+            f"{start:%H:%M}-{end:%H:%M} ({minutes_until_end} min until curfew ends)"
+        )
+    elif violation:
+        compliance = "VIOLATION"
+        reason = (
+            f"Arrival {arrival_local:%H:%M} local is {margin} min before curfew "
+            f"{start:%H:%M}, inside the {buffer_minutes} min buffer"
+        )
+    else:
+        compliance = "COMPLIANT"
+        reason = f"Arrival {arrival_local:%H:%M} local is {margin} min before curfew {start:%H:%M}"
+
+    return {
+        "arrival_utc": arrival_time_utc,
+        "arrival_local": arrival_local.isoformat(),
+        "compliance": compliance,
+        "in_curfew": in_curfew,
+        "margin_minutes": margin,
+        "minutes_until_curfew_end": minutes_until_end,
+        "exception_applied": exception if violation else None,
+        "reason": reason,
+    }
+
+
+def evaluate_curfew_batch(
+    curfew: Dict[str, Any],
+    arrival_times_utc: List[str],
+    operation_type: Optional[str] = None,
+    buffer_minutes: int = CURFEW_BUFFER_MINUTES
+) -> Dict[str, Any]:
+    """
+    Evaluate several candidate arrival times against one curfew record.
+
+    Unparseable arrival times are reported per entry with an 'error' key.
+
+    Returns:
+        dict: Per-arrival results plus counts and the latest compliant arrival
+    """
+    results = []
+    for arrival in arrival_times_utc:
+        try:
+            results.append(evaluate_curfew(curfew, arrival, operation_type, buffer_minutes))
+        except ValueError as e:
+            results.append({"arrival_utc": arrival, "error": "invalid_arrival_time", "message": str(e)})
+
+    compliant = [r for r in results if r.get("compliance") == "COMPLIANT"]
+    latest_compliant = max(
+        compliant, key=lambda r: _parse_utc(r["arrival_utc"]), default=None
+    )
+    return {
+        "results": results,
+        "compliant_count": len(compliant),
+        "violation_count": sum(1 for r in results if r.get("compliance") == "VIOLATION"),
+        "latest_compliant_arrival_utc": latest_compliant["arrival_utc"] if latest_compliant else None,
+    }
@@ -10,6 +10,8 @@ from typing import Dict, List, Optional
 import boto3
 from botocore.exceptions import ClientError
 
+from database.pagination import query_all
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,14 +75,13 @@ class SessionManager:
     def get_session_history(self, session_id: str, limit: int = 50) -> List[dict]:
         """Retrieve session history."""
         try:
-            response = self.table.query(
+            interactions = query_all(
+                self.table,
                 KeyConditionExpression='session_id = :sid',
                 ExpressionAttributeValues={':sid': session_id},
                 ScanIndexForward=False,
-                Limit=limit
+                limit=limit
             )
-            
-            interactions = response.get('Items', [])
             logger.info(f"Retrieved {len(interactions)} interactions")
             return interactions
         
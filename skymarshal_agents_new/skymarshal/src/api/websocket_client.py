@@ -86,7 +86,7 @@ class AgentCoreWebSocketClient:
         
         try:
             # Prepare the payload
-            payload = json.dumps({"prompt": prompt}).encode('utf-8')
+            payload = json.dumps({"prompt": prompt, "stream": True}).encode('utf-8')
             
             # Generate session ID if not provided (must be at least 33 characters)
             if not session_id:
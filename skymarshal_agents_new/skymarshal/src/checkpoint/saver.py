@@ -6,9 +6,14 @@ import json
 import logging
 import asyncio
 import boto3
+from botocore.exceptions import ClientError
 from typing import Any, Optional, List, Dict
 from datetime import datetime, timedelta
 
+from database.async_dynamodb import ExecutorTable, get_async_dynamodb_client, run_blocking
+from database.local_backend import get_local_dynamodb, local_backend_enabled
+from database.pagination import aquery_all
+
 logger = logging.getLogger(__name__)
 
 # Size threshold for routing to S3 (350KB)
@@ -57,7 +62,14 @@ class CheckpointSaver:
         
         try:
             # Initialize DynamoDB
-            self.dynamodb = boto3.resource('dynamodb', region_name=region)
+            if local_backend_enabled():
+                # Local store keeps large checkpoints inline (no S3 offload)
+                self.dynamodb = get_local_dynamodb()
+                self.s3_bucket = None
+                region = "local"
+            else:
+                self.dynamodb = boto3.resource('dynamodb', region_name=region)
+            self.table_name = table_name
             self.table = self.dynamodb.Table(table_name)
             self.backend = "DynamoDB"
             logger.info(f"DynamoDB backend initialized: table={table_name}, region={region}")
@@ -110,6 +122,14 @@ class CheckpointSaver:
                 logger.info(f"Retrying in {total_delay:.2f}s...")
                 await asyncio.sleep(total_delay)
 
+    async def _async_table(self):
+        """Non-blocking checkpoint table handle (aioboto3, or boto3 on the data-access pool)"""
+        client = get_async_dynamodb_client()
+        if client.native:
+            # Raw table: checkpoint writes must not invalidate the agents' request cache
+            return (await client.table(self.table_name)).wrapped
+        return ExecutorTable(self.table)
+
     async def _save_to_s3(self, thread_id: str, checkpoint_id: str, data: Dict[str, Any]) -> str:
         """Save large checkpoint to S3 and return reference"""
         if not self.s3_client or not self.s3_bucket:
@@ -119,7 +139,8 @@ class CheckpointSaver:
         
         try:
             # Upload to S3
-            self.s3_client.put_object(
+            await run_blocking(
+                self.s3_client.put_object,
                 Bucket=self.s3_bucket,
                 Key=s3_key,
                 Body=json.dumps(data),
@@ -138,13 +159,15 @@ class CheckpointSaver:
         if not self.s3_client or not self.s3_bucket:
             raise ValueError("S3 not configured")
         
-        try:
+        def read_object() -> bytes:
             response = self.s3_client.get_object(
                 Bucket=self.s3_bucket,
                 Key=s3_key
             )
-            
-            data = json.loads(response['Body'].read())
+            return response['Body'].read()
+
+        try:
+            data = json.loads(await run_blocking(read_object))
             logger.debug(f"Checkpoint loaded from S3: s3://{self.s3_bucket}/{s3_key}")
             return data
             
@@ -241,13 +264,16 @@ class CheckpointSaver:
             
             # Save to DynamoDB with conditional write to prevent overwrites
             # Use attribute_not_exists to ensure we don't overwrite existing checkpoints
+            table = await self._async_table()
             try:
-                self.table.put_item(
+                await table.put_item(
                     Item=item,
                     ConditionExpression="attribute_not_exists(PK) AND attribute_not_exists(SK)"
                 )
                 logger.debug(f"Checkpoint saved: thread={thread_id}, checkpoint={checkpoint_id}, size={size_bytes}")
-            except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    raise
                 # Checkpoint already exists - this is expected for concurrent writes
                 # Generate new timestamp to create unique checkpoint
                 logger.warning(f"Checkpoint {checkpoint_id} already exists, creating new version")
@@ -255,7 +281,7 @@ class CheckpointSaver:
                 sk = f"CHECKPOINT#{checkpoint_id}#{timestamp}"
                 item["SK"] = sk
                 item["timestamp"] = timestamp
-                self.table.put_item(Item=item)
+                await table.put_item(Item=item)
                 logger.debug(f"Checkpoint saved with new timestamp: thread={thread_id}, checkpoint={checkpoint_id}")
             
         except Exception as e:
@@ -298,10 +324,11 @@ class CheckpointSaver:
             
             # Production mode - DynamoDB
             pk = f"THREAD#{thread_id}"
+            table = await self._async_table()
             
             if checkpoint_id:
                 # Query specific checkpoint
-                response = self.table.query(
+                response = await table.query(
                     KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
                     ExpressionAttributeValues={
                         ":pk": pk,
@@ -312,7 +339,7 @@ class CheckpointSaver:
                 )
             else:
                 # Get latest checkpoint
-                response = self.table.query(
+                response = await table.query(
                     KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
                     ExpressionAttributeValues={
                         ":pk": pk,
@@ -393,17 +420,18 @@ class CheckpointSaver:
             # Production mode - DynamoDB
             pk = f"THREAD#{thread_id}"
             
-            response = self.table.query(
+            # Only the listing fields are read, not the (possibly large) checkpoint state
+            items = await aquery_all(
+                await self._async_table(),
                 KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
                 ExpressionAttributeValues={
                     ":pk": pk,
                     ":sk_prefix": "CHECKPOINT#"
                 },
-                ScanIndexForward=True  # Chronological order
+                ScanIndexForward=True,  # Chronological order
+                projection=["thread_id", "checkpoint_id", "timestamp", "metadata", "s3_reference"],
             )
             
-            items = response.get('Items', [])
-            
             # Convert to checkpoint metadata
             checkpoints = []
             for item in items:
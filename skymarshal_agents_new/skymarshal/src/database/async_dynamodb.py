@@ -0,0 +1,864 @@
+"""Native asyncio DynamoDB data-access layer
+
+AsyncDynamoDBClient mirrors the DynamoDBClient accessor surface with
+coroutines, so the orchestrator and async tools can overlap their DynamoDB
+I/O instead of serializing on blocking boto3 sockets inside coroutines.
+
+When aioboto3 is installed, requests go through aiobotocore's non-blocking
+HTTP stack (one resource per event loop). Without it, the same interface runs
+the pooled boto3 resource on a bounded data-access thread pool. Either way
+reads are served through the request cache and reference cache, sharing
+entries with the synchronous client.
+
+Usage:
+    from database.async_dynamodb import get_async_dynamodb_client
+
+    db = get_async_dynamodb_client()
+    flight, roster = await asyncio.gather(
+        db.get_flight(flight_id),
+        db.query_crew_roster_by_flight(flight_id),
+    )
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+try:
+    from database.dynamodb import (
+        AWS_REGION,
+        DYNAMODB_MAX_POOL_CONNECTIONS,
+        BatchGetResult,
+        DecimalEncoder,
+        DynamoDBClient,
+        batch_get_all,
+    )
+    from database.local_backend import local_backend_enabled
+    from database.pagination import aquery_all, ascan_all
+    from database.reference_cache import get_reference_cache, is_reference_table
+    from database.request_cache import (
+        CACHED_READ_OPERATIONS,
+        INVALIDATING_WRITE_OPERATIONS,
+        _make_key,
+        get_request_cache,
+    )
+    from database.summaries import summarize_cargo, summarize_passengers, with_records
+    from database.table_config import TABLE_VERSION, TableVersion, get_table_name, is_v2_enabled
+    from database.tool_output import compact_output_enabled, to_tool_json
+except ImportError:
+    from dynamodb import (
+        AWS_REGION,
+        DYNAMODB_MAX_POOL_CONNECTIONS,
+        BatchGetResult,
+        DecimalEncoder,
+        DynamoDBClient,
+        batch_get_all,
+    )
+    from local_backend import local_backend_enabled
+    from pagination import aquery_all, ascan_all
+    from reference_cache import get_reference_cache, is_reference_table
+    from request_cache import (
+        CACHED_READ_OPERATIONS,
+        INVALIDATING_WRITE_OPERATIONS,
+        _make_key,
+        get_request_cache,
+    )
+    from summaries import summarize_cargo, summarize_passengers, with_records
+    from table_config import TABLE_VERSION, TableVersion, get_table_name, is_v2_enabled
+    from tool_output import compact_output_enabled, to_tool_json
+
+logger = logging.getLogger(__name__)
+
+try:
+    import aioboto3
+    from aiobotocore.config import AioConfig
+except ImportError:
+    aioboto3 = None
+    AioConfig = None
+
+# Use aioboto3 when installed; set ASYNC_DYNAMODB_NATIVE=false to force the thread pool
+ASYNC_DYNAMODB_NATIVE = os.getenv("ASYNC_DYNAMODB_NATIVE", "true").lower() == "true"
+
+# Threads for blocking data access when aioboto3 is unavailable (and for S3 /
+# Bedrock calls); matches the HTTP connection pool so no call waits on a socket
+DATA_ACCESS_MAX_WORKERS = int(os.getenv("DATA_ACCESS_MAX_WORKERS", str(DYNAMODB_MAX_POOL_CONNECTIONS)))
+
+T = TypeVar("T")
+
+_data_access_executor: Optional[ThreadPoolExecutor] = None
+_data_access_executor_lock = threading.Lock()
+
+
+def _get_data_access_executor() -> ThreadPoolExecutor:
+    """Get the shared, bounded pool for blocking AWS SDK calls."""
+    global _data_access_executor
+    if _data_access_executor is None:
+        with _data_access_executor_lock:
+            if _data_access_executor is None:
+                _data_access_executor = ThreadPoolExecutor(
+                    max_workers=DATA_ACCESS_MAX_WORKERS, thread_name_prefix="data-access"
+                )
+    return _data_access_executor
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking AWS SDK call without blocking the event loop.
+
+    The call runs on the bounded data-access pool in a copy of the caller's
+    context, so request-scoped state (e.g. the request cache) stays visible.
+
+    Args:
+        func: Blocking callable (e.g. table.query, s3_client.get_object)
+        *args, **kwargs: Arguments for func
+
+    Returns:
+        The result of func
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_get_data_access_executor(), call)
+
+
+class ExecutorTable:
+    """Async facade over a boto3 Table resource, running calls on the data-access pool."""
+
+    def __init__(self, table: Any):
+        self._table = table
+        self.table_name = str(getattr(table, "table_name", getattr(table, "name", table)))
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying (request-cached) boto3 Table."""
+        return self._table
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._table, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return await run_blocking(attr, *args, **kwargs)
+        return call
+
+
+class AsyncCachedTable:
+    """
+    aioboto3 Table whose reads are request-cached (or reference-cached).
+
+    Uses the same cache keys as CachedTable, so the synchronous and async
+    clients share entries within a request.
+    """
+
+    def __init__(self, table: Any, table_name: str):
+        self._table = table
+        self.table_name = table_name
+        self.is_reference = is_reference_table(table_name)
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying aioboto3 Table."""
+        return self._table
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._table, name)
+        if name in CACHED_READ_OPERATIONS:
+            return self._cached_read(name, attr)
+        if name == "batch_writer":
+            return self._batch_writer(attr)
+        if name in INVALIDATING_WRITE_OPERATIONS:
+            return self._invalidating_write(attr)
+        return attr
+
+    def _invalidate(self) -> None:
+        cache = get_request_cache()
+        if cache is not None:
+            cache.invalidate()
+        if self.is_reference:
+            get_reference_cache().invalidate(self.table_name)
+
+    def _invalidating_write(self, method: Callable) -> Callable:
+        """Wrap a write so the cache is invalidated once it has completed."""
+        @functools.wraps(method)
+        async def write(*args, **kwargs):
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self._invalidate()
+        return write
+
+    def _batch_writer(self, method: Callable) -> Callable:
+        """Wrap batch_writer() so the cache is invalidated once the batch is flushed."""
+        @functools.wraps(method)
+        def batch_writer(*args, **kwargs):
+            return _AsyncInvalidatingBatchWriter(method(*args, **kwargs), self._invalidate)
+        return batch_writer
+
+    def _cached_read(self, operation: str, method: Callable) -> Callable:
+        async def read(**kwargs):
+            if self.is_reference and operation != "batch_get_item":
+                return await get_reference_cache().aget_or_load(
+                    self.table_name, operation, kwargs, lambda: method(**kwargs)
+                )
+            cache = get_request_cache()
+            if cache is None:
+                return await method(**kwargs)
+            key = _make_key(f"table:{self.table_name}", operation, kwargs)
+            return await cache.aget_or_load(key, lambda: method(**kwargs))
+        return read
+
+
+class _AsyncInvalidatingBatchWriter:
+    """aioboto3 batch_writer() context manager invalidating the cache after its writes are flushed."""
+
+    def __init__(self, writer: Any, invalidate: Callable[[], None]):
+        self._writer = writer
+        self._invalidate = invalidate
+
+    async def __aenter__(self) -> Any:
+        return await self._writer.__aenter__()
+
+    async def __aexit__(self, *exc_info: Any) -> Any:
+        try:
+            return await self._writer.__aexit__(*exc_info)
+        finally:
+            self._invalidate()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._writer, name)
+
+
+class _LoopResources:
+    """aioboto3 resource and table handles bound to one event loop."""
+
+    def __init__(self):
+        self.exit_stack = AsyncExitStack()
+        self.resource: Any = None
+        self.tables: Dict[str, AsyncCachedTable] = {}
+
+
+class AsyncDynamoDBClient:
+    """
+    asyncio counterpart of DynamoDBClient with the same accessor surface.
+
+    aiobotocore sessions are bound to the event loop they were opened on, so
+    native mode keeps one resource per loop (opened lazily, released by
+    close()). Accessors log and return []/None on errors like DynamoDBClient.
+    """
+
+    def __init__(self, native: Optional[bool] = None):
+        """
+        Args:
+            native: Use aioboto3 (defaults to ASYNC_DYNAMODB_NATIVE when aioboto3 is
+                installed; never with DYNAMODB_BACKEND=local)
+        """
+        if native is None:
+            native = ASYNC_DYNAMODB_NATIVE and aioboto3 is not None and not local_backend_enabled()
+        if native and aioboto3 is None:
+            raise RuntimeError("aioboto3 is required for native async DynamoDB access")
+        if native and local_backend_enabled():
+            raise RuntimeError("Native async DynamoDB access is not available with DYNAMODB_BACKEND=local")
+        self.native = native
+        self._session = aioboto3.Session() if native else None
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        logger.info(
+            f"🔧 Async DynamoDB client initialized "
+            f"({'aioboto3' if native else f'thread pool, {DATA_ACCESS_MAX_WORKERS} workers'})"
+        )
+
+    # ============================================================
+    # TABLE ACCESS
+    # ============================================================
+
+    async def _loop_resources(self) -> _LoopResources:
+        """Get (opening on first use) the aioboto3 resource for the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            opening = self._loops.get(loop)
+            if opening is None:
+                opening = loop.create_task(self._open_resources())
+                self._loops[loop] = opening
+        try:
+            return await asyncio.shield(opening)
+        except Exception:
+            with self._lock:
+                if self._loops.get(loop) is opening:
+                    del self._loops[loop]
+            raise
+
+    async def _open_resources(self) -> _LoopResources:
+        resources = _LoopResources()
+        config = AioConfig(
+            max_pool_connections=DYNAMODB_MAX_POOL_CONNECTIONS,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+        )
+        resources.resource = await resources.exit_stack.enter_async_context(
+            self._session.resource("dynamodb", region_name=AWS_REGION, config=config)
+        )
+        logger.info(f"   ✅ aioboto3 DynamoDB resource opened in {AWS_REGION}")
+        return resources
+
+    async def table(self, table_name: str) -> Any:
+        """
+        Get an async handle for a physical table name.
+
+        Returns:
+            Table handle whose get_item/query/scan/put_item/... are coroutines
+        """
+        if not self.native:
+            return ExecutorTable(DynamoDBClient().dynamodb.Table(table_name))
+
+        resources = await self._loop_resources()
+        handle = resources.tables.get(table_name)
+        if handle is None:
+            handle = AsyncCachedTable(await resources.resource.Table(table_name), table_name)
+            resources.tables[table_name] = handle
+        return handle
+
+    async def get_table(self, logical_name: str, version: Optional[TableVersion] = None) -> Any:
+        """Get an async table handle by logical name with version awareness (see DynamoDBClient.get_table)."""
+        try:
+            actual_table_name = get_table_name(logical_name, version)
+        except KeyError as e:
+            logger.error(f"Table not found: {e}")
+            raise
+        return await self.table(actual_table_name)
+
+    async def get_v2_table(self, logical_name: str) -> Any:
+        """Explicitly get a V2 table handle."""
+        return await self.get_table(logical_name, TableVersion.V2)
+
+    def get_current_table_version(self) -> str:
+        """Get the current table version as a string."""
+        return TABLE_VERSION.value
+
+    def is_using_v2(self) -> bool:
+        """Check if V2 tables are currently enabled."""
+        return is_v2_enabled()
+
+    async def close(self) -> None:
+        """Release the aioboto3 resource opened on the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            opening = self._loops.pop(loop, None)
+        if opening is not None:
+            resources = await opening
+            await resources.exit_stack.aclose()
+
+    async def _query(
+        self, logical_name: str, error: str, version: Optional[TableVersion] = None, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Run a paginated query against a logical table, logging and returning [] on errors."""
+        try:
+            return await aquery_all(await self.get_table(logical_name, version), **kwargs)
+        except Exception as e:
+            logger.error(f"{error}: {e}")
+            return []
+
+    async def _query_v2(self, logical_name: str, error: str, **kwargs) -> List[Dict[str, Any]]:
+        return await self._query(logical_name, error, TableVersion.V2, **kwargs)
+
+    async def _get_item(self, logical_name: str, key: Dict[str, Any], error: str) -> Optional[Dict[str, Any]]:
+        """Get one item by key from a logical table, logging and returning None on errors."""
+        try:
+            response = await (await self.get_table(logical_name)).get_item(Key=key)
+            return response.get("Item")
+        except Exception as e:
+            logger.error(f"{error}: {e}")
+            return None
+
+    # ============================================================
+    # V2-ONLY TABLE ACCESS METHODS
+    # ============================================================
+
+    async def get_aircraft_rotations(self, aircraft_registration: str) -> List[Dict[str, Any]]:
+        """Query aircraft rotations (V2-only table)."""
+        return await self._query_v2(
+            "aircraft_rotations",
+            f"Error querying aircraft rotations for {aircraft_registration}",
+            IndexName="aircraft-sequence-index",
+            KeyConditionExpression="aircraft_registration = :reg",
+            ExpressionAttributeValues={":reg": str(aircraft_registration)},
+        )
+
+    async def get_airport_curfews(self, airport_code: str) -> List[Dict[str, Any]]:
+        """Query airport curfews (V2-only table)."""
+        return await self._query_v2(
+            "airport_curfews",
+            f"Error querying airport curfews for {airport_code}",
+            IndexName="airport-index",
+            KeyConditionExpression="airport_code = :code",
+            ExpressionAttributeValues={":code": str(airport_code)},
+        )
+
+    async def get_airport_slots(self, flight_id: str) -> List[Dict[str, Any]]:
+        """Query airport slots for a flight (V2-only table)."""
+        return await self._query_v2(
+            "airport_slots",
+            f"Error querying airport slots for flight {flight_id}",
+            IndexName="flight-index",
+            KeyConditionExpression="flight_id = :fid",
+            ExpressionAttributeValues={":fid": str(flight_id)},
+        )
+
+    async def get_oal_flights(self, origin: str, destination: str) -> List[Dict[str, Any]]:
+        """Query Other Airline (OAL) rebooking options (V2-only table)."""
+        return await self._query_v2(
+            "oal_flights",
+            f"Error querying OAL flights for {origin}-{destination}",
+            IndexName="route-index",
+            KeyConditionExpression="origin = :orig AND destination = :dest",
+            ExpressionAttributeValues={":orig": str(origin), ":dest": str(destination)},
+        )
+
+    async def get_cold_chain_facilities(self, airport_code: str) -> List[Dict[str, Any]]:
+        """Query cold chain facilities at airport (V2-only table)."""
+        return await self._query_v2(
+            "cold_chain_facilities",
+            f"Error querying cold chain facilities for {airport_code}",
+            IndexName="airport-index",
+            KeyConditionExpression="airport_code = :code",
+            ExpressionAttributeValues={":code": str(airport_code)},
+        )
+
+    async def get_compensation_rules(self, regulation: str) -> List[Dict[str, Any]]:
+        """Query compensation rules by regulation (V2-only table)."""
+        return await self._query_v2(
+            "compensation_rules",
+            f"Error querying compensation rules for {regulation}",
+            IndexName="regulation-index",
+            KeyConditionExpression="regulation = :reg",
+            ExpressionAttributeValues={":reg": str(regulation)},
+        )
+
+    async def get_ground_equipment(self, airport_code: str, equipment_type: str = None) -> List[Dict[str, Any]]:
+        """Query ground equipment at airport (V2-only table)."""
+        condition = "airport_code = :code"
+        values = {":code": str(airport_code)}
+        if equipment_type:
+            condition += " AND equipment_type = :type"
+            values[":type"] = str(equipment_type)
+        return await self._query_v2(
+            "ground_equipment",
+            f"Error querying ground equipment for {airport_code}",
+            IndexName="airport-type-index",
+            KeyConditionExpression=condition,
+            ExpressionAttributeValues=values,
+        )
+
+    async def get_reserve_crew(self, base: str, status: str = None) -> List[Dict[str, Any]]:
+        """Query reserve crew at base (V2-only table)."""
+        query: Dict[str, Any] = {
+            "IndexName": "base-status-index",
+            "KeyConditionExpression": "base = :base",
+            "ExpressionAttributeValues": {":base": str(base)},
+        }
+        if status:
+            query["KeyConditionExpression"] += " AND #status = :status"
+            query["ExpressionAttributeNames"] = {"#status": "status"}
+            query["ExpressionAttributeValues"][":status"] = str(status)
+        return await self._query_v2("reserve_crew", f"Error querying reserve crew for base {base}", **query)
+
+    async def get_turnaround_requirements(self, flight_id: str) -> List[Dict[str, Any]]:
+        """Query turnaround requirements for a flight (V2-only table)."""
+        return await self._query_v2(
+            "turnaround_requirements",
+            f"Error querying turnaround requirements for flight {flight_id}",
+            IndexName="flight-index",
+            KeyConditionExpression="flight_id = :fid",
+            ExpressionAttributeValues={":fid": str(flight_id)},
+        )
+
+    async def get_minimum_connection_times(self, airport_code: str, connection_type: str = None) -> List[Dict[str, Any]]:
+        """Query minimum connection times at airport (V2-only table)."""
+        condition = "airport_code = :code"
+        values = {":code": str(airport_code)}
+        if connection_type:
+            condition += " AND connection_type = :type"
+            values[":type"] = str(connection_type)
+        return await self._query_v2(
+            "minimum_connection_times",
+            f"Error querying MCT for {airport_code}",
+            IndexName="airport-connection-index",
+            KeyConditionExpression=condition,
+            ExpressionAttributeValues=values,
+        )
+
+    async def get_interline_agreements(self, partner_airline_code: str = None) -> List[Dict[str, Any]]:
+        """Query interline agreements (V2-only table)."""
+        if partner_airline_code:
+            return await self._query_v2(
+                "interline_agreements",
+                "Error querying interline agreements",
+                IndexName="partner-airline-index",
+                KeyConditionExpression="partner_airline_code = :code",
+                ExpressionAttributeValues={":code": str(partner_airline_code)},
+            )
+        try:
+            return await ascan_all(await self.get_v2_table("interline_agreements"))
+        except Exception as e:
+            logger.error(f"Error querying interline agreements: {e}")
+            return []
+
+    async def get_maintenance_constraints(self, aircraft_registration: str) -> List[Dict[str, Any]]:
+        """Query maintenance constraints for aircraft (V2-only table)."""
+        return await self._query_v2(
+            "maintenance_constraints",
+            f"Error querying maintenance constraints for {aircraft_registration}",
+            IndexName="aircraft-index",
+            KeyConditionExpression="aircraft_registration = :reg",
+            ExpressionAttributeValues={":reg": str(aircraft_registration)},
+        )
+
+    # ============================================================
+    # CREW COMPLIANCE QUERIES
+    # ============================================================
+
+    async def query_crew_roster_by_flight(
+        self, flight_id: str, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Query crew roster for a flight using GSI"""
+        return await self._query(
+            "crew_roster",
+            f"Error querying crew roster for flight {flight_id}",
+            IndexName="flight-position-index",
+            KeyConditionExpression="flight_id = :fid",
+            ExpressionAttributeValues={":fid": str(flight_id)},
+            projection=projection,
+        )
+
+    async def get_crew_member(self, crew_id: str) -> Optional[Dict[str, Any]]:
+        """Get crew member details by ID"""
+        return await self._get_item(
+            "crew_members", {"crew_id": str(crew_id)}, f"Error getting crew member {crew_id}"
+        )
+
+    # ============================================================
+    # MAINTENANCE QUERIES
+    # ============================================================
+
+    async def get_aircraft_availability(
+        self, aircraft_registration: str, valid_from: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get aircraft availability and MEL status"""
+        return await self._get_item(
+            "aircraft",
+            {"aircraftRegistration": str(aircraft_registration), "valid_from_zulu": str(valid_from)},
+            f"Error getting aircraft availability for {aircraft_registration}",
+        )
+
+    async def query_maintenance_workorders(self, aircraft_registration: str) -> List[Dict[str, Any]]:
+        """Query maintenance work orders for an aircraft using GSI"""
+        return await self._query(
+            "maintenance_work_orders",
+            f"Error querying maintenance workorders for {aircraft_registration}",
+            IndexName="aircraft-registration-index",
+            KeyConditionExpression="aircraftRegistration = :reg",
+            ExpressionAttributeValues={":reg": str(aircraft_registration)},
+        )
+
+    async def query_maintenance_roster_by_workorder(self, workorder_id: str) -> List[Dict[str, Any]]:
+        """Query maintenance staff assigned to work order using GSI"""
+        return await self._query(
+            "maintenance_roster",
+            f"Error querying maintenance roster for workorder {workorder_id}",
+            IndexName="workorder-shift-index",
+            KeyConditionExpression="workorder_id = :wid",
+            ExpressionAttributeValues={":wid": str(workorder_id)},
+        )
+
+    # ============================================================
+    # REGULATORY QUERIES
+    # ============================================================
+
+    async def get_weather(self, airport_code: str, forecast_time: str) -> Optional[Dict[str, Any]]:
+        """Get weather forecast for airport"""
+        return await self._get_item(
+            "weather",
+            {"airport_code": str(airport_code), "forecast_time_zulu": str(forecast_time)},
+            f"Error getting weather for {airport_code}",
+        )
+
+    async def get_flight(self, flight_id: str) -> Optional[Dict[str, Any]]:
+        """Get flight details"""
+        return await self._get_item("flights", {"flight_id": str(flight_id)}, f"Error getting flight {flight_id}")
+
+    # ============================================================
+    # NETWORK QUERIES
+    # ============================================================
+
+    async def get_inbound_flight_impact(self, scenario: str) -> Optional[Dict[str, Any]]:
+        """Get inbound flight impact analysis"""
+        return await self._get_item(
+            "inbound_flight_impact",
+            {"scenario": str(scenario)},
+            f"Error getting inbound flight impact for scenario {scenario}",
+        )
+
+    async def query_flight_by_number_and_date(
+        self, flight_number: str, scheduled_departure: str
+    ) -> Optional[Dict[str, Any]]:
+        """Query flight by flight number and exact scheduled departure using GSI."""
+        items = await self._query(
+            "flights",
+            f"Error querying flight {flight_number} on {scheduled_departure}",
+            IndexName="flight-number-date-index",
+            KeyConditionExpression="flight_number = :fn AND scheduled_departure_utc = :sd",
+            ExpressionAttributeValues={":fn": str(flight_number), ":sd": str(scheduled_departure)},
+            limit=1,
+        )
+        return items[0] if items else None
+
+    async def get_flight_by_number_and_date(self, flight_number: str, date: str) -> Optional[Dict[str, Any]]:
+        """Resolve a flight by flight number and departure date (version-aware, begins_with on the date)."""
+        items = await self._query(
+            "flights",
+            f"Error resolving flight {flight_number} on {date}",
+            IndexName="flight-number-date-index",
+            KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
+            ExpressionAttributeValues={":fn": str(flight_number), ":sd": str(date)},
+        )
+        return items[0] if items else None
+
+    async def query_flights_by_aircraft(self, aircraft_registration: str) -> List[Dict[str, Any]]:
+        """Query flights by aircraft registration using GSI."""
+        return await self._query(
+            "flights",
+            f"Error querying flights for aircraft {aircraft_registration}",
+            IndexName="aircraft-registration-index",
+            KeyConditionExpression="aircraft_registration = :reg",
+            ExpressionAttributeValues={":reg": str(aircraft_registration)},
+        )
+
+    # ============================================================
+    # GUEST EXPERIENCE QUERIES
+    # ============================================================
+
+    async def query_bookings_by_passenger(self, passenger_id: str) -> List[Dict[str, Any]]:
+        """Query bookings for a passenger using GSI"""
+        return await self._query(
+            "bookings",
+            f"Error querying bookings for passenger {passenger_id}",
+            IndexName="passenger-flight-index",
+            KeyConditionExpression="passenger_id = :pid",
+            ExpressionAttributeValues={":pid": str(passenger_id)},
+        )
+
+    async def query_bookings_by_flight(
+        self, flight_id: str, booking_status: str = None, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Query bookings for a flight using GSI"""
+        condition = "flight_id = :fid"
+        values = {":fid": str(flight_id)}
+        if booking_status:
+            condition += " AND booking_status = :status"
+            values[":status"] = str(booking_status)
+        return await self._query(
+            "bookings",
+            f"Error querying bookings for flight {flight_id}",
+            IndexName="flight-status-index",
+            KeyConditionExpression=condition,
+            ExpressionAttributeValues=values,
+            projection=projection,
+        )
+
+    async def query_baggage_by_booking(self, booking_id: str) -> List[Dict[str, Any]]:
+        """Query baggage for a booking using GSI"""
+        return await self._query(
+            "baggage",
+            f"Error querying baggage for booking {booking_id}",
+            IndexName="booking-index",
+            KeyConditionExpression="booking_id = :bid",
+            ExpressionAttributeValues={":bid": str(booking_id)},
+        )
+
+    async def get_passenger(self, passenger_id: str) -> Optional[Dict[str, Any]]:
+        """Get passenger details"""
+        return await self._get_item(
+            "passengers", {"passenger_id": str(passenger_id)}, f"Error getting passenger {passenger_id}"
+        )
+
+    # ============================================================
+    # CARGO QUERIES
+    # ============================================================
+
+    async def query_cargo_by_shipment(self, shipment_id: str) -> List[Dict[str, Any]]:
+        """Track cargo shipment across flights using GSI"""
+        return await self._query(
+            "cargo_assignments",
+            f"Error querying cargo for shipment {shipment_id}",
+            IndexName="shipment-index",
+            KeyConditionExpression="shipment_id = :sid",
+            ExpressionAttributeValues={":sid": str(shipment_id)},
+        )
+
+    async def query_cargo_by_flight(
+        self, flight_id: str, loading_status: str = None, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Query cargo for a flight using GSI"""
+        condition = "flight_id = :fid"
+        values = {":fid": str(flight_id)}
+        if loading_status:
+            condition += " AND loading_status = :status"
+            values[":status"] = str(loading_status)
+        return await self._query(
+            "cargo_assignments",
+            f"Error querying cargo for flight {flight_id}",
+            IndexName="flight-loading-index",
+            KeyConditionExpression=condition,
+            ExpressionAttributeValues=values,
+            projection=projection,
+        )
+
+    async def get_cargo_shipment(self, shipment_id: str) -> Optional[Dict[str, Any]]:
+        """Get cargo shipment details"""
+        return await self._get_item(
+            "cargo_shipments", {"shipment_id": str(shipment_id)}, f"Error getting cargo shipment {shipment_id}"
+        )
+
+    # ============================================================
+    # FLIGHT SUMMARIES
+    # ============================================================
+
+    async def query_passengers_by_flight(
+        self, flight_id: str, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Query passenger records for a flight (V2: passengers first-leg GSI, V1: bookings)"""
+        if not is_v2_enabled():
+            return await self.query_bookings_by_flight(flight_id, projection=projection)
+        return await self._query_v2(
+            "passengers",
+            f"Error querying passengers for flight {flight_id}",
+            IndexName="first-leg-flight-index",
+            KeyConditionExpression="first_leg_flight_id = :fid",
+            ExpressionAttributeValues={":fid": str(flight_id)},
+            projection=projection,
+        )
+
+    async def query_shipments_by_flight(
+        self, flight_id: str, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Query cargo records for a flight (V2: cargo_shipments first-leg GSI, V1: assignments)"""
+        if not is_v2_enabled():
+            return await self.query_cargo_by_flight(flight_id, projection=projection)
+        return await self._query_v2(
+            "cargo_shipments",
+            f"Error querying cargo shipments for flight {flight_id}",
+            IndexName="first-leg-flight-index",
+            KeyConditionExpression="first_leg_flight_id = :fid",
+            ExpressionAttributeValues={":fid": str(flight_id)},
+            projection=projection,
+        )
+
+    async def summarize_flight_passengers(self, flight_id: str, include_records: bool = False) -> Dict[str, Any]:
+        """Aggregate a flight's passengers (see DynamoDBClient.summarize_flight_passengers)."""
+        records = await self.query_passengers_by_flight(flight_id)
+        summary = {"flight_id": flight_id, **summarize_passengers(records)}
+        return with_records(summary, records, include_records)
+
+    async def summarize_flight_cargo(self, flight_id: str, include_records: bool = False) -> Dict[str, Any]:
+        """Aggregate a flight's cargo (see DynamoDBClient.summarize_flight_cargo)."""
+        records = await self.query_shipments_by_flight(flight_id)
+        summary = {"flight_id": flight_id, **summarize_cargo(records)}
+        return with_records(summary, records, include_records)
+
+    # ============================================================
+    # BATCH QUERY METHODS
+    # ============================================================
+
+    async def batch_get_items(
+        self,
+        table_name: str,
+        keys: List[Dict[str, Any]],
+        max_batch_size: int = 100,
+        projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
+        """
+        Batch get items with concurrent BatchGetItem requests (see batch_get_all).
+
+        Returns:
+            BatchGetResult: Items retrieved and the read capacity consumed
+        """
+        return await batch_get_all(
+            self._request_batch_get, table_name, keys, max_batch_size, projection
+        )
+
+    async def _request_batch_get(self, **kwargs) -> Dict[str, Any]:
+        """Issue one request-cached BatchGetItem call through the resource API."""
+        if not self.native:
+            return await run_blocking(DynamoDBClient().dynamodb.batch_get_item, **kwargs)
+
+        resource = (await self._loop_resources()).resource
+        cache = get_request_cache()
+        if cache is None:
+            return await resource.batch_get_item(**kwargs)
+        key = _make_key("resource", "batch_get_item", kwargs)
+        return await cache.aget_or_load(key, lambda: resource.batch_get_item(**kwargs))
+
+    async def batch_get_crew_members(
+        self, crew_ids: List[str], projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
+        """Batch get crew member details."""
+        keys = [{"crew_id": str(crew_id)} for crew_id in crew_ids]
+        return await self.batch_get_items("CrewMembers", keys, projection=projection)
+
+    async def batch_get_flights(
+        self, flight_ids: List[str], projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
+        """Batch get flight details."""
+        keys = [{"flight_id": str(flight_id)} for flight_id in flight_ids]
+        return await self.batch_get_items("Flights", keys, projection=projection)
+
+    async def batch_get_passengers(
+        self, passenger_ids: List[str], projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
+        """Batch get passenger details."""
+        keys = [{"passenger_id": str(passenger_id)} for passenger_id in passenger_ids]
+        return await self.batch_get_items("Passengers", keys, projection=projection)
+
+    async def batch_get_cargo_shipments(
+        self, shipment_ids: List[str], projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
+        """Batch get cargo shipment details."""
+        keys = [{"shipment_id": str(shipment_id)} for shipment_id in shipment_ids]
+        return await self.batch_get_items("CargoShipments", keys, projection=projection)
+
+    # ============================================================
+    # UTILITY METHODS
+    # ============================================================
+
+    def to_json(self, data: Any) -> str:
+        """Convert DynamoDB data to JSON string (minified unless TOOL_OUTPUT_MODE=full)"""
+        if compact_output_enabled():
+            return to_tool_json(data)
+        return json.dumps(data, cls=DecimalEncoder, indent=2)
+
+
+_async_client_instance: Optional[AsyncDynamoDBClient] = None
+_async_client_lock = threading.Lock()
+
+
+def get_async_dynamodb_client() -> AsyncDynamoDBClient:
+    """
+    Get the process-wide AsyncDynamoDBClient.
+
+    Returns:
+        AsyncDynamoDBClient: Singleton client instance
+    """
+    global _async_client_instance
+    if _async_client_instance is None:
+        with _async_client_lock:
+            if _async_client_instance is None:
+                _async_client_instance = AsyncDynamoDBClient()
+    return _async_client_instance
@@ -17,10 +17,17 @@ Usage:
 """
 
 import boto3
+import asyncio
+import contextvars
+import functools
 import json
+import os
+import random
+import threading
 import time
+from botocore.config import Config
 from decimal import Decimal
-from typing import Optional, Dict, List, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import logging
 import sys
 
@@ -33,6 +40,11 @@ try:
         is_v2_enabled,
         V2_TABLES,
     )
+    from database.local_backend import get_local_dynamodb, local_backend_enabled
+    from database.pagination import build_projection, query_all, scan_all
+    from database.request_cache import CachedClient, CachedResource
+    from database.summaries import summarize_cargo, summarize_passengers, with_records
+    from database.tool_output import compact_output_enabled, to_tool_json
 except ImportError:
     # Fallback for direct execution or import issues
     from table_config import (
@@ -42,6 +54,11 @@ except ImportError:
         is_v2_enabled,
         V2_TABLES,
     )
+    from local_backend import get_local_dynamodb, local_backend_enabled
+    from pagination import build_projection, query_all, scan_all
+    from request_cache import CachedClient, CachedResource
+    from summaries import summarize_cargo, summarize_passengers, with_records
+    from tool_output import compact_output_enabled, to_tool_json
 
 # Configure logging
 logging.basicConfig(
@@ -54,6 +71,261 @@ logger = logging.getLogger(__name__)
 
 AWS_REGION = "us-east-1"
 
+# Shared HTTP connection pool sized for parallel Phase 1/Phase 2 agent tool calls
+# (7 agents x several concurrent tool calls). botocore defaults to 10.
+DYNAMODB_MAX_POOL_CONNECTIONS = int(os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", "50"))
+
+DYNAMODB_CONFIG = Config(
+    region_name=AWS_REGION,
+    max_pool_connections=DYNAMODB_MAX_POOL_CONNECTIONS,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+# Logical tables read by the agent tools, warmed at container start (see warm_table_handles)
+WARMUP_TABLES = (
+    "flights",
+    "crew_roster",
+    "crew_members",
+    "reserve_crew",
+    "passengers",
+    "bookings",
+    "baggage",
+    "cargo_shipments",
+    "cold_chain_facilities",
+    "ground_equipment",
+    "aircraft",
+    "maintenance_work_orders",
+    "maintenance_staff",
+    "maintenance_roster",
+    "maintenance_constraints",
+    "weather",
+    "airport_curfews",
+    "airport_slots",
+    "oal_flights",
+    "minimum_connection_times",
+    "interline_agreements",
+    "compensation_rules",
+    "financial_parameters",
+    "recovery_cost_matrix",
+)
+
+# batch_get_items / abatch_get_items fan-out and retry settings
+BATCH_GET_MAX_CONCURRENCY = int(os.getenv("BATCH_GET_MAX_CONCURRENCY", "8"))
+BATCH_GET_MAX_ATTEMPTS = 4  # Initial attempt + 3 retries
+BATCH_GET_BASE_DELAY_SECONDS = 0.1
+BATCH_GET_MAX_DELAY_SECONDS = 2.0
+
+
+def _backoff_delay(retry: int) -> float:
+    """
+    Jittered exponential backoff for the given retry (1-based).
+
+    Equal jitter: half of the exponential delay is fixed, the other half is
+    random, so concurrent batches retrying together spread out.
+    """
+    delay = min(BATCH_GET_MAX_DELAY_SECONDS, BATCH_GET_BASE_DELAY_SECONDS * 2 ** (retry - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class BatchGetResult(list):
+    """Items returned by batch_get_items, with the read capacity the call consumed."""
+
+    def __init__(self, items: Optional[List[Dict[str, Any]]] = None, consumed_capacity: float = 0.0):
+        super().__init__(items or [])
+        self.consumed_capacity = consumed_capacity
+
+
+async def batch_get_all(
+    request: Callable[..., Awaitable[Dict[str, Any]]],
+    table_name: str,
+    keys: List[Dict[str, Any]],
+    max_batch_size: int = 100,
+    projection: Optional[List[str]] = None
+) -> BatchGetResult:
+    """
+    Fetch keys with concurrent BatchGetItem requests.
+
+    Splits keys into batches of max_batch_size and issues them concurrently
+    (at most BATCH_GET_MAX_CONCURRENCY requests in flight), so N batches take
+    about one round trip instead of N. Unprocessed keys and errors are retried
+    with jittered exponential backoff that awaits instead of blocking the loop.
+
+    Args:
+        request: Coroutine function performing one BatchGetItem call
+            (RequestItems=..., ReturnConsumedCapacity=...)
+        table_name: DynamoDB table name
+        keys: List of primary key dicts
+        max_batch_size: Max items per batch (default 100, AWS limit)
+        projection: Optional attribute names to return (ProjectionExpression)
+
+    Returns:
+        BatchGetResult: Items retrieved and the read capacity consumed
+    """
+    if not keys:
+        return BatchGetResult()
+
+    table_params = build_projection(projection) if projection else {}
+
+    # Split into batches of max_batch_size
+    batches = [keys[i:i + max_batch_size] for i in range(0, len(keys), max_batch_size)]
+    logger.debug(f"Batch get: {len(keys)} items split into {len(batches)} batches")
+
+    semaphore = asyncio.Semaphore(BATCH_GET_MAX_CONCURRENCY)
+    results = await asyncio.gather(*(
+        _batch_get_with_retry(
+            request, table_name, batch, f"{batch_idx + 1}/{len(batches)}", semaphore, table_params
+        )
+        for batch_idx, batch in enumerate(batches)
+    ))
+
+    all_items = BatchGetResult(
+        [item for batch_items, _ in results for item in batch_items],
+        consumed_capacity=sum(capacity for _, capacity in results),
+    )
+    logger.info(
+        f"Batch get complete: Retrieved {len(all_items)}/{len(keys)} items "
+        f"({all_items.consumed_capacity} RCU)"
+    )
+    return all_items
+
+
+async def _batch_get_with_retry(
+    request: Callable[..., Awaitable[Dict[str, Any]]],
+    table_name: str,
+    keys: List[Dict[str, Any]],
+    label: str,
+    semaphore: asyncio.Semaphore,
+    table_params: Dict[str, Any]
+) -> Tuple[List[Dict[str, Any]], float]:
+    """Fetch one batch, retrying unprocessed keys and errors with backoff."""
+    collected: List[Dict[str, Any]] = []
+    consumed_capacity = 0.0
+    unprocessed = keys
+
+    for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+        if attempt:
+            wait_time = _backoff_delay(attempt)
+            logger.warning(
+                f"Batch {label}: {len(unprocessed)} unprocessed keys, "
+                f"retrying after {wait_time:.3f}s (retry {attempt}/{BATCH_GET_MAX_ATTEMPTS - 1})"
+            )
+            await asyncio.sleep(wait_time)
+
+        try:
+            async with semaphore:
+                response = await request(
+                    RequestItems={table_name: {"Keys": unprocessed, **table_params}},
+                    ReturnConsumedCapacity="TOTAL",
+                )
+        except Exception as e:
+            logger.error(f"Error in batch get (batch {label}): {e}")
+            continue
+
+        batch_items, capacity, unprocessed = _read_batch_response(response, table_name, label)
+        collected.extend(batch_items)
+        consumed_capacity += capacity
+        if not unprocessed:
+            break
+
+    if unprocessed:
+        logger.warning(
+            f"Batch {label}: Failed to process {len(unprocessed)} keys "
+            f"after {BATCH_GET_MAX_ATTEMPTS} attempts"
+        )
+    return collected, consumed_capacity
+
+
+def batch_get_all_sync(
+    request: Callable[..., Dict[str, Any]],
+    table_name: str,
+    keys: List[Dict[str, Any]],
+    max_batch_size: int = 100,
+    projection: Optional[List[str]] = None
+) -> BatchGetResult:
+    """
+    Fetch keys with BatchGetItem requests from synchronous code.
+
+    Synchronous counterpart of batch_get_all for sync @tool functions: the
+    same 100-key batching, unprocessed-key retries and jittered backoff, but
+    batches are issued one after another on the calling thread, so no event
+    loop is created per call.
+
+    Args:
+        request: Function performing one BatchGetItem call
+            (RequestItems=..., ReturnConsumedCapacity=...)
+        table_name: DynamoDB table name
+        keys: List of primary key dicts
+        max_batch_size: Max items per batch (default 100, AWS limit)
+        projection: Optional attribute names to return (ProjectionExpression)
+
+    Returns:
+        BatchGetResult: Items retrieved and the read capacity consumed
+    """
+    if not keys:
+        return BatchGetResult()
+
+    table_params = build_projection(projection) if projection else {}
+
+    batches = [keys[i:i + max_batch_size] for i in range(0, len(keys), max_batch_size)]
+    logger.debug(f"Batch get: {len(keys)} items split into {len(batches)} batches")
+
+    all_items = BatchGetResult()
+    for batch_idx, batch in enumerate(batches):
+        label = f"{batch_idx + 1}/{len(batches)}"
+        unprocessed = batch
+
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                wait_time = _backoff_delay(attempt)
+                logger.warning(
+                    f"Batch {label}: {len(unprocessed)} unprocessed keys, "
+                    f"retrying after {wait_time:.3f}s (retry {attempt}/{BATCH_GET_MAX_ATTEMPTS - 1})"
+                )
+                time.sleep(wait_time)
+
+            try:
+                response = request(
+                    RequestItems={table_name: {"Keys": unprocessed, **table_params}},
+                    ReturnConsumedCapacity="TOTAL",
+                )
+            except Exception as e:
+                logger.error(f"Error in batch get (batch {label}): {e}")
+                continue
+
+            batch_items, capacity, unprocessed = _read_batch_response(response, table_name, label)
+            all_items.extend(batch_items)
+            all_items.consumed_capacity += capacity
+            if not unprocessed:
+                break
+
+        if unprocessed:
+            logger.warning(
+                f"Batch {label}: Failed to process {len(unprocessed)} keys "
+                f"after {BATCH_GET_MAX_ATTEMPTS} attempts"
+            )
+
+    logger.info(
+        f"Batch get complete: Retrieved {len(all_items)}/{len(keys)} items "
+        f"({all_items.consumed_capacity} RCU)"
+    )
+    return all_items
+
+
+def _read_batch_response(
+    response: Dict[str, Any],
+    table_name: str,
+    label: str
+) -> Tuple[List[Dict[str, Any]], float, List[Dict[str, Any]]]:
+    """Split one BatchGetItem response into items, consumed capacity and unprocessed keys."""
+    batch_items = response.get("Responses", {}).get(table_name, [])
+    consumed_capacity = sum(
+        float(c.get("CapacityUnits", 0)) for c in response.get("ConsumedCapacity") or []
+    )
+    logger.debug(f"Batch {label}: Retrieved {len(batch_items)} items")
+    unprocessed = response.get("UnprocessedKeys", {}).get(table_name, {}).get("Keys", [])
+    return batch_items, consumed_capacity, unprocessed
+
 
 class DecimalEncoder(json.JSONEncoder):
     """Custom JSON encoder for Decimal types"""
@@ -64,59 +336,86 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+class _LogicalTable:
+    """Table attribute resolved by logical name on first use (see DynamoDBClient.get_table)."""
+
+    def __init__(self, logical_name: str):
+        self.logical_name = logical_name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        return instance.get_table(self.logical_name)
+
+
 class DynamoDBClient:
     """Singleton DynamoDB client with connection pooling"""
 
     _instance: Optional["DynamoDBClient"] = None
+    _lock = threading.Lock()
+
+    # Operational tables, resolved for TABLE_VERSION when first used
+    passengers = _LogicalTable("passengers")
+    flights = _LogicalTable("flights")
+    aircraft_availability = _LogicalTable("aircraft")
+    maintenance_workorders = _LogicalTable("maintenance_work_orders")
+    weather = _LogicalTable("weather")
+    disrupted_passengers = _LogicalTable("disrupted_passengers")
+    aircraft_swap_options = _LogicalTable("aircraft_swap_options")
+    inbound_flight_impact = _LogicalTable("inbound_flight_impact")
+    bookings = _LogicalTable("bookings")
+    baggage = _LogicalTable("baggage")
+    crew_members = _LogicalTable("crew_members")
+    crew_roster = _LogicalTable("crew_roster")
+    cargo_shipments = _LogicalTable("cargo_shipments")
+    cargo_flight_assignments = _LogicalTable("cargo_assignments")
+    maintenance_staff = _LogicalTable("maintenance_staff")
+    maintenance_roster = _LogicalTable("maintenance_roster")
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self):
         if self._initialized:
             return
 
+        with self._lock:
+            if self._initialized:
+                return
+            self._initialize()
+
+    def _initialize(self):
         logger.info("🔧 Initializing DynamoDB client...")
-        self._initialized = True
 
         try:
-            self.dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
-            self.client = boto3.client("dynamodb", region_name=AWS_REGION)
-            logger.info(f"   ✅ Connected to DynamoDB in {AWS_REGION}")
+            # Reads go through the request-scoped cache when a request scope is active
+            if local_backend_enabled():
+                local = get_local_dynamodb()
+                self.dynamodb = CachedResource(local)
+                self.client = CachedClient(local)
+                logger.info("   ✅ Using local in-process DynamoDB (DYNAMODB_BACKEND=local)")
+            else:
+                self.dynamodb = CachedResource(boto3.resource("dynamodb", config=DYNAMODB_CONFIG))
+                self.client = CachedClient(boto3.client("dynamodb", config=DYNAMODB_CONFIG))
+                logger.info(
+                    f"   ✅ Connected to DynamoDB in {AWS_REGION} "
+                    f"(max_pool_connections={DYNAMODB_MAX_POOL_CONNECTIONS})"
+                )
         except Exception as e:
             logger.error(f"   ❌ Failed to connect to DynamoDB: {e}")
             raise
 
-        # Initialize all table references
-        logger.debug("   Loading table references...")
-        self.passengers = self.dynamodb.Table("Passengers")
-        self.flights = self.dynamodb.Table("Flights")
-        self.aircraft_availability = self.dynamodb.Table("AircraftAvailability")
-        self.maintenance_workorders = self.dynamodb.Table("MaintenanceWorkOrders")
-        self.weather = self.dynamodb.Table("Weather")
-        self.disrupted_passengers = self.dynamodb.Table("DisruptedPassengers")
-        self.aircraft_swap_options = self.dynamodb.Table("AircraftSwapOptions")
-        self.inbound_flight_impact = self.dynamodb.Table("InboundFlightImpact")
-        self.bookings = self.dynamodb.Table("Bookings")
-        self.baggage = self.dynamodb.Table("Baggage")
-        self.crew_members = self.dynamodb.Table("CrewMembers")
-        self.crew_roster = self.dynamodb.Table("CrewRoster")
-        self.cargo_shipments = self.dynamodb.Table("CargoShipments")
-        self.cargo_flight_assignments = self.dynamodb.Table("CargoFlightAssignments")
-        self.maintenance_staff = self.dynamodb.Table("MaintenanceStaff")
-        self.maintenance_roster = self.dynamodb.Table("MaintenanceRoster")
-
-        logger.info("   ✅ DynamoDB client initialized with 16 operational tables")
-
-        # Cache for dynamically loaded V2 tables
-        self._table_cache: Dict[str, Any] = {}
-
         # Log current table version
         logger.info(f"   📊 Table version: {TABLE_VERSION.value} ({'V2 enabled' if is_v2_enabled() else 'V1 active'})")
 
+        self._initialized = True
+
     # ============================================================
     # VERSION-AWARE TABLE ACCESS
     # ============================================================
@@ -148,16 +447,8 @@ class DynamoDBClient:
             logger.error(f"Table not found: {e}")
             raise
 
-        # Check cache first
-        if actual_table_name in self._table_cache:
-            return self._table_cache[actual_table_name]
-
-        # Load table and cache it
-        table = self.dynamodb.Table(actual_table_name)
-        self._table_cache[actual_table_name] = table
-        logger.debug(f"Loaded table: {actual_table_name} (logical: {logical_name})")
-
-        return table
+        # Handles are created once per table and shared (see CachedResource.Table)
+        return self.dynamodb.Table(actual_table_name)
 
     def get_v2_table(self, logical_name: str):
         """
@@ -190,12 +481,12 @@ class DynamoDBClient:
         """Query aircraft rotations (V2-only table)."""
         try:
             table = self.get_v2_table("aircraft_rotations")
-            response = table.query(
+            return query_all(
+                table,
                 IndexName="aircraft-sequence-index",
                 KeyConditionExpression="aircraft_registration = :reg",
                 ExpressionAttributeValues={":reg": str(aircraft_registration)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying aircraft rotations for {aircraft_registration}: {e}")
             return []
@@ -204,12 +495,12 @@ class DynamoDBClient:
         """Query airport curfews (V2-only table)."""
         try:
             table = self.get_v2_table("airport_curfews")
-            response = table.query(
+            return query_all(
+                table,
                 IndexName="airport-index",
                 KeyConditionExpression="airport_code = :code",
                 ExpressionAttributeValues={":code": str(airport_code)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying airport curfews for {airport_code}: {e}")
             return []
@@ -218,12 +509,12 @@ class DynamoDBClient:
         """Query airport slots for a flight (V2-only table)."""
         try:
             table = self.get_v2_table("airport_slots")
-            response = table.query(
+            return query_all(
+                table,
                 IndexName="flight-index",
                 KeyConditionExpression="flight_id = :fid",
                 ExpressionAttributeValues={":fid": str(flight_id)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying airport slots for flight {flight_id}: {e}")
             return []
@@ -232,7 +523,8 @@ class DynamoDBClient:
         """Query Other Airline (OAL) rebooking options (V2-only table)."""
         try:
             table = self.get_v2_table("oal_flights")
-            response = table.query(
+            return query_all(
+                table,
                 IndexName="route-index",
                 KeyConditionExpression="origin = :orig AND destination = :dest",
                 ExpressionAttributeValues={
@@ -240,7 +532,6 @@ class DynamoDBClient:
                     ":dest": str(destination),
                 },
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying OAL flights for {origin}-{destination}: {e}")
             return []
@@ -249,12 +540,12 @@ class DynamoDBClient:
         """Query cold chain facilities at airport (V2-only table)."""
         try:
             table = self.get_v2_table("cold_chain_facilities")
-            response = table.query(
+            return query_all(
+                table,
                 IndexName="airport-index",
                 KeyConditionExpression="airport_code = :code",
                 ExpressionAttributeValues={":code": str(airport_code)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying cold chain facilities for {airport_code}: {e}")
             return []
@@ -263,12 +554,12 @@ class DynamoDBClient:
         """Query compensation rules by regulation (V2-only table)."""
         try:
             table = self.get_v2_table("compensation_rules")
-            response = table.query(
+            return query_all(
+                table,
                 IndexName="regulation-index",
                 KeyConditionExpression="regulation = :reg",
                 ExpressionAttributeValues={":reg": str(regulation)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying compensation rules for {regulation}: {e}")
             return []
@@ -278,7 +569,8 @@ class DynamoDBClient:
         try:
             table = self.get_v2_table("ground_equipment")
             if equipment_type:
-                response = table.query(
+                items = query_all(
+                    table,
                     IndexName="airport-type-index",
                     KeyConditionExpression="airport_code = :code AND equipment_type = :type",
                     ExpressionAttributeValues={
@@ -287,12 +579,13 @@ class DynamoDBClient:
                     },
                 )
             else:
-                response = table.query(
+                items = query_all(
+                    table,
                     IndexName="airport-type-index",
                     KeyConditionExpression="airport_code = :code",
                     ExpressionAttributeValues={":code": str(airport_code)},
                 )
-            return response.get("Items", [])
+            return items
         except Exception as e:
             logger.error(f"Error querying ground equipment for {airport_code}: {e}")
             return []
@@ -302,7 +595,8 @@ class DynamoDBClient:
         try:
             table = self.get_v2_table("reserve_crew")
             if status:
-                response = table.query(
+                items = query_all(
+                    table,
                     IndexName="base-status-index",
                     KeyConditionExpression="base = :base AND #status = :status",
                     ExpressionAttributeNames={"#status": "status"},
@@ -312,12 +606,13 @@ class DynamoDBClient:
                     },
                 )
             else:
-                response = table.query(
+                items = query_all(
+                    table,
                     IndexName="base-status-index",
                     KeyConditionExpression="base = :base",
                     ExpressionAttributeValues={":base": str(base)},
                 )
-            return response.get("Items", [])
+            return items
         except Exception as e:
             logger.error(f"Error querying reserve crew for base {base}: {e}")
             return []
@@ -326,12 +621,12 @@ class DynamoDBClient:
         """Query turnaround requirements for a flight (V2-only table)."""
         try:
             table = self.get_v2_table("turnaround_requirements")
-            response = table.query(
+            return query_all(
+                table,
                 IndexName="flight-index",
                 KeyConditionExpression="flight_id = :fid",
                 ExpressionAttributeValues={":fid": str(flight_id)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying turnaround requirements for flight {flight_id}: {e}")
             return []
@@ -341,7 +636,8 @@ class DynamoDBClient:
         try:
             table = self.get_v2_table("minimum_connection_times")
             if connection_type:
-                response = table.query(
+                items = query_all(
+                    table,
                     IndexName="airport-connection-index",
                     KeyConditionExpression="airport_code = :code AND connection_type = :type",
                     ExpressionAttributeValues={
@@ -350,12 +646,13 @@ class DynamoDBClient:
                     },
                 )
             else:
-                response = table.query(
+                items = query_all(
+                    table,
                     IndexName="airport-connection-index",
                     KeyConditionExpression="airport_code = :code",
                     ExpressionAttributeValues={":code": str(airport_code)},
                 )
-            return response.get("Items", [])
+            return items
         except Exception as e:
             logger.error(f"Error querying MCT for {airport_code}: {e}")
             return []
@@ -365,14 +662,15 @@ class DynamoDBClient:
         try:
             table = self.get_v2_table("interline_agreements")
             if partner_airline_code:
-                response = table.query(
+                items = query_all(
+                    table,
                     IndexName="partner-airline-index",
                     KeyConditionExpression="partner_airline_code = :code",
                     ExpressionAttributeValues={":code": str(partner_airline_code)},
                 )
             else:
-                response = table.scan()
-            return response.get("Items", [])
+                items = scan_all(table)
+            return items
         except Exception as e:
             logger.error(f"Error querying interline agreements: {e}")
             return []
@@ -381,12 +679,12 @@ class DynamoDBClient:
         """Query maintenance constraints for aircraft (V2-only table)."""
         try:
             table = self.get_v2_table("maintenance_constraints")
-            response = table.query(
+            return query_all(
+                table,
                 IndexName="aircraft-index",
                 KeyConditionExpression="aircraft_registration = :reg",
                 ExpressionAttributeValues={":reg": str(aircraft_registration)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying maintenance constraints for {aircraft_registration}: {e}")
             return []
@@ -395,15 +693,18 @@ class DynamoDBClient:
     # CREW COMPLIANCE QUERIES
     # ============================================================
 
-    def query_crew_roster_by_flight(self, flight_id: str) -> List[Dict[str, Any]]:
+    def query_crew_roster_by_flight(
+        self, flight_id: str, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """Query crew roster for a flight using GSI"""
         try:
-            response = self.crew_roster.query(
+            return query_all(
+                self.crew_roster,
                 IndexName="flight-position-index",
                 KeyConditionExpression="flight_id = :fid",
                 ExpressionAttributeValues={":fid": str(flight_id)},
+                projection=projection,
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying crew roster for flight {flight_id}: {e}")
             return []
@@ -444,12 +745,12 @@ class DynamoDBClient:
     ) -> List[Dict[str, Any]]:
         """Query maintenance work orders for an aircraft using GSI"""
         try:
-            response = self.maintenance_workorders.query(
+            return query_all(
+                self.maintenance_workorders,
                 IndexName="aircraft-registration-index",
                 KeyConditionExpression="aircraftRegistration = :reg",
                 ExpressionAttributeValues={":reg": str(aircraft_registration)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(
                 f"Error querying maintenance workorders for {aircraft_registration}: {e}"
@@ -461,12 +762,12 @@ class DynamoDBClient:
     ) -> List[Dict[str, Any]]:
         """Query maintenance staff assigned to work order using GSI"""
         try:
-            response = self.maintenance_roster.query(
+            return query_all(
+                self.maintenance_roster,
                 IndexName="workorder-shift-index",
                 KeyConditionExpression="workorder_id = :wid",
                 ExpressionAttributeValues={":wid": str(workorder_id)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(
                 f"Error querying maintenance roster for workorder {workorder_id}: {e}"
@@ -533,15 +834,16 @@ class DynamoDBClient:
             Flight record if found, None otherwise
         """
         try:
-            response = self.flights.query(
+            items = query_all(
+                self.flights,
                 IndexName="flight-number-date-index",
                 KeyConditionExpression="flight_number = :fn AND scheduled_departure_utc = :sd",
                 ExpressionAttributeValues={
                     ":fn": str(flight_number),
                     ":sd": str(scheduled_departure),
                 },
+                limit=1,
             )
-            items = response.get("Items", [])
             return items[0] if items else None
         except Exception as e:
             logger.error(
@@ -549,6 +851,38 @@ class DynamoDBClient:
             )
             return None
 
+    def get_flight_by_number_and_date(
+        self, flight_number: str, date: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a flight by flight number and departure date (version-aware).
+
+        Matches the agents' query_flight tools: uses the current flights table
+        and a begins_with condition so a YYYY-MM-DD date matches the full
+        scheduled_departure_utc timestamp.
+
+        Args:
+            flight_number: Flight number (e.g., "EY123")
+            date: Departure date in YYYY-MM-DD format
+
+        Returns:
+            Flight record if found, None otherwise
+        """
+        try:
+            items = query_all(
+                self.get_table("flights"),
+                IndexName="flight-number-date-index",
+                KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
+                ExpressionAttributeValues={
+                    ":fn": str(flight_number),
+                    ":sd": str(date),
+                },
+            )
+            return items[0] if items else None
+        except Exception as e:
+            logger.error(f"Error resolving flight {flight_number} on {date}: {e}")
+            return None
+
     def query_flights_by_aircraft(
         self, aircraft_registration: str
     ) -> List[Dict[str, Any]]:
@@ -562,12 +896,12 @@ class DynamoDBClient:
             List of flight records for the aircraft
         """
         try:
-            response = self.flights.query(
+            return query_all(
+                self.flights,
                 IndexName="aircraft-registration-index",
                 KeyConditionExpression="aircraft_registration = :reg",
                 ExpressionAttributeValues={":reg": str(aircraft_registration)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(
                 f"Error querying flights for aircraft {aircraft_registration}: {e}"
@@ -586,8 +920,7 @@ class DynamoDBClient:
             "Use query_flight_by_number_and_date() or query_flights_by_aircraft() instead."
         )
         try:
-            response = self.flights.scan(**kwargs)
-            return response.get("Items", [])
+            return scan_all(self.flights, **kwargs)
         except Exception as e:
             logger.error(f"Error querying flights: {e}")
             return []
@@ -599,37 +932,44 @@ class DynamoDBClient:
     def query_bookings_by_passenger(self, passenger_id: str) -> List[Dict[str, Any]]:
         """Query bookings for a passenger using GSI"""
         try:
-            response = self.bookings.query(
+            return query_all(
+                self.bookings,
                 IndexName="passenger-flight-index",
                 KeyConditionExpression="passenger_id = :pid",
                 ExpressionAttributeValues={":pid": str(passenger_id)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying bookings for passenger {passenger_id}: {e}")
             return []
 
     def query_bookings_by_flight(
-        self, flight_id: str, booking_status: str = None
+        self,
+        flight_id: str,
+        booking_status: str = None,
+        projection: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Query bookings for a flight using GSI"""
         try:
             if booking_status:
-                response = self.bookings.query(
+                items = query_all(
+                    self.bookings,
                     IndexName="flight-status-index",
                     KeyConditionExpression="flight_id = :fid AND booking_status = :status",
                     ExpressionAttributeValues={
                         ":fid": str(flight_id),
                         ":status": str(booking_status),
                     },
+                    projection=projection,
                 )
             else:
-                response = self.bookings.query(
+                items = query_all(
+                    self.bookings,
                     IndexName="flight-status-index",
                     KeyConditionExpression="flight_id = :fid",
                     ExpressionAttributeValues={":fid": str(flight_id)},
+                    projection=projection,
                 )
-            return response.get("Items", [])
+            return items
         except Exception as e:
             logger.error(f"Error querying bookings for flight {flight_id}: {e}")
             return []
@@ -637,12 +977,12 @@ class DynamoDBClient:
     def query_baggage_by_booking(self, booking_id: str) -> List[Dict[str, Any]]:
         """Query baggage for a booking using GSI"""
         try:
-            response = self.baggage.query(
+            return query_all(
+                self.baggage,
                 IndexName="booking-index",
                 KeyConditionExpression="booking_id = :bid",
                 ExpressionAttributeValues={":bid": str(booking_id)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying baggage for booking {booking_id}: {e}")
             return []
@@ -663,37 +1003,44 @@ class DynamoDBClient:
     def query_cargo_by_shipment(self, shipment_id: str) -> List[Dict[str, Any]]:
         """Track cargo shipment across flights using GSI"""
         try:
-            response = self.cargo_flight_assignments.query(
+            return query_all(
+                self.cargo_flight_assignments,
                 IndexName="shipment-index",
                 KeyConditionExpression="shipment_id = :sid",
                 ExpressionAttributeValues={":sid": str(shipment_id)},
             )
-            return response.get("Items", [])
         except Exception as e:
             logger.error(f"Error querying cargo for shipment {shipment_id}: {e}")
             return []
 
     def query_cargo_by_flight(
-        self, flight_id: str, loading_status: str = None
+        self,
+        flight_id: str,
+        loading_status: str = None,
+        projection: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Query cargo for a flight using GSI"""
         try:
             if loading_status:
-                response = self.cargo_flight_assignments.query(
+                items = query_all(
+                    self.cargo_flight_assignments,
                     IndexName="flight-loading-index",
                     KeyConditionExpression="flight_id = :fid AND loading_status = :status",
                     ExpressionAttributeValues={
                         ":fid": str(flight_id),
                         ":status": str(loading_status),
                     },
+                    projection=projection,
                 )
             else:
-                response = self.cargo_flight_assignments.query(
+                items = query_all(
+                    self.cargo_flight_assignments,
                     IndexName="flight-loading-index",
                     KeyConditionExpression="flight_id = :fid",
                     ExpressionAttributeValues={":fid": str(flight_id)},
+                    projection=projection,
                 )
-            return response.get("Items", [])
+            return items
         except Exception as e:
             logger.error(f"Error querying cargo for flight {flight_id}: {e}")
             return []
@@ -709,6 +1056,78 @@ class DynamoDBClient:
             logger.error(f"Error getting cargo shipment {shipment_id}: {e}")
             return None
 
+    # ============================================================
+    # FLIGHT SUMMARIES
+    # ============================================================
+
+    def query_passengers_by_flight(
+        self, flight_id: str, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Query passenger records for a flight (V2: passengers first-leg GSI, V1: bookings)"""
+        if not is_v2_enabled():
+            return self.query_bookings_by_flight(flight_id, projection=projection)
+        try:
+            return query_all(
+                self.get_table("passengers"),
+                IndexName="first-leg-flight-index",
+                KeyConditionExpression="first_leg_flight_id = :fid",
+                ExpressionAttributeValues={":fid": str(flight_id)},
+                projection=projection,
+            )
+        except Exception as e:
+            logger.error(f"Error querying passengers for flight {flight_id}: {e}")
+            return []
+
+    def query_shipments_by_flight(
+        self, flight_id: str, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Query cargo records for a flight (V2: cargo_shipments first-leg GSI, V1: assignments)"""
+        if not is_v2_enabled():
+            return self.query_cargo_by_flight(flight_id, projection=projection)
+        try:
+            return query_all(
+                self.get_table("cargo_shipments"),
+                IndexName="first-leg-flight-index",
+                KeyConditionExpression="first_leg_flight_id = :fid",
+                ExpressionAttributeValues={":fid": str(flight_id)},
+                projection=projection,
+            )
+        except Exception as e:
+            logger.error(f"Error querying cargo shipments for flight {flight_id}: {e}")
+            return []
+
+    def summarize_flight_passengers(self, flight_id: str, include_records: bool = False) -> Dict[str, Any]:
+        """
+        Aggregate a flight's passengers in Python (see database.summaries).
+
+        Args:
+            flight_id: Flight ID
+            include_records: Also return the raw passenger records
+
+        Returns:
+            dict: Counts by cabin class, tier and booking status, connection
+            counts and fare revenue
+        """
+        records = self.query_passengers_by_flight(flight_id)
+        summary = {"flight_id": flight_id, **summarize_passengers(records)}
+        return with_records(summary, records, include_records)
+
+    def summarize_flight_cargo(self, flight_id: str, include_records: bool = False) -> Dict[str, Any]:
+        """
+        Aggregate a flight's cargo in Python (see database.summaries).
+
+        Args:
+            flight_id: Flight ID
+            include_records: Also return the raw shipment records
+
+        Returns:
+            dict: Total weight, weight and count by commodity,
+            temperature-controlled totals, revenue and declared value
+        """
+        records = self.query_shipments_by_flight(flight_id)
+        summary = {"flight_id": flight_id, **summarize_cargo(records)}
+        return with_records(summary, records, include_records)
+
     # ============================================================
     # BATCH QUERY METHODS
     # ============================================================
@@ -717,98 +1136,76 @@ class DynamoDBClient:
         self,
         table_name: str,
         keys: List[Dict[str, Any]],
-        max_batch_size: int = 100
-    ) -> List[Dict[str, Any]]:
+        max_batch_size: int = 100,
+        projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
         """
         Batch get items from DynamoDB table.
 
-        Automatically splits requests into batches of max_batch_size.
-        Handles unprocessed keys with exponential backoff retry.
+        Splits keys into batches of max_batch_size and retries unprocessed keys
+        with jittered exponential backoff. Batches are issued one after another
+        on the calling thread (batch_get_all_sync); async callers use
+        abatch_get_items to issue them concurrently.
 
         Args:
             table_name: DynamoDB table name
             keys: List of primary key dicts (e.g., [{"crew_id": "C001"}, {"crew_id": "C002"}])
             max_batch_size: Max items per batch (default 100, AWS limit)
+            projection: Optional attribute names to return (ProjectionExpression)
 
         Returns:
-            List of items retrieved
+            BatchGetResult: List of items retrieved, with the read capacity
+            units consumed by the call in .consumed_capacity
 
         Example:
             keys = [{"crew_id": "C001"}, {"crew_id": "C002"}]
             items = client.batch_get_items("CrewMembers", keys)
         """
-        if not keys:
-            return []
+        return batch_get_all_sync(
+            self.client.batch_get_item, table_name, keys, max_batch_size, projection
+        )
 
-        # Split into batches of max_batch_size
-        batches = [keys[i:i + max_batch_size] for i in range(0, len(keys), max_batch_size)]
-        logger.debug(f"Batch get: {len(keys)} items split into {len(batches)} batches")
-
-        all_items = []
-        for batch_idx, batch in enumerate(batches):
-            unprocessed = batch
-            attempt_count = 0
-            max_attempts = 4  # Initial attempt + 3 retries
-            batch_items_collected = []
-
-            while unprocessed and attempt_count < max_attempts:
-                try:
-                    response = self.client.batch_get_item(
-                        RequestItems={
-                            table_name: {'Keys': unprocessed}
-                        }
-                    )
-
-                    # Collect successful items from this attempt
-                    batch_items = response.get('Responses', {}).get(table_name, [])
-                    batch_items_collected.extend(batch_items)
-                    logger.debug(f"Batch {batch_idx + 1}/{len(batches)}: Retrieved {len(batch_items)} items")
-
-                    # Handle unprocessed keys
-                    unprocessed_response = response.get('UnprocessedKeys', {})
-                    if table_name in unprocessed_response:
-                        unprocessed = unprocessed_response[table_name].get('Keys', [])
-                    else:
-                        unprocessed = []
-
-                    if unprocessed:
-                        attempt_count += 1
-                        if attempt_count < max_attempts:
-                            # Exponential backoff
-                            wait_time = (2 ** (attempt_count - 1)) * 0.1
-                            logger.warning(
-                                f"Batch {batch_idx + 1}/{len(batches)}: {len(unprocessed)} unprocessed keys, "
-                                f"retrying after {wait_time}s (retry {attempt_count}/{max_attempts - 1})"
-                            )
-                            time.sleep(wait_time)
-                    else:
-                        # All items processed successfully
-                        break
-
-                except Exception as e:
-                    logger.error(f"Error in batch get (batch {batch_idx + 1}/{len(batches)}): {e}")
-                    attempt_count += 1
-                    if attempt_count < max_attempts:
-                        # Exponential backoff on error
-                        wait_time = (2 ** (attempt_count - 1)) * 0.1
-                        time.sleep(wait_time)
-
-            # Add all items collected for this batch
-            all_items.extend(batch_items_collected)
-
-            if unprocessed:
-                logger.warning(
-                    f"Batch {batch_idx + 1}/{len(batches)}: Failed to process {len(unprocessed)} keys "
-                    f"after {max_attempts} attempts"
-                )
+    async def abatch_get_items(
+        self,
+        table_name: str,
+        keys: List[Dict[str, Any]],
+        max_batch_size: int = 100,
+        projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
+        """
+        Batch get items from DynamoDB table, issuing the batches concurrently.
+
+        asyncio counterpart of batch_get_items: at most
+        BATCH_GET_MAX_CONCURRENCY requests are in flight, and the backoff
+        before retrying unprocessed keys is awaited (batch_get_all).
 
-        logger.info(f"Batch get complete: Retrieved {len(all_items)}/{len(keys)} items")
-        return all_items
+        Args:
+            table_name: DynamoDB table name
+            keys: List of primary key dicts
+            max_batch_size: Max items per batch (default 100, AWS limit)
+            projection: Optional attribute names to return (ProjectionExpression)
+
+        Returns:
+            BatchGetResult: List of items retrieved, with the read capacity consumed
+
+        Example:
+            items = await client.abatch_get_items("CrewMembers", keys)
+        """
+        return await batch_get_all(
+            self._request_batch_get, table_name, keys, max_batch_size, projection
+        )
+
+    async def _request_batch_get(self, **kwargs) -> Dict[str, Any]:
+        """Issue one BatchGetItem request on the executor (boto3 is blocking)."""
+        loop = asyncio.get_running_loop()
+        request = functools.partial(contextvars.copy_context().run, self.client.batch_get_item, **kwargs)
+        return await loop.run_in_executor(None, request)
 
     def batch_get_crew_members(
         self,
-        crew_ids: List[str]
-    ) -> List[Dict[str, Any]]:
+        crew_ids: List[str],
+        projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
         """
         Batch get crew member details.
 
@@ -817,6 +1214,7 @@ class DynamoDBClient:
 
         Args:
             crew_ids: List of crew member IDs
+            projection: Optional attribute names to return
 
         Returns:
             List of crew member records
@@ -825,16 +1223,14 @@ class DynamoDBClient:
             crew_ids = ["C001", "C002", "C003"]
             members = client.batch_get_crew_members(crew_ids)
         """
-        if not crew_ids:
-            return []
-
         keys = [{"crew_id": str(crew_id)} for crew_id in crew_ids]
-        return self.batch_get_items("CrewMembers", keys)
+        return self.batch_get_items("CrewMembers", keys, projection=projection)
 
     def batch_get_flights(
         self,
-        flight_ids: List[str]
-    ) -> List[Dict[str, Any]]:
+        flight_ids: List[str],
+        projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
         """
         Batch get flight details.
 
@@ -843,6 +1239,7 @@ class DynamoDBClient:
 
         Args:
             flight_ids: List of flight IDs
+            projection: Optional attribute names to return
 
         Returns:
             List of flight records
@@ -851,16 +1248,14 @@ class DynamoDBClient:
             flight_ids = ["FL001", "FL002", "FL003"]
             flights = client.batch_get_flights(flight_ids)
         """
-        if not flight_ids:
-            return []
-
         keys = [{"flight_id": str(flight_id)} for flight_id in flight_ids]
-        return self.batch_get_items("Flights", keys)
+        return self.batch_get_items("Flights", keys, projection=projection)
 
     def batch_get_passengers(
         self,
-        passenger_ids: List[str]
-    ) -> List[Dict[str, Any]]:
+        passenger_ids: List[str],
+        projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
         """
         Batch get passenger details.
 
@@ -869,6 +1264,7 @@ class DynamoDBClient:
 
         Args:
             passenger_ids: List of passenger IDs
+            projection: Optional attribute names to return
 
         Returns:
             List of passenger records
@@ -877,16 +1273,14 @@ class DynamoDBClient:
             passenger_ids = ["P001", "P002", "P003"]
             passengers = client.batch_get_passengers(passenger_ids)
         """
-        if not passenger_ids:
-            return []
-
         keys = [{"passenger_id": str(passenger_id)} for passenger_id in passenger_ids]
-        return self.batch_get_items("Passengers", keys)
+        return self.batch_get_items("Passengers", keys, projection=projection)
 
     def batch_get_cargo_shipments(
         self,
-        shipment_ids: List[str]
-    ) -> List[Dict[str, Any]]:
+        shipment_ids: List[str],
+        projection: Optional[List[str]] = None
+    ) -> BatchGetResult:
         """
         Batch get cargo shipment details.
 
@@ -895,6 +1289,7 @@ class DynamoDBClient:
 
         Args:
             shipment_ids: List of shipment IDs
+            projection: Optional attribute names to return
 
         Returns:
             List of cargo shipment records
@@ -903,16 +1298,70 @@ class DynamoDBClient:
             shipment_ids = ["SH001", "SH002", "SH003"]
             shipments = client.batch_get_cargo_shipments(shipment_ids)
         """
-        if not shipment_ids:
-            return []
-
         keys = [{"shipment_id": str(shipment_id)} for shipment_id in shipment_ids]
-        return self.batch_get_items("CargoShipments", keys)
+        return self.batch_get_items("CargoShipments", keys, projection=projection)
 
     # ============================================================
     # UTILITY METHODS
     # ============================================================
 
     def to_json(self, data: Any) -> str:
-        """Convert DynamoDB data to JSON string"""
+        """Convert DynamoDB data to JSON string (minified unless TOOL_OUTPUT_MODE=full)"""
+        if compact_output_enabled():
+            return to_tool_json(data)
         return json.dumps(data, cls=DecimalEncoder, indent=2)
+
+
+def get_dynamodb_resource():
+    """
+    Get the process-wide pooled DynamoDB resource.
+
+    Agent @tool functions use this instead of calling boto3.resource() per
+    invocation, so the session, credential chain and HTTP connection pool are
+    created once and shared across all agents and phases. Reads through it are
+    served from the request cache inside a request scope (see request_cache).
+
+    Returns:
+        boto3 DynamoDB ServiceResource (request-cached) owned by the DynamoDBClient singleton
+    """
+    return DynamoDBClient().dynamodb
+
+
+def warm_table_handles(
+    logical_names: Tuple[str, ...] = WARMUP_TABLES,
+    describe: bool = True
+) -> Dict[str, Any]:
+    """
+    Resolve the agents' table handles ahead of the first request.
+
+    Handles are resolved for the current TABLE_VERSION and shared with every
+    later caller. With describe=True each table is also loaded (DescribeTable),
+    which resolves credentials and the endpoint and opens pooled connections,
+    so the first disruption does not pay for those round-trips. Tables that
+    fail are skipped and resolved on demand.
+
+    Args:
+        logical_names: Logical tables to warm (defaults to the agents' tables)
+        describe: Issue DescribeTable for each table (skipped with DYNAMODB_BACKEND=local)
+
+    Returns:
+        dict: Physical tables warmed, logical tables that failed, and duration
+    """
+    client = DynamoDBClient()
+    describe = describe and not local_backend_enabled()
+    warmed: List[str] = []
+    failed: List[str] = []
+    start = time.time()
+    for logical_name in logical_names:
+        try:
+            table = client.get_table(logical_name)
+            if describe:
+                table.load()
+            warmed.append(get_table_name(logical_name))
+        except Exception as e:
+            logger.warning(f"⚠️  Table warmup failed for {logical_name}: {e}")
+            failed.append(logical_name)
+
+    stats = {"warmed": warmed, "failed": failed, "duration_seconds": round(time.time() - start, 3)}
+    logger.info(f"🔥 Warmed {len(warmed)} table handles in {stats['duration_seconds']}s ({len(failed)} failed)")
+    return stats
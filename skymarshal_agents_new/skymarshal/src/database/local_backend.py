@@ -0,0 +1,769 @@
+"""In-process DynamoDB stand-in for offline runs and benchmarks
+
+DYNAMODB_BACKEND=local makes DynamoDBClient (and with it the agent tools, the
+async client and CheckpointSaver production mode) read and write an
+in-process store instead of AWS. Tables are created from V1_TABLE_SCHEMAS /
+V2_TABLE_SCHEMAS and loaded from the generated CSVs:
+
+- LOCAL_DYNAMODB_DATA_DIR/*.csv      V1 tables (V1_CSV_TO_TABLE_MAPPING)
+- LOCAL_DYNAMODB_DATA_DIR/v2/*.csv   V2 tables (CSV_TO_TABLE_MAPPING)
+
+CSV values are typed the way the import scripts type them (IDs and codes
+stay strings, numbers become Decimal, true/false become bool).
+
+The store answers the Table operations the data layer uses (get_item,
+put_item, delete_item, query, scan, batch_writer) and resource-level
+batch_get_item, with DynamoDB semantics for what the agents depend on:
+hash-partitioned GSIs with sorted sort keys, key condition / filter /
+condition / projection expressions, Limit + LastEvaluatedKey paging,
+sparse indexes and ClientError codes. Capacity, throttling, the 1 MB page
+limit and reserved-word checks are not emulated. The low-level client handle
+shares the same store and takes Python values, like the resource API.
+
+Usage:
+    DYNAMODB_BACKEND=local LOCAL_DYNAMODB_DATA_DIR=../../database/output \\
+        python -m database.local_backend
+"""
+
+import copy
+import csv
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+try:
+    from database.table_config import (
+        CSV_TO_TABLE_MAPPING,
+        V1_CSV_TO_TABLE_MAPPING,
+        V1_TABLE_SCHEMAS,
+        V2_TABLE_SCHEMAS,
+        TableSchema,
+    )
+except ImportError:
+    from table_config import (
+        CSV_TO_TABLE_MAPPING,
+        V1_CSV_TO_TABLE_MAPPING,
+        V1_TABLE_SCHEMAS,
+        V2_TABLE_SCHEMAS,
+        TableSchema,
+    )
+
+logger = logging.getLogger(__name__)
+
+# "aws" (default) or "local" (in-process store loaded from CSVs)
+DYNAMODB_BACKEND = os.getenv("DYNAMODB_BACKEND", "aws").lower()
+
+# Directory holding the generated CSVs (V2 files in its v2/ subdirectory)
+LOCAL_DYNAMODB_DATA_DIR = os.getenv(
+    "LOCAL_DYNAMODB_DATA_DIR",
+    str(Path(__file__).resolve().parents[4] / "database" / "output"),
+)
+
+# Checkpoint table used by CheckpointSaver in production mode
+CHECKPOINT_TABLE_SCHEMA = TableSchema(
+    partition_key="PK",
+    sort_key="SK",
+    sort_key_type="S",
+    gsis=[{"name": "thread-status-index", "pk": "thread_id", "sk": "status"}],
+)
+
+# Columns kept as strings when loading CSVs (mirrors scripts/import_v2_data.py)
+_STRING_COLUMN_SUFFIXES = (
+    "_id", "_number", "pnr", "code", "name", "type", "status", "regulation",
+    "category", "connection_type", "role", "base", "aircraft_registration",
+    "airport_code", "equipment_type", "origin", "destination",
+)
+
+_MISSING = object()
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def local_backend_enabled() -> bool:
+    """Check whether DynamoDB access is served from the in-process store."""
+    return DYNAMODB_BACKEND == "local"
+
+
+def _client_error(code: str, message: str, operation: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+
+def _normalize(value: Any) -> Any:
+    """Round-trip a value through boto3's type (de)serializer (ints become Decimal, floats are rejected)."""
+    return _deserializer.deserialize(_serializer.serialize(value))
+
+
+# ============================================================
+# EXPRESSIONS
+# ============================================================
+
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:(<>|<=|>=|[=<>(),.\[\]])|(:[A-Za-z0-9_]+)|(#[A-Za-z0-9_]+)|(\d+)|([A-Za-z_][A-Za-z0-9_\-]*))"
+)
+_KEYWORDS = {"AND", "OR", "NOT", "BETWEEN", "IN"}
+_FUNCTIONS = {"attribute_exists", "attribute_not_exists", "attribute_type", "begins_with", "contains"}
+_TYPE_NAMES = {
+    str: "S", Decimal: "N", bytes: "B", bool: "BOOL", type(None): "NULL", list: "L", dict: "M",
+}
+
+
+def _tokenize(expression: str) -> List[str]:
+    tokens, position = [], 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN_PATTERN.match(expression, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Invalid expression near: {expression[position:]!r}")
+        tokens.append(next(group for group in match.groups() if group is not None))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser for condition, key condition and projection expressions."""
+
+    def __init__(self, expression: str, names: Dict[str, str]):
+        self.tokens = _tokenize(expression)
+        self.position = 0
+        self.names = names
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self, expected: Optional[str] = None) -> str:
+        token = self.peek()
+        if token is None or (expected is not None and token.upper() != expected):
+            raise ValueError(f"Expected {expected or 'token'}, got {token!r}")
+        self.position += 1
+        return token
+
+    def at_keyword(self, keyword: str) -> bool:
+        token = self.peek()
+        return token is not None and token.upper() == keyword
+
+    def done(self) -> None:
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected token {self.peek()!r}")
+
+    def condition(self) -> tuple:
+        node = self.conjunction()
+        while self.at_keyword("OR"):
+            self.take()
+            node = ("or", node, self.conjunction())
+        return node
+
+    def conjunction(self) -> tuple:
+        node = self.negation()
+        while self.at_keyword("AND"):
+            self.take()
+            node = ("and", node, self.negation())
+        return node
+
+    def negation(self) -> tuple:
+        if self.at_keyword("NOT"):
+            self.take()
+            return ("not", self.negation())
+        return self.comparison()
+
+    def comparison(self) -> tuple:
+        if self.peek() == "(":
+            self.take()
+            node = self.condition()
+            self.take(")")
+            return node
+        if self.peek() in _FUNCTIONS:
+            name = self.take()
+            return ("func", name, self.arguments())
+
+        left = self.operand()
+        token = self.peek()
+        if token in ("=", "<>", "<", "<=", ">", ">="):
+            self.take()
+            return ("cmp", token, left, self.operand())
+        if self.at_keyword("BETWEEN"):
+            self.take()
+            low = self.operand()
+            self.take("AND")
+            return ("between", left, low, self.operand())
+        if self.at_keyword("IN"):
+            self.take()
+            return ("in", left, self.arguments())
+        raise ValueError(f"Expected comparison after operand, got {token!r}")
+
+    def arguments(self) -> List[tuple]:
+        self.take("(")
+        arguments = [self.operand()]
+        while self.peek() == ",":
+            self.take()
+            arguments.append(self.operand())
+        self.take(")")
+        return arguments
+
+    def operand(self) -> tuple:
+        token = self.peek()
+        if token is not None and token.startswith(":"):
+            return ("value", self.take())
+        if token == "size":
+            self.take()
+            return ("size", self.arguments()[0])
+        return self.path()
+
+    def path(self) -> tuple:
+        segments: List[Any] = [self.name()]
+        while self.peek() in (".", "["):
+            if self.take() == ".":
+                segments.append(self.name())
+            else:
+                segments.append(int(self.take()))
+                self.take("]")
+        return ("path", segments)
+
+    def name(self) -> str:
+        token = self.take()
+        if token.startswith("#"):
+            if token not in self.names:
+                raise ValueError(f"An expression attribute name used in the document path is not defined: {token}")
+            return self.names[token]
+        if token.upper() in _KEYWORDS or not re.match(r"^[A-Za-z_]", token):
+            raise ValueError(f"Invalid attribute name {token!r}")
+        return token
+
+
+def _parse_condition(expression: str, names: Dict[str, str]) -> tuple:
+    parser = _Parser(expression, names)
+    node = parser.condition()
+    parser.done()
+    return node
+
+
+def _parse_projection(expression: str, names: Dict[str, str]) -> List[List[Any]]:
+    parser = _Parser(expression, names)
+    paths = [parser.path()[1]]
+    while parser.peek() == ",":
+        parser.take()
+        paths.append(parser.path()[1])
+    parser.done()
+    return paths
+
+
+def _resolve_path(item: Any, segments: List[Any]) -> Any:
+    for segment in segments:
+        if isinstance(segment, int):
+            if not isinstance(item, list) or segment >= len(item):
+                return _MISSING
+        elif not isinstance(item, dict) or segment not in item:
+            return _MISSING
+        item = item[segment]
+    return item
+
+
+def _operand(node: tuple, item: Dict[str, Any], values: Dict[str, Any]) -> Any:
+    kind = node[0]
+    if kind == "value":
+        if node[1] not in values:
+            raise ValueError(f"An expression attribute value used in expression is not defined: {node[1]}")
+        return values[node[1]]
+    if kind == "size":
+        value = _resolve_path(item, node[1][1])
+        return _MISSING if value is _MISSING or isinstance(value, (bool, Decimal)) else Decimal(len(value))
+    return _resolve_path(item, node[1])
+
+
+def _compare(op: str, left: Any, right: Any) -> bool:
+    if left is _MISSING or right is _MISSING:
+        return op == "<>" and not (left is _MISSING and right is _MISSING)
+    if op == "=":
+        return type(left) is type(right) and left == right
+    if op == "<>":
+        return not (type(left) is type(right) and left == right)
+    if type(left) is not type(right) or not isinstance(left, (str, Decimal, bytes)):
+        return False
+    return {"<": left < right, "<=": left <= right, ">": left > right, ">=": left >= right}[op]
+
+
+def _evaluate(node: tuple, item: Dict[str, Any], values: Dict[str, Any]) -> bool:
+    kind = node[0]
+    if kind == "and":
+        return _evaluate(node[1], item, values) and _evaluate(node[2], item, values)
+    if kind == "or":
+        return _evaluate(node[1], item, values) or _evaluate(node[2], item, values)
+    if kind == "not":
+        return not _evaluate(node[1], item, values)
+    if kind == "cmp":
+        return _compare(node[1], _operand(node[2], item, values), _operand(node[3], item, values))
+    if kind == "between":
+        value = _operand(node[1], item, values)
+        return (_compare(">=", value, _operand(node[2], item, values))
+                and _compare("<=", value, _operand(node[3], item, values)))
+    if kind == "in":
+        value = _operand(node[1], item, values)
+        return any(_compare("=", value, _operand(option, item, values)) for option in node[2])
+
+    name, arguments = node[1], node[2]
+    value = _operand(arguments[0], item, values)
+    if name == "attribute_exists":
+        return value is not _MISSING
+    if name == "attribute_not_exists":
+        return value is _MISSING
+    operand = _operand(arguments[1], item, values)
+    if value is _MISSING or operand is _MISSING:
+        return False
+    if name == "begins_with":
+        return isinstance(value, (str, bytes)) and type(value) is type(operand) and value.startswith(operand)
+    if name == "contains":
+        if isinstance(value, str):
+            return isinstance(operand, str) and operand in value
+        return isinstance(value, (list, set)) and operand in value
+    return _TYPE_NAMES.get(type(value), "SS" if isinstance(value, set) else None) == operand
+
+
+def _project(item: Dict[str, Any], paths: List[List[Any]]) -> Dict[str, Any]:
+    projected: Dict[str, Any] = {}
+    for segments in paths:
+        if any(isinstance(segment, int) for segment in segments):
+            segments = segments[:1]  # List elements: project the whole top-level attribute
+        value = _resolve_path(item, segments)
+        if value is _MISSING:
+            continue
+        target = projected
+        for segment in segments[:-1]:
+            target = target.setdefault(segment, {})
+        target[segments[-1]] = value
+    return projected
+
+
+def _sort_value(value: Any) -> Tuple[int, Any]:
+    return (0, value) if isinstance(value, Decimal) else (1, value)
+
+
+# ============================================================
+# TABLES
+# ============================================================
+
+class LocalTable:
+    """
+    One table of the in-process store.
+
+    Items are kept by primary key; every index (the table's own partition key
+    and each GSI) maps partition values to the items carrying that key, so
+    queries touch one partition instead of the whole table.
+    """
+
+    def __init__(self, name: str, schema: TableSchema):
+        self.name = name
+        self.table_name = name
+        self.schema = schema
+        self._lock = threading.RLock()
+        self._items: Dict[tuple, Dict[str, Any]] = {}
+        self._indexes: Dict[Optional[str], Tuple[str, Optional[str]]] = {
+            None: (schema.partition_key, schema.sort_key)
+        }
+        for gsi in schema.gsis or []:
+            self._indexes[gsi["name"]] = (gsi["pk"], gsi.get("sk"))
+        self._partitions: Dict[Optional[str], Dict[Any, Dict[tuple, Dict[str, Any]]]] = {
+            index: {} for index in self._indexes
+        }
+
+    # -------------------- keys and indexes --------------------
+
+    @property
+    def key_attributes(self) -> Tuple[str, ...]:
+        return tuple(a for a in (self.schema.partition_key, self.schema.sort_key) if a)
+
+    def _primary_key(self, key: Dict[str, Any], operation: str) -> tuple:
+        if set(key) != set(self.key_attributes):
+            raise _client_error(
+                "ValidationException", "The provided key element does not match the schema", operation
+            )
+        return tuple(key[a] for a in self.key_attributes)
+
+    def _index_entries(self, item: Dict[str, Any]) -> Iterator[Tuple[Optional[str], Any]]:
+        for index, (pk, sk) in self._indexes.items():
+            if pk in item and (sk is None or sk in item):
+                yield index, item[pk]
+
+    def _store(self, item: Dict[str, Any]) -> None:
+        key = tuple(item[a] for a in self.key_attributes)
+        self._remove(key)
+        self._items[key] = item
+        for index, partition_value in self._index_entries(item):
+            self._partitions[index].setdefault(partition_value, {})[key] = item
+
+    def _remove(self, key: tuple) -> Optional[Dict[str, Any]]:
+        old = self._items.pop(key, None)
+        if old is not None:
+            for index, partition_value in self._index_entries(old):
+                partition = self._partitions[index].get(partition_value, {})
+                partition.pop(key, None)
+                if not partition:
+                    self._partitions[index].pop(partition_value, None)
+        return old
+
+    def load_items(self, items: List[Dict[str, Any]]) -> int:
+        """Bulk-load already typed items (no (de)serialization round trip)."""
+        loaded = 0
+        with self._lock:
+            for item in items:
+                if all(a in item for a in self.key_attributes):
+                    self._store(item)
+                    loaded += 1
+        return loaded
+
+    def item_count(self) -> int:
+        return len(self._items)
+
+    # -------------------- reads --------------------
+
+    def get_item(self, **kwargs) -> Dict[str, Any]:
+        key = self._primary_key(_normalize(kwargs["Key"]), "GetItem")
+        with self._lock:
+            item = self._items.get(key)
+        if item is None:
+            return {}
+        return {"Item": _read_output(item, kwargs)}
+
+    def query(self, **kwargs) -> Dict[str, Any]:
+        index = kwargs.get("IndexName")
+        if index not in self._indexes:
+            raise _client_error("ValidationException", "The table does not have the specified index", "Query")
+        pk, sk = self._indexes[index]
+        condition, names, values = _condition_params(kwargs, "KeyConditionExpression", "Query", is_key=True)
+        partition_value = _partition_value(condition, pk, values)
+        if partition_value is _MISSING:
+            raise _client_error("ValidationException", f"Query condition missed key schema element: {pk}", "Query")
+
+        with self._lock:
+            candidates = list(self._partitions[index].get(partition_value, {}).values())
+        candidates = [item for item in candidates if _evaluate(condition, item, values)]
+        if sk is not None:
+            candidates.sort(key=lambda item: _sort_value(item[sk]))
+        if kwargs.get("ScanIndexForward") is False:
+            candidates.reverse()
+        return self._page(candidates, kwargs, names, values, index, "Query")
+
+    def scan(self, **kwargs) -> Dict[str, Any]:
+        index = kwargs.get("IndexName")
+        if index not in self._indexes:
+            raise _client_error("ValidationException", "The table does not have the specified index", "Scan")
+        names = dict(kwargs.get("ExpressionAttributeNames") or {})
+        values = _normalize(dict(kwargs.get("ExpressionAttributeValues") or {}))
+        with self._lock:
+            if index is None:
+                candidates = list(self._items.values())
+            else:
+                candidates = [
+                    item for partition in self._partitions[index].values() for item in partition.values()
+                ]
+        return self._page(candidates, kwargs, names, values, index, "Scan")
+
+    def _page(
+        self,
+        candidates: List[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+        names: Dict[str, str],
+        values: Dict[str, Any],
+        index: Optional[str],
+        operation: str
+    ) -> Dict[str, Any]:
+        """Apply ExclusiveStartKey, Limit, FilterExpression, projection and Select."""
+        key_attributes = self.key_attributes + tuple(a for a in self._indexes.get(index, ()) if a)
+        start = kwargs.get("ExclusiveStartKey")
+        if start:
+            start = _normalize(start)
+            position = next(
+                (i for i, item in enumerate(candidates)
+                 if all(item.get(a) == start.get(a) for a in key_attributes)),
+                None,
+            )
+            candidates = candidates[position + 1:] if position is not None else candidates
+
+        limit = kwargs.get("Limit")
+        last_key = None
+        if limit is not None and len(candidates) > limit:
+            candidates = candidates[:limit]
+            last_key = {a: candidates[-1][a] for a in key_attributes if a in candidates[-1]}
+
+        scanned = len(candidates)
+        if kwargs.get("FilterExpression") is not None:
+            condition, names, values = _condition_params(kwargs, "FilterExpression", operation)
+            candidates = [item for item in candidates if _evaluate(condition, item, values)]
+
+        response: Dict[str, Any] = {"Count": len(candidates), "ScannedCount": scanned}
+        if kwargs.get("Select") != "COUNT":
+            response["Items"] = [_read_output(item, kwargs) for item in candidates]
+        if last_key is not None:
+            response["LastEvaluatedKey"] = last_key
+        if kwargs.get("ReturnConsumedCapacity") in ("TOTAL", "INDEXES"):
+            response["ConsumedCapacity"] = {"TableName": self.name, "CapacityUnits": _read_units(candidates)}
+        return response
+
+    # -------------------- writes --------------------
+
+    def put_item(self, **kwargs) -> Dict[str, Any]:
+        item = _normalize(kwargs["Item"])
+        key = self._primary_key({a: item.get(a) for a in self.key_attributes if a in item}, "PutItem")
+        with self._lock:
+            self._check_condition(kwargs, self._items.get(key), "PutItem")
+            old = self._items.get(key)
+            self._store(item)
+        return {"Attributes": copy.deepcopy(old)} if old and kwargs.get("ReturnValues") == "ALL_OLD" else {}
+
+    def delete_item(self, **kwargs) -> Dict[str, Any]:
+        key = self._primary_key(_normalize(kwargs["Key"]), "DeleteItem")
+        with self._lock:
+            self._check_condition(kwargs, self._items.get(key), "DeleteItem")
+            old = self._remove(key)
+        return {"Attributes": copy.deepcopy(old)} if old and kwargs.get("ReturnValues") == "ALL_OLD" else {}
+
+    def _check_condition(self, kwargs: Dict[str, Any], existing: Optional[Dict[str, Any]], operation: str) -> None:
+        if kwargs.get("ConditionExpression") is None:
+            return
+        condition, _, values = _condition_params(kwargs, "ConditionExpression", operation)
+        if not _evaluate(condition, existing or {}, values):
+            raise _client_error("ConditionalCheckFailedException", "The conditional request failed", operation)
+
+    def batch_writer(self, overwrite_by_pkeys: Optional[List[str]] = None) -> "LocalBatchWriter":
+        return LocalBatchWriter(self)
+
+
+class LocalBatchWriter:
+    """batch_writer() stand-in applying each write immediately."""
+
+    def __init__(self, table: LocalTable):
+        self._table = table
+
+    def put_item(self, Item: Dict[str, Any]) -> None:
+        self._table.put_item(Item=Item)
+
+    def delete_item(self, Key: Dict[str, Any]) -> None:
+        self._table.delete_item(Key=Key)
+
+    def __enter__(self) -> "LocalBatchWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+class _MissingTable:
+    """Handle for a table the store does not have (boto3 Table() is lazy too)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.table_name = name
+
+    def __getattr__(self, operation: str) -> Callable:
+        def fail(**kwargs):
+            raise _client_error(
+                "ResourceNotFoundException", f"Requested resource not found: Table: {self.name} not found", operation
+            )
+        return fail
+
+
+def _condition_params(
+    kwargs: Dict[str, Any],
+    parameter: str,
+    operation: str,
+    is_key: bool = False
+) -> Tuple[tuple, Dict[str, str], Dict[str, Any]]:
+    """Parse a condition parameter (string or boto3 Key/Attr condition) with its placeholders."""
+    expression = kwargs[parameter]
+    names = dict(kwargs.get("ExpressionAttributeNames") or {})
+    values = dict(kwargs.get("ExpressionAttributeValues") or {})
+    if isinstance(expression, ConditionBase):
+        built = ConditionExpressionBuilder().build_expression(expression, is_key_condition=is_key)
+        expression = built.condition_expression
+        names.update(built.attribute_name_placeholders)
+        values.update(built.attribute_value_placeholders)
+    try:
+        return _parse_condition(expression, names), names, _normalize(values)
+    except (ValueError, TypeError) as e:
+        raise _client_error("ValidationException", f"Invalid {parameter}: {e}", operation) from e
+
+
+def _partition_value(condition: tuple, partition_key: str, values: Dict[str, Any]) -> Any:
+    """Find the "pk = :value" equality in a key condition."""
+    if condition[0] == "and":
+        found = _partition_value(condition[1], partition_key, values)
+        return found if found is not _MISSING else _partition_value(condition[2], partition_key, values)
+    if condition[0] == "cmp" and condition[1] == "=":
+        for path, value in ((condition[2], condition[3]), (condition[3], condition[2])):
+            if path == ("path", [partition_key]) and value[0] == "value":
+                return values.get(value[1], _MISSING)
+    return _MISSING
+
+
+def _read_output(item: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an item for the caller, applying ProjectionExpression."""
+    expression = kwargs.get("ProjectionExpression")
+    if expression:
+        item = _project(item, _parse_projection(expression, kwargs.get("ExpressionAttributeNames") or {}))
+    return copy.deepcopy(item)
+
+
+def _read_units(items: List[Dict[str, Any]]) -> float:
+    """Eventually consistent read units for items (0.5 per started 4 KB)."""
+    size = sum(len(json.dumps(item, default=str)) for item in items)
+    return max(0.5, math.ceil(size / 4096) * 0.5)
+
+
+# ============================================================
+# STORE
+# ============================================================
+
+class LocalDynamoDB:
+    """
+    In-process stand-in for the boto3 DynamoDB resource (and client).
+
+    Table() returns LocalTable handles; unknown tables fail on first use with
+    ResourceNotFoundException, as the lazy boto3 handles do.
+    """
+
+    def __init__(self, schemas: Optional[Dict[str, TableSchema]] = None):
+        self.tables: Dict[str, LocalTable] = {}
+        for name, schema in (schemas if schemas is not None else local_table_schemas()).items():
+            self.create_table(name, schema)
+
+    def create_table(self, name: str, schema: TableSchema) -> LocalTable:
+        self.tables[name] = LocalTable(name, schema)
+        return self.tables[name]
+
+    def Table(self, name: str) -> Any:
+        return self.tables.get(name) or _MissingTable(name)
+
+    def batch_get_item(self, **kwargs) -> Dict[str, Any]:
+        request_items = kwargs["RequestItems"]
+        if sum(len(request["Keys"]) for request in request_items.values()) > 100:
+            raise _client_error("ValidationException", "Too many items requested for the BatchGetItem call", "BatchGetItem")
+
+        responses: Dict[str, List[Dict[str, Any]]] = {}
+        capacity = []
+        for table_name, request in request_items.items():
+            table = self.Table(table_name)
+            keys = [json.dumps(key, sort_keys=True, default=str) for key in request["Keys"]]
+            if len(set(keys)) != len(keys):
+                raise _client_error(
+                    "ValidationException", "Provided list of item keys contains duplicates", "BatchGetItem"
+                )
+            params = {k: v for k, v in request.items() if k != "Keys"}
+            items = [table.get_item(Key=key, **params).get("Item") for key in request["Keys"]]
+            responses[table_name] = [item for item in items if item is not None]
+            capacity.append({"TableName": table_name, "CapacityUnits": _read_units(responses[table_name])})
+
+        response: Dict[str, Any] = {"Responses": responses, "UnprocessedKeys": {}}
+        if kwargs.get("ReturnConsumedCapacity") in ("TOTAL", "INDEXES"):
+            response["ConsumedCapacity"] = capacity
+        return response
+
+    def load_csv(self, path: Path, table_name: str) -> int:
+        """Load one CSV file into a table, typing values like the import scripts."""
+        table = self.tables[table_name]
+        key_types = _key_types(table.schema)
+        with open(path, newline="", encoding="utf-8") as f:
+            items = [
+                {column: value for column, value in (
+                    (column, _csv_value(raw, column, key_types.get(column)))
+                    for column, raw in row.items() if column and column.strip()
+                ) if value is not None}
+                for row in csv.DictReader(f)
+            ]
+        return table.load_items(items)
+
+    def load_directory(self, data_dir: str) -> Dict[str, int]:
+        """Load every mapped CSV found in data_dir (V1) and data_dir/v2 (V2)."""
+        loaded: Dict[str, int] = {}
+        root = Path(data_dir)
+        for directory, mapping in ((root, V1_CSV_TO_TABLE_MAPPING), (root / "v2", CSV_TO_TABLE_MAPPING)):
+            for filename, table_name in mapping.items():
+                path = directory / filename
+                if path.is_file():
+                    loaded[table_name] = loaded.get(table_name, 0) + self.load_csv(path, table_name)
+        return loaded
+
+    def get_stats(self) -> Dict[str, int]:
+        """Item count per non-empty table."""
+        return {name: table.item_count() for name, table in self.tables.items() if table.item_count()}
+
+
+def local_table_schemas() -> Dict[str, TableSchema]:
+    """Schemas of every table the local store creates."""
+    checkpoint_table = os.getenv("CHECKPOINT_TABLE_NAME", "SkyMarshalCheckpoints")
+    return {**V1_TABLE_SCHEMAS, **V2_TABLE_SCHEMAS, checkpoint_table: CHECKPOINT_TABLE_SCHEMA}
+
+
+def _key_types(schema: TableSchema) -> Dict[str, str]:
+    types = {schema.partition_key: schema.partition_key_type}
+    if schema.sort_key:
+        types[schema.sort_key] = schema.sort_key_type or "S"
+    for gsi in schema.gsis or []:
+        types.setdefault(gsi["pk"], gsi.get("pk_type", "S"))
+        if gsi.get("sk"):
+            types.setdefault(gsi["sk"], gsi.get("sk_type", "S"))
+    return types
+
+
+def _csv_value(raw: Optional[str], column: str, key_type: Optional[str]) -> Any:
+    """Type a CSV cell: key attributes by schema type, other columns like scripts/import_v2_data.py."""
+    value = (raw or "").strip()
+    if value == "" or value.lower() == "null":
+        return None
+    if key_type is not None or column.lower() == "sequence_number":
+        if key_type == "N":
+            try:
+                return Decimal(value)
+            except InvalidOperation:
+                return value
+        return value
+    lowered = column.lower()
+    if any(lowered.endswith(suffix) or lowered == suffix.strip("_") for suffix in _STRING_COLUMN_SUFFIXES):
+        return value
+    if value.lower() in ("true", "yes"):
+        return True
+    if value.lower() in ("false", "no"):
+        return False
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        return value
+    return number if number.is_finite() else value
+
+
+_local_dynamodb: Optional[LocalDynamoDB] = None
+_local_lock = threading.Lock()
+
+
+def get_local_dynamodb() -> LocalDynamoDB:
+    """Get the process-wide local store, loading LOCAL_DYNAMODB_DATA_DIR on first use."""
+    global _local_dynamodb
+    if _local_dynamodb is None:
+        with _local_lock:
+            if _local_dynamodb is None:
+                start = time.time()
+                store = LocalDynamoDB()
+                if os.path.isdir(LOCAL_DYNAMODB_DATA_DIR):
+                    loaded = store.load_directory(LOCAL_DYNAMODB_DATA_DIR)
+                    logger.info(
+                        f"🗄️  Local DynamoDB loaded {sum(loaded.values())} items into {len(loaded)} tables "
+                        f"from {LOCAL_DYNAMODB_DATA_DIR} in {time.time() - start:.2f}s"
+                    )
+                else:
+                    logger.warning(f"⚠️  Local DynamoDB data directory not found: {LOCAL_DYNAMODB_DATA_DIR}")
+                _local_dynamodb = store
+    return _local_dynamodb
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for table_name, count in sorted(get_local_dynamodb().get_stats().items()):
+        print(f"{table_name:<40} {count:>8}")
@@ -0,0 +1,281 @@
+"""Paginating query/scan helpers for DynamoDB
+
+A single Query or Scan call returns at most 1 MB of items and reports the rest
+through LastEvaluatedKey. These helpers follow LastEvaluatedKey so accessors
+and agent tools see complete result sets (e.g. every booking on a widebody
+flight), with optional projections and item limits.
+
+Usage:
+    from database.pagination import query_all, iter_query_pages
+
+    bookings = query_all(
+        bookings_table,
+        IndexName="flight-status-index",
+        KeyConditionExpression="flight_id = :fid",
+        ExpressionAttributeValues={":fid": flight_id},
+        projection=["booking_id", "passenger_id", "booking_status"],
+    )
+
+    for page in iter_query_pages(bookings_table, page_size=500, **query):
+        process(page)  # Large result sets are never fully materialized
+
+    # Coroutine tables (database.async_dynamodb)
+    bookings = await aquery_all(async_bookings_table, **query)
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def build_projection(
+    attributes: Sequence[str],
+    expression_attribute_names: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    Build ProjectionExpression parameters for a list of attribute names.
+
+    Every attribute is aliased (#p0, #p1, ...) so reserved words such as
+    "status" or "name" can be projected safely.
+
+    Args:
+        attributes: Top-level attribute names to return
+        expression_attribute_names: Existing ExpressionAttributeNames to merge with
+
+    Returns:
+        dict: ProjectionExpression and ExpressionAttributeNames request parameters
+    """
+    names = dict(expression_attribute_names or {})
+    placeholders = []
+    for i, attribute in enumerate(dict.fromkeys(attributes)):
+        placeholder = f"#p{i}"
+        names[placeholder] = attribute
+        placeholders.append(placeholder)
+    return {"ProjectionExpression": ", ".join(placeholders), "ExpressionAttributeNames": names}
+
+
+def _with_projection(params: Dict[str, Any], projection: Optional[Sequence[str]]) -> Dict[str, Any]:
+    params = dict(params)
+    if projection:
+        params.update(build_projection(projection, params.get("ExpressionAttributeNames")))
+    return params
+
+
+def _page_request(params: Dict[str, Any], remaining: Optional[int], page_size: Optional[int]) -> Dict[str, Any]:
+    request = dict(params)
+    page_limits = [x for x in (page_size, remaining) if x]
+    if page_limits:
+        request["Limit"] = min(page_limits)
+    return request
+
+
+def _next_start_key(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    last_key = response.get("LastEvaluatedKey")
+    return last_key if isinstance(last_key, dict) and last_key else None
+
+
+def _iter_pages(
+    operation: Any,
+    params: Dict[str, Any],
+    projection: Optional[Sequence[str]],
+    limit: Optional[int],
+    page_size: Optional[int]
+) -> Iterator[List[Dict[str, Any]]]:
+    """Call a Query/Scan operation repeatedly, yielding each page of items."""
+    params = _with_projection(params, projection)
+
+    remaining = limit
+    pages = 0
+    while remaining is None or remaining > 0:
+        response = operation(**_page_request(params, remaining, page_size))
+        pages += 1
+
+        items = response.get("Items", [])
+        if remaining is not None:
+            items = items[:remaining]
+            remaining -= len(items)
+        if items:
+            yield items
+
+        last_key = _next_start_key(response)
+        if last_key is None:
+            break
+        params["ExclusiveStartKey"] = last_key
+
+    if pages > 1:
+        logger.debug(f"Paginated read completed in {pages} pages")
+
+
+async def _aiter_pages(
+    operation: Any,
+    params: Dict[str, Any],
+    projection: Optional[Sequence[str]],
+    limit: Optional[int],
+    page_size: Optional[int]
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Async variant of _iter_pages for coroutine Query/Scan operations."""
+    params = _with_projection(params, projection)
+
+    remaining = limit
+    pages = 0
+    while remaining is None or remaining > 0:
+        response = await operation(**_page_request(params, remaining, page_size))
+        pages += 1
+
+        items = response.get("Items", [])
+        if remaining is not None:
+            items = items[:remaining]
+            remaining -= len(items)
+        if items:
+            yield items
+
+        last_key = _next_start_key(response)
+        if last_key is None:
+            break
+        params["ExclusiveStartKey"] = last_key
+
+    if pages > 1:
+        logger.debug(f"Paginated read completed in {pages} pages")
+
+
+def iter_query_pages(
+    table: Any,
+    projection: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    page_size: Optional[int] = None,
+    **kwargs
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Run a Query and yield its items page by page.
+
+    Args:
+        table: boto3 Table resource
+        projection: Optional attribute names to return (others are not read out)
+        limit: Optional maximum number of items across all pages
+        page_size: Optional maximum items evaluated per request (DynamoDB Limit)
+        **kwargs: Query parameters (IndexName, KeyConditionExpression, ...)
+
+    Yields:
+        list: Items of each non-empty page
+    """
+    return _iter_pages(table.query, kwargs, projection, limit, page_size)
+
+
+def iter_scan_pages(
+    table: Any,
+    projection: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    page_size: Optional[int] = None,
+    **kwargs
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Run a Scan and yield its items page by page.
+
+    Args:
+        table: boto3 Table resource
+        projection: Optional attribute names to return
+        limit: Optional maximum number of items across all pages
+        page_size: Optional maximum items evaluated per request (DynamoDB Limit)
+        **kwargs: Scan parameters (FilterExpression, ...)
+
+    Yields:
+        list: Items of each non-empty page
+    """
+    return _iter_pages(table.scan, kwargs, projection, limit, page_size)
+
+
+def query_all(
+    table: Any,
+    projection: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Run a Query and return all matching items across pages.
+
+    Args:
+        table: boto3 Table resource
+        projection: Optional attribute names to return
+        limit: Optional maximum number of items
+        **kwargs: Query parameters (IndexName, KeyConditionExpression, ...)
+
+    Returns:
+        list: All items (up to limit)
+    """
+    return [item for page in iter_query_pages(table, projection, limit, **kwargs) for item in page]
+
+
+def scan_all(
+    table: Any,
+    projection: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Run a Scan and return all matching items across pages.
+
+    Args:
+        table: boto3 Table resource
+        projection: Optional attribute names to return
+        limit: Optional maximum number of items
+        **kwargs: Scan parameters (FilterExpression, ...)
+
+    Returns:
+        list: All items (up to limit)
+    """
+    return [item for page in iter_scan_pages(table, projection, limit, **kwargs) for item in page]
+
+
+async def aquery_all(
+    table: Any,
+    projection: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    page_size: Optional[int] = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Async query_all for tables whose query() is a coroutine (see async_dynamodb).
+
+    Args:
+        table: Async table handle
+        projection: Optional attribute names to return
+        limit: Optional maximum number of items
+        page_size: Optional maximum items evaluated per request (DynamoDB Limit)
+        **kwargs: Query parameters (IndexName, KeyConditionExpression, ...)
+
+    Returns:
+        list: All items (up to limit)
+    """
+    return [
+        item
+        async for page in _aiter_pages(table.query, kwargs, projection, limit, page_size)
+        for item in page
+    ]
+
+
+async def ascan_all(
+    table: Any,
+    projection: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    page_size: Optional[int] = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Async scan_all for tables whose scan() is a coroutine (see async_dynamodb).
+
+    Args:
+        table: Async table handle
+        projection: Optional attribute names to return
+        limit: Optional maximum number of items
+        page_size: Optional maximum items evaluated per request (DynamoDB Limit)
+        **kwargs: Scan parameters (FilterExpression, ...)
+
+    Returns:
+        list: All items (up to limit)
+    """
+    return [
+        item
+        async for page in _aiter_pages(table.scan, kwargs, projection, limit, page_size)
+        for item in page
+    ]
@@ -0,0 +1,229 @@
+"""Prefetch of the hot data bundle for one disruption
+
+Once the shared extraction stage has resolved the flight, the reads the
+agents will make first are predictable: the flight record, crew roster and
+crew members, passengers, cargo, work orders and aircraft availability.
+prefetch_disruption_bundle issues all of them concurrently on the data-access pool so they land in the
+request cache (see request_cache) while the agents are still on their first
+model call; the agents' tool calls then become cache hits.
+
+Each read in the bundle mirrors the request the corresponding agent tool
+issues (table, index, expressions and values), because the request cache
+keys on the exact parameters. Crew members are fetched with the batch
+requests calculate_crew_fdp issues and also seeded as the per-member get_item
+entries query_crew_members would request; the resolved flight is seeded as the
+get_item by flight_id that calculate_crew_fdp issues.
+
+Airport reads (curfews, slots, weather) are not prefetched: the tools'
+requests for them do not match those tables' key schemas, so prefetching
+them would only repeat the tools' failing calls.
+
+Prefetch is best effort: failed reads are logged and left to the tools, which
+retry them on demand.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    from database.async_dynamodb import run_blocking
+    from database.constants import (
+        AIRCRAFT_REGISTRATION_INDEX,
+        FIRST_LEG_FLIGHT_INDEX,
+        FLIGHT_NUMBER_DATE_INDEX,
+        FLIGHT_POSITION_INDEX,
+    )
+    from database.dynamodb import batch_get_all, get_dynamodb_resource
+    from database.pagination import query_all
+    from database.request_cache import prime_table_read
+    from database.table_config import get_table_name
+except ImportError:
+    from async_dynamodb import run_blocking
+    from constants import (
+        AIRCRAFT_REGISTRATION_INDEX,
+        FIRST_LEG_FLIGHT_INDEX,
+        FLIGHT_NUMBER_DATE_INDEX,
+        FLIGHT_POSITION_INDEX,
+    )
+    from dynamodb import batch_get_all, get_dynamodb_resource
+    from pagination import query_all
+    from request_cache import prime_table_read
+    from table_config import get_table_name
+
+logger = logging.getLogger(__name__)
+
+# Prefetch the disruption bundle right after extraction
+PREFETCH_ENABLED = os.getenv("DISRUPTION_PREFETCH", "true").lower() == "true"
+
+
+@dataclass(frozen=True)
+class PrefetchRead:
+    """One read of the bundle, shaped exactly like the agent tool's request."""
+
+    name: str
+    table: str  # Logical table name (see table_config.get_table_name)
+    operation: str  # "query" (all pages) or "get_item"
+    params: Dict[str, Any]
+
+
+def build_prefetch_reads(flight_info: Dict[str, Any], flight: Dict[str, Any]) -> List[PrefetchRead]:
+    """
+    Build the bundle of reads for a resolved flight.
+
+    Reads whose inputs are missing from the flight record are skipped.
+
+    Args:
+        flight_info: Extracted FlightInfo as dict (flight_number, date, ...)
+        flight: Flight record from the flights table
+
+    Returns:
+        list: Reads to issue, in no particular order
+    """
+    flight_id = flight.get("flight_id")
+    registration = flight.get("aircraft_registration")
+    date = flight_info.get("date")
+    reads: List[PrefetchRead] = []
+
+    if flight_info.get("flight_number") and date:
+        # query_flight (every agent)
+        reads.append(PrefetchRead("flight", "flights", "query", {
+            "IndexName": FLIGHT_NUMBER_DATE_INDEX,
+            "KeyConditionExpression": "flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
+            "ExpressionAttributeValues": {":fn": flight_info["flight_number"], ":sd": date},
+        }))
+
+    if flight_id:
+        flight_id = str(flight_id)
+        # query_crew_roster / calculate_crew_fdp
+        reads.append(PrefetchRead("crew_roster", "crew_roster", "query", {
+            "IndexName": FLIGHT_POSITION_INDEX,
+            "KeyConditionExpression": "flight_id = :fid",
+            "ExpressionAttributeValues": {":fid": flight_id},
+        }))
+        # Passenger and cargo tools and summaries
+        for name, table in (("passengers", "passengers"), ("cargo", "cargo_shipments")):
+            reads.append(PrefetchRead(name, table, "query", {
+                "IndexName": FIRST_LEG_FLIGHT_INDEX,
+                "KeyConditionExpression": "first_leg_flight_id = :fid",
+                "ExpressionAttributeValues": {":fid": flight_id},
+            }))
+
+    if registration:
+        # finance query_maintenance_costs
+        reads.append(PrefetchRead("work_orders", "maintenance_work_orders", "query", {
+            "IndexName": AIRCRAFT_REGISTRATION_INDEX,
+            "KeyConditionExpression": "aircraftRegistration = :ar",
+            "ExpressionAttributeValues": {":ar": registration},
+        }))
+        # network query_flights_by_aircraft
+        reads.append(PrefetchRead("aircraft_flights", "flights", "query", {
+            "IndexName": AIRCRAFT_REGISTRATION_INDEX,
+            "KeyConditionExpression": "aircraft_registration = :ar",
+            "ExpressionAttributeValues": {":ar": registration},
+        }))
+        if date:
+            # network query_aircraft_availability
+            reads.append(PrefetchRead("aircraft_availability", "aircraft", "query", {
+                "KeyConditionExpression": "aircraft_registration = :ar AND valid_from <= :date",
+                "FilterExpression": "valid_to >= :date",
+                "ExpressionAttributeValues": {":ar": registration, ":date": date},
+            }))
+
+    return reads
+
+
+def _execute(read: PrefetchRead) -> Any:
+    """Issue one read through the shared (request-cached) DynamoDB resource."""
+    table = get_dynamodb_resource().Table(get_table_name(read.table))
+    if read.operation == "query":
+        return query_all(table, **read.params)
+    return table.get_item(**read.params).get("Item")
+
+
+async def _prefetch_crew_members(roster: List[Dict[str, Any]]) -> int:
+    """
+    Batch-read the rostered crew members and seed their get_item entries.
+
+    The batch requests are shaped like calculate_crew_fdp's (same keys, same
+    100-key batches), so that tool's first call is a hit as well.
+
+    Returns:
+        int: Crew members fetched
+    """
+    crew_ids = list(dict.fromkeys(item["crew_id"] for item in roster if item.get("crew_id")))
+    if not crew_ids:
+        return 0
+
+    table_name = get_table_name("crew_members")
+    members = await batch_get_all(
+        functools.partial(run_blocking, get_dynamodb_resource().batch_get_item),
+        table_name,
+        [{"crew_id": crew_id} for crew_id in crew_ids]
+    )
+
+    for member in members:
+        # query_crew_members passes crew_id as given in the roster
+        prime_table_read(table_name, "get_item", {"Key": {"crew_id": member["crew_id"]}}, {"Item": member})
+    return len(members)
+
+
+async def prefetch_disruption_bundle(
+    flight_info: Dict[str, Any],
+    flight: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Read the disruption bundle concurrently into the active request cache.
+
+    Must run in the request's context (the orchestrator runs it as a task in
+    the request context); outside a request scope the reads are wasted.
+
+    Args:
+        flight_info: Extracted FlightInfo as dict
+        flight: Resolved flight record (None skips the prefetch)
+
+    Returns:
+        dict: Reads issued, succeeded and failed, crew members seeded and duration
+    """
+    if not flight:
+        return {"reads": 0, "succeeded": 0, "failed": [], "crew_members": 0, "duration_seconds": 0.0}
+
+    start = time.time()
+    if flight.get("flight_id"):
+        # calculate_crew_fdp reads the flight by id for its block time
+        prime_table_read(
+            get_table_name("flights"), "get_item", {"Key": {"flight_id": str(flight["flight_id"])}}, {"Item": flight}
+        )
+    reads = build_prefetch_reads(flight_info, flight)
+    results = await asyncio.gather(
+        *(run_blocking(_execute, read) for read in reads), return_exceptions=True
+    )
+
+    failed: List[str] = []
+    roster: List[Dict[str, Any]] = []
+    for read, result in zip(reads, results):
+        if isinstance(result, Exception):
+            logger.debug(f"Prefetch of {read.name} failed: {result}")
+            failed.append(read.name)
+        elif read.name == "crew_roster":
+            roster = result
+
+    crew_members = 0
+    try:
+        crew_members = await _prefetch_crew_members(roster)
+    except Exception as e:
+        logger.debug(f"Prefetch of crew members failed: {e}")
+
+    stats = {
+        "reads": len(reads),
+        "succeeded": len(reads) - len(failed),
+        "failed": failed,
+        "crew_members": crew_members,
+        "duration_seconds": round(time.time() - start, 3),
+    }
+    logger.info(f"📦 Prefetched disruption bundle: {stats}")
+    return stats
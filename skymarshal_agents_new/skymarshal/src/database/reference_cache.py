@@ -0,0 +1,339 @@
+"""Process-level TTL cache for slow-changing reference tables
+
+Compensation rules, minimum connection times, interline agreements, airport
+curfews, cold chain facilities and the finance parameter/recovery-cost tables
+change rarely, yet every agent tool call used to query them. Reads against
+these tables are served from a bounded, TTL-evicting ReferenceDataCache shared
+by all requests in the process, so warm lookups never leave the process.
+
+Whole tables can be bulk-loaded at container start (preload_reference_tables).
+Preloaded snapshots answer get_item and simple equality queries
+("attr = :value [AND ...]") in memory; anything else is cached per request
+parameters.
+
+Usage:
+    from database.reference_cache import get_reference_cache, preload_reference_tables
+
+    preload_reference_tables()
+    logger.info(get_reference_cache().get_stats())
+"""
+
+import copy
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+try:
+    from database.pagination import scan_all
+    from database.table_config import get_table_name
+except ImportError:
+    from pagination import scan_all
+    from table_config import get_table_name
+
+logger = logging.getLogger(__name__)
+
+# Logical names of the effectively static reference tables
+REFERENCE_TABLES = (
+    "compensation_rules",
+    "minimum_connection_times",
+    "interline_agreements",
+    "airport_curfews",
+    "cold_chain_facilities",
+    "financial_parameters",
+    "recovery_cost_matrix",
+)
+
+# Entry lifetime and bound; a TTL of 0 disables the cache
+REFERENCE_CACHE_TTL_SECONDS = float(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "900"))
+REFERENCE_CACHE_MAX_ENTRIES = int(os.getenv("REFERENCE_CACHE_MAX_ENTRIES", "1024"))
+
+# Request parameters a snapshot can answer; anything else goes to DynamoDB
+_SNAPSHOT_PARAMS = {
+    "get_item": {"Key", "ConsistentRead"},
+    "query": {
+        "IndexName", "KeyConditionExpression", "FilterExpression",
+        "ExpressionAttributeNames", "ExpressionAttributeValues",
+    },
+    "scan": set(),
+}
+
+_EQUALITY_PATTERN = re.compile(r"^\s*\(?\s*(#?[\w.]+)\s*=\s*(:\w+)\s*\)?\s*$")
+_AND_PATTERN = re.compile(r"\s+AND\s+", re.IGNORECASE)
+
+
+def reference_table_names() -> List[str]:
+    """Physical names of the reference tables for the active table version."""
+    return [get_table_name(name) for name in REFERENCE_TABLES]
+
+
+def is_reference_table(table_name: str) -> bool:
+    """Check whether a physical table name is one of the reference tables."""
+    return table_name in reference_table_names()
+
+
+def _equality_conditions(
+    expression: Optional[str],
+    names: Dict[str, str],
+    values: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Parse "a = :x AND b = :y" into {"a": x, "b": y}.
+
+    Returns:
+        Attribute/value mapping, or None if the expression is not a plain
+        conjunction of equalities
+    """
+    if not expression:
+        return {}
+    conditions = {}
+    for part in _AND_PATTERN.split(expression):
+        match = _EQUALITY_PATTERN.match(part)
+        if not match or match.group(2) not in values:
+            return None
+        attribute, placeholder = match.groups()
+        conditions[names.get(attribute, attribute)] = values[placeholder]
+    return conditions
+
+
+def _matches(item: Dict[str, Any], conditions: Dict[str, Any]) -> bool:
+    return all(attribute in item and item[attribute] == value for attribute, value in conditions.items())
+
+
+def _answer_from_snapshot(
+    items: List[Dict[str, Any]],
+    operation: str,
+    kwargs: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Answer a read from a full-table snapshot, or None if it cannot be answered exactly."""
+    allowed = _SNAPSHOT_PARAMS.get(operation)
+    if allowed is None or not set(kwargs) <= allowed:
+        return None
+
+    if operation == "get_item":
+        found = next((item for item in items if _matches(item, kwargs["Key"])), None)
+        return {"Item": found} if found is not None else {}
+
+    if operation == "scan":
+        return {"Items": items, "Count": len(items), "ScannedCount": len(items)}
+
+    names = kwargs.get("ExpressionAttributeNames", {})
+    values = kwargs.get("ExpressionAttributeValues", {})
+    key_conditions = _equality_conditions(kwargs.get("KeyConditionExpression"), names, values)
+    filter_conditions = _equality_conditions(kwargs.get("FilterExpression"), names, values)
+    if not key_conditions or filter_conditions is None:
+        return None
+    matched = [item for item in items if _matches(item, key_conditions)]
+    scanned = len(matched)
+    matched = [item for item in matched if _matches(item, filter_conditions)]
+    return {"Items": matched, "Count": len(matched), "ScannedCount": scanned}
+
+
+class ReferenceDataCache:
+    """
+    Bounded, TTL-evicting cache for reference table reads.
+
+    Holds full-table snapshots (from preload) and per-request entries keyed by
+    table, operation and request parameters, evicted least-recently-used once
+    max_entries is exceeded. Callers receive deep copies.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = REFERENCE_CACHE_TTL_SECONDS,
+        max_entries: int = REFERENCE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = OrderedDict()
+        self._snapshots: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self.hits = 0
+        self.snapshot_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get_or_load(
+        self,
+        table_name: str,
+        operation: str,
+        kwargs: Dict[str, Any],
+        loader: Callable[[], Any]
+    ) -> Any:
+        """
+        Serve a read from a snapshot or cached entry, loading it on a miss.
+
+        Args:
+            table_name: Physical table name
+            operation: Read operation (get_item, query, scan)
+            kwargs: Request parameters
+            loader: Zero-argument callable performing the read
+
+        Returns:
+            A deep copy of the response
+        """
+        if not self.enabled:
+            return loader()
+
+        key = (table_name, operation, json.dumps(kwargs, sort_keys=True, default=repr))
+        found, value = self._lookup(key, kwargs)
+        if found:
+            return copy.deepcopy(value)
+
+        value = loader()
+        self._store(key, value)
+        return copy.deepcopy(value)
+
+    async def aget_or_load(
+        self,
+        table_name: str,
+        operation: str,
+        kwargs: Dict[str, Any],
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Async variant of get_or_load; loader is a zero-argument coroutine function."""
+        if not self.enabled:
+            return await loader()
+
+        key = (table_name, operation, json.dumps(kwargs, sort_keys=True, default=repr))
+        found, value = self._lookup(key, kwargs)
+        if found:
+            return copy.deepcopy(value)
+
+        value = await loader()
+        self._store(key, value)
+        return copy.deepcopy(value)
+
+    def _lookup(self, key: Tuple[str, str, str], kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Find a live snapshot answer or entry for a read, counting the hit or miss."""
+        table_name, operation, _ = key
+        now = self._clock()
+        with self._lock:
+            snapshot = self._snapshots.get(table_name)
+            if snapshot is not None and snapshot[0] > now:
+                answer = _answer_from_snapshot(snapshot[1], operation, kwargs)
+                if answer is not None:
+                    self.snapshot_hits += 1
+                    return True, answer
+            elif snapshot is not None:
+                del self._snapshots[table_name]
+
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+        return False, None
+
+    def _store(self, key: Tuple[str, str, str], value: Any) -> None:
+        """Store a loaded entry, evicting least-recently-used entries over the bound."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def put_snapshot(self, table_name: str, items: List[Dict[str, Any]]) -> None:
+        """Store a full-table snapshot used to answer reads in memory."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._snapshots[table_name] = (self._clock() + self.ttl_seconds, list(items))
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """Drop cached data for one table, or everything when table_name is None."""
+        with self._lock:
+            if table_name is None:
+                self._entries.clear()
+                self._snapshots.clear()
+                return
+            self._snapshots.pop(table_name, None)
+            for key in [key for key in self._entries if key[0] == table_name]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached data and reset counters (mainly for tests)."""
+        with self._lock:
+            self._entries.clear()
+            self._snapshots.clear()
+            self.hits = self.snapshot_hits = self.misses = self.evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and cache size."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "snapshots": sorted(self._snapshots),
+                "hits": self.hits,
+                "snapshot_hits": self.snapshot_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_reference_cache = ReferenceDataCache()
+
+
+def get_reference_cache() -> ReferenceDataCache:
+    """Get the process-wide reference data cache."""
+    return _reference_cache
+
+
+def preload_reference_tables(dynamodb: Any = None) -> Dict[str, Any]:
+    """
+    Bulk-load every reference table into the cache (e.g. at container start).
+
+    Tables that fail to load are skipped and served on demand instead.
+
+    Args:
+        dynamodb: boto3 DynamoDB resource (defaults to the shared client's resource)
+
+    Returns:
+        dict: Items loaded per table and the tables that failed
+    """
+    try:
+        from database.request_cache import CachedTable
+    except ImportError:
+        from request_cache import CachedTable
+    if dynamodb is None:
+        try:
+            from database.dynamodb import get_dynamodb_resource
+        except ImportError:
+            from dynamodb import get_dynamodb_resource
+        dynamodb = get_dynamodb_resource()
+
+    cache = get_reference_cache()
+    loaded: Dict[str, int] = {}
+    failed: List[str] = []
+    start = time.time()
+    for table_name in reference_table_names():
+        table = dynamodb.Table(table_name)
+        # Scan the underlying table directly so pages are not cached as entries
+        if isinstance(table, CachedTable):
+            table = table.wrapped
+        try:
+            items = scan_all(table)
+        except Exception as e:
+            logger.warning(f"⚠️  Reference preload failed for {table_name}: {e}")
+            failed.append(table_name)
+            continue
+        cache.put_snapshot(table_name, items)
+        loaded[table_name] = len(items)
+
+    logger.info(
+        f"📚 Reference tables preloaded in {time.time() - start:.3f}s: "
+        f"{sum(loaded.values())} items from {len(loaded)} tables"
+    )
+    return {"loaded": loaded, "failed": failed}
@@ -0,0 +1,394 @@
+"""Request-scoped read-through cache for DynamoDB reads
+
+All seven agents resolve the same flight, roster, bookings and reference rows,
+in both Phase 1 and Phase 2. Within one disruption (one orchestrator thread_id)
+identical reads are served from a shared RequestCache, and concurrent agents
+asking for the same key share a single in-flight DynamoDB call.
+
+The cache is only active inside a request scope; outside one, every read goes
+straight to DynamoDB. Reads against reference tables are served from the
+process-level ReferenceDataCache instead (see reference_cache).
+
+Usage:
+    from database.request_cache import request_cache_scope
+
+    with request_cache_scope(thread_id) as cache:
+        ...  # DynamoDBClient / get_dynamodb_resource() reads are cached
+    logger.info(cache.get_stats())
+"""
+
+import asyncio
+import copy
+import functools
+import json
+import logging
+import threading
+from concurrent.futures import CancelledError, Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    from database.reference_cache import get_reference_cache, is_reference_table
+except ImportError:
+    from reference_cache import get_reference_cache, is_reference_table
+
+logger = logging.getLogger(__name__)
+
+# Read operations served through the cache (boto3 Table resources and low-level client)
+CACHED_READ_OPERATIONS = frozenset({"get_item", "query", "scan", "batch_get_item"})
+
+# Write operations that invalidate the current request cache
+INVALIDATING_WRITE_OPERATIONS = frozenset({
+    "put_item", "update_item", "delete_item", "batch_write_item",
+    "transact_write_items", "batch_writer",
+})
+
+_current_request_cache: ContextVar[Optional["RequestCache"]] = ContextVar(
+    "current_request_cache", default=None
+)
+
+
+class RequestCache:
+    """
+    Thread-safe read-through cache with single-flight de-duplication.
+
+    The first caller for a key performs the load; concurrent callers for the
+    same key wait on its result instead of issuing their own call. Failed
+    loads are not cached. A load abandoned by its caller (e.g. the agent task
+    was cancelled) is dropped and the waiters retry it themselves instead of
+    receiving the cancellation. Callers receive deep copies so mutating a
+    result never affects other agents.
+    """
+
+    def __init__(self, scope_id: str):
+        self.scope_id = scope_id
+        self._lock = threading.Lock()
+        self._entries: Dict[Any, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, loading it once if missing.
+
+        Args:
+            key: Hashable cache key
+            loader: Zero-argument callable performing the read
+
+        Returns:
+            A deep copy of the cached (or freshly loaded) value
+        """
+        while True:
+            future, owner = self._claim(key)
+            if owner:
+                try:
+                    value = loader()
+                except Exception as e:
+                    self._fail(key, future, e)
+                    raise
+                except BaseException:
+                    self._abandon(key, future)
+                    raise
+                future.set_result(value)
+
+            try:
+                return copy.deepcopy(future.result())
+            except CancelledError:
+                continue  # Load abandoned by its owner - retry it
+
+    async def aget_or_load(self, key: Any, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async variant of get_or_load for native asyncio data access.
+
+        Shares entries with get_or_load; waiting on another caller's load
+        suspends the coroutine instead of blocking the event loop. Cancelling
+        a waiter does not affect the shared load.
+
+        Args:
+            key: Hashable cache key
+            loader: Zero-argument coroutine function performing the read
+
+        Returns:
+            A deep copy of the cached (or freshly loaded) value
+        """
+        while True:
+            future, owner = self._claim(key)
+            if owner:
+                try:
+                    value = await loader()
+                except Exception as e:
+                    self._fail(key, future, e)
+                    raise
+                except BaseException:
+                    self._abandon(key, future)
+                    raise
+                future.set_result(value)
+
+            try:
+                return copy.deepcopy(await asyncio.shield(asyncio.wrap_future(future)))
+            except asyncio.CancelledError:
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    continue  # Load abandoned by its owner - retry it
+                raise
+
+    def _claim(self, key: Any) -> Tuple[Future, bool]:
+        """Get the future for a key, creating it (and owning the load) if missing."""
+        with self._lock:
+            future = self._entries.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._entries[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+        return future, owner
+
+    def _fail(self, key: Any, future: Future, error: Exception) -> None:
+        """Propagate a failed load to waiters and forget it so it can be retried."""
+        self._forget(key, future)
+        future.set_exception(error)
+
+    def _abandon(self, key: Any, future: Future) -> None:
+        """Forget a load whose owner was cancelled and wake its waiters to retry it."""
+        self._forget(key, future)
+        future.cancel()
+
+    def _forget(self, key: Any, future: Future) -> None:
+        """Drop the entry for key if it still refers to future."""
+        with self._lock:
+            if self._entries.get(key) is future:
+                del self._entries[key]
+
+    def prime(self, key: Any, value: Any) -> bool:
+        """
+        Seed an entry with an already-loaded value (e.g. from a prefetch).
+
+        Existing entries, including in-flight loads, are left untouched.
+
+        Args:
+            key: Hashable cache key
+            value: Value later callers receive copies of
+
+        Returns:
+            bool: True if the entry was added
+        """
+        with self._lock:
+            if key in self._entries:
+                return False
+            future: Future = Future()
+            future.set_result(value)
+            self._entries[key] = future
+            return True
+
+    def invalidate(self) -> None:
+        """Drop all cached entries (called after writes)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for this request."""
+        with self._lock:
+            return {
+                "scope_id": self.scope_id,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def get_request_cache() -> Optional[RequestCache]:
+    """Get the request cache for the current context, if a request scope is active."""
+    return _current_request_cache.get()
+
+
+def bind_request_cache(cache: Optional[RequestCache]) -> None:
+    """
+    Bind a request cache to the current context.
+
+    Intended for contexts that are created explicitly (e.g. via
+    contextvars.copy_context().run) and passed to asyncio tasks.
+    """
+    _current_request_cache.set(cache)
+
+
+@contextmanager
+def request_cache_scope(scope_id: str) -> Iterator[RequestCache]:
+    """
+    Activate a request cache for the duration of a block.
+
+    Args:
+        scope_id: Request identifier (the orchestrator thread_id)
+
+    Yields:
+        RequestCache: The active cache
+    """
+    cache = RequestCache(scope_id)
+    token = _current_request_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_request_cache.reset(token)
+        logger.info(f"📦 Request cache closed: {cache.get_stats()}")
+
+
+def _make_key(target: str, operation: str, kwargs: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Build a cache key from the target, operation and request parameters."""
+    return (target, operation, json.dumps(kwargs, sort_keys=True, default=repr))
+
+
+def prime_table_read(table_name: str, operation: str, kwargs: Dict[str, Any], response: Any) -> bool:
+    """
+    Seed the current request cache with the response of a Table read.
+
+    Later identical reads through a CachedTable (same operation and
+    parameters) are then served without calling DynamoDB.
+
+    Args:
+        table_name: Physical table name
+        operation: Read operation (e.g. "get_item")
+        kwargs: Request parameters exactly as the reader will pass them
+        response: Raw response the read would have returned
+
+    Returns:
+        bool: True if an entry was added (False outside a request scope or if already cached)
+    """
+    cache = get_request_cache()
+    if cache is None:
+        return False
+    return cache.prime(_make_key(f"table:{table_name}", operation, kwargs), response)
+
+
+class _CachedReads:
+    """Proxy routing read operations through the active request cache."""
+
+    def __init__(self, target: Any, key_prefix: str):
+        self._target = target
+        self._key_prefix = key_prefix
+
+    @property
+    def wrapped(self) -> Any:
+        """The underlying boto3 object."""
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name in CACHED_READ_OPERATIONS:
+            return self._cached_read(name, attr)
+        if name == "batch_writer":
+            return self._batch_writer(attr)
+        if name in INVALIDATING_WRITE_OPERATIONS:
+            return self._invalidating_write(attr)
+        return attr
+
+    def _invalidate(self) -> None:
+        cache = get_request_cache()
+        if cache is not None:
+            cache.invalidate()
+
+    def _invalidating_write(self, method: Callable) -> Callable:
+        """Wrap a write so the cache is invalidated once it has completed."""
+        @functools.wraps(method)
+        def write(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._invalidate()
+        return write
+
+    def _batch_writer(self, method: Callable) -> Callable:
+        """Wrap batch_writer() so the cache is invalidated once the batch is flushed."""
+        @functools.wraps(method)
+        def batch_writer(*args, **kwargs):
+            return _InvalidatingBatchWriter(method(*args, **kwargs), self._invalidate)
+        return batch_writer
+
+    def _cached_read(self, operation: str, method: Callable) -> Callable:
+        def read(**kwargs):
+            cache = get_request_cache()
+            if cache is None:
+                return method(**kwargs)
+            key = _make_key(self._key_prefix, operation, kwargs)
+            return cache.get_or_load(key, lambda: method(**kwargs))
+        return read
+
+
+class _InvalidatingBatchWriter:
+    """batch_writer() context manager invalidating the cache after its writes are flushed."""
+
+    def __init__(self, writer: Any, invalidate: Callable[[], None]):
+        self._writer = writer
+        self._invalidate = invalidate
+
+    def __enter__(self) -> Any:
+        return self._writer.__enter__()
+
+    def __exit__(self, *exc_info: Any) -> Any:
+        try:
+            return self._writer.__exit__(*exc_info)
+        finally:
+            self._invalidate()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._writer, name)
+
+
+class CachedTable(_CachedReads):
+    """boto3 Table resource whose reads are request-cached (or reference-cached)."""
+
+    def __init__(self, table: Any):
+        self.table_name = str(getattr(table, "name", table))
+        self.is_reference = is_reference_table(self.table_name)
+        super().__init__(table, f"table:{self.table_name}")
+
+    def _cached_read(self, operation: str, method: Callable) -> Callable:
+        if operation == "batch_get_item" or not self.is_reference:
+            return super()._cached_read(operation, method)
+
+        def read(**kwargs):
+            return get_reference_cache().get_or_load(
+                self.table_name, operation, kwargs, lambda: method(**kwargs)
+            )
+        return read
+
+    def _invalidate(self) -> None:
+        super()._invalidate()
+        if self.is_reference:
+            get_reference_cache().invalidate(self.table_name)
+
+
+class CachedResource(_CachedReads):
+    """
+    boto3 DynamoDB resource handing out request-cached Table objects.
+
+    Table handles are created once per table name and shared, so callers that
+    resolve a table on every call (e.g. the agent tools) reuse one handle.
+    """
+
+    def __init__(self, resource: Any):
+        super().__init__(resource, "resource")
+        self._tables: Dict[str, CachedTable] = {}
+        self._tables_lock = threading.Lock()
+
+    def Table(self, name: str) -> CachedTable:
+        table = self._tables.get(name)
+        if table is None:
+            with self._tables_lock:
+                table = self._tables.get(name)
+                if table is None:
+                    table = CachedTable(self._target.Table(name))
+                    self._tables[name] = table
+        return table
+
+    def loaded_tables(self) -> Dict[str, CachedTable]:
+        """Table handles created so far, by physical name."""
+        with self._tables_lock:
+            return dict(self._tables)
+
+
+class CachedClient(_CachedReads):
+    """Low-level boto3 DynamoDB client whose reads are request-cached."""
+
+    def __init__(self, client: Any):
+        super().__init__(client, "client")
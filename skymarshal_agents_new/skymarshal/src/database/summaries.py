@@ -0,0 +1,199 @@
+"""Exact passenger and cargo aggregates for a flight
+
+Guest experience and finance used to pull every booking and shipment on a
+flight and let the LLM count tiers, connections and revenue from raw rows.
+These helpers compute the same figures in one pass so tools return a few
+hundred tokens of exact numbers instead of thousands of tokens of records.
+
+Attribute names differ between the V1 and V2 schemas; every figure accepts
+both (see PASSENGER_FIELDS / CARGO_FIELDS). Records missing an attribute are
+counted under UNKNOWN (or in missing_* counters) rather than dropped, so
+totals always reconcile with the record count.
+"""
+
+from collections import Counter
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional
+
+UNKNOWN = "UNKNOWN"
+
+PASSENGER_FIELDS = {
+    "cabin_class": ("cabin_class", "booking_class", "fare_class", "travel_class"),
+    "tier": ("frequent_flyer_tier", "loyalty_tier", "frequent_flyer_tier_id"),
+    "booking_status": ("booking_status", "status"),
+    "is_connection": ("is_connection", "is_connecting", "has_connection"),
+    "connecting_flight": ("connecting_flight_id", "onward_flight_id", "next_leg_flight_id"),
+    "connection_at_risk": ("connection_at_risk", "is_connection_at_risk"),
+    "fare": ("fare_paid", "fare_amount", "ticket_price", "fare"),
+}
+
+CARGO_FIELDS = {
+    "weight": ("weight_on_flight_kg", "total_weight_kg", "weight_kg", "chargeable_weight_kg"),
+    "commodity": ("commodity_type", "cargo_type", "commodity", "commodity_code", "commodity_type_id"),
+    "temperature_controlled": (
+        "temperature_controlled", "is_temperature_controlled", "requires_cold_chain", "cold_chain_required",
+    ),
+    "temperature_requirement": ("temperature_requirement", "temperature_range", "temperature_range_c"),
+    "revenue": ("revenue_usd", "freight_revenue_usd", "freight_charges_usd"),
+    "declared_value": ("declared_value_usd", "declared_value", "value_usd"),
+}
+
+# Temperature requirements meaning "no control needed"
+AMBIENT_TEMPERATURES = ("", "none", "ambient", "n/a", "na", "no")
+
+
+def _field(record: Dict[str, Any], fields: Dict[str, tuple], name: str) -> Any:
+    """Get an attribute, accepting the V1 and V2 names."""
+    for key in fields[name]:
+        if record.get(key) not in (None, ""):
+            return record[key]
+    return None
+
+
+def _flag(value: Any) -> bool:
+    """Interpret DynamoDB booleans stored as bool, number or string."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "yes", "y", "1")
+    return bool(value)
+
+
+def _amount(value: Any) -> Optional[Decimal]:
+    """Parse a numeric attribute exactly (None if missing or not numeric)."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _number(total: Decimal) -> Any:
+    """Return an exact total as an int when integral, else a float rounded to cents."""
+    return int(total) if total == total.to_integral_value() else float(round(total, 2))
+
+
+def _label(value: Any) -> str:
+    return UNKNOWN if value in (None, "") else str(value)
+
+
+def summarize_passengers(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate passenger/booking records for one flight.
+
+    Args:
+        records: Passenger (V2) or booking (V1) items
+
+    Returns:
+        dict: passenger_count, counts by cabin class / tier / booking status,
+        connection counts, and fare revenue (total and per cabin class)
+
+    Example:
+        >>> summarize_passengers([{"booking_class": "Business", "fare_paid": 1200}])["fare_revenue"]
+        {'total': 1200, 'by_cabin_class': {'Business': 1200}, 'records_missing_fare': 0}
+    """
+    by_class: Counter = Counter()
+    by_tier: Counter = Counter()
+    by_status: Counter = Counter()
+    revenue_by_class: Dict[str, Decimal] = {}
+    connecting = at_risk = missing_fare = count = 0
+    total_revenue = Decimal(0)
+
+    for record in records:
+        count += 1
+        cabin_class = _label(_field(record, PASSENGER_FIELDS, "cabin_class"))
+        by_class[cabin_class] += 1
+        by_tier[_label(_field(record, PASSENGER_FIELDS, "tier"))] += 1
+        by_status[_label(_field(record, PASSENGER_FIELDS, "booking_status"))] += 1
+
+        if (_flag(_field(record, PASSENGER_FIELDS, "is_connection"))
+                or _field(record, PASSENGER_FIELDS, "connecting_flight") is not None):
+            connecting += 1
+        if _flag(_field(record, PASSENGER_FIELDS, "connection_at_risk")):
+            at_risk += 1
+
+        fare = _amount(_field(record, PASSENGER_FIELDS, "fare"))
+        if fare is None:
+            missing_fare += 1
+            continue
+        total_revenue += fare
+        revenue_by_class[cabin_class] = revenue_by_class.get(cabin_class, Decimal(0)) + fare
+
+    return {
+        "passenger_count": count,
+        "by_cabin_class": dict(by_class),
+        "by_tier": dict(by_tier),
+        "by_booking_status": dict(by_status),
+        "connections": {"connecting": connecting, "at_risk": at_risk},
+        "fare_revenue": {
+            "total": _number(total_revenue),
+            "by_cabin_class": {k: _number(v) for k, v in revenue_by_class.items()},
+            "records_missing_fare": missing_fare,
+        },
+    }
+
+
+def _is_temperature_controlled(record: Dict[str, Any]) -> bool:
+    flag = _field(record, CARGO_FIELDS, "temperature_controlled")
+    if flag is not None:
+        return _flag(flag)
+    requirement = _field(record, CARGO_FIELDS, "temperature_requirement")
+    return requirement is not None and str(requirement).strip().lower() not in AMBIENT_TEMPERATURES
+
+
+def summarize_cargo(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate cargo shipment/assignment records for one flight.
+
+    Args:
+        records: Cargo shipment (V2) or flight assignment (V1) items
+
+    Returns:
+        dict: shipment_count, total weight, weight and count by commodity,
+        temperature-controlled count/weight, revenue and declared value totals
+    """
+    weight_by_commodity: Dict[str, Decimal] = {}
+    count_by_commodity: Counter = Counter()
+    total_weight = cold_weight = total_revenue = total_value = Decimal(0)
+    cold_count = missing_weight = missing_revenue = count = 0
+
+    for record in records:
+        count += 1
+        commodity = _label(_field(record, CARGO_FIELDS, "commodity"))
+        count_by_commodity[commodity] += 1
+
+        weight = _amount(_field(record, CARGO_FIELDS, "weight"))
+        if weight is None:
+            missing_weight += 1
+            weight = Decimal(0)
+        total_weight += weight
+        weight_by_commodity[commodity] = weight_by_commodity.get(commodity, Decimal(0)) + weight
+
+        if _is_temperature_controlled(record):
+            cold_count += 1
+            cold_weight += weight
+
+        revenue = _amount(_field(record, CARGO_FIELDS, "revenue"))
+        if revenue is None:
+            missing_revenue += 1
+        else:
+            total_revenue += revenue
+        total_value += _amount(_field(record, CARGO_FIELDS, "declared_value")) or Decimal(0)
+
+    return {
+        "shipment_count": count,
+        "total_weight_kg": _number(total_weight),
+        "weight_by_commodity_kg": {k: _number(v) for k, v in weight_by_commodity.items()},
+        "count_by_commodity": dict(count_by_commodity),
+        "temperature_controlled": {"count": cold_count, "weight_kg": _number(cold_weight)},
+        "revenue_usd": _number(total_revenue),
+        "declared_value_usd": _number(total_value),
+        "records_missing_weight": missing_weight,
+        "records_missing_revenue": missing_revenue,
+    }
+
+
+def with_records(summary: Dict[str, Any], records: List[Dict[str, Any]], include_records: bool) -> Dict[str, Any]:
+    """Attach the raw records to a summary only when the caller asked for them."""
+    if include_records:
+        summary["records"] = records
+    return summary
@@ -66,6 +66,7 @@ V1_TABLES: Dict[str, str] = {
     "weather": "Weather",
     "maintenance_work_orders": "MaintenanceWorkOrders",
     "maintenance_staff": "MaintenanceStaff",
+    "maintenance_roster": "maintenance_roster",
     # Analysis and impact tables
     "disrupted_passengers": "disrupted_passengers_scenario",
     "aircraft_swap_options": "aircraft_swap_options",
@@ -314,6 +315,96 @@ V2_TABLE_SCHEMAS: Dict[str, TableSchema] = {
     ),
 }
 
+# =============================================================================
+# V1 Table Schemas (keys from the original upload, GSIs from scripts/create_*gsis.py)
+# =============================================================================
+V1_TABLE_SCHEMAS: Dict[str, TableSchema] = {
+    "flights": TableSchema(
+        partition_key="flight_id",
+        partition_key_type="N",
+        gsis=[
+            {"name": "flight-number-date-index", "pk": "flight_number", "sk": "scheduled_departure"},
+            {"name": "aircraft-registration-index", "pk": "aircraft_registration"},
+            {"name": "aircraft-rotation-index", "pk": "aircraft_registration", "sk": "scheduled_departure"},
+            {"name": "airport-curfew-index", "pk": "destination_airport_id", "pk_type": "N", "sk": "scheduled_arrival"},
+        ]
+    ),
+    "passengers": TableSchema(
+        partition_key="passenger_id",
+        partition_key_type="N",
+        gsis=[
+            {"name": "passenger-elite-tier-index", "pk": "frequent_flyer_tier_id", "pk_type": "N", "sk": "booking_date"},
+        ]
+    ),
+    "bookings": TableSchema(
+        partition_key="booking_id",
+        partition_key_type="N",
+        gsis=[
+            {"name": "flight-id-index", "pk": "flight_id"},
+            {"name": "passenger-flight-index", "pk": "passenger_id", "sk": "flight_id"},
+            {"name": "flight-status-index", "pk": "flight_id", "sk": "booking_status"},
+        ]
+    ),
+    "Baggage": TableSchema(
+        partition_key="baggage_id",
+        partition_key_type="N",
+        gsis=[
+            {"name": "booking-index", "pk": "booking_id"},
+            {"name": "location-status-index", "pk": "current_location", "sk": "baggage_status"},
+        ]
+    ),
+    "CrewRoster": TableSchema(
+        partition_key="roster_id",
+        partition_key_type="N",
+        gsis=[
+            {"name": "flight-position-index", "pk": "flight_id", "sk": "position"},
+            {"name": "crew-duty-date-index", "pk": "crew_id", "sk": "duty_date"},
+        ]
+    ),
+    "CrewMembers": TableSchema(
+        partition_key="crew_id",
+        partition_key_type="N",
+    ),
+    "CargoShipments": TableSchema(
+        partition_key="shipment_id",
+        partition_key_type="N",
+        gsis=[
+            {"name": "cargo-temperature-index", "pk": "commodity_type_id", "pk_type": "N", "sk": "temperature_requirement"},
+        ]
+    ),
+    "CargoFlightAssignments": TableSchema(
+        partition_key="assignment_id",
+        partition_key_type="N",
+        gsis=[
+            {"name": "flight-loading-index", "pk": "flight_id", "sk": "loading_priority", "sk_type": "N"},
+            {"name": "shipment-index", "pk": "shipment_id"},
+        ]
+    ),
+    "AircraftAvailability": TableSchema(
+        partition_key="aircraftRegistration",
+        sort_key="valid_from_zulu",
+        sort_key_type="S",
+    ),
+    "MaintenanceWorkOrders": TableSchema(
+        partition_key="workorder_id",
+        gsis=[
+            {"name": "aircraft-registration-index", "pk": "aircraftRegistration"},
+            {"name": "aircraft-maintenance-date-index", "pk": "aircraft_registration", "sk": "scheduled_date"},
+        ]
+    ),
+    "MaintenanceStaff": TableSchema(partition_key="staff_id"),
+    "Weather": TableSchema(
+        partition_key="airport_code",
+        sort_key="forecast_time_zulu",
+        sort_key_type="S",
+    ),
+    "disruption_events": TableSchema(partition_key="disruption_id"),
+    "recovery_scenarios": TableSchema(partition_key="scenario_id"),
+    "recovery_actions": TableSchema(partition_key="action_id"),
+    "business_impact_assessment": TableSchema(partition_key="assessment_id"),
+    "safety_constraints": TableSchema(partition_key="constraint_id"),
+}
+
 # =============================================================================
 # CSV to Table Mapping (for import script)
 # =============================================================================
@@ -344,6 +435,32 @@ CSV_TO_TABLE_MAPPING: Dict[str, str] = {
 }
 
 
+# V1 CSVs in database/output (original upload files and generate_data.py output).
+# When both exist, the enriched file is loaded last and wins on key collisions.
+V1_CSV_TO_TABLE_MAPPING: Dict[str, str] = {
+    "flights.csv": "flights",
+    "flights_enriched_mel.csv": "flights",
+    "passengers.csv": "passengers",
+    "passengers_enriched_final.csv": "passengers",
+    "bookings.csv": "bookings",
+    "baggage.csv": "Baggage",
+    "crew_members.csv": "CrewMembers",
+    "crew_members_enriched.csv": "CrewMembers",
+    "crew_roster.csv": "CrewRoster",
+    "crew_roster_enriched.csv": "CrewRoster",
+    "cargo_shipments.csv": "CargoShipments",
+    "cargo_flight_assignments.csv": "CargoFlightAssignments",
+    "aircraft_availability_enriched_mel.csv": "AircraftAvailability",
+    "aircraft_maintenance_workorders.csv": "MaintenanceWorkOrders",
+    "maintenance_staff.csv": "MaintenanceStaff",
+    "weather.csv": "Weather",
+    "disruption_events.csv": "disruption_events",
+    "recovery_scenarios.csv": "recovery_scenarios",
+    "recovery_actions.csv": "recovery_actions",
+    "business_impact_assessment.csv": "business_impact_assessment",
+    "safety_constraints.csv": "safety_constraints",
+}
+
 # =============================================================================
 # Table Access Functions
 # =============================================================================
@@ -421,15 +538,15 @@ def get_enhanced_tables() -> List[str]:
 
 def get_table_schema(table_name: str) -> Optional[TableSchema]:
     """
-    Get schema definition for a V2 table.
+    Get schema definition for a V2 or V1 table.
 
     Args:
-        table_name: The actual DynamoDB table name (e.g., "flights_v2")
+        table_name: The actual DynamoDB table name (e.g., "flights_v2", "bookings")
 
     Returns:
         TableSchema object or None if not found
     """
-    return V2_TABLE_SCHEMAS.get(table_name)
+    return V2_TABLE_SCHEMAS.get(table_name) or V1_TABLE_SCHEMAS.get(table_name)
 
 
 def get_current_version() -> str:
@@ -0,0 +1,148 @@
+"""Projections and compact serialization for agent tool output
+
+Every tool result is fed back to the LLM on each tool-calling iteration, so
+unused attributes and pretty-printing cost input tokens over and over. In the
+default "compact" output mode:
+
+- Tools request only the attributes each agent reasons about
+  (ProjectionExpression, see TOOL_PROJECTIONS), cutting read capacity and
+  network bytes as well as tokens.
+- Results are serialized without indentation or separator whitespace, and
+  integral Decimals are written as integers ("3" instead of "3.0").
+- Batch tools return each record once, nested in the enriched list, instead
+  of repeating it in a top-level list or lookup map.
+
+TOOL_OUTPUT_MODE=full restores full items and the indented, duplicated output.
+
+Usage:
+    from database.tool_output import get_tool_projection, to_tool_json
+
+    projection = get_tool_projection("guest_experience", BOOKINGS_TABLE)
+    bookings = db.query_bookings_by_flight(flight_id, projection=projection)
+    return to_tool_json({"bookings": bookings})
+"""
+
+import json
+import os
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from database.constants import (
+        BOOKINGS_TABLE,
+        CARGO_FLIGHT_ASSIGNMENTS_TABLE,
+        CARGO_SHIPMENTS_TABLE,
+        CREW_MEMBERS_TABLE,
+        CREW_ROSTER_TABLE,
+        FLIGHTS_TABLE,
+        PASSENGERS_TABLE,
+    )
+except ImportError:
+    from constants import (
+        BOOKINGS_TABLE,
+        CARGO_FLIGHT_ASSIGNMENTS_TABLE,
+        CARGO_SHIPMENTS_TABLE,
+        CREW_MEMBERS_TABLE,
+        CREW_ROSTER_TABLE,
+        FLIGHTS_TABLE,
+        PASSENGERS_TABLE,
+    )
+
+# "compact" (projected, de-duplicated, minified) or "full" (legacy output)
+TOOL_OUTPUT_MODE = os.getenv("TOOL_OUTPUT_MODE", "compact").lower()
+
+# Attributes each agent's tools read, per table. Key attributes used to join
+# records (crew_id, passenger_id, shipment_id, flight_id) must stay listed.
+TOOL_PROJECTIONS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "crew_compliance": {
+        CREW_ROSTER_TABLE: (
+            "roster_id", "crew_id", "flight_id", "position_id", "duty_start", "duty_end",
+            "is_standby", "is_deadhead", "roster_status",
+        ),
+        CREW_MEMBERS_TABLE: (
+            "crew_id", "employee_id", "first_name", "last_name", "position_id",
+            "base_airport_id", "is_active", "license_expiry", "type_ratings",
+            "qualifications", "medical_certificate_status", "medical_expiry_date",
+        ),
+    },
+    "network": {
+        FLIGHTS_TABLE: (
+            "flight_id", "flight_number", "aircraft_type_id", "aircraft_registration",
+            "origin_airport_id", "destination_airport_id", "scheduled_departure",
+            "scheduled_arrival", "actual_departure", "actual_arrival", "flight_status",
+        ),
+    },
+    "guest_experience": {
+        BOOKINGS_TABLE: (
+            "booking_id", "pnr", "passenger_id", "flight_id", "booking_class", "seat_number",
+            "booking_status", "is_connection", "connection_at_risk", "connecting_flight_id",
+            "special_service_request",
+        ),
+        PASSENGERS_TABLE: (
+            "passenger_id", "first_name", "last_name", "frequent_flyer_tier_id",
+            "frequent_flyer_tier", "is_vip", "has_medical_condition", "medical_notes",
+        ),
+    },
+    "cargo": {
+        CARGO_FLIGHT_ASSIGNMENTS_TABLE: (
+            "assignment_id", "shipment_id", "flight_id", "sequence_number",
+            "pieces_on_flight", "weight_on_flight_kg", "loading_status", "uld_number",
+        ),
+        CARGO_SHIPMENTS_TABLE: (
+            "shipment_id", "awb_number", "origin_airport_id", "destination_airport_id",
+            "commodity_type_id", "total_pieces", "total_weight_kg", "total_volume_cbm",
+            "declared_value_usd", "shipment_status", "special_handling_codes",
+        ),
+    },
+}
+
+
+def compact_output_enabled() -> bool:
+    """Check whether tools should emit projected, de-duplicated, minified output."""
+    return TOOL_OUTPUT_MODE != "full"
+
+
+def get_tool_projection(agent_name: str, table_name: str) -> Optional[List[str]]:
+    """
+    Get the attributes an agent's tools should read from a table.
+
+    Args:
+        agent_name: Agent name (e.g., "crew_compliance")
+        table_name: Table name constant (e.g., CREW_ROSTER_TABLE)
+
+    Returns:
+        Attribute names to project, or None to read full items (full output
+        mode, or no projection configured)
+    """
+    if not compact_output_enabled():
+        return None
+    attributes = TOOL_PROJECTIONS.get(agent_name, {}).get(table_name)
+    return list(attributes) if attributes else None
+
+
+def with_full_output(result: Dict[str, Any], **duplicates: Any) -> Dict[str, Any]:
+    """
+    Add fields that repeat records already present in a tool result.
+
+    Batch tools nest each fetched record in their enriched list; the flat
+    lists and lookup maps passed here are only included in full output mode.
+    """
+    if not compact_output_enabled():
+        result.update(duplicates)
+    return result
+
+
+class CompactJSONEncoder(json.JSONEncoder):
+    """JSON encoder writing integral Decimals as ints and other unknown types as strings"""
+
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return int(obj) if obj == obj.to_integral_value() else float(obj)
+        return str(obj)
+
+
+def to_tool_json(data: Any) -> str:
+    """Serialize a tool result, minified unless TOOL_OUTPUT_MODE=full."""
+    if not compact_output_enabled():
+        return json.dumps(data, default=str)
+    return json.dumps(data, cls=CompactJSONEncoder, separators=(",", ":"))
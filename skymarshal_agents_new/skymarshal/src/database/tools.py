@@ -55,6 +55,7 @@ from database.constants import (
     can_agent_access_table
 )
 from database.table_config import TABLE_VERSION, TableVersion, is_v2_enabled
+from database.tool_output import get_tool_projection, with_full_output
 import logging
 
 logger = logging.getLogger(__name__)
@@ -92,7 +93,9 @@ def get_crew_compliance_tools():
                     "error": f"Agent {agent_name} not authorized to access {CREW_ROSTER_TABLE}"
                 })
             
-            roster = db.query_crew_roster_by_flight(flight_id)
+            roster = db.query_crew_roster_by_flight(
+                flight_id, projection=get_tool_projection(agent_name, CREW_ROSTER_TABLE)
+            )
             result = {
                 "flight_id": flight_id,
                 "crew_count": len(roster),
@@ -165,23 +168,26 @@ def get_crew_compliance_tools():
                 })
             
             # Query 1: Get crew roster for the flight
-            roster = db.query_crew_roster_by_flight(flight_id)
+            roster = db.query_crew_roster_by_flight(
+                flight_id, projection=get_tool_projection(agent_name, CREW_ROSTER_TABLE)
+            )
             
             if not roster:
-                return db.to_json({
+                return db.to_json(with_full_output({
                     "flight_id": flight_id,
                     "crew_count": 0,
                     "roster": [],
-                    "crew_members": [],
                     "query_method": "GSI + Batch",
                     "query_count": 1
-                })
+                }, crew_members=[]))
             
             # Extract crew IDs from roster
             crew_ids = [assignment.get("crew_id") for assignment in roster if assignment.get("crew_id")]
             
             # Query 2: Batch get all crew member details
-            crew_members = db.batch_get_crew_members(crew_ids)
+            crew_members = db.batch_get_crew_members(
+                crew_ids, projection=get_tool_projection(agent_name, CREW_MEMBERS_TABLE)
+            )
             
             # Create a lookup map for easy access
             crew_member_map = {member.get("crew_id"): member for member in crew_members}
@@ -196,15 +202,14 @@ def get_crew_compliance_tools():
                 }
                 enriched_roster.append(enriched_assignment)
             
-            return db.to_json({
+            return db.to_json(with_full_output({
                 "flight_id": flight_id,
                 "crew_count": len(roster),
                 "roster": enriched_roster,
-                "crew_members": crew_members,
                 "query_method": f"GSI: {FLIGHT_POSITION_INDEX} + Batch: CrewMembers",
                 "query_count": 2,
                 "optimization": f"Reduced from {1 + len(crew_ids)} queries to 2 queries"
-            })
+            }, crew_members=crew_members))
         except Exception as e:
             logger.error(f"Error in query_crew_roster_and_members: {e}")
             return db.to_json({"error": str(e), "flight_id": flight_id})
@@ -389,6 +394,7 @@ def get_regulatory_tools():
 def get_network_tools():
     """Get database tools for network agent"""
     db = DynamoDBClient()
+    agent_name = "network"
 
     @tool
     def query_inbound_flight_impact(scenario: str) -> str:
@@ -467,7 +473,9 @@ def get_network_tools():
                 })
             
             # Batch get all flight details
-            flights = db.batch_get_flights(flight_id_list)
+            flights = db.batch_get_flights(
+                flight_id_list, projection=get_tool_projection(agent_name, FLIGHTS_TABLE)
+            )
             
             # Create a lookup map for easy access
             flight_map = {flight.get("flight_id"): flight for flight in flights}
@@ -477,16 +485,15 @@ def get_network_tools():
             requested_ids = set(flight_id_list)
             missing_ids = requested_ids - found_ids
             
-            return db.to_json({
+            return db.to_json(with_full_output({
                 "flight_count": len(flights),
                 "flights": flights,
-                "flight_map": flight_map,
                 "requested_count": len(flight_id_list),
                 "found_count": len(flights),
                 "missing_ids": list(missing_ids) if missing_ids else [],
                 "query_method": "Batch: Flights",
                 "optimization": f"Reduced from {len(flight_id_list)} queries to 1 batch query"
-            })
+            }, flight_map=flight_map))
         except Exception as e:
             logger.error(f"Error in query_multiple_flights_network: {e}")
             return db.to_json({"error": str(e), "flight_ids": flight_ids})
@@ -502,6 +509,7 @@ def get_network_tools():
 def get_guest_experience_tools():
     """Get database tools for guest experience agent"""
     db = DynamoDBClient()
+    agent_name = "guest_experience"
 
     @tool
     def query_passenger_bookings(passenger_id: str) -> str:
@@ -540,7 +548,9 @@ def get_guest_experience_tools():
             JSON string containing flight bookings and passenger manifest
         """
         try:
-            bookings = db.query_bookings_by_flight(flight_id, booking_status)
+            bookings = db.query_bookings_by_flight(
+                flight_id, booking_status, projection=get_tool_projection(agent_name, BOOKINGS_TABLE)
+            )
             result = {
                 "flight_id": flight_id,
                 "booking_status_filter": booking_status,
@@ -622,24 +632,27 @@ def get_guest_experience_tools():
         """
         try:
             # Query 1: Get bookings for the flight
-            bookings = db.query_bookings_by_flight(flight_id, booking_status)
+            bookings = db.query_bookings_by_flight(
+                flight_id, booking_status, projection=get_tool_projection(agent_name, BOOKINGS_TABLE)
+            )
             
             if not bookings:
-                return db.to_json({
+                return db.to_json(with_full_output({
                     "flight_id": flight_id,
                     "booking_status_filter": booking_status,
                     "booking_count": 0,
                     "bookings": [],
-                    "passengers": [],
                     "query_method": "GSI + Batch",
                     "query_count": 1
-                })
+                }, passengers=[]))
             
             # Extract passenger IDs from bookings
             passenger_ids = [booking.get("passenger_id") for booking in bookings if booking.get("passenger_id")]
             
             # Query 2: Batch get all passenger details
-            passengers = db.batch_get_passengers(passenger_ids)
+            passengers = db.batch_get_passengers(
+                passenger_ids, projection=get_tool_projection(agent_name, PASSENGERS_TABLE)
+            )
             
             # Create a lookup map for easy access
             passenger_map = {passenger.get("passenger_id"): passenger for passenger in passengers}
@@ -654,16 +667,15 @@ def get_guest_experience_tools():
                 }
                 enriched_bookings.append(enriched_booking)
             
-            return db.to_json({
+            return db.to_json(with_full_output({
                 "flight_id": flight_id,
                 "booking_status_filter": booking_status,
                 "booking_count": len(bookings),
                 "bookings": enriched_bookings,
-                "passengers": passengers,
                 "query_method": f"GSI: flight-status-index + Batch: Passengers",
                 "query_count": 2,
                 "optimization": f"Reduced from {1 + len(passenger_ids)} queries to 2 queries"
-            })
+            }, passengers=passengers))
         except Exception as e:
             logger.error(f"Error in query_flight_bookings_with_passengers: {e}")
             return db.to_json({"error": str(e), "flight_id": flight_id})
@@ -685,6 +697,7 @@ def get_guest_experience_tools():
 def get_cargo_tools():
     """Get database tools for cargo agent"""
     db = DynamoDBClient()
+    agent_name = "cargo"
 
     @tool
     def track_cargo_shipment(shipment_id: str) -> str:
@@ -726,7 +739,10 @@ def get_cargo_tools():
             JSON string containing cargo manifest, weight, special handling
         """
         try:
-            cargo = db.query_cargo_by_flight(flight_id, loading_status)
+            cargo = db.query_cargo_by_flight(
+                flight_id, loading_status,
+                projection=get_tool_projection(agent_name, CARGO_FLIGHT_ASSIGNMENTS_TABLE)
+            )
 
             # Calculate total weight
             total_weight = sum(
@@ -764,19 +780,21 @@ def get_cargo_tools():
         """
         try:
             # Query 1: Get cargo assignments for the flight
-            cargo = db.query_cargo_by_flight(flight_id, loading_status)
+            cargo = db.query_cargo_by_flight(
+                flight_id, loading_status,
+                projection=get_tool_projection(agent_name, CARGO_FLIGHT_ASSIGNMENTS_TABLE)
+            )
             
             if not cargo:
-                return db.to_json({
+                return db.to_json(with_full_output({
                     "flight_id": flight_id,
                     "loading_status_filter": loading_status,
                     "cargo_count": 0,
                     "total_weight_kg": 0,
                     "cargo": [],
-                    "shipments": [],
                     "query_method": "GSI + Batch",
                     "query_count": 1
-                })
+                }, shipments=[]))
             
             # Calculate total weight
             total_weight = sum(
@@ -787,7 +805,9 @@ def get_cargo_tools():
             shipment_ids = [assignment.get("shipment_id") for assignment in cargo if assignment.get("shipment_id")]
             
             # Query 2: Batch get all shipment details
-            shipments = db.batch_get_cargo_shipments(shipment_ids)
+            shipments = db.batch_get_cargo_shipments(
+                shipment_ids, projection=get_tool_projection(agent_name, CARGO_SHIPMENTS_TABLE)
+            )
             
             # Create a lookup map for easy access
             shipment_map = {shipment.get("shipment_id"): shipment for shipment in shipments}
@@ -802,17 +822,16 @@ def get_cargo_tools():
                 }
                 enriched_cargo.append(enriched_assignment)
             
-            return db.to_json({
+            return db.to_json(with_full_output({
                 "flight_id": flight_id,
                 "loading_status_filter": loading_status,
                 "cargo_count": len(cargo),
                 "total_weight_kg": total_weight,
                 "cargo": enriched_cargo,
-                "shipments": shipments,
                 "query_method": f"GSI: flight-loading-index + Batch: CargoShipments",
                 "query_count": 2,
                 "optimization": f"Reduced from {1 + len(shipment_ids)} queries to 2 queries"
-            })
+            }, shipments=shipments))
         except Exception as e:
             logger.error(f"Error in query_flight_cargo_manifest_with_shipments: {e}")
             return db.to_json({"error": str(e), "flight_id": flight_id})
@@ -1,12 +1,13 @@
 """SkyMarshal Multi-Agent Orchestrator"""
 
 import asyncio
+import contextvars
 import logging
 import os
 import sys
 import time
 from datetime import datetime
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from functools import wraps
 
 from bedrock_agentcore import BedrockAgentCoreApp
@@ -21,10 +22,23 @@ from agents import (
     analyze_regulatory,
 )
 from agents.arbitrator import arbitrate
+from agents.arbitrator.agent import ARBITRATOR_MODEL_PRIORITY
+from agents.data_stage import bind_shared_reads, data_cache_stats, start_data_warmup, start_prefetch
+from agents.flight_context import (
+    resolve_flight_context,
+)
+from agents.revision_logic import (
+    RevisionDecision,
+    analyze_other_recommendations,
+    format_revision_statement,
+    get_domain_keywords,
+)
 from agents.schemas import AgentResponse, Collation
 from checkpoint import CheckpointSaver, ThreadManager
 from mcp_client.client import get_streamable_http_mcp_client
-from model.load import load_model, load_model_for_agent
+from model.health import MODEL_HEALTH_REFRESH_SECONDS, get_model_health_registry, start_health_refresh
+from model.load import BEDROCK_REGION, MODEL_PRIORITY, load_model, load_model_for_agent
+from utils.metrics import RequestMetrics, bind_request_metrics, metric_labels
 from utils.response_formatting import format_agent_response_compact, get_compact_context
 
 # Configure comprehensive logging
@@ -128,6 +142,83 @@ AGENT_TIMEOUTS = {
 # Arbitrator timeout (complex reasoning and conflict resolution)
 ARBITRATOR_TIMEOUT = 90
 
+# Phase label for usage metrics, per agent payload "phase"
+METRIC_PHASES = {"initial": "phase1", "revision": "phase2"}
+
+# Skip the Phase 2 LLM call for agents whose deterministic revision pre-check
+# (revision_logic.analyze_other_recommendations) does not come out as REVISE
+REVISION_FAST_PATH_ENABLED = os.getenv("REVISION_FAST_PATH", "true").lower() == "true"
+
+
+def get_phase2_dependencies(agent_name: str) -> List[str]:
+    """
+    Phase 1 results an agent needs before its Phase 2 revision can start.
+    
+    Every agent waits for all safety agents (their binding constraints must be
+    respected) and its own initial recommendation. Other business results are
+    folded in if they have arrived by then, otherwise marked as absent.
+    
+    Args:
+        agent_name: Agent whose revision is being scheduled
+        
+    Returns:
+        list: Agent names whose Phase 1 results are required
+    """
+    return list(dict.fromkeys(SAFETY_AGENT_NAMES + [agent_name]))
+
+
+class Phase1Progress:
+    """
+    Tracks Phase 1 agent results as they complete.
+    
+    Lets each Phase 2 revision start as soon as its own dependencies are in,
+    instead of waiting for the slowest Phase 1 agent.
+    """
+
+    def __init__(self, agent_names: List[str]):
+        self._results: Dict[str, dict] = {}
+        self._finished = False
+        self._events: Dict[str, asyncio.Event] = {
+            name: asyncio.Event() for name in agent_names
+        }
+
+    @classmethod
+    def from_collation(cls, collation: Collation) -> "Phase1Progress":
+        """Build a fully-resolved tracker from a completed Phase 1 collation."""
+        progress = cls(list(collation.responses.keys()))
+        progress.record_collation(collation)
+        progress.finish()
+        return progress
+
+    def record(self, agent_name: str, response: dict) -> None:
+        """Record an agent's Phase 1 response (AgentResponse-shaped dict)."""
+        if agent_name in self._results:
+            return
+        self._results[agent_name] = response
+        self._events.setdefault(agent_name, asyncio.Event()).set()
+
+    def record_collation(self, collation: Collation) -> None:
+        """Record any responses from a collation that are not yet tracked."""
+        for name, response in collation.responses.items():
+            self.record(name, response.model_dump())
+
+    def finish(self) -> None:
+        """Mark Phase 1 as finished; agents still missing are treated as absent."""
+        for event in self._events.values():
+            event.set()
+        self._finished = True
+
+    async def wait_for(self, agent_names: List[str]) -> None:
+        """Wait until all given agents have a recorded Phase 1 response."""
+        for name in agent_names:
+            if self._finished:
+                return
+            await self._events.setdefault(name, asyncio.Event()).wait()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Get the Phase 1 responses recorded so far."""
+        return dict(self._results)
+
 
 def augment_prompt_phase1(user_prompt: str) -> str:
     """
@@ -199,6 +290,232 @@ def augment_prompt_phase2(user_prompt: str, initial_collation: dict) -> str:
     return prompt.to_xml_phase2()
 
 
+def build_revision_payload(
+    user_prompt: str,
+    phase1_responses: Dict[str, dict],
+    flight_context: Optional[dict] = None,
+    expected_agents: Optional[List[str]] = None
+) -> dict:
+    """
+    Build the Phase 2 payload from the Phase 1 responses available so far.
+    
+    Args:
+        user_prompt: Original natural language prompt from user
+        phase1_responses: Phase 1 responses (AgentResponse dicts) keyed by agent name
+        flight_context: Optional pre-resolved flight_info/flight from resolve_flight_context()
+        expected_agents: Agents expected in Phase 1; missing ones are marked absent
+        
+    Returns:
+        dict: Revision payload with augmented prompt and compact recommendations
+    """
+    # Apply compact formatting to reduce token usage in A2A communication
+    compact_responses = {
+        name: format_agent_response_compact(response)
+        for name, response in phase1_responses.items()
+    }
+    for name in expected_agents or []:
+        if name not in compact_responses:
+            compact_responses[name] = {
+                "agent_name": name,
+                "recommendation": "ABSENT: Phase 1 result not yet available",
+                "confidence": 0.0,
+                "binding_constraints": [],
+                "status": "absent",
+            }
+
+    # Augment prompt with phase 2 instructions and compact collation
+    augmented_prompt = augment_prompt_phase2(
+        user_prompt, {"phase": "initial", "responses": compact_responses}
+    )
+    logger.debug(f"   Augmented prompt length: {len(augmented_prompt)} chars")
+
+    payload = {
+        "user_prompt": augmented_prompt,
+        "phase": "revision",
+        "other_recommendations": compact_responses
+    }
+    if flight_context:
+        payload.update(flight_context)
+    return payload
+
+
+def precheck_revision(
+    agent_name: str,
+    phase1_responses: Dict[str, dict]
+) -> Tuple[Optional[RevisionDecision], Optional[dict]]:
+    """
+    Deterministic Phase 2 pre-check for one agent.
+    
+    Runs revision_logic.analyze_other_recommendations over the Phase 1 results.
+    When the outcome is CONFIRM or STRENGTHEN, the agent's initial recommendation
+    is carried forward with a generated revision statement instead of invoking
+    the LLM revision.
+    
+    Args:
+        agent_name: Agent whose revision is being decided
+        phase1_responses: Phase 1 responses (AgentResponse dicts) keyed by agent name
+        
+    Returns:
+        tuple: (decision, carried-forward result), where the result is None when
+            the LLM revision must run (REVISE, or no usable Phase 1 result)
+    """
+    initial = phase1_responses.get(agent_name)
+    if not initial or initial.get("status", "success") != "success":
+        # Nothing valid to carry forward - the agent must run its revision
+        return None, None
+    
+    # Only the other agents' results count - the agent's own wording must not
+    # trigger its revision
+    others = {name: response for name, response in phase1_responses.items() if name != agent_name}
+    decision, reasons, justification = analyze_other_recommendations(
+        agent_name=agent_name,
+        initial_recommendation=initial,
+        other_recommendations=others,
+        domain_keywords=get_domain_keywords(agent_name)
+    )
+    if decision == RevisionDecision.REVISE:
+        return decision, None
+    
+    statement = format_revision_statement(
+        decision=decision,
+        reasons=reasons,
+        justification=justification,
+        initial_recommendation=initial.get("recommendation", "")
+    )
+    result = {
+        "agent": agent_name,
+        "recommendation": initial.get("recommendation", "No recommendation provided"),
+        "confidence": initial.get("confidence", 0.0),
+        "binding_constraints": initial.get("binding_constraints", []),
+        "reasoning": f"{statement}\n\n{initial.get('reasoning', '')}".strip(),
+        "data_sources": initial.get("data_sources", []),
+        "extracted_flight_info": initial.get("extracted_flight_info"),
+        "timestamp": datetime.now().isoformat(),
+        "status": "success",
+        "duration_seconds": 0.0,
+    }
+    return decision, result
+
+
+# Callback used by the phases to publish progress events (see handle_disruption_stream)
+EventCallback = Callable[[Dict[str, Any]], None]
+
+
+def build_agent_event(phase: str, result: dict) -> Dict[str, Any]:
+    """
+    Build a compact progress event for a completed agent.
+    
+    Args:
+        phase: Phase identifier ("phase1" or "phase2")
+        result: Raw agent result from run_agent_safely()
+        
+    Returns:
+        dict: "agent_complete" event suitable for streaming to clients
+    """
+    return {
+        "type": "agent_complete",
+        "phase": phase,
+        "agent": result.get("agent", "unknown"),
+        "status": result.get("status", "success"),
+        "recommendation": result.get("recommendation"),
+        "confidence": result.get("confidence"),
+        "binding_constraints": result.get("binding_constraints", []),
+        "duration_seconds": result.get("duration_seconds"),
+        "error": result.get("error"),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def build_agent_response(result: dict) -> AgentResponse:
+    """
+    Convert a raw agent result into an AgentResponse.
+    
+    Args:
+        result: Raw agent result from run_agent_safely()
+        
+    Returns:
+        AgentResponse: Parsed response, or an error response if parsing fails
+    """
+    agent_name = result.get("agent", "unknown")
+    try:
+        # Determine status - use result status if present, otherwise default to success
+        status = result.get("status", "success")
+        
+        # Convert raw result to AgentResponse model
+        return AgentResponse(
+            agent_name=agent_name,
+            recommendation=result.get("recommendation", "No recommendation provided"),
+            confidence=result.get("confidence", 0.0),
+            binding_constraints=result.get("binding_constraints", []),
+            reasoning=result.get("reasoning", "No reasoning provided"),
+            data_sources=result.get("data_sources", []),
+            extracted_flight_info=result.get("extracted_flight_info"),
+            timestamp=result.get("timestamp", datetime.now().isoformat()),
+            status=status,
+            duration_seconds=result.get("duration_seconds"),
+            error=result.get("error"),
+        )
+    except Exception as e:
+        logger.error(f"   ⚠️  Failed to parse response from {agent_name}: {e}")
+        # Create error response
+        return AgentResponse(
+            agent_name=agent_name,
+            recommendation="Failed to parse agent response",
+            confidence=0.0,
+            reasoning=f"Error parsing response: {str(e)}",
+            data_sources=[],
+            timestamp=datetime.now().isoformat(),
+            status="error",
+            error=str(e),
+        )
+
+
+async def _completed(result: dict) -> dict:
+    """Wrap an already-available agent result as an awaitable."""
+    return result
+
+
+async def _run_and_report(
+    phase: str,
+    agent_coro: Awaitable[dict],
+    event_callback: Optional[EventCallback] = None,
+    progress: Optional[Phase1Progress] = None
+) -> dict:
+    """
+    Await an agent run, publish its completion event and record it in the
+    Phase 1 progress tracker, if provided.
+    """
+    result = await agent_coro
+    if progress is not None:
+        progress.record(result.get("agent", "unknown"), build_agent_response(result).model_dump())
+    if event_callback:
+        event_callback(build_agent_event(phase, result))
+    return result
+
+
+async def _stream_task_events(
+    task: "asyncio.Task",
+    queue: "asyncio.Queue"
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield events published to the queue until the task finishes.
+    
+    Events emitted right before the task completes are drained, so none are lost.
+    The task's result (or exception) is left for the caller to collect.
+    """
+    while True:
+        getter = asyncio.ensure_future(queue.get())
+        done, _ = await asyncio.wait({task, getter}, return_when=asyncio.FIRST_COMPLETED)
+        if getter in done:
+            yield getter.result()
+        else:
+            getter.cancel()
+        if task in done:
+            while not queue.empty():
+                yield queue.get_nowait()
+            return
+
+
 async def run_agent_safely(
     agent_name: str,
     agent_fn: Callable[[dict, Any, list], Awaitable[dict]],
@@ -253,9 +570,11 @@ async def run_agent_safely(
         
         # Time the agent execution
         agent_start = time.time()
-        result = await asyncio.wait_for(
-            agent_fn(payload, llm, mcp_tools), timeout=timeout
-        )
+        phase = METRIC_PHASES.get(payload.get("phase"), payload.get("phase", "unknown"))
+        with metric_labels(agent=agent_name, phase=phase):
+            result = await asyncio.wait_for(
+                agent_fn(payload, llm, mcp_tools), timeout=timeout
+            )
         agent_duration = time.time() - agent_start
 
         duration = (datetime.now() - start_time).total_seconds()
@@ -379,13 +698,17 @@ async def phase1_initial_recommendations(
     llm: Any,
     mcp_tools: list,
     thread_id: str = None,
-    checkpoint_saver: CheckpointSaver = None
+    checkpoint_saver: CheckpointSaver = None,
+    flight_context: Optional[dict] = None,
+    event_callback: Optional[EventCallback] = None,
+    progress: Optional[Phase1Progress] = None
 ) -> Collation:
     """
     Phase 1: Initial Recommendations with checkpoint persistence.
     
     Invoke all 7 agents in parallel with the user prompt plus instructions.
-    Agents are responsible for extracting flight info and performing lookups.
+    Agents reuse the shared flight context when provided, otherwise they
+    extract flight info themselves before performing lookups.
     
     Safety agents use Sonnet 4.5 for accuracy-critical analysis.
     Business agents use Haiku 4.5 for speed and cost optimization.
@@ -398,6 +721,9 @@ async def phase1_initial_recommendations(
         mcp_tools: MCP tools
         thread_id: Optional thread identifier for checkpoint persistence
         checkpoint_saver: Optional checkpoint saver for state persistence
+        flight_context: Optional pre-resolved flight_info/flight from resolve_flight_context()
+        event_callback: Optional callback receiving an "agent_complete" event as each agent finishes
+        progress: Optional tracker recording each result as it arrives (for Phase 2 early start)
         
     Returns:
         Collation: Collated initial recommendations with metadata
@@ -427,6 +753,8 @@ async def phase1_initial_recommendations(
         "user_prompt": augmented_prompt,
         "phase": "initial"
     }
+    if flight_context:
+        payload.update(flight_context)
     
     # Get all agents (safety + business)
     all_agents = SAFETY_AGENTS + BUSINESS_AGENTS
@@ -442,11 +770,16 @@ async def phase1_initial_recommendations(
         agent_llm = load_model_for_agent(agent_type)
         
         agent_tasks.append(
-            run_agent_safely(
-                name, fn, payload, agent_llm, mcp_tools, 
-                timeout=AGENT_TIMEOUTS.get(name, 60),  # Agent-specific timeout
-                thread_id=thread_id, 
-                checkpoint_saver=checkpoint_saver
+            _run_and_report(
+                "phase1",
+                run_agent_safely(
+                    name, fn, payload, agent_llm, mcp_tools, 
+                    timeout=AGENT_TIMEOUTS.get(name, 60),  # Agent-specific timeout
+                    thread_id=thread_id, 
+                    checkpoint_saver=checkpoint_saver
+                ),
+                event_callback,
+                progress
             )
         )
     
@@ -495,41 +828,10 @@ async def phase1_initial_recommendations(
         )
     
     # Collate responses using Pydantic model
-    responses = {}
-    for result in agent_results:
-        agent_name = result.get("agent", "unknown")
-        try:
-            # Determine status - use result status if present, otherwise default to success
-            status = result.get("status", "success")
-            
-            # Convert raw result to AgentResponse model
-            agent_response = AgentResponse(
-                agent_name=agent_name,
-                recommendation=result.get("recommendation", "No recommendation provided"),
-                confidence=result.get("confidence", 0.0),
-                binding_constraints=result.get("binding_constraints", []),
-                reasoning=result.get("reasoning", "No reasoning provided"),
-                data_sources=result.get("data_sources", []),
-                extracted_flight_info=result.get("extracted_flight_info"),
-                timestamp=result.get("timestamp", datetime.now().isoformat()),
-                status=status,
-                duration_seconds=result.get("duration_seconds"),
-                error=result.get("error"),
-            )
-            responses[agent_name] = agent_response
-        except Exception as e:
-            logger.error(f"   ⚠️  Failed to parse response from {agent_name}: {e}")
-            # Create error response
-            responses[agent_name] = AgentResponse(
-                agent_name=agent_name,
-                recommendation="Failed to parse agent response",
-                confidence=0.0,
-                reasoning=f"Error parsing response: {str(e)}",
-                data_sources=[],
-                timestamp=datetime.now().isoformat(),
-                status="error",
-                error=str(e),
-            )
+    responses = {
+        result.get("agent", "unknown"): build_agent_response(result)
+        for result in agent_results
+    }
     
     # Create collation using Pydantic model
     collation = Collation(
@@ -563,11 +865,14 @@ async def phase1_initial_recommendations(
 
 async def phase2_revision_round(
     user_prompt: str,
-    initial_collation: Collation,
+    initial_collation: Optional[Collation],
     llm: Any,
     mcp_tools: list,
     thread_id: str = None,
-    checkpoint_saver: CheckpointSaver = None
+    checkpoint_saver: CheckpointSaver = None,
+    flight_context: Optional[dict] = None,
+    event_callback: Optional[EventCallback] = None,
+    progress: Optional[Phase1Progress] = None
 ) -> Collation:
     """
     Phase 2: Revision Round with checkpoint persistence.
@@ -575,6 +880,17 @@ async def phase2_revision_round(
     Invoke all 7 agents with user prompt, initial recommendations, and revision instructions.
     Agents review others' recommendations and revise their own.
     
+    Each agent's revision is scheduled independently: it starts as soon as the
+    Phase 1 results it depends on (see get_phase2_dependencies) are available.
+    When a Phase1Progress tracker is passed, Phase 2 can therefore run while
+    slower Phase 1 agents are still working; results that have not arrived
+    when a revision starts are marked as absent in its context.
+    
+    Before invoking an agent, a deterministic pre-check (precheck_revision)
+    decides REVISE / CONFIRM / STRENGTHEN. Only REVISE outcomes invoke the LLM;
+    other agents carry their initial recommendation forward with a revision
+    statement. Set REVISION_FAST_PATH=false to always invoke every agent.
+    
     Safety agents use Sonnet 4.5 for accuracy-critical analysis.
     Business agents use Haiku 4.5 for speed and cost optimization.
     
@@ -582,25 +898,38 @@ async def phase2_revision_round(
     
     Args:
         user_prompt: Original natural language prompt from user
-        initial_collation: Collated initial recommendations from phase 1
+        initial_collation: Collated initial recommendations from phase 1.
+            Callers must pass it unless progress is provided (then it may be None)
         llm: Model instance (unused - agents load their own models)
         mcp_tools: MCP tools
         thread_id: Optional thread identifier for checkpoint persistence
         checkpoint_saver: Optional checkpoint saver for state persistence
+        flight_context: Optional pre-resolved flight_info/flight from resolve_flight_context()
+        event_callback: Optional callback receiving an "agent_complete" event as each agent finishes
+        progress: Optional live Phase 1 tracker enabling per-agent early start
         
     Returns:
         Collation: Collated revised recommendations with metadata
     """
-    logger.info("🔄 Phase 2: Revision Round (parallel execution)")
+    logger.info("🔄 Phase 2: Revision Round (dependency-aware parallel execution)")
+    
+    # Pipelined with a still-running Phase 1 (vs. a completed initial collation)
+    pipelined = progress is not None
+    if progress is None:
+        progress = Phase1Progress.from_collation(initial_collation)
     
     # Save checkpoint before phase execution
     if thread_id and checkpoint_saver:
+        phase1_results = (
+            initial_collation.model_dump() if initial_collation is not None
+            else {"phase": "initial", "responses": progress.snapshot()}
+        )
         await checkpoint_saver.save_checkpoint(
             thread_id=thread_id,
             checkpoint_id="phase2_start",
             state={
                 "user_prompt": user_prompt,
-                "phase1_results": initial_collation.model_dump()
+                "phase1_results": phase1_results
             },
             metadata={
                 "phase": "phase2",
@@ -610,54 +939,81 @@ async def phase2_revision_round(
         )
         logger.debug(f"   ✅ Phase 2 start checkpoint saved")
     
-    # Convert Collation to compact dict for augment_prompt_phase2
-    # Apply compact formatting to reduce token usage in A2A communication
-    compact_responses = {
-        name: format_agent_response_compact(response.model_dump())
-        for name, response in initial_collation.responses.items()
-    }
-
-    initial_collation_dict = {
-        "phase": initial_collation.phase,
-        "responses": compact_responses,
-        "timestamp": initial_collation.timestamp,
-        "duration_seconds": initial_collation.duration_seconds
-    }
-
-    # Augment prompt with phase 2 instructions and compact collation
-    augmented_prompt = augment_prompt_phase2(user_prompt, initial_collation_dict)
-    logger.debug(f"   Augmented prompt length: {len(augmented_prompt)} chars")
-
-    # Create payload with augmented prompt and compact recommendations
-    payload = {
-        "user_prompt": augmented_prompt,
-        "phase": "revision",
-        "other_recommendations": compact_responses
-    }
-    
     # Get all agents (safety + business)
     all_agents = SAFETY_AGENTS + BUSINESS_AGENTS
-    logger.debug(f"   Agents: {[name for name, _ in all_agents]}")
+    all_agent_names = [name for name, _ in all_agents]
+    logger.debug(f"   Agents: {all_agent_names}")
     
-    # Run all agents in parallel with checkpoint support
-    # Load agent-specific models: safety agents use Sonnet, business agents use Haiku
-    # Phase 2 has longer timeout (base + 30s) since agents review other recommendations
-    phase_start = datetime.now()
-    agent_tasks = []
-    for name, fn in all_agents:
+    async def revise_when_ready(name: str, fn: Callable) -> dict:
+        # Wait only for the Phase 1 results this agent depends on (among scheduled agents)
+        dependencies = [
+            dep for dep in get_phase2_dependencies(name) if dep in all_agent_names
+        ]
+        await progress.wait_for(dependencies)
+        phase1_responses = progress.snapshot()
+        
+        # Don't spend an LLM call if a safety dependency already failed (Phase 1 will halt)
+        failed = [
+            dep for dep in dependencies
+            if pipelined and dep in SAFETY_AGENT_NAMES
+            and phase1_responses.get(dep, {}).get("status") in ["timeout", "error"]
+        ]
+        if failed:
+            logger.warning(f"   ⚠️  Skipping {name} revision: safety agent(s) failed in Phase 1: {failed}")
+            return {
+                "agent": name,
+                "status": "error",
+                "error": f"Revision skipped: Phase 1 safety agent(s) failed: {failed}",
+                "recommendation": "Revision skipped due to Phase 1 safety agent failure",
+                "confidence": 0.0,
+                "reasoning": "Phase 1 safety dependency failed",
+                "data_sources": [],
+                "timestamp": datetime.now().isoformat(),
+            }
+        
+        absent = [agent for agent in all_agent_names if agent not in phase1_responses]
+        
+        if REVISION_FAST_PATH_ENABLED:
+            decision, carried = precheck_revision(name, phase1_responses)
+            if carried is not None and absent:
+                # A later Phase 1 result could still require a revision: decide on the
+                # full picture (the LLM call this may save takes longer than the wait)
+                await progress.wait_for(all_agent_names)
+                phase1_responses = progress.snapshot()
+                absent = [agent for agent in all_agent_names if agent not in phase1_responses]
+                decision, carried = precheck_revision(name, phase1_responses)
+            if carried is not None:
+                logger.info(f"   ⚡ {name} revision fast path: {decision.value} (LLM revision skipped)")
+                return await _run_and_report("phase2", _completed(carried), event_callback)
+        
+        if absent:
+            logger.info(f"   ⏩ {name} revision starting early (Phase 1 pending: {absent})")
+        
+        payload = build_revision_payload(
+            user_prompt, phase1_responses, flight_context, expected_agents=all_agent_names
+        )
+        
         # Determine agent type based on agent list membership
         agent_type = "safety" if name in SAFETY_AGENT_NAMES else "business"
         agent_llm = load_model_for_agent(agent_type)
         
-        agent_tasks.append(
+        return await _run_and_report(
+            "phase2",
             run_agent_safely(
                 name, fn, payload, agent_llm, mcp_tools, 
                 timeout=AGENT_TIMEOUTS.get(name, 60) + 30,  # Add 30s for revision complexity
                 thread_id=thread_id, 
                 checkpoint_saver=checkpoint_saver
-            )
+            ),
+            event_callback
         )
     
+    # Run all agent revisions in parallel, each gated on its own dependencies
+    # Load agent-specific models: safety agents use Sonnet, business agents use Haiku
+    # Phase 2 has longer timeout (base + 30s) since agents review other recommendations
+    phase_start = datetime.now()
+    agent_tasks = [revise_when_ready(name, fn) for name, fn in all_agents]
+    
     agent_results = await asyncio.gather(*agent_tasks)
     phase_duration = (datetime.now() - phase_start).total_seconds()
     
@@ -703,41 +1059,10 @@ async def phase2_revision_round(
         )
     
     # Collate responses using Pydantic model
-    responses = {}
-    for result in agent_results:
-        agent_name = result.get("agent", "unknown")
-        try:
-            # Determine status - use result status if present, otherwise default to success
-            status = result.get("status", "success")
-            
-            # Convert raw result to AgentResponse model
-            agent_response = AgentResponse(
-                agent_name=agent_name,
-                recommendation=result.get("recommendation", "No recommendation provided"),
-                confidence=result.get("confidence", 0.0),
-                binding_constraints=result.get("binding_constraints", []),
-                reasoning=result.get("reasoning", "No reasoning provided"),
-                data_sources=result.get("data_sources", []),
-                extracted_flight_info=result.get("extracted_flight_info"),
-                timestamp=result.get("timestamp", datetime.now().isoformat()),
-                status=status,
-                duration_seconds=result.get("duration_seconds"),
-                error=result.get("error"),
-            )
-            responses[agent_name] = agent_response
-        except Exception as e:
-            logger.error(f"   ⚠️  Failed to parse response from {agent_name}: {e}")
-            # Create error response
-            responses[agent_name] = AgentResponse(
-                agent_name=agent_name,
-                recommendation="Failed to parse agent response",
-                confidence=0.0,
-                reasoning=f"Error parsing response: {str(e)}",
-                data_sources=[],
-                timestamp=datetime.now().isoformat(),
-                status="error",
-                error=str(e),
-            )
+    responses = {
+        result.get("agent", "unknown"): build_agent_response(result)
+        for result in agent_results
+    }
     
     # Create collation using Pydantic model
     collation = Collation(
@@ -774,7 +1099,8 @@ async def phase3_arbitration(
     llm: Any,
     thread_id: str = None,
     checkpoint_saver: CheckpointSaver = None,
-    initial_collation: Optional[Collation] = None
+    initial_collation: Optional[Collation] = None,
+    event_callback: Optional[EventCallback] = None
 ) -> dict:
     """
     Phase 3: Arbitration with checkpoint persistence.
@@ -794,6 +1120,8 @@ async def phase3_arbitration(
         initial_collation: Optional collated initial recommendations from phase 1 (Collation model).
             When provided, enables phase evolution analysis showing how recommendations
             changed between Phase 1 and Phase 2.
+        event_callback: Optional callback receiving partial arbitration events
+            ("arbitration_decision", "arbitration_solution") while the model streams
         
     Returns:
         dict: Final arbitrated decision
@@ -848,10 +1176,14 @@ async def phase3_arbitration(
         
         # Wrap arbitrator call with timeout (90s for complex reasoning)
         logger.debug(f"   Arbitrator timeout: {ARBITRATOR_TIMEOUT}s")
-        result = await asyncio.wait_for(
-            arbitrate(revised_collation, llm_opus=arbitrator_llm, initial_recommendations=initial_collation),
-            timeout=ARBITRATOR_TIMEOUT
-        )
+        with metric_labels(agent="arbitrator", phase="phase3"):
+            result = await asyncio.wait_for(
+                arbitrate(
+                    revised_collation, llm_opus=arbitrator_llm, initial_recommendations=initial_collation,
+                    on_partial=event_callback
+                ),
+                timeout=ARBITRATOR_TIMEOUT
+            )
         
         # Add phase metadata
         result["phase"] = "arbitration"
@@ -963,29 +1295,63 @@ async def phase3_arbitration(
         return fallback_decision
 
 
-async def handle_disruption(user_prompt: str, llm: Any, mcp_tools: list) -> dict:
+async def _cancel_stage_tasks(tasks: List[Optional[asyncio.Task]]) -> None:
     """
-    Orchestrator: Three-phase multi-round orchestration with checkpoint persistence.
+    Cancel orchestration stage tasks that are still running and wait for them.
+
+    Tasks that already finished are only reaped, so a failure nobody awaited
+    does not surface as "Task exception was never retrieved".
+    """
+    outstanding = [task for task in tasks if task is not None]
+    for task in outstanding:
+        task.cancel()
+    await asyncio.gather(*outstanding, return_exceptions=True)
+
+
+def _run_in_request_context(
+    request_context: contextvars.Context, coro: Awaitable[Any]
+) -> asyncio.Task:
+    """
+    Run an orchestration stage as a task in the request's context.
+
+    Each task gets its own copy of the context so stages see the request-scoped
+    state (e.g. the DynamoDB request cache) without sharing other ContextVar
+    changes.
+    """
+    return asyncio.create_task(coro, context=request_context.copy())
+
+
+async def handle_disruption_stream(
+    user_prompt: str,
+    llm: Any,
+    mcp_tools: list
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Orchestrator: Three-phase multi-round orchestration, streamed as progress events.
     
-    Phase 1: Initial recommendations from all agents
-    Phase 2: Revision round with cross-agent insights
-    Phase 3: Arbitration and final decision
+    Runs the same workflow as handle_disruption() but yields events as soon as
+    they happen, so clients see the first safety agent's result instead of
+    waiting for the whole run.
     
-    Accepts natural language prompts. Agents will use their database tools
-    to extract required information and perform analysis.
+    Event types (each a dict with a "type" key):
+    - "start": thread created ({"thread_id"})
+    - "extraction_complete": shared flight context resolved
+    - "phase_start" / "phase_complete": Phase 1 and Phase 2 boundaries
+    - "agent_complete": an agent finished in Phase 1 or Phase 2
+    - "arbitration_start": Phase 3 started
+    - "arbitration_decision": the arbitrator's final decision, before its solutions
+    - "arbitration_solution": a recovery solution, as soon as the arbitrator completes it
+    - "complete": final response ({"data": <same dict handle_disruption returns>})
     
-    Checkpoint persistence enables:
-    - Failure recovery from last successful checkpoint
-    - Complete audit trail for regulatory compliance
-    - Time-travel debugging for issue investigation
+    Exceptions are re-raised after the thread is marked failed.
 
     Args:
         user_prompt: Natural language description of the disruption
         llm: Model instance
         mcp_tools: MCP tools
 
-    Returns:
-        dict: Final decision with complete audit trail and thread_id
+    Yields:
+        dict: Progress events, ending with a "complete" event
     """
     logger.info("=" * 60)
     logger.info("🎯 Starting SkyMarshal Orchestrator (Three-Phase)")
@@ -993,16 +1359,20 @@ async def handle_disruption(user_prompt: str, llm: Any, mcp_tools: list) -> dict
 
     if not user_prompt or not user_prompt.strip():
         logger.error("❌ No prompt provided")
-        return {
-            "status": "VALIDATION_FAILED",
-            "reason": "No prompt provided. Please provide a natural language description of the disruption.",
-            "timestamp": datetime.now().isoformat(),
-            "recommendations": [
-                "Provide a prompt describing the disruption.",
-                "Example: 'Flight EY123 from AUH to LHR is delayed 3 hours due to technical issues'",
-                "Example: 'Analyze the impact of a 5-hour delay on flight 1 departing from JFK'",
-            ],
+        yield {
+            "type": "complete",
+            "data": {
+                "status": "VALIDATION_FAILED",
+                "reason": "No prompt provided. Please provide a natural language description of the disruption.",
+                "timestamp": datetime.now().isoformat(),
+                "recommendations": [
+                    "Provide a prompt describing the disruption.",
+                    "Example: 'Flight EY123 from AUH to LHR is delayed 3 hours due to technical issues'",
+                    "Example: 'Analyze the impact of a 5-hour delay on flight 1 departing from JFK'",
+                ],
+            },
         }
+        return
 
     logger.info(f"📝 Processing prompt: {user_prompt[:100]}...")
     logger.info("📋 Agents will extract required information from prompt and database")
@@ -1017,6 +1387,21 @@ async def handle_disruption(user_prompt: str, llm: Any, mcp_tools: list) -> dict
     )
     thread_time = time.time() - thread_start
     logger.info(f"🧵 Thread created: {thread_id} ({thread_time:.3f}s)")
+    yield {"type": "start", "thread_id": thread_id, "timestamp": datetime.now().isoformat()}
+    
+    # DynamoDB reads are shared across agents and phases for this thread. The cache is
+    # bound in a dedicated context that every stage runs in (a generator cannot hold a
+    # ContextVar binding across yields). Model token/latency metrics are collected the same way.
+    request_metrics = RequestMetrics(thread_id)
+    request_context = contextvars.copy_context()
+    request_cache = request_context.run(bind_shared_reads, thread_id)
+    request_context.run(bind_request_metrics, request_metrics)
+    
+    # Agent completion events are published here by the phases and streamed as they arrive
+    events: asyncio.Queue = asyncio.Queue()
+    
+    # Stage tasks still running when the stream ends early are cancelled (see finally)
+    prefetch_task = phase1_task = phase2_task = phase3_task = None
     
     try:
         # Save initial checkpoint
@@ -1033,33 +1418,106 @@ async def handle_disruption(user_prompt: str, llm: Any, mcp_tools: list) -> dict
         checkpoint_time = time.time() - checkpoint_start
         logger.debug(f"   ✅ Initial checkpoint saved ({checkpoint_time:.3f}s)")
         
+        # Shared extraction stage: resolve flight context once for all agents
+        logger.info("⏱️  [EXTRACTION] Resolving flight context...")
+        extraction_start = time.time()
+        flight_context = await _run_in_request_context(
+            request_context, resolve_flight_context(user_prompt, llm)
+        )
+        extraction_time = time.time() - extraction_start
+        logger.info(f"⏱️  [EXTRACTION] Completed in {extraction_time:.3f}s")
+        yield {
+            "type": "extraction_complete",
+            "flight_info": flight_context.get("flight_info") if flight_context else None,
+            "duration_seconds": extraction_time,
+        }
+        
+        # Read the predictable data bundle into the request cache while the agents
+        # make their first model calls; concurrent tool reads of the same keys wait
+        # on the in-flight prefetch instead of issuing their own calls
+        prefetch = start_prefetch(flight_context)
+        if prefetch is not None:
+            prefetch_task = _run_in_request_context(request_context, prefetch)
+        
+        # Phase 1 and Phase 2 are pipelined: each agent's revision starts as soon as
+        # the Phase 1 results it depends on are in (see get_phase2_dependencies)
+        progress = Phase1Progress([name for name, _ in SAFETY_AGENTS + BUSINESS_AGENTS])
+        
         # Phase 1: Initial Recommendations
         logger.info("⏱️  [PHASE 1] Starting initial recommendations...")
+        yield {"type": "phase_start", "phase": "phase1"}
         phase1_start = time.time()
-        initial_collation = await phase1_initial_recommendations(
-            user_prompt, llm, mcp_tools, thread_id, checkpoint_saver
-        )
+        phase1_task = _run_in_request_context(request_context, phase1_initial_recommendations(
+            user_prompt, llm, mcp_tools, thread_id, checkpoint_saver, flight_context,
+            events.put_nowait, progress
+        ))
+        
+        # Phase 2: Revision Round (starts per agent while Phase 1 is still running)
+        logger.info("⏱️  [PHASE 2] Starting revision round (early start per agent)...")
+        yield {"type": "phase_start", "phase": "phase2"}
+        phase2_start = time.time()
+        phase2_task = _run_in_request_context(request_context, phase2_revision_round(
+            user_prompt, None, llm, mcp_tools, thread_id, checkpoint_saver,
+            flight_context, events.put_nowait, progress
+        ))
+        
+        try:
+            async for event in _stream_task_events(phase1_task, events):
+                yield event
+            initial_collation = phase1_task.result()
+        except BaseException:
+            # Phase 1 halted (e.g. safety agent failure): stop pending revisions
+            phase2_task.cancel()
+            await asyncio.gather(phase2_task, return_exceptions=True)
+            raise
+        # Any results not recorded live (e.g. parse failures) are folded in now
+        progress.record_collation(initial_collation)
+        progress.finish()
         phase1_time = time.time() - phase1_start
         logger.info(f"⏱️  [PHASE 1] Completed in {phase1_time:.3f}s")
+        yield {
+            "type": "phase_complete",
+            "phase": "phase1",
+            "duration_seconds": phase1_time,
+            "agent_counts": initial_collation.get_agent_count(),
+        }
         
-        # Phase 2: Revision Round
-        logger.info("⏱️  [PHASE 2] Starting revision round...")
-        phase2_start = time.time()
-        revised_collation = await phase2_revision_round(
-            user_prompt, initial_collation, llm, mcp_tools, thread_id, checkpoint_saver
-        )
+        async for event in _stream_task_events(phase2_task, events):
+            yield event
+        revised_collation = phase2_task.result()
         phase2_time = time.time() - phase2_start
-        logger.info(f"⏱️  [PHASE 2] Completed in {phase2_time:.3f}s")
+        logger.info(f"⏱️  [PHASE 2] Completed in {phase2_time:.3f}s (overlapped with Phase 1)")
+        yield {
+            "type": "phase_complete",
+            "phase": "phase2",
+            "duration_seconds": phase2_time,
+            "agent_counts": revised_collation.get_agent_count(),
+        }
         
         # Phase 3: Arbitration
         logger.info("⏱️  [PHASE 3] Starting arbitration...")
+        yield {"type": "arbitration_start", "timestamp": datetime.now().isoformat()}
         phase3_start = time.time()
-        final_decision = await phase3_arbitration(
-            revised_collation, llm, thread_id, checkpoint_saver, initial_collation
-        )
+        phase3_task = _run_in_request_context(request_context, phase3_arbitration(
+            revised_collation, llm, thread_id, checkpoint_saver, initial_collation,
+            events.put_nowait
+        ))
+        
+        # The decision and each recovery solution are streamed as the arbitrator writes them
+        async for event in _stream_task_events(phase3_task, events):
+            yield event
+        final_decision = phase3_task.result()
         phase3_time = time.time() - phase3_start
         logger.info(f"⏱️  [PHASE 3] Completed in {phase3_time:.3f}s")
         
+        # The prefetch is best effort: its failure must not fail the disruption
+        prefetch_stats = None
+        if prefetch_task is not None:
+            try:
+                prefetch_stats = await prefetch_task
+            except Exception as e:
+                logger.warning(f"⚠️  DynamoDB prefetch failed: {e}")
+        
         # Calculate total duration
         total_duration = time.time() - orchestration_start
         
@@ -1080,11 +1538,15 @@ async def handle_disruption(user_prompt: str, llm: Any, mcp_tools: list) -> dict
             "knowledgeBaseConsidered": final_decision.get("knowledgeBaseConsidered", False),
             "audit_trail": {
                 "user_prompt": user_prompt,
+                "flight_context": flight_context,
                 "phase1_initial": initial_collation.model_dump(),
                 "phase2_revision": revised_collation.model_dump(),
-                "phase3_arbitration": final_decision
+                "phase3_arbitration": final_decision,
+                "model_calls": request_metrics.records()
             },
+            "metrics": request_metrics.summary(),
             "timestamp": datetime.now().isoformat(),
+            "extraction_duration_seconds": extraction_time,
             "phase1_duration_seconds": phase1_time,
             "phase2_duration_seconds": phase2_time,
             "phase3_duration_seconds": phase3_time,
@@ -1098,13 +1560,22 @@ async def handle_disruption(user_prompt: str, llm: Any, mcp_tools: list) -> dict
 
         logger.info("=" * 60)
         logger.info(f"⏱️  [TIMING SUMMARY]")
+        logger.info(f"   Extraction: {extraction_time:.3f}s ({extraction_time/total_duration*100:.1f}%)")
         logger.info(f"   Phase 1: {phase1_time:.3f}s ({phase1_time/total_duration*100:.1f}%)")
         logger.info(f"   Phase 2: {phase2_time:.3f}s ({phase2_time/total_duration*100:.1f}%)")
         logger.info(f"   Phase 3: {phase3_time:.3f}s ({phase3_time/total_duration*100:.1f}%)")
         logger.info(f"   TOTAL: {total_duration:.3f}s")
+        logger.info(f"   DynamoDB prefetch: {prefetch_stats}")
+        cache_stats = data_cache_stats(request_cache)
+        logger.info(f"   DynamoDB request cache: {cache_stats['request_cache']}")
+        logger.info(f"   Reference data cache: {cache_stats['reference_cache']}")
+        logger.info(f"   Model health: {get_model_health_registry().get_stats()}")
+        logger.info(f"   Model usage: {response['metrics']['totals']}")
         logger.info("=" * 60)
+        
+        request_metrics.export()
 
-        return response
+        yield {"type": "complete", "data": response}
         
     except Exception as e:
         # Mark thread as failed
@@ -1115,8 +1586,97 @@ async def handle_disruption(user_prompt: str, llm: Any, mcp_tools: list) -> dict
         )
         logger.error(f"   ❌ Thread marked failed: {thread_id} - {e}")
         
+        # Usage up to the failure still counts
+        request_metrics.export()
+        
         # Re-raise exception for upstream handling
         raise
+    
+    finally:
+        # The client may disconnect (GeneratorExit / CancelledError) or a stage may
+        # fail while others still run: stop their agent and Bedrock work
+        await _cancel_stage_tasks([prefetch_task, phase1_task, phase2_task, phase3_task])
+
+
+async def handle_disruption(user_prompt: str, llm: Any, mcp_tools: list) -> dict:
+    """
+    Orchestrator: Three-phase multi-round orchestration with checkpoint persistence.
+    
+    Phase 1: Initial recommendations from all agents
+    Phase 2: Revision round with cross-agent insights
+    Phase 3: Arbitration and final decision
+    
+    Accepts natural language prompts. Flight info is extracted once up front
+    and shared with every agent; agents use their database tools to perform
+    analysis.
+    
+    Checkpoint persistence enables:
+    - Failure recovery from last successful checkpoint
+    - Complete audit trail for regulatory compliance
+    - Time-travel debugging for issue investigation
+    
+    Buffered form of handle_disruption_stream(): consumes the event stream
+    and returns only the final response.
+
+    Args:
+        user_prompt: Natural language description of the disruption
+        llm: Model instance
+        mcp_tools: MCP tools
+
+    Returns:
+        dict: Final decision with complete audit trail, thread_id and per-agent/phase
+            model usage ("metrics", see utils.metrics.RequestMetrics.summary)
+    """
+    response = None
+    async for event in handle_disruption_stream(user_prompt, llm, mcp_tools):
+        if event["type"] == "complete":
+            response = event["data"]
+    return response
+
+
+async def stream_orchestrator_events(
+    user_prompt: str,
+    llm: Any,
+    mcp_tools: list,
+    request_start: float
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream orchestrator events for the entrypoint.
+    
+    Wraps handle_disruption_stream(), adding request timing to the final
+    "complete" event and converting failures into an "error" event (the
+    format expected by api.websocket_client).
+
+    Args:
+        user_prompt: Natural language description of the disruption
+        llm: Model instance
+        mcp_tools: MCP tools
+        request_start: Request start time (time.time())
+
+    Yields:
+        dict: Orchestrator progress events
+    """
+    try:
+        async for event in handle_disruption_stream(user_prompt, llm, mcp_tools):
+            if event["type"] == "complete":
+                total_duration = time.time() - request_start
+                event["data"]["request_duration_seconds"] = total_duration
+                logger.info("=" * 80)
+                logger.info(f"⏱️  [TOTAL] STREAMED REQUEST COMPLETED in {total_duration:.3f}s")
+                logger.info("=" * 80)
+            yield event
+    except Exception as e:
+        total_duration = time.time() - request_start
+        logger.error(f"❌ ORCHESTRATOR STREAM FAILED after {total_duration:.3f}s: {e}")
+        logger.exception("Full traceback:")
+        yield {
+            "type": "error",
+            "error": {
+                "message": str(e),
+                "error_type": type(e).__name__,
+            },
+            "request_duration_seconds": total_duration,
+        }
 
 
 @app.entrypoint
@@ -1130,8 +1690,14 @@ async def invoke(payload):
     Payload format:
     {
         "agent": "crew_compliance" | "orchestrator" | <other_agent>,
-        "user_prompt": "Natural language description of the disruption..."
+        "user_prompt": "Natural language description of the disruption...",
+        "stream": true  # Optional, orchestrator only (default false)
     }
+    
+    Orchestrator requests return a single buffered JSON response. With
+    "stream": true they instead stream progress events (text/event-stream)
+    from handle_disruption_stream(), ending with a "complete" event carrying
+    the full response.
 
     Examples:
     - "Flight EY123 from AUH to LHR is delayed 3 hours due to technical issues"
@@ -1139,7 +1705,8 @@ async def invoke(payload):
     - "What's the financial impact of canceling flight AA456?"
 
     Returns:
-        dict: Agent response or aggregated orchestrator response
+        dict | AsyncIterator[dict]: Agent response, buffered orchestrator
+        response, or the orchestrator event stream
     """
     request_start = time.time()
     logger.info("=" * 80)
@@ -1198,6 +1765,11 @@ async def invoke(payload):
 
         # Determine routing
         routing_start = time.time()
+        if agent_name == "orchestrator" and payload.get("stream", False):
+            # Stream progress events (SSE) as agents complete
+            logger.info("🎯 Routing to ORCHESTRATOR (all agents, streaming)")
+            return stream_orchestrator_events(user_prompt, llm, mcp_tools, request_start)
+
         if agent_name == "orchestrator":
             # Run all agents (safety → business)
             logger.info("🎯 Routing to ORCHESTRATOR (all agents)")
@@ -1253,5 +1825,14 @@ async def invoke(payload):
 
 
 if __name__ == "__main__":
+    # Warm table handles and reference data in the background so startup is not delayed
+    start_data_warmup()
+
+    # Probe fallback models in the background so model selection never waits on a probe
+    model_health = get_model_health_registry()
+    model_health.watch([config["id"] for config in MODEL_PRIORITY], BEDROCK_REGION)
+    model_health.watch([config["id"] for config in ARBITRATOR_MODEL_PRIORITY])
+    start_health_refresh(MODEL_HEALTH_REFRESH_SECONDS)
+
     # Run local development server on port 8080
     app.run()
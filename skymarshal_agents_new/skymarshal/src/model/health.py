@@ -0,0 +1,463 @@
+"""Model health registry for Bedrock model selection
+
+Model fallback used to probe each candidate with a live invoke("test") call on
+first use, in priority order, before any real work. The registry replaces
+those probes on the request path: it is fed passively by the outcomes of real
+model calls (see ModelHealthCallback, attached to every cached client) and
+refreshed by a background thread that probes only models it has no current
+evidence about. Selecting a model is a dictionary lookup.
+
+A model is taken out of rotation for a cooldown when:
+- it is throttled on a large share of its recent calls (THROTTLE_RATE_THRESHOLD)
+- it is not available (access denied, unknown model, wrong region)
+- it fails repeatedly for other reasons
+
+Errors caused by the request itself (input too long, bad tool schema, bad
+message order) are counted but leave the model in rotation.
+
+Usage:
+    from model.health import get_model_health_registry
+
+    registry = get_model_health_registry()
+    model_id = registry.select([primary_id, fallback_id])
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, Optional, Sequence
+from uuid import UUID
+
+from langchain_aws import ChatBedrock
+from langchain_core.callbacks import BaseCallbackHandler
+
+logger = logging.getLogger(__name__)
+
+# Background refresh interval in seconds (0 disables the refresh thread)
+MODEL_HEALTH_REFRESH_SECONDS = int(os.getenv("MODEL_HEALTH_REFRESH_SECONDS", "300"))
+
+# Recent call outcomes kept per model
+OUTCOME_WINDOW = 10
+
+# Share of recent calls throttled before a model is taken out of rotation
+THROTTLE_RATE_THRESHOLD = 0.5
+
+# Consecutive non-throttling failures before a model is taken out of rotation
+MAX_CONSECUTIVE_FAILURES = 3
+
+# Cooldowns in seconds
+THROTTLE_COOLDOWN_SECONDS = 60
+FAILURE_COOLDOWN_SECONDS = 60
+UNAVAILABLE_COOLDOWN_SECONDS = 900
+
+# Recent successful-call latencies kept per model (for p50/p95)
+LATENCY_WINDOW = 50
+
+# Weight of the latest call in the latency moving average
+LATENCY_SMOOTHING = 0.3
+
+STATUS_UNKNOWN = "unknown"
+STATUS_HEALTHY = "healthy"
+STATUS_THROTTLED = "throttled"
+STATUS_UNAVAILABLE = "unavailable"
+STATUS_FAILING = "failing"
+
+# Failure kind of errors caused by the request, not the model (never a status)
+REQUEST_ERROR = "request_error"
+
+# Error text meaning the model itself cannot be used (access, unknown model, region)
+UNAVAILABLE_MARKERS = (
+    "AccessDeniedException",
+    "ResourceNotFoundException",
+    "model identifier is invalid",
+    "don't have access to the model",
+    "on-demand throughput isn't supported",
+)
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Classify a model call failure.
+
+    Bedrock errors reach callers either as botocore ClientErrors or wrapped
+    by langchain_aws, so classification is by message. Only errors saying
+    the model cannot be used make it unavailable; other ValidationExceptions
+    are request errors.
+
+    Returns:
+        str: STATUS_THROTTLED, STATUS_UNAVAILABLE, REQUEST_ERROR or STATUS_FAILING
+    """
+    message = str(error)
+    if "ThrottlingException" in message or "Too many tokens" in message:
+        return STATUS_THROTTLED
+    if any(marker in message for marker in UNAVAILABLE_MARKERS):
+        return STATUS_UNAVAILABLE
+    if "ValidationException" in message:
+        return REQUEST_ERROR
+    return STATUS_FAILING
+
+
+@dataclass
+class ModelHealth:
+    """Current health of one model."""
+
+    model_id: str
+    status: str = STATUS_UNKNOWN
+    outcomes: Deque[str] = field(default_factory=lambda: deque(maxlen=OUTCOME_WINDOW))
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    consecutive_failures: int = 0
+    request_errors: int = 0
+    latency_seconds: Optional[float] = None
+    cooldown_until: float = 0.0
+    last_error: Optional[str] = None
+    last_updated: Optional[float] = None
+
+    def throttle_rate(self) -> float:
+        """Share of recent calls that were throttled."""
+        if not self.outcomes:
+            return 0.0
+        return sum(1 for outcome in self.outcomes if outcome == STATUS_THROTTLED) / len(self.outcomes)
+
+    def error_rate(self) -> float:
+        """Share of recent calls that failed (throttled or otherwise)."""
+        if not self.outcomes:
+            return 0.0
+        return sum(1 for outcome in self.outcomes if outcome != STATUS_HEALTHY) / len(self.outcomes)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Recent successful-call latency at a percentile (0-100), if any calls were timed."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        p50 = self.latency_percentile(50)
+        p95 = self.latency_percentile(95)
+        return {
+            "status": self.status,
+            "throttle_rate": round(self.throttle_rate(), 2),
+            "error_rate": round(self.error_rate(), 2),
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "p95_seconds": round(p95, 3) if p95 is not None else None,
+            "consecutive_failures": self.consecutive_failures,
+            "request_errors": self.request_errors,
+            "latency_seconds": round(self.latency_seconds, 3) if self.latency_seconds is not None else None,
+            "cooldown_remaining_seconds": max(0.0, round(self.cooldown_until - time.time(), 1)),
+            "last_error": self.last_error,
+        }
+
+
+class ModelHealthRegistry:
+    """
+    Thread-safe registry of model health, fed by real calls and background probes.
+
+    Models without any evidence are assumed healthy, so a cold container uses
+    its first-choice model straight away rather than probing it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: Dict[str, ModelHealth] = {}
+        self._watched: Dict[str, Optional[str]] = {}
+
+    def _health(self, model_id: str) -> ModelHealth:
+        health = self._models.get(model_id)
+        if health is None:
+            health = ModelHealth(model_id)
+            self._models[model_id] = health
+        return health
+
+    def record_success(self, model_id: str, latency_seconds: Optional[float] = None) -> None:
+        """
+        Record a successful model call.
+
+        Args:
+            model_id: Bedrock model ID
+            latency_seconds: Call duration, if known
+        """
+        with self._lock:
+            health = self._health(model_id)
+            health.outcomes.append(STATUS_HEALTHY)
+            health.status = STATUS_HEALTHY
+            health.consecutive_failures = 0
+            health.cooldown_until = 0.0
+            health.last_updated = time.time()
+            if latency_seconds is not None:
+                health.latencies.append(latency_seconds)
+                if health.latency_seconds is None:
+                    health.latency_seconds = latency_seconds
+                else:
+                    health.latency_seconds += LATENCY_SMOOTHING * (latency_seconds - health.latency_seconds)
+
+    def record_failure(self, model_id: str, error: BaseException) -> str:
+        """
+        Record a failed model call, taking the model out of rotation if warranted.
+
+        Request errors are counted but do not affect rotation or the model's
+        recent outcomes.
+
+        Args:
+            model_id: Bedrock model ID
+            error: The exception the call raised
+
+        Returns:
+            str: The failure classification (see classify_error)
+        """
+        kind = classify_error(error)
+        now = time.time()
+        with self._lock:
+            health = self._health(model_id)
+            health.last_error = str(error)[:200]
+            if kind == REQUEST_ERROR:
+                health.request_errors += 1
+                return kind
+
+            health.outcomes.append(kind)
+            health.last_updated = now
+
+            if kind == STATUS_THROTTLED:
+                if health.throttle_rate() >= THROTTLE_RATE_THRESHOLD:
+                    health.status = STATUS_THROTTLED
+                    health.cooldown_until = now + THROTTLE_COOLDOWN_SECONDS
+            elif kind == STATUS_UNAVAILABLE:
+                health.status = STATUS_UNAVAILABLE
+                health.cooldown_until = now + UNAVAILABLE_COOLDOWN_SECONDS
+            else:
+                health.consecutive_failures += 1
+                if health.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                    health.status = STATUS_FAILING
+                    health.cooldown_until = now + FAILURE_COOLDOWN_SECONDS
+            out_of_rotation = health.cooldown_until > now
+            status = health.status
+
+        if out_of_rotation:
+            logger.warning(f"⚠️ Model {model_id} out of rotation ({status}): {error}")
+        return kind
+
+    def is_available(self, model_id: str) -> bool:
+        """Whether a model is in rotation (unknown models are)."""
+        with self._lock:
+            health = self._models.get(model_id)
+            return health is None or health.cooldown_until <= time.time()
+
+    def latency_percentile(self, model_id: str, percentile: float) -> Optional[float]:
+        """Recent latency of a model at a percentile (None until calls were timed)."""
+        with self._lock:
+            health = self._models.get(model_id)
+            return health.latency_percentile(percentile) if health is not None else None
+
+    def error_rate(self, model_id: str) -> float:
+        """Share of a model's recent calls that failed."""
+        with self._lock:
+            health = self._models.get(model_id)
+            return health.error_rate() if health is not None else 0.0
+
+    def select(self, model_ids: Sequence[str]) -> str:
+        """
+        Pick the first model in priority order that is in rotation.
+
+        Never probes. If every candidate is out of rotation, the one whose
+        cooldown ends first is returned rather than failing the request.
+
+        Args:
+            model_ids: Candidate model IDs in priority order
+
+        Returns:
+            str: Selected model ID
+
+        Raises:
+            ValueError: If no candidates are given
+        """
+        if not model_ids:
+            raise ValueError("No candidate models given")
+
+        now = time.time()
+        with self._lock:
+            cooldowns = {
+                model_id: self._models[model_id].cooldown_until if model_id in self._models else 0.0
+                for model_id in model_ids
+            }
+        for model_id in model_ids:
+            if cooldowns[model_id] <= now:
+                return model_id
+
+        model_id = min(model_ids, key=lambda candidate: cooldowns[candidate])
+        logger.warning(f"⚠️ All candidate models out of rotation, using {model_id} (earliest recovery)")
+        return model_id
+
+    def watch(self, model_ids: Iterable[str], region_name: Optional[str] = None) -> None:
+        """
+        Register models for background probing.
+
+        Args:
+            model_ids: Model IDs to keep fresh
+            region_name: Bedrock region to probe in (None for the default)
+        """
+        with self._lock:
+            for model_id in model_ids:
+                self._watched.setdefault(model_id, region_name)
+
+    def due_for_probe(self, max_age_seconds: float) -> Dict[str, Optional[str]]:
+        """
+        Watched models without recent evidence, or whose cooldown has expired.
+
+        Models recently used by real traffic are skipped: their health is
+        already known without spending a call.
+        """
+        now = time.time()
+        with self._lock:
+            due = {}
+            for model_id, region_name in self._watched.items():
+                health = self._models.get(model_id)
+                if (
+                    health is None
+                    or health.last_updated is None
+                    or now - health.last_updated >= max_age_seconds
+                    or (health.status != STATUS_HEALTHY and health.cooldown_until <= now)
+                ):
+                    due[model_id] = region_name
+            return due
+
+    def probe(self, model_id: str, region_name: Optional[str] = None) -> bool:
+        """
+        Check a model with a minimal live call and record the outcome.
+
+        Only called from the background refresh, never on the request path.
+
+        Args:
+            model_id: Bedrock model ID
+            region_name: Bedrock region (None for the default)
+
+        Returns:
+            bool: True if the call succeeded
+        """
+        client_kwargs: Dict[str, Any] = {
+            "model_id": model_id,
+            "model_kwargs": {"temperature": 0.1, "max_tokens": 10},
+        }
+        if region_name:
+            client_kwargs["region_name"] = region_name
+
+        start = time.time()
+        try:
+            ChatBedrock(**client_kwargs).invoke("test")
+        except Exception as e:
+            self.record_failure(model_id, e)
+            return False
+        self.record_success(model_id, time.time() - start)
+        return True
+
+    def refresh(self, max_age_seconds: float = MODEL_HEALTH_REFRESH_SECONDS) -> Dict[str, bool]:
+        """
+        Probe the watched models that are due.
+
+        Returns:
+            dict: Probe result by model ID
+        """
+        results = {}
+        for model_id, region_name in self.due_for_probe(max_age_seconds).items():
+            results[model_id] = self.probe(model_id, region_name)
+        if results:
+            logger.info(f"🩺 Model health refreshed: {results}")
+        return results
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current health of every model seen, by model ID."""
+        with self._lock:
+            return {model_id: health.to_dict() for model_id, health in self._models.items()}
+
+    def clear(self) -> None:
+        """Forget all health data (e.g. in tests)."""
+        with self._lock:
+            self._models.clear()
+
+
+class ModelHealthCallback(BaseCallbackHandler):
+    """Record the outcome and latency of every call made through a model client."""
+
+    run_inline = True
+
+    def __init__(self, model_id: str, registry: Optional[ModelHealthRegistry] = None):
+        self.model_id = model_id
+        self._registry = registry
+        self._starts: Dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def registry(self) -> ModelHealthRegistry:
+        return self._registry or get_model_health_registry()
+
+    def _start(self, run_id: UUID) -> None:
+        with self._lock:
+            self._starts[run_id] = time.time()
+
+    def _elapsed(self, run_id: UUID) -> Optional[float]:
+        with self._lock:
+            start = self._starts.pop(run_id, None)
+        return time.time() - start if start is not None else None
+
+    def on_chat_model_start(self, serialized: Any, messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_start(self, serialized: Any, prompts: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self.registry.record_success(self.model_id, self._elapsed(run_id))
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._elapsed(run_id)
+        if isinstance(error, asyncio.CancelledError):
+            # Abandoned (e.g. the losing side of a hedged request), not a model failure
+            return
+        self.registry.record_failure(self.model_id, error)
+
+
+_registry: Optional[ModelHealthRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_health_registry() -> ModelHealthRegistry:
+    """Get the process-level model health registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelHealthRegistry()
+    return _registry
+
+
+def start_health_refresh(interval_seconds: float = MODEL_HEALTH_REFRESH_SECONDS) -> Optional[threading.Thread]:
+    """
+    Start the background refresh of the watched models.
+
+    The first pass runs immediately, so by the time the first disruption
+    arrives the registry usually holds a result for every candidate.
+
+    Args:
+        interval_seconds: Seconds between passes (0 disables the refresh)
+
+    Returns:
+        threading.Thread: The daemon thread, or None if disabled
+    """
+    if interval_seconds <= 0:
+        return None
+
+    def run() -> None:
+        registry = get_model_health_registry()
+        while True:
+            try:
+                registry.refresh(interval_seconds)
+            except Exception as e:
+                logger.warning(f"Model health refresh failed: {e}")
+            time.sleep(interval_seconds)
+
+    thread = threading.Thread(target=run, name="model-health-refresh", daemon=True)
+    thread.start()
+    return thread
+
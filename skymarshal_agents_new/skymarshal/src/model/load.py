@@ -1,9 +1,19 @@
+import asyncio
 import logging
-from typing import Optional
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
 import boto3
 from botocore.config import Config
-from botocore.exceptions import ClientError
 from langchain_aws import ChatBedrock
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict
+
+from model.health import STATUS_THROTTLED, ModelHealthCallback, classify_error, get_model_health_registry
+from utils.metrics import UsageMetricsCallback
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +26,8 @@ BOTO_CONFIG = Config(
     region_name=BEDROCK_REGION,
     read_timeout=180,  # 3 minutes - allows for complex multi-step reasoning
     connect_timeout=10,  # 10 seconds for connection
-    retries={'max_attempts': 3, 'mode': 'adaptive'}  # Retry on transient failures
+    retries={'max_attempts': 3, 'mode': 'adaptive'},  # Retry on transient failures
+    max_pool_connections=50  # Cached clients are shared by all parallel agents
 )
 
 # Model priority list (will try in order until one works)
@@ -60,8 +71,38 @@ MODEL_PRIORITY = [
     }
 ]
 
-# Cache for tested models to avoid repeated checks
-_tested_models = {}
+# Process-level cache of model clients keyed by (model_id, temperature, max_tokens).
+# ChatBedrock (and its botocore client) is thread-safe, so one warm client per
+# configuration is shared across agents, phases and requests.
+_model_clients: Dict[Tuple[str, float, int], ChatBedrock] = {}
+_model_clients_lock = threading.Lock()
+
+# Route agent model calls across equivalent inference profiles (see RoutedChatModel)
+MODEL_ROUTING_ENABLED = os.getenv("MODEL_ROUTING", "true").lower() == "true"
+
+# Equivalent inference profiles per configured model: the same model served
+# from a separate throughput quota, so calls can move between them freely
+EQUIVALENT_MODELS = {
+    "global.anthropic.claude-sonnet-4-5-20250929-v1:0": ["eu.anthropic.claude-sonnet-4-5-20250929-v1:0"],
+    "global.anthropic.claude-haiku-4-5-20251001-v1:0": ["eu.anthropic.claude-haiku-4-5-20251001-v1:0"],
+}
+
+# Client-side request budget per inference profile (token bucket)
+MODEL_REQUEST_BUDGET_RPM = int(os.getenv("MODEL_REQUEST_BUDGET_RPM", "200"))
+MODEL_REQUEST_BURST = 20
+
+# A model whose p95 latency exceeds the fastest equivalent's by this factor is deprioritized
+SLOW_MODEL_FACTOR = 2.0
+
+# Models failing more than this share of recent calls are deprioritized
+MAX_ERROR_RATE = 0.5
+
+# Agent types whose calls are hedged on an equivalent model when the primary is slow
+HEDGED_AGENT_TYPES = frozenset({"safety"})
+HEDGE_DEFAULT_DELAY_SECONDS = 20.0
+HEDGE_MIN_DELAY_SECONDS = 5.0
+
+_routed_models: Dict[str, "RoutedChatModel"] = {}
 
 # Agent-specific model configuration
 # Safety agents use Sonnet 4.5 for accuracy-critical analysis
@@ -84,63 +125,362 @@ AGENT_MODEL_CONFIG = {
         "model_id": "global.anthropic.claude-sonnet-4-5-20250929-v1:0",
         "temperature": 0.2,
         "max_tokens": 8192,
+        "streaming": True,  # Structured output is streamed (see arbitrator _astream_decision)
         "reason": "Conflict resolution requires balanced reasoning"
     }
 }
 
 
-def _test_model(model_id: str) -> bool:
+def get_cached_model(model_id: str, temperature: float, max_tokens: int, streaming: bool = False) -> ChatBedrock:
     """
-    Test if a model is available and not throttled by making a minimal test call.
+    Get a cached ChatBedrock client, creating it on first use.
     
     Args:
-        model_id: The model ID to test
+        model_id: Bedrock model ID
+        temperature: Sampling temperature
+        max_tokens: Maximum output tokens
+        streaming: Create a streaming client; its with_structured_output()
+            then parses tool-call chunks incrementally instead of only the
+            complete message
         
     Returns:
-        bool: True if model is available and working, False otherwise
+        ChatBedrock: Shared model instance for this configuration
     """
-    # Check cache first
-    if model_id in _tested_models:
-        return _tested_models[model_id]
+    key = (model_id, temperature, max_tokens, streaming)
+    client = _model_clients.get(key)
+    if client is not None:
+        return client
     
-    try:
-        logger.info(f"Testing model availability: {model_id}")
-        
-        # Create a minimal test client
-        test_client = ChatBedrock(
-            model_id=model_id,
-            region_name=BEDROCK_REGION,
-            model_kwargs={
-                "temperature": 0.1,
-                "max_tokens": 10,  # Minimal tokens for test
-            },
-        )
-        
-        # Make a minimal test call
-        test_client.invoke("test")
-        
-        logger.info(f"✅ Model {model_id} is available and working")
-        _tested_models[model_id] = True
-        return True
-        
-    except ClientError as e:
-        error_code = e.response.get('Error', {}).get('Code', '')
-        error_message = str(e)
-        
-        if 'ThrottlingException' in error_message or 'Too many tokens' in error_message:
-            logger.warning(f"⚠️ Model {model_id} is throttled (quota exceeded)")
-        elif 'ValidationException' in error_message or 'not found' in error_message.lower():
-            logger.warning(f"⚠️ Model {model_id} is not available in this region")
-        else:
-            logger.warning(f"⚠️ Model {model_id} test failed: {error_message}")
-        
-        _tested_models[model_id] = False
-        return False
-        
-    except Exception as e:
-        logger.warning(f"⚠️ Model {model_id} test failed with unexpected error: {e}")
-        _tested_models[model_id] = False
-        return False
+    with _model_clients_lock:
+        client = _model_clients.get(key)
+        if client is None:
+            logger.info(f"Creating model client: {model_id} (temperature={temperature}, max_tokens={max_tokens})")
+            client = ChatBedrock(
+                model_id=model_id,
+                region_name=BEDROCK_REGION,
+                model_kwargs={
+                    "temperature": temperature,
+                    "max_tokens": max_tokens,
+                },
+                config=BOTO_CONFIG,  # Use increased timeout configuration
+                streaming=streaming,
+                # Feed the model health registry and per-request usage metrics
+                callbacks=[ModelHealthCallback(model_id), UsageMetricsCallback(model_id)],
+            )
+            _model_clients[key] = client
+    return client
+
+
+def clear_model_cache() -> None:
+    """Clear cached model clients (e.g. after credential rotation or in tests)."""
+    with _model_clients_lock:
+        _model_clients.clear()
+        _routed_models.clear()
+
+
+class TokenBucket:
+    """
+    Client-side request budget for one inference profile.
+
+    The refill rate adapts to throttling (AIMD): a ThrottlingException halves
+    it and empties the bucket, each success raises it back toward the
+    configured budget. Calls are steered away from a model before Bedrock
+    starts throttling it rather than after.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int):
+        self.max_rate = requests_per_minute / 60.0
+        self.rate = self.max_rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """Tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self.tokens
+
+    def try_acquire(self) -> bool:
+        """Take one token if available."""
+        with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = max(self.rate / 2, self.max_rate / 16)
+            self.tokens = 0.0
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class ModelRouter:
+    """
+    Choose among equivalent models per call.
+
+    Candidates are ranked by (in order): in rotation according to the model
+    health registry, within their request budget, not markedly slower (p95)
+    than the fastest candidate, then configured priority.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, model_id: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(model_id)
+            if bucket is None:
+                bucket = TokenBucket(MODEL_REQUEST_BUDGET_RPM, MODEL_REQUEST_BURST)
+                self._buckets[model_id] = bucket
+            return bucket
+
+    def rank(self, model_ids: Sequence[str]) -> List[str]:
+        """
+        Order candidates best first.
+
+        Args:
+            model_ids: Equivalent model IDs in configured priority order
+
+        Returns:
+            list: Candidates in rotation (all candidates if none are), best first
+        """
+        health = get_model_health_registry()
+        in_rotation = [
+            model_id for model_id in model_ids
+            if health.is_available(model_id) and health.error_rate(model_id) <= MAX_ERROR_RATE
+        ] or list(model_ids)
+
+        p95 = {model_id: health.latency_percentile(model_id, 95) for model_id in in_rotation}
+        known = [latency for latency in p95.values() if latency is not None]
+        fastest = min(known) if known else None
+
+        def key(model_id: str) -> Tuple[bool, bool, int]:
+            over_budget = self.bucket(model_id).available() < 1
+            slow = fastest is not None and p95[model_id] is not None and p95[model_id] > fastest * SLOW_MODEL_FACTOR
+            return (over_budget, slow, model_ids.index(model_id))
+
+        return sorted(in_rotation, key=key)
+
+    def acquire(self, model_ids: Sequence[str]) -> str:
+        """
+        Pick the best candidate and spend one request of its budget.
+
+        Never waits: when every candidate is over budget the best ranked one
+        is used anyway.
+        """
+        ranked = self.rank(model_ids)
+        for model_id in ranked:
+            if self.bucket(model_id).try_acquire():
+                return model_id
+        return ranked[0]
+
+    def acquire_hedge(self, model_ids: Sequence[str]) -> Optional[str]:
+        """Pick a candidate for a hedged request, or None if none is in rotation with budget."""
+        health = get_model_health_registry()
+        for model_id in self.rank(model_ids):
+            if health.is_available(model_id) and self.bucket(model_id).try_acquire():
+                return model_id
+        return None
+
+    def hedge_delay(self, model_id: str) -> float:
+        """Seconds to wait on a model before hedging: its recent p95 latency."""
+        p95 = get_model_health_registry().latency_percentile(model_id, 95)
+        if p95 is None:
+            return HEDGE_DEFAULT_DELAY_SECONDS
+        return max(HEDGE_MIN_DELAY_SECONDS, p95)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Current budget per model."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            model_id: {
+                "tokens": round(bucket.available(), 1),
+                "requests_per_minute": round(bucket.rate * 60, 1),
+            }
+            for model_id, bucket in buckets.items()
+        }
+
+
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """Get the process-level model router."""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = ModelRouter()
+    return _router
+
+
+class RoutedChatModel(BaseChatModel):
+    """
+    Chat model that routes every call to one of several equivalent models.
+
+    Each call picks a model with ModelRouter; a throttled call moves to the
+    next equivalent model instead of retrying the same one. With hedging
+    enabled, a call still running after the chosen model's p95 latency is
+    duplicated on an equivalent model and the first response wins (the
+    losing request is abandoned, not cancelled server-side).
+
+    Tools and structured output are bound once, in the primary model's
+    format, and passed to whichever model serves the call.
+    """
+
+    model_config = ConfigDict(protected_namespaces=())
+
+    model_id: str
+    model_ids: List[str]
+    temperature: float
+    max_tokens: int
+    hedge: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "routed-bedrock"
+
+    def _client(self, model_id: str) -> ChatBedrock:
+        return get_cached_model(model_id, self.temperature, self.max_tokens)
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Any:
+        binding = self._client(self.model_id).bind_tools(tools, **kwargs)
+        return self.bind(**binding.kwargs)
+
+    def _invoke_on(self, model_id: str, messages: List[BaseMessage], stop: Optional[List[str]], kwargs: Dict[str, Any]) -> BaseMessage:
+        router = get_model_router()
+        try:
+            message = self._client(model_id).invoke(messages, stop=stop, **kwargs)
+        except Exception as e:
+            if classify_error(e) == STATUS_THROTTLED:
+                router.bucket(model_id).on_throttle()
+            raise
+        router.bucket(model_id).on_success()
+        return message
+
+    async def _ainvoke_on(self, model_id: str, messages: List[BaseMessage], stop: Optional[List[str]], kwargs: Dict[str, Any]) -> BaseMessage:
+        router = get_model_router()
+        try:
+            message = await self._client(model_id).ainvoke(messages, stop=stop, **kwargs)
+        except Exception as e:
+            if classify_error(e) == STATUS_THROTTLED:
+                router.bucket(model_id).on_throttle()
+            raise
+        router.bucket(model_id).on_success()
+        return message
+
+    async def _ainvoke_hedged(self, model_id: str, tried: List[str], messages: List[BaseMessage], stop: Optional[List[str]], kwargs: Dict[str, Any]) -> BaseMessage:
+        router = get_model_router()
+        primary = asyncio.ensure_future(self._ainvoke_on(model_id, messages, stop, kwargs))
+        pending = {primary}
+        try:
+            alternates = [m for m in self.model_ids if m not in tried]
+            if self.hedge and alternates:
+                done, _ = await asyncio.wait(pending, timeout=router.hedge_delay(model_id))
+                backup_id = None if done else router.acquire_hedge(alternates)
+                if backup_id is not None:
+                    logger.info(f"⏩ {model_id} slower than its p95, hedging on {backup_id}")
+                    tried.append(backup_id)
+                    pending.add(asyncio.ensure_future(self._ainvoke_on(backup_id, messages, stop, kwargs)))
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        router = get_model_router()
+        tried: List[str] = []
+        while True:
+            model_id = router.acquire([m for m in self.model_ids if m not in tried])
+            tried.append(model_id)
+            try:
+                message = self._invoke_on(model_id, messages, stop, kwargs)
+            except Exception as e:
+                if classify_error(e) != STATUS_THROTTLED or len(tried) == len(self.model_ids):
+                    raise
+                logger.warning(f"⚠️ {model_id} throttled, routing to an equivalent model")
+                continue
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        router = get_model_router()
+        tried: List[str] = []
+        while True:
+            model_id = router.acquire([m for m in self.model_ids if m not in tried])
+            tried.append(model_id)
+            try:
+                message = await self._ainvoke_hedged(model_id, tried, messages, stop, kwargs)
+            except Exception as e:
+                if classify_error(e) != STATUS_THROTTLED or len(tried) >= len(self.model_ids):
+                    raise
+                logger.warning(f"⚠️ {model_id} throttled, routing to an equivalent model")
+                continue
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        model_id = get_model_router().acquire(self.model_ids)
+        for chunk in self._client(model_id).stream(messages, stop=stop, **kwargs):
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        model_id = get_model_router().acquire(self.model_ids)
+        async for chunk in self._client(model_id).astream(messages, stop=stop, **kwargs):
+            yield ChatGenerationChunk(message=chunk)
+
+
+def get_routed_model(agent_type: str) -> RoutedChatModel:
+    """
+    Get the shared routed model for an agent type.
+
+    Args:
+        agent_type: Key of AGENT_MODEL_CONFIG
+
+    Returns:
+        RoutedChatModel: Routes across the configured model and its equivalents
+    """
+    routed = _routed_models.get(agent_type)
+    if routed is not None:
+        return routed
+
+    config = AGENT_MODEL_CONFIG[agent_type]
+    with _model_clients_lock:
+        routed = _routed_models.get(agent_type)
+        if routed is None:
+            model_ids = [config["model_id"]] + EQUIVALENT_MODELS.get(config["model_id"], [])
+            logger.info(f"Creating routed model for {agent_type} agents: {model_ids}")
+            routed = RoutedChatModel(
+                model_id=config["model_id"],
+                model_ids=model_ids,
+                temperature=config["temperature"],
+                max_tokens=config["max_tokens"],
+                hedge=agent_type in HEDGED_AGENT_TYPES,
+            )
+            _routed_models[agent_type] = routed
+    return routed
 
 
 def load_model(skip_test: bool = True) -> ChatBedrock:
@@ -155,66 +495,25 @@ def load_model(skip_test: bool = True) -> ChatBedrock:
     5. Amazon Nova Premier US (regional fallback)
     
     Args:
-        skip_test: If True, skip model availability test for faster startup (default: True)
-                   Global CRIS endpoints are highly available, so testing is usually unnecessary.
+        skip_test: If True, use the first model without consulting model health (default: True).
+                   Global CRIS endpoints are highly available, so this is usually sufficient.
+                   If False, use the first model in rotation according to the model health
+                   registry (see model.health); no probe calls are made.
     
     Returns:
         ChatBedrock: Configured model instance with structured output support
-        
-    Raises:
-        RuntimeError: If no models are available
     """
     logger.info("Loading model...")
     
-    for model_config in MODEL_PRIORITY:
-        model_id = model_config["id"]
-        model_name = model_config["name"]
-        
-        # Skip test for faster startup when using Global CRIS endpoints
-        if skip_test:
-            logger.info(f"✅ Using {model_name} in {BEDROCK_REGION} (skip_test=True): {model_config['reason']}")
-            return ChatBedrock(
-                model_id=model_id,
-                region_name=BEDROCK_REGION,
-                model_kwargs={
-                    "temperature": model_config["temperature"],
-                    "max_tokens": model_config["max_tokens"],
-                },
-                config=BOTO_CONFIG  # Use increased timeout configuration
-            )
-        
-        logger.info(f"Trying {model_name} ({model_id})...")
-        
-        # Test if model is available
-        if _test_model(model_id):
-            logger.info(f"✅ Using {model_name} in {BEDROCK_REGION}: {model_config['reason']}")
-            
-            return ChatBedrock(
-                model_id=model_id,
-                region_name=BEDROCK_REGION,
-                model_kwargs={
-                    "temperature": model_config["temperature"],
-                    "max_tokens": model_config["max_tokens"],
-                },
-                config=BOTO_CONFIG  # Use increased timeout configuration
-            )
-        else:
-            logger.warning(f"❌ {model_name} not available, trying next model...")
-    
-    # If we get here, no models worked
-    error_msg = "❌ CRITICAL: No models available! All models failed or are throttled."
-    logger.error(error_msg)
-    logger.error("Available models tried:")
-    for model_config in MODEL_PRIORITY:
-        logger.error(f"  - {model_config['name']}: {model_config['id']}")
+    model_config = MODEL_PRIORITY[0]
+    if not skip_test:
+        model_id = get_model_health_registry().select([config["id"] for config in MODEL_PRIORITY])
+        model_config = next(config for config in MODEL_PRIORITY if config["id"] == model_id)
     
-    raise RuntimeError(
-        "No Bedrock models available. Please check:\n"
-        "1. AWS credentials and permissions\n"
-        "2. Model access in AWS Bedrock console\n"
-        "3. Daily token quotas (may need to wait or request increase)\n"
-        "4. Region availability (us-east-1 recommended)"
+    logger.info(
+        f"✅ Using {model_config['name']} in {BEDROCK_REGION} (skip_test={skip_test}): {model_config['reason']}"
     )
+    return get_cached_model(model_config["id"], model_config["temperature"], model_config["max_tokens"])
 
 
 def load_fast_model() -> ChatBedrock:
@@ -229,14 +528,10 @@ def load_fast_model() -> ChatBedrock:
     """
     logger.info(f"Loading fast model (Claude Haiku 4.5 Global CRIS) in {BEDROCK_REGION}...")
     
-    return ChatBedrock(
-        model_id="global.anthropic.claude-haiku-4-5-20251001-v1:0",
-        region_name=BEDROCK_REGION,
-        model_kwargs={
-            "temperature": 0.3,
-            "max_tokens": 4096,  # Reduced for faster responses
-        },
-        config=BOTO_CONFIG
+    return get_cached_model(
+        "global.anthropic.claude-haiku-4-5-20251001-v1:0",
+        temperature=0.3,
+        max_tokens=4096,  # Reduced for faster responses
     )
 
 
@@ -252,14 +547,11 @@ def load_arbitrator_model() -> ChatBedrock:
     """
     logger.info(f"Loading arbitrator model (Claude Sonnet 4.5 Global CRIS) in {BEDROCK_REGION}...")
     
-    return ChatBedrock(
-        model_id="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
-        region_name=BEDROCK_REGION,
-        model_kwargs={
-            "temperature": 0.2,  # Lower temperature for more consistent arbitration
-            "max_tokens": 8192,
-        },
-        config=BOTO_CONFIG
+    return get_cached_model(
+        "global.anthropic.claude-sonnet-4-5-20250929-v1:0",
+        temperature=0.2,  # Lower temperature for more consistent arbitration
+        max_tokens=8192,
+        streaming=True,
     )
 
 
@@ -279,7 +571,9 @@ def load_model_for_agent(agent_type: str = "safety") -> ChatBedrock:
         agent_type: Type of agent ("safety", "business", or "arbitrator")
         
     Returns:
-        ChatBedrock: Model instance configured for agent type
+        Shared (cached) model instance configured for agent type: a RoutedChatModel
+        over the configured model and its EQUIVALENT_MODELS when routing is enabled,
+        otherwise the ChatBedrock client
         
     Raises:
         ValueError: If agent_type is not recognized
@@ -302,12 +596,8 @@ def load_model_for_agent(agent_type: str = "safety") -> ChatBedrock:
     logger.debug(f"   Temperature: {config['temperature']}")
     logger.debug(f"   Max tokens: {config['max_tokens']}")
     
-    return ChatBedrock(
-        model_id=config["model_id"],
-        region_name=BEDROCK_REGION,
-        model_kwargs={
-            "temperature": config["temperature"],
-            "max_tokens": config["max_tokens"],
-        },
-        config=BOTO_CONFIG  # Use increased timeout configuration
+    if MODEL_ROUTING_ENABLED and config["model_id"] in EQUIVALENT_MODELS:
+        return get_routed_model(agent_type)
+    return get_cached_model(
+        config["model_id"], config["temperature"], config["max_tokens"], streaming=config.get("streaming", False)
     )
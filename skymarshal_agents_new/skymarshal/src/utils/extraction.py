@@ -5,8 +5,9 @@ This module provides robust extraction functions that automatically retry
 with fallback models when throttling errors occur.
 """
 
+import json
 import logging
-from typing import Any, Type, TypeVar
+from typing import Any, Optional, Type, TypeVar
 from pydantic import BaseModel
 from botocore.exceptions import ClientError
 
@@ -116,3 +117,57 @@ async def extract_with_fallback(
         f"All models throttled or unavailable. Tried primary + {len(fallback_models)} fallback models. "
         "Please wait for quota reset or request quota increase."
     )
+
+
+async def resolve_flight_info(
+    llm: Any,
+    schema: Type[T],
+    prompt: str,
+    payload: Optional[dict] = None
+) -> T:
+    """
+    Return the flight info resolved by the orchestrator, or extract it.
+
+    The orchestrator extracts flight info once per disruption and passes it
+    down in the payload under ``flight_info``. When present it is validated
+    through ``schema`` and returned without an LLM call; otherwise this falls
+    back to extract_with_fallback() so agents still work when invoked directly.
+
+    Args:
+        llm: Primary LangChain LLM instance (only used when extraction is needed)
+        schema: Pydantic model class to extract (e.g., FlightInfo)
+        prompt: Natural language prompt to extract from
+        payload: Agent payload that may carry a pre-resolved ``flight_info``
+
+    Returns:
+        Flight info as instance of schema
+
+    Raises:
+        ValueError: If the pre-resolved flight info fails schema validation
+        Exception: If extraction fails (see extract_with_fallback)
+    """
+    resolved = (payload or {}).get("flight_info")
+    if resolved is not None:
+        if isinstance(resolved, schema):
+            return resolved
+        logger.debug("Using orchestrator-resolved flight info, skipping extraction")
+        return schema.model_validate(resolved)
+
+    return await extract_with_fallback(llm, schema, prompt)
+
+
+def format_flight_record(payload: Optional[dict]) -> str:
+    """
+    Format the orchestrator-resolved flight record for an agent user message.
+
+    Args:
+        payload: Agent payload that may carry a pre-resolved ``flight`` record
+
+    Returns:
+        str: ``<flight_record>`` XML line (newline-terminated), or "" when the
+             payload has no resolved flight record
+    """
+    flight = (payload or {}).get("flight")
+    if not flight:
+        return ""
+    return f"  <flight_record>{json.dumps(flight, default=str, separators=(',', ':'))}</flight_record>\n"
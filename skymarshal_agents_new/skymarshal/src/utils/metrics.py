@@ -0,0 +1,386 @@
+"""Request-scoped token and latency accounting for model calls
+
+Every Bedrock call made through the model clients from model.load (and the
+arbitrator's own clients) reports its usage metadata - input/output tokens
+and prompt cache reads/writes - and its latency to the active RequestMetrics,
+labelled with the agent, phase and tool-calling iteration it belongs to.
+invoke_with_tools adds tool execution time. The orchestrator aggregates the
+records into its response and audit trail and exports them as CloudWatch
+Embedded Metric Format (EMF) JSON lines.
+
+Like the DynamoDB request cache, metrics are only collected inside a request
+scope; outside one, calls are not recorded.
+
+Usage:
+    from utils.metrics import RequestMetrics, bind_request_metrics, metric_labels
+
+    metrics = RequestMetrics(thread_id)
+    bind_request_metrics(metrics)
+    with metric_labels(agent="crew_compliance", phase="phase1"):
+        ...  # model calls are recorded under these labels
+    response["metrics"] = metrics.summary()
+    metrics.export()
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+logger = logging.getLogger(__name__)
+
+# Export per-request metrics as CloudWatch EMF log lines
+METRICS_EMF_ENABLED = os.getenv("METRICS_EMF", "true").lower() == "true"
+METRICS_NAMESPACE = os.getenv("METRICS_NAMESPACE", "SkyMarshal")
+
+# Label used when a call is made outside any agent or phase
+UNLABELLED = "unknown"
+
+# Counters aggregated per agent, phase, model and request
+_COUNTERS = (
+    "llm_calls",
+    "llm_errors",
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_write_tokens",
+    "llm_seconds",
+    "tool_calls",
+    "tool_seconds",
+)
+
+# EMF metric name and unit per counter
+_EMF_METRICS = {
+    "llm_calls": ("LLMCalls", "Count"),
+    "llm_errors": ("LLMErrors", "Count"),
+    "input_tokens": ("InputTokens", "Count"),
+    "output_tokens": ("OutputTokens", "Count"),
+    "cache_read_tokens": ("CacheReadTokens", "Count"),
+    "cache_write_tokens": ("CacheWriteTokens", "Count"),
+    "llm_seconds": ("LLMTime", "Seconds"),
+    "tool_calls": ("ToolCalls", "Count"),
+    "tool_seconds": ("ToolTime", "Seconds"),
+}
+
+_current_request_metrics: ContextVar[Optional["RequestMetrics"]] = ContextVar(
+    "current_request_metrics", default=None
+)
+_current_labels: ContextVar[Dict[str, Any]] = ContextVar("current_metric_labels", default={})
+
+# EMF lines must be bare JSON, so they bypass the root handler's log format
+_emf_logger = logging.getLogger("skymarshal.metrics.emf")
+_emf_logger.propagate = False
+_emf_logger.setLevel(logging.INFO)
+if not _emf_logger.handlers:
+    _emf_handler = logging.StreamHandler(sys.stdout)
+    _emf_handler.setFormatter(logging.Formatter("%(message)s"))
+    _emf_logger.addHandler(_emf_handler)
+
+
+@dataclass
+class ModelCallRecord:
+    """Usage and latency of one model call."""
+
+    agent: str
+    phase: str
+    model_id: str
+    iteration: Optional[int]
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    latency_seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def _new_counters() -> Dict[str, float]:
+    return {name: 0 for name in _COUNTERS}
+
+
+def _rounded(counters: Dict[str, float]) -> Dict[str, float]:
+    return {
+        name: round(value, 3) if isinstance(value, float) else value
+        for name, value in counters.items()
+    }
+
+
+class RequestMetrics:
+    """
+    Thread-safe collector of model call and tool usage for one request.
+
+    Model calls are kept individually (for the audit trail); tool time is
+    only kept aggregated per agent and phase.
+    """
+
+    def __init__(self, scope_id: str):
+        self.scope_id = scope_id
+        self._lock = threading.Lock()
+        self._calls: List[ModelCallRecord] = []
+        self._tools: Dict[tuple, Dict[str, float]] = {}
+
+    def record_model_call(self, record: ModelCallRecord) -> None:
+        with self._lock:
+            self._calls.append(record)
+
+    def record_tools(self, agent: str, phase: str, calls: int, seconds: float) -> None:
+        with self._lock:
+            totals = self._tools.setdefault((agent, phase), {"tool_calls": 0, "tool_seconds": 0.0})
+            totals["tool_calls"] += calls
+            totals["tool_seconds"] += seconds
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Per-call records, in completion order."""
+        with self._lock:
+            return [asdict(record) for record in self._calls]
+
+    def _aggregate(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = list(self._calls)
+            tools = {key: dict(value) for key, value in self._tools.items()}
+
+        totals = _new_counters()
+        by_agent: Dict[str, Dict[str, float]] = {}
+        by_phase: Dict[str, Dict[str, float]] = {}
+        by_model: Dict[str, Dict[str, float]] = {}
+        by_agent_phase: Dict[tuple, Dict[str, float]] = {}
+        iterations: Dict[tuple, int] = {}
+
+        def add(counters: Dict[str, float], values: Dict[str, float]) -> None:
+            for name, value in values.items():
+                counters[name] += value
+
+        for record in calls:
+            values = {
+                "llm_calls": 1,
+                "llm_errors": 1 if record.error else 0,
+                "input_tokens": record.input_tokens,
+                "output_tokens": record.output_tokens,
+                "cache_read_tokens": record.cache_read_tokens,
+                "cache_write_tokens": record.cache_write_tokens,
+                "llm_seconds": record.latency_seconds,
+            }
+            key = (record.agent, record.phase)
+            for counters in (
+                totals,
+                by_agent.setdefault(record.agent, _new_counters()),
+                by_phase.setdefault(record.phase, _new_counters()),
+                by_model.setdefault(record.model_id, _new_counters()),
+                by_agent_phase.setdefault(key, _new_counters()),
+            ):
+                add(counters, values)
+            if record.iteration is not None:
+                iterations[key] = max(iterations.get(key, 0), record.iteration)
+
+        for (agent, phase), values in tools.items():
+            for counters in (
+                totals,
+                by_agent.setdefault(agent, _new_counters()),
+                by_phase.setdefault(phase, _new_counters()),
+                by_agent_phase.setdefault((agent, phase), _new_counters()),
+            ):
+                add(counters, values)
+
+        for key, counters in by_agent_phase.items():
+            counters["iterations"] = iterations.get(key, 0)
+
+        return {
+            "totals": totals,
+            "by_agent": by_agent,
+            "by_phase": by_phase,
+            "by_model": by_model,
+            "by_agent_phase": by_agent_phase,
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Aggregate usage for the request.
+
+        Returns:
+            dict: "totals" plus the same counters "by_phase", "by_agent"
+            (across phases), "by_model" and "by_agent_phase"
+            ({phase: {agent: counters}}, including the highest tool-calling
+            iteration reached)
+        """
+        aggregate = self._aggregate()
+        by_agent_phase: Dict[str, Dict[str, Any]] = {}
+        for (agent, phase), counters in aggregate["by_agent_phase"].items():
+            by_agent_phase.setdefault(phase, {})[agent] = _rounded(counters)
+        return {
+            "scope_id": self.scope_id,
+            "totals": _rounded(aggregate["totals"]),
+            "by_phase": {name: _rounded(c) for name, c in aggregate["by_phase"].items()},
+            "by_agent": {name: _rounded(c) for name, c in aggregate["by_agent"].items()},
+            "by_model": {name: _rounded(c) for name, c in aggregate["by_model"].items()},
+            "by_agent_phase": by_agent_phase,
+        }
+
+    def to_emf(self) -> List[Dict[str, Any]]:
+        """
+        Build one CloudWatch EMF record per agent and phase.
+
+        Metrics are published with the dimension sets [Phase, Agent] and
+        [Phase], so CloudWatch also rolls them up per phase.
+        """
+        timestamp = int(time.time() * 1000)
+        emf_records = []
+        for (agent, phase), counters in self._aggregate()["by_agent_phase"].items():
+            emf_record: Dict[str, Any] = {
+                "_aws": {
+                    "Timestamp": timestamp,
+                    "CloudWatchMetrics": [{
+                        "Namespace": METRICS_NAMESPACE,
+                        "Dimensions": [["Phase", "Agent"], ["Phase"]],
+                        "Metrics": [
+                            {"Name": name, "Unit": unit} for name, unit in _EMF_METRICS.values()
+                        ],
+                    }],
+                },
+                "Phase": phase,
+                "Agent": agent,
+                "ThreadId": self.scope_id,
+                "Iterations": counters["iterations"],
+            }
+            for counter, (name, _) in _EMF_METRICS.items():
+                emf_record[name] = round(counters[counter], 3)
+            emf_records.append(emf_record)
+        return emf_records
+
+    def export(self) -> int:
+        """
+        Write the request's EMF records to stdout (if METRICS_EMF is enabled).
+
+        Returns:
+            int: Number of records written
+        """
+        if not METRICS_EMF_ENABLED:
+            return 0
+        emf_records = self.to_emf()
+        for emf_record in emf_records:
+            _emf_logger.info(json.dumps(emf_record))
+        return len(emf_records)
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    """Get the metrics collector for the current context, if a request scope is active."""
+    return _current_request_metrics.get()
+
+
+def bind_request_metrics(metrics: Optional[RequestMetrics]) -> None:
+    """
+    Bind a metrics collector to the current context.
+
+    Intended for contexts that are created explicitly (e.g. via
+    contextvars.copy_context().run) and passed to asyncio tasks.
+    """
+    _current_request_metrics.set(metrics)
+
+
+def get_metric_labels() -> Dict[str, Any]:
+    """Labels (agent, phase, iteration) applying to calls in the current context."""
+    return _current_labels.get()
+
+
+@contextmanager
+def metric_labels(**labels: Any) -> Iterator[None]:
+    """
+    Label model calls and tool time recorded within a block.
+
+    Labels are merged over the enclosing ones, so an agent run can set
+    agent and phase and the tool-calling loop add the iteration.
+    """
+    token = _current_labels.set({**_current_labels.get(), **labels})
+    try:
+        yield
+    finally:
+        _current_labels.reset(token)
+
+
+def record_tool_time(calls: int, seconds: float) -> None:
+    """Record tool executions under the current labels (no-op outside a request scope)."""
+    metrics = get_request_metrics()
+    if metrics is None:
+        return
+    labels = get_metric_labels()
+    metrics.record_tools(labels.get("agent", UNLABELLED), labels.get("phase", UNLABELLED), calls, seconds)
+
+
+def _usage_from_result(response: Any) -> Dict[str, int]:
+    """Extract token usage from an LLMResult (message usage metadata, else llm_output)."""
+    try:
+        message = response.generations[0][0].message
+        usage = message.usage_metadata
+    except (AttributeError, IndexError, TypeError):
+        usage = None
+
+    if usage:
+        details = usage.get("input_token_details") or {}
+        return {
+            "input_tokens": usage.get("input_tokens", 0),
+            "output_tokens": usage.get("output_tokens", 0),
+            "cache_read_tokens": details.get("cache_read") or 0,
+            "cache_write_tokens": details.get("cache_creation") or 0,
+        }
+
+    usage = (getattr(response, "llm_output", None) or {}).get("usage") or {}
+    return {
+        "input_tokens": usage.get("prompt_tokens", 0),
+        "output_tokens": usage.get("completion_tokens", 0),
+        "cache_read_tokens": usage.get("cache_read_input_tokens", 0),
+        "cache_write_tokens": usage.get("cache_write_input_tokens", 0),
+    }
+
+
+class UsageMetricsCallback(BaseCallbackHandler):
+    """Record token usage and latency of every call made through a model client."""
+
+    run_inline = True
+
+    def __init__(self, model_id: str):
+        self.model_id = model_id
+        self._starts: Dict[UUID, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: UUID) -> None:
+        # Metrics and labels are captured at call start, in the caller's context
+        metrics = get_request_metrics()
+        if metrics is None:
+            return
+        with self._lock:
+            self._starts[run_id] = (time.time(), metrics, get_metric_labels())
+
+    def _finish(self, run_id: UUID, usage: Dict[str, int], error: Optional[str] = None) -> None:
+        with self._lock:
+            started = self._starts.pop(run_id, None)
+        if started is None:
+            return
+        start, metrics, labels = started
+        metrics.record_model_call(ModelCallRecord(
+            agent=labels.get("agent", UNLABELLED),
+            phase=labels.get("phase", UNLABELLED),
+            model_id=self.model_id,
+            iteration=labels.get("iteration"),
+            latency_seconds=time.time() - start,
+            error=error,
+            **usage,
+        ))
+
+    def on_chat_model_start(self, serialized: Any, messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_start(self, serialized: Any, prompts: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(run_id)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, _usage_from_result(response))
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, {}, error=type(error).__name__)
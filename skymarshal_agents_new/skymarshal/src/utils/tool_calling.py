@@ -9,20 +9,265 @@ The error: "messages.X.content.Y.tool_result.content.0.text.id: Extra inputs are
 Solution: Manually implement the tool calling loop with clean message formatting.
 """
 
+import asyncio
+import contextvars
+import functools
 import logging
 import json
+import os
 import time
-from typing import Any, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple
+
+from utils.metrics import metric_labels, record_tool_time
 
 logger = logging.getLogger(__name__)
 
+# Per-tool execution timeout (seconds). A single slow query must not consume
+# the whole agent timeout budget.
+TOOL_TIMEOUT_SECONDS = 30
+
+# Shared, bounded pool for sync-only tools so they never block the event loop
+# that runs all agents in parallel.
+TOOL_EXECUTOR_MAX_WORKERS = 16
+
+_tool_executor: Optional[ThreadPoolExecutor] = None
+
+# Bedrock prompt caching (Anthropic models): the tool schemas and system prompt
+# are identical for every call an agent makes in Phase 1 and Phase 2, so they
+# are marked as a cached prefix; see cached_system_message()
+PROMPT_CACHING_ENABLED = os.getenv("PROMPT_CACHING", "true").lower() == "true"
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Upper bound on cached registries / bound models. Agent tool lists are fixed
+# module-level objects, so in practice this holds one entry per agent.
+TOOL_CACHE_MAX_ENTRIES = 64
+
+
+class ToolRegistry:
+    """
+    Name-indexed view over a fixed list of tools.
+
+    Built once per distinct tool list and reused across invocations so tool
+    lookup is a dict access instead of a linear scan per tool call.
+    """
+
+    def __init__(self, tools: List[Any]):
+        self.tools = list(tools)
+        self.by_name: Dict[str, Any] = {t.name: t for t in self.tools}
+        # Tools are held by reference, so their ids stay unique while cached
+        self.key: Tuple[int, ...] = tuple(id(t) for t in self.tools)
+
+    def get(self, name: str) -> Optional[Any]:
+        """Look up a tool by name."""
+        return self.by_name.get(name)
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+
+_tool_registries: Dict[Tuple[int, ...], ToolRegistry] = {}
+_bound_models: Dict[Tuple[Any, ...], Any] = {}
+
+
+def _cache_put(cache: Dict[Any, Any], key: Any, value: Any) -> None:
+    """Insert into a bounded cache, evicting the oldest entry when full."""
+    if len(cache) >= TOOL_CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def get_tool_registry(tools: List[Any]) -> ToolRegistry:
+    """
+    Get the cached ToolRegistry for a tool list, building it on first use.
+
+    Args:
+        tools: List of LangChain tools
+
+    Returns:
+        ToolRegistry indexed by tool name
+    """
+    key = tuple(id(t) for t in tools)
+    registry = _tool_registries.get(key)
+    if registry is None:
+        registry = ToolRegistry(tools)
+        _cache_put(_tool_registries, key, registry)
+    return registry
+
+
+def _model_cache_key(llm: Any) -> Tuple[Any, ...]:
+    """
+    Build the cache key identifying a model configuration.
+
+    Uses model class, model id and sampling parameters when available, falling back to the
+    instance identity for models that do not expose them.
+    """
+    model_id = getattr(llm, "model_id", None)
+    if isinstance(model_id, str):
+        return (
+            type(llm).__name__,
+            model_id,
+            getattr(llm, "temperature", None),
+            getattr(llm, "max_tokens", None),
+        )
+    return ("instance", id(llm))
+
+
+def get_bound_model(llm: Any, registry: ToolRegistry) -> Any:
+    """
+    Get the model with tools bound, reusing a cached binding when available.
+
+    bind_tools() converts every tool into a JSON schema; caching the bound
+    model per (model id, tool set) means this happens once per process
+    instead of on every agent invocation.
+
+    Args:
+        llm: ChatBedrock model instance
+        registry: ToolRegistry for the tools to bind
+
+    Returns:
+        Model runnable with tools bound
+    """
+    key = _model_cache_key(llm) + registry.key
+    cached = _bound_models.get(key)
+    if cached is not None:
+        logger.debug(f"Reusing cached tool binding ({len(registry)} tools)")
+        return cached[1]
+
+    bind_start = time.time()
+    bound = llm.bind_tools(registry.tools)
+    bind_time = time.time() - bind_start
+    logger.info(f"⏱️  Tool binding took {bind_time:.3f}s ({len(registry)} tools, cached for reuse)")
+    # Keep the source model alive alongside the binding so id-based keys stay valid
+    _cache_put(_bound_models, key, (llm, bound))
+    return bound
+
+
+def clear_tool_caches() -> None:
+    """Clear cached tool registries and bound models (mainly for tests)."""
+    _tool_registries.clear()
+    _bound_models.clear()
+
+
+def _get_tool_executor() -> ThreadPoolExecutor:
+    """Get (lazily creating) the shared thread pool for sync tool execution."""
+    global _tool_executor
+    if _tool_executor is None:
+        _tool_executor = ThreadPoolExecutor(
+            max_workers=TOOL_EXECUTOR_MAX_WORKERS,
+            thread_name_prefix="tool-exec",
+        )
+    return _tool_executor
+
+
+def cached_system_message(system_prompt: str) -> Dict[str, Any]:
+    """
+    Build a system message that ends a prompt cache checkpoint.
+
+    Bedrock caches the request prefix up to the checkpoint, in the order tool
+    schemas, system prompt, messages. Keeping the static system prompt first
+    and all per-request content (disruption, phase, other agents'
+    recommendations) in later messages makes tools + system prompt one
+    prefix shared by every call with the same model, tools and prompt.
+
+    Args:
+        system_prompt: Static system prompt
+
+    Returns:
+        dict: System message (plain string content when PROMPT_CACHING is disabled)
+    """
+    if not PROMPT_CACHING_ENABLED:
+        return {"role": "system", "content": system_prompt}
+    return {
+        "role": "system",
+        "content": [{"type": "text", "text": system_prompt, "cache_control": CACHE_CONTROL}],
+    }
+
+
+def _is_async_tool(tool: Any) -> bool:
+    """Check whether a tool has a native coroutine implementation (e.g. @tool on async def)."""
+    return getattr(tool, "coroutine", None) is not None
+
+
+async def _execute_tool_call(
+    tool_call: Dict[str, Any],
+    registry: ToolRegistry,
+    idx: int,
+    total: int,
+    timeout: float,
+) -> Dict[str, Any]:
+    """
+    Execute a single tool call and return its result and timing.
+
+    Async tools are awaited directly; sync tools are offloaded to the shared
+    bounded thread pool. Errors and timeouts are converted into JSON error
+    payloads so the model can still reason about the failure.
+
+    Args:
+        tool_call: Tool call dict from the model response (name, args, id)
+        registry: Name-indexed tool registry
+        idx: 1-based position of the call within the turn (for logging)
+        total: Number of tool calls in the turn (for logging)
+        timeout: Per-tool timeout in seconds
+
+    Returns:
+        Dict with "result" (str) and "duration" (seconds)
+    """
+    tool_name = tool_call["name"]
+    tool_args = tool_call["args"]
+
+    logger.info(f"🔧 [{idx}/{total}] Executing tool: {tool_name}")
+    logger.debug(f"   Args: {tool_args}")
+
+    tool_exec_start = time.time()
+    tool = registry.get(tool_name)
+
+    if tool is None:
+        tool_exec_time = time.time() - tool_exec_start
+        logger.error(f"❌ Tool {tool_name} not found (searched for {tool_exec_time:.3f}s)")
+        return {
+            "result": json.dumps({"error": f"Tool {tool_name} not found"}),
+            "duration": tool_exec_time,
+        }
+
+    try:
+        # Execute tool (native async, or sync on the bounded pool)
+        if _is_async_tool(tool):
+            coro = tool.ainvoke(tool_args)
+        else:
+            # Run in a copy of the caller's context so request-scoped state
+            # (e.g. the DynamoDB request cache) is visible to the tool
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            coro = loop.run_in_executor(
+                _get_tool_executor(), functools.partial(context.run, tool.invoke, tool_args)
+            )
+        tool_result = await asyncio.wait_for(coro, timeout=timeout)
+        tool_exec_time = time.time() - tool_exec_start
+        logger.info(f"⏱️  Tool {tool_name} took {tool_exec_time:.3f}s")
+        logger.debug(f"   Result: {str(tool_result)[:200]}")
+    except asyncio.TimeoutError:
+        tool_exec_time = time.time() - tool_exec_start
+        logger.error(f"❌ Tool {tool_name} timed out after {tool_exec_time:.3f}s")
+        tool_result = json.dumps({
+            "error": f"Tool {tool_name} timed out after {timeout}s",
+            "error_type": "TimeoutError",
+        })
+    except Exception as e:
+        tool_exec_time = time.time() - tool_exec_start
+        logger.error(f"❌ Tool {tool_name} failed after {tool_exec_time:.3f}s: {e}")
+        tool_result = json.dumps({"error": str(e), "error_type": type(e).__name__})
+
+    return {"result": str(tool_result), "duration": tool_exec_time}
+
 
 async def invoke_with_tools(
     llm: Any,
     system_prompt: str,
     user_message: str,
     tools: List[Any],
-    max_iterations: int = 5
+    max_iterations: int = 5,
+    tool_timeout: float = TOOL_TIMEOUT_SECONDS
 ) -> Dict[str, Any]:
     """
     Invoke LLM with tools using a custom tool calling loop that avoids extra metadata.
@@ -31,29 +276,38 @@ async def invoke_with_tools(
     formatting that Bedrock accepts, without the extra 'index' and 'id' fields that
     LangChain's create_agent adds.
     
+    When the model requests several tools in one turn they are executed
+    concurrently, so the turn takes as long as the slowest tool rather than
+    the sum. Results are returned to the model in the original call order.
+    
+    With PROMPT_CACHING enabled the tools + system prompt prefix is cached
+    (see cached_system_message), and each iteration also places a cache
+    checkpoint on its latest message, so the next iteration only pays full
+    price for the new tool results.
+    
     Args:
         llm: ChatBedrock model instance
         system_prompt: System prompt for the agent
         user_message: User message to process
         tools: List of LangChain tools
         max_iterations: Maximum number of tool calling iterations
+        tool_timeout: Per-tool execution timeout in seconds
     
     Returns:
         Dict with final response and metadata
     """
     overall_start = time.time()
     
-    # Bind tools to the model
-    bind_start = time.time()
-    llm_with_tools = llm.bind_tools(tools)
-    bind_time = time.time() - bind_start
-    logger.info(f"⏱️  Tool binding took {bind_time:.3f}s")
+    # Look up (or build once) the tool registry and bound model
+    registry = get_tool_registry(tools)
+    llm_with_tools = get_bound_model(llm, registry)
     
     # Initialize messages
     messages = [
-        {"role": "system", "content": system_prompt},
+        cached_system_message(system_prompt),
         {"role": "user", "content": user_message}
     ]
+    invoke_kwargs = {"cache_control": CACHE_CONTROL} if PROMPT_CACHING_ENABLED else {}
     
     iteration = 0
     total_llm_time = 0
@@ -67,7 +321,8 @@ async def invoke_with_tools(
         try:
             # Invoke model
             llm_start = time.time()
-            response = await llm_with_tools.ainvoke(messages)
+            with metric_labels(iteration=iteration):
+                response = await llm_with_tools.ainvoke(messages, **invoke_kwargs)
             llm_time = time.time() - llm_start
             total_llm_time += llm_time
             logger.info(f"⏱️  LLM invocation took {llm_time:.3f}s")
@@ -97,55 +352,35 @@ async def invoke_with_tools(
             # Add assistant message with tool calls
             messages.append(response)
             
-            # Execute each tool call
-            tool_results = []
-            for idx, tool_call in enumerate(response.tool_calls, 1):
-                tool_name = tool_call["name"]
-                tool_args = tool_call["args"]
-                tool_call_id = tool_call["id"]
-                
-                logger.info(f"🔧 [{idx}/{len(response.tool_calls)}] Executing tool: {tool_name}")
-                logger.debug(f"   Args: {tool_args}")
-                
-                # Find and execute the tool
-                tool_result = None
-                tool_exec_start = time.time()
-                for tool in tools:
-                    if tool.name == tool_name:
-                        try:
-                            # Execute tool (sync or async)
-                            if hasattr(tool, 'ainvoke'):
-                                tool_result = await tool.ainvoke(tool_args)
-                            else:
-                                tool_result = tool.invoke(tool_args)
-                            tool_exec_time = time.time() - tool_exec_start
-                            total_tool_time += tool_exec_time
-                            logger.info(f"⏱️  Tool {tool_name} took {tool_exec_time:.3f}s")
-                            logger.debug(f"   Result: {str(tool_result)[:200]}")
-                        except Exception as e:
-                            tool_exec_time = time.time() - tool_exec_start
-                            total_tool_time += tool_exec_time
-                            logger.error(f"❌ Tool {tool_name} failed after {tool_exec_time:.3f}s: {e}")
-                            tool_result = json.dumps({"error": str(e), "error_type": type(e).__name__})
-                        break
-                
-                if tool_result is None:
-                    tool_exec_time = time.time() - tool_exec_start
-                    logger.error(f"❌ Tool {tool_name} not found (searched for {tool_exec_time:.3f}s)")
-                    tool_result = json.dumps({"error": f"Tool {tool_name} not found"})
-                
-                # Format tool result message - CLEAN FORMAT for Bedrock
-                # Only include required fields, no extra metadata
-                tool_results.append({
+            # Execute all tool calls from this turn concurrently
+            tools_start = time.time()
+            total_calls = len(response.tool_calls)
+            executions = await asyncio.gather(*[
+                _execute_tool_call(tool_call, registry, idx, total_calls, tool_timeout)
+                for idx, tool_call in enumerate(response.tool_calls, 1)
+            ])
+            tools_wall_time = time.time() - tools_start
+            total_tool_time += tools_wall_time
+            record_tool_time(total_calls, tools_wall_time)
+            if total_calls > 1:
+                summed = sum(e["duration"] for e in executions)
+                logger.info(f"⏱️  {total_calls} tools ran concurrently in {tools_wall_time:.3f}s (sequential would be {summed:.3f}s)")
+            
+            # Format tool result messages in original call order - CLEAN FORMAT for Bedrock
+            # Only include required fields, no extra metadata
+            tool_results = [
+                {
                     "role": "user",
                     "content": [
                         {
                             "type": "tool_result",
-                            "tool_use_id": tool_call_id,
-                            "content": str(tool_result)
+                            "tool_use_id": tool_call["id"],
+                            "content": execution["result"]
                         }
                     ]
-                })
+                }
+                for tool_call, execution in zip(response.tool_calls, executions)
+            ]
             
             # Add all tool results to messages
             messages.extend(tool_results)
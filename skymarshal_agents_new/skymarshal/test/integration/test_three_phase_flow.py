@@ -800,7 +800,7 @@ class TestAuditTrailCompleteness:
                     "duration_seconds": 1.0
                 }
         
-        with patch("main.SAFETY_AGENTS", []):
+        with patch("main.SAFETY_AGENTS", []), patch("main.REVISION_FAST_PATH_ENABLED", False):
             with patch("main.BUSINESS_AGENTS", [("network", initial_agent)]):
                 result = await handle_disruption(sample_user_prompt, mock_llm, mock_mcp_tools)
         
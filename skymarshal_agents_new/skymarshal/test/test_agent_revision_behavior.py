@@ -26,7 +26,7 @@ class TestCrewComplianceRevisionBehavior:
     """Test crew compliance agent revision behavior"""
     
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_agent_checks_phase_field(self, mock_boto3):
         """Test that agent checks payload.phase to determine initial vs revision"""
         from agents.crew_compliance.agent import analyze_crew_compliance
@@ -36,7 +36,7 @@ class TestCrewComplianceRevisionBehavior:
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
         mock_dynamodb.Table.return_value = mock_table
-        mock_boto3.resource.return_value = mock_dynamodb
+        mock_boto3.return_value = mock_dynamodb
         
         # Mock LLM
         llm = Mock()
@@ -79,7 +79,7 @@ class TestCrewComplianceRevisionBehavior:
         assert "agent_name" in result
     
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_agent_receives_other_recommendations_in_revision(self, mock_boto3):
         """Test that agent receives other_recommendations in revision phase"""
         from agents.crew_compliance.agent import analyze_crew_compliance
@@ -89,7 +89,7 @@ class TestCrewComplianceRevisionBehavior:
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
         mock_dynamodb.Table.return_value = mock_table
-        mock_boto3.resource.return_value = mock_dynamodb
+        mock_boto3.return_value = mock_dynamodb
         
         # Mock LLM
         llm = Mock()
@@ -232,7 +232,7 @@ class TestNetworkRevisionBehavior:
     """Test network agent revision behavior"""
     
     @pytest.mark.asyncio
-    @patch('agents.network.agent.boto3')
+    @patch('agents.network.agent.get_dynamodb_resource')
     async def test_agent_revises_with_aircraft_swap_info(self, mock_boto3):
         """Test that network agent revises when maintenance suggests aircraft swap"""
         from agents.network.agent import analyze_network
@@ -242,7 +242,7 @@ class TestNetworkRevisionBehavior:
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
         mock_dynamodb.Table.return_value = mock_table
-        mock_boto3.resource.return_value = mock_dynamodb
+        mock_boto3.return_value = mock_dynamodb
         
         # Mock LLM
         llm = Mock()
@@ -341,7 +341,7 @@ class TestCargoRevisionBehavior:
     """Test cargo agent revision behavior"""
     
     @pytest.mark.asyncio
-    @patch('agents.cargo.agent.boto3.resource')
+    @patch('agents.cargo.agent.get_dynamodb_resource')
     async def test_agent_maintains_domain_priorities(self, mock_boto3):
         """Test that cargo agent maintains cargo domain priorities during revision"""
         from agents.cargo.agent import analyze_cargo
@@ -398,7 +398,7 @@ class TestFinanceRevisionBehavior:
     """Test finance agent revision behavior"""
     
     @pytest.mark.asyncio
-    @patch('agents.finance.agent.boto3')
+    @patch('agents.finance.agent.get_dynamodb_resource')
     @patch('agents.finance.agent.create_agent')
     async def test_agent_revises_with_cost_implications(self, mock_create_agent, mock_boto3):
         """Test that finance agent revises when other agents provide cost implications"""
@@ -418,7 +418,7 @@ class TestFinanceRevisionBehavior:
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
         mock_dynamodb.Table.return_value = mock_table
-        mock_boto3.resource.return_value = mock_dynamodb
+        mock_boto3.return_value = mock_dynamodb
         
         # Mock LLM
         llm = AsyncMock()
@@ -0,0 +1,266 @@
+"""Unit tests for the non-blocking, streamed arbitrator invocation"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from langchain_aws import ChatBedrock
+from langchain_core.messages import AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+
+import agents.arbitrator.agent as arbitrator
+from agents.arbitrator.agent import ARBITRATOR_SYSTEM_PROMPT, _generate_minimal_solution, arbitrate
+from main import handle_disruption_stream
+from model.load import RoutedChatModel
+
+
+RESPONSES = {
+    "crew_compliance": {
+        "recommendation": "Delay 3 hours for crew rest",
+        "binding_constraints": ["Crew must have 10 hours rest"],
+        "confidence": 0.95,
+        "reasoning": "Crew at FDP limit",
+    },
+    "network": {
+        "recommendation": "Delay 1 hour",
+        "confidence": 0.85,
+        "reasoning": "Limits propagation",
+    },
+}
+
+
+def make_output(solution_count=2):
+    """A complete ArbitratorOutput as the model would emit it (schema field order)"""
+    solution = _generate_minimal_solution([], RESPONSES).model_dump()
+    return {
+        "final_decision": "Delay 3 hours for crew rest",
+        "recommendations": ["Delay 3 hours"],
+        "conflicts_identified": [],
+        "conflict_resolutions": [],
+        "safety_overrides": [],
+        "justification": "Safety first",
+        "reasoning": "Crew rest is binding",
+        "confidence": 0.9,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "solution_options": [dict(solution, solution_id=i + 1) for i in range(solution_count)],
+        "recommended_solution_id": 1,
+    }
+
+
+def stream_of(output, fail=False):
+    """Structured-output runnable streaming growing partial dicts of output"""
+    async def astream(messages):
+        partial = {}
+        for key, value in output.items():
+            if key == "solution_options":
+                partial[key] = []
+                for solution in value:
+                    partial[key].append({"solution_id": solution["solution_id"]})
+                    yield dict(partial)
+                    await asyncio.sleep(0)
+                    partial[key][-1] = solution
+                    yield dict(partial)
+                    await asyncio.sleep(0)
+            else:
+                partial[key] = value
+                yield dict(partial)
+                await asyncio.sleep(0)
+            if fail and key == "confidence":
+                raise RuntimeError("Stream interrupted")
+
+    runnable = Mock()
+    runnable.astream = astream
+    return runnable
+
+
+@pytest.fixture(autouse=True)
+def no_knowledge_base():
+    with patch("agents.arbitrator.agent.get_knowledge_base_client", return_value=Mock(enabled=False)):
+        yield
+
+
+class TestStreamedArbitration:
+    """Test arbitrate() streaming partial results"""
+
+    @pytest.mark.asyncio
+    async def test_decision_then_solutions_are_published_in_order(self):
+        llm = Mock(model_id="test-model")
+        llm.with_structured_output.return_value = stream_of(make_output())
+        events = []
+
+        result = await arbitrate(RESPONSES, llm_opus=llm, on_partial=events.append)
+
+        assert [e["type"] for e in events] == [
+            "arbitration_decision", "arbitration_solution", "arbitration_solution"
+        ]
+        assert events[0]["final_decision"] == "Delay 3 hours for crew rest"
+        assert [e["solution"]["solution_id"] for e in events[1:]] == [1, 2]
+        assert all(e["attempt"] == 1 for e in events)
+        assert len(result["solution_options"]) == 2
+        assert result["model_used"] == "test-model"
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_is_a_cache_checkpoint(self):
+        llm = Mock(model_id="test-model")
+        runnable = stream_of(make_output())
+        astream = runnable.astream
+        sent = []
+
+        def record(messages):
+            sent.append(messages)
+            return astream(messages)
+
+        runnable.astream = record
+        llm.with_structured_output.return_value = runnable
+
+        await arbitrate(RESPONSES, llm_opus=llm)
+
+        [system_block] = sent[0][0]["content"]
+        assert system_block["text"] == ARBITRATOR_SYSTEM_PROMPT
+        assert system_block["cache_control"] == {"type": "ephemeral"}
+
+    @pytest.mark.asyncio
+    async def test_event_loop_is_not_blocked(self):
+        llm = Mock(model_id="test-model")
+        llm.with_structured_output.return_value = stream_of(make_output())
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticking = asyncio.create_task(ticker())
+        await arbitrate(RESPONSES, llm_opus=llm)
+        ticking.cancel()
+
+        assert ticks > 1
+
+    @pytest.mark.asyncio
+    async def test_retry_streams_as_second_attempt(self):
+        llm = Mock(model_id="test-model")
+        llm.with_structured_output.side_effect = [
+            stream_of(make_output(), fail=True), stream_of(make_output(solution_count=1))
+        ]
+        events = []
+
+        result = await arbitrate(RESPONSES, llm_opus=llm, on_partial=events.append)
+
+        assert result["retry_used"] is True
+        assert [(e["type"], e["attempt"]) for e in events] == [
+            ("arbitration_decision", 1), ("arbitration_decision", 2), ("arbitration_solution", 2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_partial_solution_is_not_published(self):
+        output = make_output()
+        output["solution_options"][0] = {"solution_id": 1, "title": "Incomplete"}
+        llm = Mock(model_id="test-model")
+        llm.with_structured_output.return_value = stream_of(output)
+        events = []
+
+        with pytest.raises(RuntimeError):
+            await arbitrate(RESPONSES, llm_opus=llm, on_partial=events.append)
+
+        solutions = [e for e in events if e["type"] == "arbitration_solution" and e["attempt"] == 1]
+        assert [e["solution"]["solution_id"] for e in solutions] == [2]
+
+
+class FakeStreamingBedrock(ChatBedrock):
+    """ChatBedrock streaming an ArbitratorOutput tool call in small chunks, as Bedrock does"""
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        args = json.dumps(make_output())
+        for start in range(0, len(args), 50):
+            first = start == 0
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[{
+                "name": "ArbitratorOutput" if first else None,
+                "args": args[start:start + 50],
+                "id": "toolu_1" if first else None,
+                "index": 0,
+            }]))
+
+
+@pytest.fixture
+def fake_bedrock(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setattr(arbitrator, "ChatBedrock", FakeStreamingBedrock)
+
+
+class TestStructuredOutputParsing:
+    """Test the real structured-output parser chain on streamed tool-call chunks"""
+
+    async def partials(self, llm):
+        structured_llm = llm.with_structured_output(arbitrator._arbitrator_output_schema())
+        return [partial async for partial in structured_llm.astream("Arbitrate")]
+
+    @pytest.mark.asyncio
+    async def test_arbitrator_model_parses_the_stream_incrementally(self, fake_bedrock):
+        partials = await self.partials(arbitrator._load_opus_model())
+
+        assert len(partials) > 2
+        assert list(partials[0]) == ["final_decision"]
+        assert partials[-1] == make_output() | {"timestamp": partials[-1]["timestamp"]}
+
+    @pytest.mark.asyncio
+    async def test_routed_arbitrator_model_parses_the_stream_incrementally(self, fake_bedrock):
+        client = FakeStreamingBedrock(model_id="global.anthropic.claude-sonnet-4-5-20250929-v1:0")
+        llm = RoutedChatModel(
+            model_id=client.model_id, model_ids=[client.model_id], temperature=0.2, max_tokens=8192
+        )
+
+        with patch("model.load.get_cached_model", return_value=client):
+            partials = await self.partials(llm)
+
+        assert len(partials) > 2
+        assert partials[-1]["recommended_solution_id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_events_are_published_from_the_stream(self, fake_bedrock):
+        events = []
+
+        result = await arbitrator._astream_decision(
+            arbitrator._load_opus_model(), [{"role": "user", "content": "Arbitrate"}], events.append
+        )
+
+        assert [e["type"] for e in events] == [
+            "arbitration_decision", "arbitration_solution", "arbitration_solution"
+        ]
+        assert result.final_decision == "Delay 3 hours for crew rest"
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_partial_arbitration_events():
+    """Test partial arbitration events reach the client before the final response"""
+    agent_response = {
+        "agent": "crew_compliance",
+        "recommendation": "Test rec",
+        "confidence": 0.95,
+        "reasoning": "Test reasoning",
+        "data_sources": ["test"],
+        "timestamp": datetime.now().isoformat(),
+        "status": "success",
+    }
+
+    async def phase3(revised, llm, thread_id, saver, initial, event_callback):
+        event_callback({"type": "arbitration_decision", "final_decision": "Delay", "attempt": 1})
+        await asyncio.sleep(0)
+        event_callback({"type": "arbitration_solution", "index": 0, "solution": {}, "attempt": 1})
+        return {"final_decision": "Delay"}
+
+    async def agent(payload, llm, tools):
+        return agent_response
+
+    with patch("main.resolve_flight_context", AsyncMock(return_value=None)), \
+         patch("main.phase3_arbitration", phase3), \
+         patch("main.SAFETY_AGENTS", [("crew_compliance", agent)]), \
+         patch("main.BUSINESS_AGENTS", []):
+        events = [e async for e in handle_disruption_stream("Flight EY123 delayed", Mock(), [])]
+
+    assert [e["type"] for e in events][-4:] == [
+        "arbitration_start", "arbitration_decision", "arbitration_solution", "complete"
+    ]
+
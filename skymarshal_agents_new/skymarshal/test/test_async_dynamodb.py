@@ -0,0 +1,192 @@
+"""Unit tests for the native asyncio DynamoDB data-access layer"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from database.async_dynamodb import AsyncCachedTable, AsyncDynamoDBClient, run_blocking
+from database.dynamodb import DynamoDBClient
+from database.pagination import aquery_all
+from database.request_cache import get_request_cache, request_cache_scope
+
+
+PAGES = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
+
+def async_paged_table(pages):
+    """Async table mock whose query returns the given pages in order."""
+    table = MagicMock()
+    table.query = AsyncMock(side_effect=[
+        {"Items": items, **({"LastEvaluatedKey": {"id": items[-1]["id"]}} if i < len(pages) - 1 else {})}
+        for i, items in enumerate(pages)
+    ])
+    return table
+
+
+@pytest.fixture
+def sync_client():
+    """DynamoDBClient singleton backed by mocked boto3 tables"""
+    with patch("database.dynamodb.boto3") as mock_boto3:
+        tables = {}
+
+        def make_table(name):
+            if name not in tables:
+                table = MagicMock()
+                table.name = name
+                tables[name] = table
+            return tables[name]
+
+        mock_boto3.resource.return_value.Table.side_effect = make_table
+        mock_boto3.client.return_value = Mock()
+        DynamoDBClient._instance = None
+        client = DynamoDBClient()
+        client.mock_tables = tables
+        yield client
+        DynamoDBClient._instance = None
+
+
+class TestExecutorBackend:
+    """Test the thread-pool backend used when aioboto3 is not installed"""
+
+    @pytest.mark.asyncio
+    async def test_accessor_follows_pagination(self, sync_client):
+        sync_client.mock_tables.clear()
+        bookings = sync_client.get_table("bookings").wrapped
+        bookings.query.side_effect = [
+            {"Items": PAGES[0], "LastEvaluatedKey": {"id": 2}},
+            {"Items": PAGES[1]},
+        ]
+
+        items = await AsyncDynamoDBClient(native=False).query_bookings_by_flight("FLT-1", "confirmed")
+
+        assert [i["id"] for i in items] == [1, 2, 3]
+        assert bookings.query.call_args_list[0].kwargs["KeyConditionExpression"] == (
+            "flight_id = :fid AND booking_status = :status"
+        )
+
+    @pytest.mark.asyncio
+    async def test_reads_overlap_without_blocking_loop(self, sync_client):
+        def slow_get_item(**kwargs):
+            time.sleep(0.1)
+            return {"Item": {"id": kwargs["Key"]}}
+
+        for name in ("flights", "passengers", "crew_members"):
+            sync_client.get_table(name).wrapped.get_item.side_effect = slow_get_item
+        db = AsyncDynamoDBClient(native=False)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            db.get_flight("1"), db.get_passenger("P1"), db.get_crew_member("C1")
+        )
+
+        assert all(results)
+        assert time.perf_counter() - start < 0.25  # Serial calls would take ~0.3s
+
+    @pytest.mark.asyncio
+    async def test_errors_are_logged_not_raised(self, sync_client):
+        sync_client.get_table("flights").wrapped.get_item.side_effect = RuntimeError("throttled")
+        sync_client.get_table("crew_roster").wrapped.query.side_effect = RuntimeError("throttled")
+        db = AsyncDynamoDBClient(native=False)
+
+        assert await db.get_flight("1") is None
+        assert await db.query_crew_roster_by_flight("1") == []
+
+    @pytest.mark.asyncio
+    async def test_run_blocking_preserves_request_context(self):
+        with request_cache_scope("thread-1") as cache:
+            seen = await run_blocking(lambda: (get_request_cache(), threading.current_thread()))
+
+        assert seen[0] is cache
+        assert seen[1] is not threading.current_thread()
+
+
+class TestNativeBackend:
+    """Test cached aioboto3 table handles"""
+
+    @pytest.mark.asyncio
+    async def test_aquery_all_follows_last_evaluated_key(self):
+        table = async_paged_table(PAGES)
+
+        items = await aquery_all(table, limit=3, KeyConditionExpression="flight_id = :f")
+
+        assert [i["id"] for i in items] == [1, 2, 3]
+        assert table.query.await_args_list[1].kwargs["ExclusiveStartKey"] == {"id": 2}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_reads_share_one_call(self):
+        raw = MagicMock()
+
+        async def slow_get_item(**kwargs):
+            await asyncio.sleep(0.05)
+            return {"Item": {"flight_id": "1"}}
+
+        raw.get_item = AsyncMock(side_effect=slow_get_item)
+        table = AsyncCachedTable(raw, "flights_v2")
+
+        with request_cache_scope("thread-1") as cache:
+            results = await asyncio.gather(*(table.get_item(Key={"flight_id": "1"}) for _ in range(5)))
+
+        assert raw.get_item.await_count == 1
+        assert all(r == {"Item": {"flight_id": "1"}} for r in results)
+        assert cache.get_stats()["hits"] == 4
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_request_cache(self):
+        raw = MagicMock()
+        raw.get_item = AsyncMock(return_value={"Item": {"flight_id": "1"}})
+        raw.put_item = AsyncMock(return_value={})
+        table = AsyncCachedTable(raw, "flights_v2")
+
+        with request_cache_scope("thread-1"):
+            await table.get_item(Key={"flight_id": "1"})
+            await table.put_item(Item={"flight_id": "1"})
+            await table.get_item(Key={"flight_id": "1"})
+
+        assert raw.get_item.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_during_a_write_are_not_served_after_it(self):
+        raw = MagicMock()
+        raw.get_item = AsyncMock(return_value={"Item": {"flight_id": "1"}})
+        table = AsyncCachedTable(raw, "flights_v2")
+
+        async def put_item(**kwargs):
+            # A read racing the write (issued before it completes) must not stay cached
+            await table.get_item(Key={"flight_id": "1"})
+            return {}
+
+        raw.put_item = AsyncMock(side_effect=put_item)
+
+        with request_cache_scope("thread-1"):
+            await table.put_item(Item={"flight_id": "1", "status": "delayed"})
+            await table.get_item(Key={"flight_id": "1"})
+
+        assert raw.get_item.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_writer_invalidates_after_flush(self):
+        raw = MagicMock()
+        raw.get_item = AsyncMock(return_value={"Item": {"flight_id": "1"}})
+        writer = MagicMock()
+        writer.__aenter__ = AsyncMock(return_value=writer)
+        writer.__aexit__ = AsyncMock(return_value=None)
+        writer.put_item = AsyncMock(return_value=None)
+        raw.batch_writer.return_value = writer
+        table = AsyncCachedTable(raw, "flights_v2")
+
+        with request_cache_scope("thread-1"):
+            async with table.batch_writer() as batch:
+                await table.get_item(Key={"flight_id": "1"})
+                await batch.put_item(Item={"flight_id": "1", "status": "delayed"})
+            await table.get_item(Key={"flight_id": "1"})
+
+        assert raw.get_item.await_count == 2
+        writer.__aexit__.assert_awaited_once()
+
+    def test_native_requires_aioboto3(self):
+        with patch("database.async_dynamodb.aioboto3", None):
+            with pytest.raises(RuntimeError):
+                AsyncDynamoDBClient(native=True)
@@ -44,7 +44,7 @@ class TestCargoErrorHandling:
             assert "Agent execution error" in result["failure_reason"]
             assert result["error_type"] == "Exception"
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_flight_database_error(self, mock_boto3):
         """Test handling of database error in query_flight."""
         # Setup mock to raise exception
@@ -58,7 +58,7 @@ class TestCargoErrorHandling:
         # Verify returns None on error
         assert result is None
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_cargo_manifest_database_error(self, mock_boto3):
         """Test handling of database error in query_cargo_manifest."""
         # Setup mock to raise exception
@@ -73,7 +73,7 @@ class TestCargoErrorHandling:
         assert result == []
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_flight_not_found(self, mock_boto3):
         """Test handling when flight is not found in database."""
         # Setup mocks
@@ -114,7 +114,7 @@ class TestCargoErrorHandling:
             assert "not found" in result["failure_reason"]
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_no_cargo_on_flight(self, mock_boto3):
         """Test handling when flight has no cargo."""
         # Setup mocks
@@ -172,7 +172,7 @@ class TestCargoErrorHandling:
             assert isinstance(e, (TypeError, AttributeError))
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_database_timeout(self, mock_boto3):
         """Test handling of database timeout."""
         # Setup mocks
@@ -213,7 +213,7 @@ class TestCargoErrorHandling:
             assert "timeout" in result["failure_reason"].lower()
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_partial_data_available(self, mock_boto3):
         """Test handling when only partial cargo data is available."""
         # Setup mocks
@@ -17,7 +17,7 @@ class TestCargoNaturalLanguage:
     """Test suite for Cargo Agent natural language processing."""
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_extract_flight_info_standard_format(self, mock_boto3):
         """Test extraction of flight info from standard format prompt."""
         # Setup mocks
@@ -59,7 +59,7 @@ class TestCargoNaturalLanguage:
             assert result["extracted_flight_info"]["date"] == "2026-01-20"
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_extract_flight_info_relative_date(self, mock_boto3):
         """Test extraction with relative date (yesterday, today, tomorrow)."""
         # Setup mocks
@@ -135,7 +135,7 @@ class TestCargoNaturalLanguage:
         assert "date" in result["missing_data"]
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_extract_flight_info_numeric_date(self, mock_boto3):
         """Test extraction with numeric date format."""
         # Setup mocks
@@ -173,7 +173,7 @@ class TestCargoNaturalLanguage:
             assert result["extracted_flight_info"]["date"] == "2026-01-20"
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_revision_phase_with_other_recommendations(self, mock_boto3):
         """Test cargo agent in revision phase with other agents' recommendations."""
         # Setup mocks
@@ -227,7 +227,7 @@ class TestCargoNaturalLanguage:
             assert "OTHER AGENTS' RECOMMENDATIONS" in system_message
 
     @pytest.mark.asyncio
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     async def test_extract_disruption_event(self, mock_boto3):
         """Test extraction of disruption event description."""
         # Setup mocks
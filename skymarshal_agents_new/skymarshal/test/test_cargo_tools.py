@@ -21,7 +21,7 @@ from agents.cargo.agent import (
 class TestCargoTools:
     """Test suite for Cargo Agent DynamoDB query tools."""
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_flight_success(self, mock_boto3):
         """Test successful flight query using flight-number-date-index GSI."""
         # Setup mock
@@ -56,7 +56,7 @@ class TestCargoTools:
         call_kwargs = mock_table.query.call_args[1]
         assert call_kwargs["IndexName"] == "flight-number-date-index"
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_flight_not_found(self, mock_boto3):
         """Test flight query when flight doesn't exist."""
         # Setup mock
@@ -70,7 +70,7 @@ class TestCargoTools:
         # Verify
         assert result is None
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_cargo_manifest_success(self, mock_boto3):
         """Test successful cargo manifest query using flight-loading-index GSI."""
         # Setup mock
@@ -110,7 +110,7 @@ class TestCargoTools:
         call_kwargs = mock_table.query.call_args[1]
         assert call_kwargs["IndexName"] == "flight-loading-index"
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_cargo_manifest_empty(self, mock_boto3):
         """Test cargo manifest query when no cargo exists."""
         # Setup mock
@@ -124,7 +124,7 @@ class TestCargoTools:
         # Verify
         assert result == []
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_shipment_details_success(self, mock_boto3):
         """Test successful shipment details query."""
         # Setup mock
@@ -156,7 +156,7 @@ class TestCargoTools:
         assert result["value_usd"] == 125000
         assert "RRW" in result["special_handling_codes"]
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_shipment_details_not_found(self, mock_boto3):
         """Test shipment details query when shipment doesn't exist."""
         # Setup mock
@@ -170,7 +170,7 @@ class TestCargoTools:
         # Verify
         assert result is None
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_shipment_by_awb_success(self, mock_boto3):
         """Test successful shipment query by AWB number."""
         # Setup mock
@@ -196,7 +196,7 @@ class TestCargoTools:
         assert result["shipment_id"] == "SHP-12345"
         assert result["awb_number"] == "607-12345678"
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_shipment_by_awb_not_found(self, mock_boto3):
         """Test shipment query by AWB when shipment doesn't exist."""
         # Setup mock
@@ -226,7 +226,7 @@ class TestCargoTools:
         assert "CrewRoster" not in authorized_tables
         assert "MaintenanceWorkOrders" not in authorized_tables
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_flight_uses_correct_table(self, mock_boto3):
         """Test that query_flight uses the flights table."""
         # Setup mock
@@ -242,7 +242,7 @@ class TestCargoTools:
         # Verify correct table accessed
         mock_dynamodb.Table.assert_called_once_with("flights")
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_cargo_manifest_uses_correct_table(self, mock_boto3):
         """Test that query_cargo_manifest uses CargoFlightAssignments table."""
         # Setup mock
@@ -258,7 +258,7 @@ class TestCargoTools:
         # Verify correct table accessed
         mock_dynamodb.Table.assert_called_once_with("CargoFlightAssignments")
 
-    @patch("agents.cargo.agent.boto3.resource")
+    @patch("agents.cargo.agent.get_dynamodb_resource")
     def test_query_shipment_details_uses_correct_table(self, mock_boto3):
         """Test that query_shipment_details uses CargoShipments table."""
         # Setup mock
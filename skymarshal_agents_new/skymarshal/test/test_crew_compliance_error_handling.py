@@ -154,13 +154,13 @@ class TestFlightInfoExtractionErrors:
 class TestQueryFlightErrors:
     """Test error handling in query_flight tool."""
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_flight_not_found(self, mock_boto3):
         """Test handling when flight is not found in database."""
         # Mock DynamoDB to return empty results
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_flight.invoke({"flight_number": "EY999", "date": "2026-01-20"})
         
@@ -171,13 +171,13 @@ class TestQueryFlightErrors:
         assert result["date"] == "2026-01-20"
         assert "suggestion" in result
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_flight_database_error(self, mock_boto3):
         """Test handling of database errors during flight query."""
         # Mock DynamoDB to raise exception
         mock_table = Mock()
         mock_table.query.side_effect = Exception("DynamoDB connection timeout")
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_flight.invoke({"flight_number": "EY123", "date": "2026-01-20"})
         
@@ -189,7 +189,7 @@ class TestQueryFlightErrors:
         assert "error_type" in result
         assert "suggestion" in result
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_flight_success(self, mock_boto3):
         """Test successful flight query returns flight data."""
         # Mock DynamoDB to return flight data
@@ -202,7 +202,7 @@ class TestQueryFlightErrors:
                 "aircraft_registration": "A6-ABC"
             }]
         }
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_flight.invoke({"flight_number": "EY123", "date": "2026-01-20"})
         
@@ -214,13 +214,13 @@ class TestQueryFlightErrors:
 class TestQueryCrewRosterErrors:
     """Test error handling in query_crew_roster tool."""
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_crew_roster_not_found(self, mock_boto3):
         """Test handling when crew roster is not found."""
         # Mock DynamoDB to return empty results
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_roster.invoke({"flight_id": "999"})
         
@@ -232,13 +232,13 @@ class TestQueryCrewRosterErrors:
         assert result[0]["flight_id"] == "999"
         assert "suggestion" in result[0]
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_crew_roster_database_error(self, mock_boto3):
         """Test handling of database errors during crew roster query."""
         # Mock DynamoDB to raise exception
         mock_table = Mock()
         mock_table.query.side_effect = Exception("Table not accessible")
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_roster.invoke({"flight_id": "1"})
         
@@ -251,7 +251,7 @@ class TestQueryCrewRosterErrors:
         assert "error_type" in result[0]
         assert "suggestion" in result[0]
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_crew_roster_success(self, mock_boto3):
         """Test successful crew roster query returns crew data."""
         # Mock DynamoDB to return crew roster
@@ -262,7 +262,7 @@ class TestQueryCrewRosterErrors:
                 {"crew_id": "6", "position": "First Officer"}
             ]
         }
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_roster.invoke({"flight_id": "1"})
         
@@ -276,13 +276,13 @@ class TestQueryCrewRosterErrors:
 class TestQueryCrewMembersErrors:
     """Test error handling in query_crew_members tool."""
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_crew_member_not_found(self, mock_boto3):
         """Test handling when crew member is not found."""
         # Mock DynamoDB to return no item
         mock_table = Mock()
         mock_table.get_item.return_value = {}  # No Item key
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_members.invoke({"crew_id": "999"})
         
@@ -292,13 +292,13 @@ class TestQueryCrewMembersErrors:
         assert result["crew_id"] == "999"
         assert "suggestion" in result
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_crew_members_database_error(self, mock_boto3):
         """Test handling of database errors during crew member query."""
         # Mock DynamoDB to raise exception
         mock_table = Mock()
         mock_table.get_item.side_effect = Exception("Access denied")
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_members.invoke({"crew_id": "5"})
         
@@ -309,7 +309,7 @@ class TestQueryCrewMembersErrors:
         assert "error_type" in result
         assert "suggestion" in result
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_crew_members_success(self, mock_boto3):
         """Test successful crew member query returns member data."""
         # Mock DynamoDB to return crew member
@@ -321,7 +321,7 @@ class TestQueryCrewMembersErrors:
                 "type_ratings": ["A380"]
             }
         }
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_members.invoke({"crew_id": "5"})
         
@@ -333,12 +333,12 @@ class TestQueryCrewMembersErrors:
 class TestErrorMessageClarity:
     """Test that error messages are clear and actionable."""
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_flight_not_found_message_clarity(self, mock_boto3):
         """Test that flight not found error message is clear."""
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_flight.invoke({"flight_number": "EY999", "date": "2026-01-20"})
         
@@ -352,12 +352,12 @@ class TestErrorMessageClarity:
         assert "suggestion" in result
         assert len(result["suggestion"]) > 20  # Meaningful suggestion
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_crew_roster_not_found_message_clarity(self, mock_boto3):
         """Test that crew roster not found error message is clear."""
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_roster.invoke({"flight_id": "999"})
         
@@ -370,12 +370,12 @@ class TestErrorMessageClarity:
         assert "suggestion" in result[0]
         assert len(result[0]["suggestion"]) > 20
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_crew_member_not_found_message_clarity(self, mock_boto3):
         """Test that crew member not found error message is clear."""
         mock_table = Mock()
         mock_table.get_item.return_value = {}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_members.invoke({"crew_id": "999"})
         
@@ -392,12 +392,12 @@ class TestErrorMessageClarity:
 class TestErrorResponseStructure:
     """Test that error responses have consistent structure."""
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_flight_error_structure(self, mock_boto3):
         """Test query_flight error response has required fields."""
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_flight.invoke({"flight_number": "EY999", "date": "2026-01-20"})
         
@@ -408,12 +408,12 @@ class TestErrorResponseStructure:
         assert "flight_number" in result
         assert "date" in result
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_crew_roster_error_structure(self, mock_boto3):
         """Test query_crew_roster error response has required fields."""
         mock_table = Mock()
         mock_table.query.return_value = {"Items": []}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_roster.invoke({"flight_id": "999"})
         
@@ -423,12 +423,12 @@ class TestErrorResponseStructure:
         assert "suggestion" in result[0]
         assert "flight_id" in result[0]
 
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     def test_query_crew_members_error_structure(self, mock_boto3):
         """Test query_crew_members error response has required fields."""
         mock_table = Mock()
         mock_table.get_item.return_value = {}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         result = query_crew_members.invoke({"crew_id": "999"})
         
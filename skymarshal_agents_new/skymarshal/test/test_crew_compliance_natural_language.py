@@ -26,7 +26,7 @@ class TestVariousPromptPhrasings:
     """Test agent handles different ways of expressing the same information."""
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_standard_phrasing(self, mock_boto3):
         """Test: 'Flight EY123 on January 20th had a mechanical failure'"""
         # Mock flight info extraction
@@ -62,7 +62,7 @@ class TestVariousPromptPhrasings:
             assert result["extracted_flight_info"]["disruption_event"] == "mechanical failure"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_casual_phrasing(self, mock_boto3):
         """Test: 'EY456 yesterday was delayed 3 hours due to weather'"""
         llm = Mock()
@@ -92,7 +92,7 @@ class TestVariousPromptPhrasings:
             assert result["extracted_flight_info"]["date"] == "2026-01-31"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_formal_phrasing(self, mock_boto3):
         """Test: 'Flight EY789 on 20/01/2026 needs crew assessment for 2-hour delay'"""
         llm = Mock()
@@ -122,7 +122,7 @@ class TestVariousPromptPhrasings:
             assert result["extracted_flight_info"]["date"] == "2026-01-20"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_minimal_phrasing(self, mock_boto3):
         """Test: 'EY111 today delay'"""
         llm = Mock()
@@ -151,7 +151,7 @@ class TestVariousPromptPhrasings:
             assert result["extracted_flight_info"]["flight_number"] == "EY111"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_verbose_phrasing(self, mock_boto3):
         """Test: Long descriptive prompt with embedded flight info"""
         llm = Mock()
@@ -187,7 +187,7 @@ class TestDateFormats:
     """Test agent handles various date formats correctly."""
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_relative_date_yesterday(self, mock_boto3):
         """Test relative date: 'yesterday'"""
         llm = Mock()
@@ -216,7 +216,7 @@ class TestDateFormats:
             assert result["extracted_flight_info"]["date"] == "2026-01-31"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_relative_date_today(self, mock_boto3):
         """Test relative date: 'today'"""
         llm = Mock()
@@ -245,7 +245,7 @@ class TestDateFormats:
             assert result["extracted_flight_info"]["date"] == "2026-02-01"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_relative_date_tomorrow(self, mock_boto3):
         """Test relative date: 'tomorrow'"""
         llm = Mock()
@@ -274,7 +274,7 @@ class TestDateFormats:
             assert result["extracted_flight_info"]["date"] == "2026-02-02"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_named_date_format_1(self, mock_boto3):
         """Test named date: 'January 20th'"""
         llm = Mock()
@@ -303,7 +303,7 @@ class TestDateFormats:
             assert result["extracted_flight_info"]["date"] == "2026-01-20"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_named_date_format_2(self, mock_boto3):
         """Test named date: '20 Jan'"""
         llm = Mock()
@@ -332,7 +332,7 @@ class TestDateFormats:
             assert result["extracted_flight_info"]["date"] == "2026-01-20"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_named_date_format_3(self, mock_boto3):
         """Test named date: '20th January 2026'"""
         llm = Mock()
@@ -361,7 +361,7 @@ class TestDateFormats:
             assert result["extracted_flight_info"]["date"] == "2026-01-20"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_numeric_date_format_ddmmyyyy(self, mock_boto3):
         """Test numeric date: '20/01/2026' (European format)"""
         llm = Mock()
@@ -390,7 +390,7 @@ class TestDateFormats:
             assert result["extracted_flight_info"]["date"] == "2026-01-20"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_numeric_date_format_ddmmyy(self, mock_boto3):
         """Test numeric date: '20-01-26' (short year)"""
         llm = Mock()
@@ -419,7 +419,7 @@ class TestDateFormats:
             assert result["extracted_flight_info"]["date"] == "2026-01-20"
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_numeric_date_format_iso(self, mock_boto3):
         """Test numeric date: '2026-01-20' (ISO format)"""
         llm = Mock()
@@ -597,7 +597,7 @@ class TestRevisionPhase:
     """Test agent handles revision phase correctly."""
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_revision_phase_with_other_recommendations(self, mock_boto3):
         """Test agent receives and processes other agents' recommendations in revision phase"""
         llm = Mock()
@@ -637,7 +637,7 @@ class TestExtractedFlightInfoInResponse:
     """Test that extracted flight info is included in all responses."""
 
     @pytest.mark.asyncio
-    @patch('agents.crew_compliance.agent.boto3')
+    @patch('agents.crew_compliance.agent.get_dynamodb_resource')
     async def test_extracted_info_in_success_response(self, mock_boto3):
         """Test extracted flight info is included in successful response"""
         llm = Mock()
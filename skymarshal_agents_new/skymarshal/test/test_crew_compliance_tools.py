@@ -86,7 +86,7 @@ class TestCrewComplianceTools:
         # Verify response structure
         assert result["crew_count"] == 0
         assert result["roster"] == []
-        assert result["crew_members"] == []
+        assert "crew_members" not in result
         assert result["query_count"] == 1  # Only roster query
 
     def test_query_crew_roster_and_members_enriches_data(self, mock_db_client):
@@ -183,3 +183,184 @@ class TestCrewComplianceTools:
         
         # Verify roster still contains all entries
         assert len(result["roster"]) == 3
+
+
+class TestCrewFdpCalculator:
+    """Test the deterministic FDP/rest/qualification evaluator"""
+
+    def _roster(self, positions, start="2026-01-20T06:00:00Z", end="2026-01-20T16:00:00Z"):
+        return [
+            {"crew_id": f"C{i}", "position": position, "duty_start_utc": start, "duty_end_utc": end}
+            for i, position in enumerate(positions, start=1)
+        ]
+
+    def test_fdp_includes_delay_and_bands_risk(self):
+        """Test FDP = duty_end - duty_start + delay, banded against the 13h two-pilot limit"""
+        from agents.crew_compliance import evaluate_crew_fdp
+
+        result = evaluate_crew_fdp(self._roster(["Captain", "First_Officer"]), delay_minutes=120)
+
+        assert result["pilot_count"] == 2
+        assert result["max_fdp_hours"] == 13.0
+        captain = result["crew"][0]
+        assert captain["fdp_hours"] == 12.0
+        assert captain["margin_hours"] == 1.0
+        assert captain["utilization_pct"] == 92.3
+        assert captain["risk_band"] == "HIGH"
+        assert captain["min_rest_after_hours"] == 12.0  # FDP > 10h -> 1:1 rest
+        assert captain["status"] == "COMPLIANT"
+
+    def test_fdp_violation_requires_crew_change(self):
+        """Test FDP over the limit is a violation and triggers crew change"""
+        from agents.crew_compliance import evaluate_crew_fdp
+
+        result = evaluate_crew_fdp(self._roster(["Captain", "First_Officer", "Purser"]), delay_minutes=240)
+
+        assert all(c["risk_band"] == "VIOLATION" for c in result["crew"])
+        assert result["summary"]["worst_risk_band"] == "VIOLATION"
+        assert result["summary"]["crew_change_required"] is True
+        assert result["summary"]["mandatory_replacements"] == ["C1", "C3"]
+
+    def test_augmented_crew_uses_higher_limit(self):
+        """Test three and four pilot crews get 16h and 18h limits"""
+        from agents.crew_compliance import evaluate_crew_fdp
+
+        three = evaluate_crew_fdp(self._roster(["Captain", "First_Officer", "First_Officer"]))
+        four = evaluate_crew_fdp(self._roster(["Captain", "Captain", "First_Officer", "First_Officer"]))
+
+        assert three["max_fdp_hours"] == 16.0
+        assert four["max_fdp_hours"] == 18.0
+        assert four["crew"][0]["risk_band"] == "LOW"
+
+    def test_short_fdp_rest_and_long_haul_minimum(self):
+        """Test rest rules: FDP <= 10h -> 12h, long-haul -> 18h"""
+        from agents.crew_compliance import evaluate_crew_fdp
+
+        roster = self._roster(["Captain"], end="2026-01-20T14:00:00Z")
+        assert evaluate_crew_fdp(roster)["crew"][0]["min_rest_after_hours"] == 12.0
+        assert evaluate_crew_fdp(roster, long_haul=True)["crew"][0]["min_rest_after_hours"] == 18.0
+
+    def test_qualification_and_data_gap_issues(self):
+        """Test missing type rating is flagged and missing duty times are data gaps"""
+        from agents.crew_compliance import evaluate_crew_fdp
+
+        roster = self._roster(["Captain", "First_Officer"])
+        roster.append({"crew_id": "C3", "position": "Flight_Attendant"})
+        crew_members = {"C2": {"crew_id": "C2", "type_ratings": ["B777"]}}
+
+        result = evaluate_crew_fdp(roster, crew_members=crew_members, aircraft_type="A380")
+
+        assert result["crew"][1]["issues"] == ["No A380 type rating"]
+        assert result["crew"][1]["status"] == "NON_COMPLIANT"
+        assert result["crew"][2]["status"] == "DATA_GAP"
+        assert result["summary"]["data_gaps"] == 1
+
+    def test_v1_roster_position_ids(self):
+        """Test V1 rosters (numeric position_id, '%Y-%m-%d %H:%M:%S' duty times) are classified by role"""
+        from decimal import Decimal
+        from agents.crew_compliance import evaluate_crew_fdp
+
+        roster = [
+            {"crew_id": f"C{i}", "position_id": Decimal(position_id),
+             "duty_start": "2026-01-20 06:00:00", "duty_end": "2026-01-20 20:00:00"}
+            for i, position_id in enumerate([1, 2, 7, 3, 5], start=1)
+        ]
+
+        result = evaluate_crew_fdp(roster, delay_minutes=180)
+
+        assert result["pilot_count"] == 3
+        assert result["max_fdp_hours"] == 16.0
+        assert [c["position"] for c in result["crew"]] == [
+            "Captain", "First Officer", "Relief Pilot", "Cabin Manager", "Flight Attendant"
+        ]
+        assert result["crew"][0]["fdp_hours"] == 17.0
+        assert result["crew"][0]["risk_band"] == "VIOLATION"
+        assert result["summary"]["mandatory_replacements"] == ["C1", "C4"]
+
+    def test_position_names_match_roles_not_prefixes(self):
+        """Test role names: Check Captain is a pilot, Cabin Manager is senior cabin"""
+        from agents.crew_compliance.fdp import is_pilot, is_senior
+
+        assert is_pilot("Check Captain") and is_pilot(8) and is_pilot("RELIEF_PILOT")
+        assert is_senior("Cabin Manager") and is_senior("3") and is_senior("Check Captain")
+        assert not is_pilot("Cabin Manager") and not is_pilot("Flight Attendant")
+        assert not is_senior("First Officer") and not is_senior(5)
+
+    def test_long_haul_flight_and_positioning_rest(self):
+        """Test the tool applies 18h rest for a long-haul flight and 10h rest before duty when positioning"""
+        from agents.crew_compliance.agent import calculate_crew_fdp
+
+        roster = self._roster(["Captain", "First_Officer"], end="2026-01-20T14:00:00Z")
+        for item in roster:
+            item["previous_duty_end_utc"] = "2026-01-19T19:00:00Z"  # 11h rest before duty
+        mock_resource = MagicMock()
+        mock_resource.Table.return_value.query.return_value = {"Items": roster}
+        mock_resource.Table.return_value.get_item.return_value = {"Item": {
+            "flight_id": "1",
+            "scheduled_departure": "2026-01-20 08:00:00",
+            "scheduled_arrival": "2026-01-20 15:30:00",
+        }}
+        mock_resource.batch_get_item.return_value = {"Responses": {}, "UnprocessedKeys": {}}
+
+        with patch("agents.crew_compliance.agent.get_dynamodb_resource", return_value=mock_resource):
+            standard = json.loads(calculate_crew_fdp.invoke({"flight_id": "1"}))
+            positioned = json.loads(calculate_crew_fdp.invoke({"flight_id": "1", "positioning": True}))
+
+        mock_resource.Table.return_value.get_item.assert_called_with(Key={"flight_id": "1"})
+        assert standard["long_haul"] is True
+        assert standard["crew"][0]["min_rest_after_hours"] == 18.0
+        assert standard["crew"][0]["issues"] == ["Rest before duty 11.0h below 12h minimum"]
+        assert positioned["crew"][0]["min_rest_before_hours"] == 10.0
+        assert positioned["crew"][0]["status"] == "COMPLIANT"
+
+    def test_calculate_crew_fdp_tool(self):
+        """Test the agent tool loads roster and crew members then evaluates"""
+        from agents.crew_compliance.agent import calculate_crew_fdp
+
+        mock_resource = MagicMock()
+        mock_resource.Table.return_value.query.return_value = {
+            "Items": self._roster(["Captain", "First_Officer"])
+        }
+        mock_resource.Table.return_value.get_item.return_value = {"Item": {"flight_id": "1"}}
+        mock_resource.batch_get_item.return_value = {
+            "Responses": {"CrewMembers": [{"crew_id": "C1", "type_ratings": ["A380"]}]},
+            "UnprocessedKeys": {}
+        }
+
+        with patch("agents.crew_compliance.agent.get_dynamodb_resource", return_value=mock_resource):
+            result = json.loads(calculate_crew_fdp.invoke(
+                {"flight_id": "1", "delay_minutes": 60, "aircraft_type": "A380"}
+            ))
+
+        assert result["flight_id"] == "1"
+        assert result["crew"][0]["fdp_hours"] == 11.0
+        assert mock_resource.batch_get_item.call_count == 1
+
+    def test_calculate_crew_fdp_batches_and_retries_crew_members(self):
+        """Test crew member lookups go in 100-key batches with backoff on unprocessed keys"""
+        from agents.crew_compliance.agent import calculate_crew_fdp
+
+        mock_resource = MagicMock()
+        mock_resource.Table.return_value.query.return_value = {
+            "Items": self._roster(["Captain", "First_Officer"] * 60)
+        }
+        mock_resource.Table.return_value.get_item.return_value = {"Item": {"flight_id": "1"}}
+
+        def batch_get_item(**kwargs):
+            keys = kwargs["RequestItems"]["CrewMembers"]["Keys"]
+            if mock_resource.batch_get_item.call_count == 1:
+                return {"Responses": {"CrewMembers": keys[:10]},
+                        "UnprocessedKeys": {"CrewMembers": {"Keys": keys[10:]}}}
+            return {"Responses": {"CrewMembers": keys}, "UnprocessedKeys": {}}
+
+        mock_resource.batch_get_item.side_effect = batch_get_item
+
+        with patch("agents.crew_compliance.agent.get_dynamodb_resource", return_value=mock_resource), \
+                patch("database.dynamodb.time.sleep") as sleep:
+            result = json.loads(calculate_crew_fdp.invoke({"flight_id": "1"}))
+
+        batch_sizes = [len(c.kwargs["RequestItems"]["CrewMembers"]["Keys"])
+                       for c in mock_resource.batch_get_item.call_args_list]
+        assert batch_sizes == [100, 90, 20]
+        assert sleep.call_count == 1
+        assert len(result["crew"]) == 120
@@ -0,0 +1,79 @@
+"""
+Unit tests for utils.extraction.
+
+Covers reuse of orchestrator-resolved flight info so agents skip their own
+structured-output extraction.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from agents.schemas import FlightInfo
+from utils.extraction import format_flight_record, resolve_flight_info
+
+
+class TestResolveFlightInfo:
+    """Tests for resolve_flight_info."""
+
+    @pytest.mark.asyncio
+    async def test_uses_resolved_flight_info_without_llm_call(self):
+        """Pre-resolved flight info is validated and returned without extraction."""
+        llm = Mock()
+        payload = {
+            "flight_info": {
+                "flight_number": "ey123",
+                "date": "2026-01-20",
+                "disruption_event": "mechanical failure",
+            }
+        }
+
+        result = await resolve_flight_info(llm, FlightInfo, "prompt", payload)
+
+        assert isinstance(result, FlightInfo)
+        assert result.flight_number == "EY123"
+        llm.with_structured_output.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_resolved_flight_info_raises(self):
+        """Pre-resolved flight info still goes through FlightInfo validation."""
+        payload = {
+            "flight_info": {
+                "flight_number": "AA123",
+                "date": "2026-01-20",
+                "disruption_event": "delay",
+            }
+        }
+
+        with pytest.raises(ValueError):
+            await resolve_flight_info(Mock(), FlightInfo, "prompt", payload)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_extraction(self):
+        """Without flight_info in the payload, extraction runs as before."""
+        extracted = FlightInfo(
+            flight_number="EY123", date="2026-01-20", disruption_event="delay"
+        )
+        with patch(
+            "utils.extraction.extract_with_fallback", AsyncMock(return_value=extracted)
+        ) as mock_extract:
+            result = await resolve_flight_info(Mock(), FlightInfo, "prompt", {"phase": "initial"})
+
+        assert result is extracted
+        mock_extract.assert_awaited_once()
+
+
+class TestFormatFlightRecord:
+    """Tests for format_flight_record."""
+
+    def test_empty_without_flight(self):
+        assert format_flight_record({}) == ""
+        assert format_flight_record({"flight": None}) == ""
+
+    def test_formats_compact_record(self):
+        result = format_flight_record({"flight": {"flight_id": "1", "origin": "AUH"}})
+        assert result == '  <flight_record>{"flight_id":"1","origin":"AUH"}</flight_record>\n'
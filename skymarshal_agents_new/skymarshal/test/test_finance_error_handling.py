@@ -22,7 +22,7 @@ from agents.finance.agent import (
 class TestFlightNotFoundHandling:
     """Test Finance agent handles missing flight records."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_flight_returns_none_when_not_found(self, mock_boto3):
         """Test that query_flight returns None when flight not found."""
         # Setup mock
@@ -38,7 +38,7 @@ class TestFlightNotFoundHandling:
         # Verify
         assert result is None
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_flight_handles_invalid_flight_number(self, mock_boto3):
         """Test that query_flight handles invalid flight numbers."""
         # Setup mock
@@ -58,7 +58,7 @@ class TestFlightNotFoundHandling:
 class TestDatabaseErrorHandling:
     """Test Finance agent handles database errors gracefully."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_flight_handles_dynamodb_exception(self, mock_boto3):
         """Test that query_flight handles DynamoDB exceptions."""
         # Setup mock to raise exception
@@ -70,7 +70,7 @@ class TestDatabaseErrorHandling:
         # Verify - should return None, not propagate exception
         assert result is None
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_passenger_bookings_handles_exception(self, mock_boto3):
         """Test that query_passenger_bookings handles exceptions."""
         # Setup mock to raise exception
@@ -82,7 +82,7 @@ class TestDatabaseErrorHandling:
         # Verify - should return empty list, not propagate exception
         assert result == []
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_cargo_revenue_handles_exception(self, mock_boto3):
         """Test that query_cargo_revenue handles exceptions."""
         # Setup mock to raise exception
@@ -94,7 +94,7 @@ class TestDatabaseErrorHandling:
         # Verify - should return empty list, not propagate exception
         assert result == []
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_maintenance_costs_handles_exception(self, mock_boto3):
         """Test that query_maintenance_costs handles exceptions."""
         # Setup mock to raise exception
@@ -110,7 +110,7 @@ class TestDatabaseErrorHandling:
 class TestEmptyDataHandling:
     """Test Finance agent handles empty query results."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_passenger_bookings_empty_result(self, mock_boto3):
         """Test that query_passenger_bookings handles empty results."""
         # Setup mock
@@ -127,7 +127,7 @@ class TestEmptyDataHandling:
         assert result == []
         assert isinstance(result, list)
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_cargo_revenue_empty_result(self, mock_boto3):
         """Test that query_cargo_revenue handles empty results."""
         # Setup mock
@@ -144,7 +144,7 @@ class TestEmptyDataHandling:
         assert result == []
         assert isinstance(result, list)
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_maintenance_costs_empty_result(self, mock_boto3):
         """Test that query_maintenance_costs handles empty results."""
         # Setup mock
@@ -165,7 +165,7 @@ class TestEmptyDataHandling:
 class TestMissingFieldHandling:
     """Test Finance agent handles missing fields in query results."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_passenger_bookings_missing_fare_field(self, mock_boto3):
         """Test that query_passenger_bookings handles missing fare_paid field."""
         # Setup mock with incomplete data
@@ -188,7 +188,7 @@ class TestMissingFieldHandling:
         assert result[0]["booking_id"] == "B001"
         assert "fare_paid" not in result[0]
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_cargo_revenue_missing_revenue_field(self, mock_boto3):
         """Test that query_cargo_revenue handles missing revenue_usd field."""
         # Setup mock with incomplete data
@@ -214,7 +214,7 @@ class TestMissingFieldHandling:
 class TestInvalidInputHandling:
     """Test Finance agent handles invalid inputs."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_flight_with_empty_flight_number(self, mock_boto3):
         """Test that query_flight handles empty flight number."""
         # Setup mock
@@ -230,7 +230,7 @@ class TestInvalidInputHandling:
         # Verify - should handle gracefully
         assert result is None or result == []
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_flight_with_empty_date(self, mock_boto3):
         """Test that query_flight handles empty date."""
         # Setup mock
@@ -246,7 +246,7 @@ class TestInvalidInputHandling:
         # Verify - should handle gracefully
         assert result is None or result == []
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_passenger_bookings_with_invalid_flight_id(self, mock_boto3):
         """Test that query_passenger_bookings handles invalid flight_id."""
         # Setup mock
@@ -266,7 +266,7 @@ class TestInvalidInputHandling:
 class TestPartialDataHandling:
     """Test Finance agent handles partial data scenarios."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_flight_found_but_no_bookings(self, mock_boto3):
         """Test scenario where flight exists but has no bookings."""
         # This tests the agent's ability to handle flights with no passengers
@@ -283,7 +283,7 @@ class TestPartialDataHandling:
         # Verify - empty list is valid (ferry flight, cargo-only, etc.)
         assert result == []
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_flight_found_but_no_cargo(self, mock_boto3):
         """Test scenario where flight exists but has no cargo."""
         # Setup mock
@@ -299,7 +299,7 @@ class TestPartialDataHandling:
         # Verify - empty list is valid (passenger-only flight)
         assert result == []
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_aircraft_with_no_maintenance(self, mock_boto3):
         """Test scenario where aircraft has no maintenance work orders."""
         # Setup mock
@@ -319,7 +319,7 @@ class TestPartialDataHandling:
 class TestConcurrentQueryHandling:
     """Test Finance agent handles concurrent query scenarios."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_multiple_queries_in_sequence(self, mock_boto3):
         """Test that multiple queries can be executed in sequence."""
         # Setup mock
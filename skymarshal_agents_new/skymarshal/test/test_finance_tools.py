@@ -66,7 +66,7 @@ class TestFinanceAgentTools:
 class TestQueryFlightTool:
     """Test query_flight tool implementation."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_flight_uses_gsi(self, mock_boto3):
         """Test that query_flight uses flight-number-date-index GSI."""
         # Setup mock
@@ -92,7 +92,7 @@ class TestQueryFlightTool:
         assert result is not None
         assert result["flight_id"] == "EY123-20260120"
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_flight_not_found(self, mock_boto3):
         """Test query_flight returns None when flight not found."""
         # Setup mock
@@ -108,7 +108,7 @@ class TestQueryFlightTool:
         # Verify
         assert result is None
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_flight_handles_errors(self, mock_boto3):
         """Test query_flight handles DynamoDB errors gracefully."""
         # Setup mock to raise exception
@@ -124,7 +124,7 @@ class TestQueryFlightTool:
 class TestQueryPassengerBookingsTool:
     """Test query_passenger_bookings tool implementation."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_passenger_bookings_uses_gsi(self, mock_boto3):
         """Test that query_passenger_bookings uses flight-id-index GSI."""
         # Setup mock
@@ -149,7 +149,7 @@ class TestQueryPassengerBookingsTool:
         assert len(result) == 2
         assert result[0]["booking_id"] == "B001"
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_passenger_bookings_empty(self, mock_boto3):
         """Test query_passenger_bookings returns empty list when no bookings."""
         # Setup mock
@@ -169,7 +169,7 @@ class TestQueryPassengerBookingsTool:
 class TestQueryCargoRevenueTool:
     """Test query_cargo_revenue tool implementation."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_cargo_revenue_uses_gsi(self, mock_boto3):
         """Test that query_cargo_revenue uses flight-loading-index GSI."""
         # Setup mock
@@ -198,7 +198,7 @@ class TestQueryCargoRevenueTool:
 class TestQueryMaintenanceCostsTool:
     """Test query_maintenance_costs tool implementation."""
 
-    @patch("agents.finance.agent.boto3.resource")
+    @patch("agents.finance.agent.get_dynamodb_resource")
     def test_query_maintenance_costs_uses_gsi(self, mock_boto3):
         """Test that query_maintenance_costs uses aircraft-registration-index GSI."""
         # Setup mock
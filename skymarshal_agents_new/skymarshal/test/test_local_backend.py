@@ -0,0 +1,202 @@
+"""Unit tests for the in-process DynamoDB stand-in backend"""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+
+from checkpoint.saver import CheckpointSaver
+from database.dynamodb import DynamoDBClient
+from database.local_backend import LocalDynamoDB
+from database.pagination import iter_query_pages
+
+
+FLIGHTS_CSV = """flight_id,flight_number,scheduled_departure_utc,aircraft_registration,delay_minutes
+FLT-2,EY123,2026-01-21T08:00:00Z,A6-APX,45
+FLT-1,EY123,2026-01-20T08:00:00Z,A6-APX,
+FLT-3,EY456,2026-01-20T09:00:00Z,A6-BLA,0
+"""
+
+PASSENGERS_CSV = """passenger_id,first_leg_flight_id,frequent_flyer_tier,cabin_class,fare_paid,is_vip
+P1,FLT-1,Gold,Business,1200.50,true
+P2,FLT-1,,Economy,300,false
+P3,FLT-2,Gold,Economy,250,no
+"""
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Local store loaded from V2 CSVs in a temporary data directory"""
+    (tmp_path / "v2").mkdir()
+    (tmp_path / "v2" / "flights.csv").write_text(FLIGHTS_CSV)
+    (tmp_path / "v2" / "passengers.csv").write_text(PASSENGERS_CSV)
+    local = LocalDynamoDB()
+    local.load_directory(str(tmp_path))
+    return local
+
+
+class TestLoading:
+    """Test CSV loading and typing"""
+
+    def test_loads_mapped_csvs_with_import_typing(self, store):
+        item = store.Table("passengers_v2").get_item(Key={"passenger_id": "P1"})["Item"]
+
+        assert store.get_stats() == {"flights_v2": 3, "passengers_v2": 3}
+        assert item["fare_paid"] == Decimal("1200.50")
+        assert item["is_vip"] is True
+        assert item["first_leg_flight_id"] == "FLT-1"
+
+    def test_empty_cells_are_omitted(self, store):
+        item = store.Table("flights_v2").get_item(Key={"flight_id": "FLT-1"})["Item"]
+
+        assert "delay_minutes" not in item
+
+
+class TestQuery:
+    """Test GSI emulation and expressions"""
+
+    def test_gsi_query_with_sort_key_condition(self, store):
+        response = store.Table("flights_v2").query(
+            IndexName="flight-number-date-index",
+            KeyConditionExpression="flight_number = :fn AND begins_with(scheduled_departure_utc, :sd)",
+            ExpressionAttributeValues={":fn": "EY123", ":sd": "2026-01-21"},
+        )
+
+        assert [i["flight_id"] for i in response["Items"]] == ["FLT-2"]
+
+    def test_results_sorted_by_index_sort_key(self, store):
+        table = store.Table("flights_v2")
+        kwargs = {
+            "IndexName": "flight-number-date-index",
+            "KeyConditionExpression": Key("flight_number").eq("EY123"),
+        }
+
+        assert [i["flight_id"] for i in table.query(**kwargs)["Items"]] == ["FLT-1", "FLT-2"]
+        assert [i["flight_id"] for i in table.query(ScanIndexForward=False, **kwargs)["Items"]] == ["FLT-2", "FLT-1"]
+
+    def test_limit_pages_with_last_evaluated_key(self, store):
+        table = store.Table("passengers_v2")
+
+        first = table.query(
+            IndexName="first-leg-flight-index",
+            KeyConditionExpression="first_leg_flight_id = :fid",
+            ExpressionAttributeValues={":fid": "FLT-1"},
+            Limit=1,
+        )
+        pages = list(iter_query_pages(
+            table,
+            page_size=1,
+            IndexName="first-leg-flight-index",
+            KeyConditionExpression="first_leg_flight_id = :fid",
+            ExpressionAttributeValues={":fid": "FLT-1"},
+        ))
+
+        assert len(first["Items"]) == 1 and "LastEvaluatedKey" in first
+        assert sorted(i["passenger_id"] for page in pages for i in page) == ["P1", "P2"]
+
+    def test_sparse_index_skips_items_without_key(self, store):
+        response = store.Table("passengers_v2").query(
+            IndexName="passenger-elite-tier-index",
+            KeyConditionExpression="frequent_flyer_tier = :tier",
+            ExpressionAttributeValues={":tier": "Gold"},
+        )
+        scanned = store.Table("passengers_v2").scan(IndexName="passenger-elite-tier-index")
+
+        assert {i["passenger_id"] for i in response["Items"]} == {"P1", "P3"}
+        assert scanned["Count"] == 2
+
+    def test_filter_and_projection(self, store):
+        response = store.Table("passengers_v2").scan(
+            FilterExpression=Attr("fare_paid").gt(260) & Attr("frequent_flyer_tier").exists(),
+            ProjectionExpression="passenger_id, #c",
+            ExpressionAttributeNames={"#c": "cabin_class"},
+        )
+
+        assert response["Items"] == [{"passenger_id": "P1", "cabin_class": "Business"}]
+        assert response["ScannedCount"] == 3
+
+    def test_unknown_index_and_missing_partition_key_are_rejected(self, store):
+        table = store.Table("flights_v2")
+
+        with pytest.raises(ClientError) as unknown_index:
+            table.query(IndexName="no-such-index", KeyConditionExpression=Key("a").eq("b"))
+        with pytest.raises(ClientError) as missing_key:
+            table.query(
+                IndexName="flight-number-date-index",
+                KeyConditionExpression="scheduled_departure_utc = :sd",
+                ExpressionAttributeValues={":sd": "x"},
+            )
+
+        assert unknown_index.value.response["Error"]["Code"] == "ValidationException"
+        assert missing_key.value.response["Error"]["Code"] == "ValidationException"
+
+    def test_missing_table_raises_resource_not_found(self, store):
+        with pytest.raises(ClientError) as error:
+            store.Table("Flights").get_item(Key={"flight_id": "FLT-1"})
+
+        assert error.value.response["Error"]["Code"] == "ResourceNotFoundException"
+
+
+class TestWrites:
+    """Test writes and batch reads"""
+
+    def test_conditional_put_and_index_maintenance(self, store):
+        table = store.Table("passengers_v2")
+        table.put_item(Item={"passenger_id": "P4", "first_leg_flight_id": "FLT-2", "seats": 2})
+
+        with pytest.raises(ClientError) as error:
+            table.put_item(Item={"passenger_id": "P4"}, ConditionExpression="attribute_not_exists(passenger_id)")
+        table.delete_item(Key={"passenger_id": "P3"})
+        response = table.query(
+            IndexName="first-leg-flight-index",
+            KeyConditionExpression="first_leg_flight_id = :fid",
+            ExpressionAttributeValues={":fid": "FLT-2"},
+        )
+
+        assert error.value.response["Error"]["Code"] == "ConditionalCheckFailedException"
+        assert response["Items"] == [{"passenger_id": "P4", "first_leg_flight_id": "FLT-2", "seats": Decimal(2)}]
+
+    def test_batch_get_item(self, store):
+        response = store.batch_get_item(
+            RequestItems={"flights_v2": {"Keys": [{"flight_id": "FLT-1"}, {"flight_id": "FLT-9"}]}},
+            ReturnConsumedCapacity="TOTAL",
+        )
+
+        assert [i["flight_id"] for i in response["Responses"]["flights_v2"]] == ["FLT-1"]
+        assert response["UnprocessedKeys"] == {}
+        assert response["ConsumedCapacity"][0]["CapacityUnits"] > 0
+
+
+class TestBackendSelection:
+    """Test that the data layer and checkpoints use the local store when selected"""
+
+    def test_dynamodb_client_reads_local_store(self, store):
+        with patch("database.dynamodb.local_backend_enabled", return_value=True), \
+                patch("database.dynamodb.get_local_dynamodb", return_value=store):
+            DynamoDBClient._instance = None
+            try:
+                summary = DynamoDBClient().summarize_flight_passengers("FLT-1")
+            finally:
+                DynamoDBClient._instance = None
+
+        assert summary["passenger_count"] == 2
+        assert summary["fare_revenue"]["total"] == 1500.5
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_saver_production_mode_round_trip(self, store):
+        with patch("checkpoint.saver.local_backend_enabled", return_value=True), \
+                patch("checkpoint.saver.get_local_dynamodb", return_value=store):
+            saver = CheckpointSaver(mode="production")
+
+        await saver.save_checkpoint("thread-1", "phase1", {"step": 1}, {"status": "active"})
+        await saver.save_checkpoint("thread-1", "phase2", {"step": 2}, {"status": "active"})
+        latest = await saver.load_checkpoint("thread-1")
+        listed = await saver.list_checkpoints("thread-1")
+
+        assert saver.backend == "DynamoDB"
+        assert store.get_stats()["SkyMarshalCheckpoints"] == 2
+        assert latest["checkpoint_id"] == "phase2"
+        assert latest["state"] == {"step": 2}
+        assert [c["checkpoint_id"] for c in listed] == ["phase1", "phase2"]
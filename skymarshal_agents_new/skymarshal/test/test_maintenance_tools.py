@@ -22,7 +22,7 @@ from agents.maintenance.agent import (
 class TestMaintenanceTools:
     """Test suite for maintenance agent DynamoDB query tools"""
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_flight_success(self, mock_boto3):
         """Test query_flight returns flight data successfully"""
         # Mock DynamoDB response
@@ -53,7 +53,7 @@ class TestMaintenanceTools:
         call_kwargs = mock_table.query.call_args[1]
         assert call_kwargs['IndexName'] == 'flight-number-date-index'
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_flight_not_found(self, mock_boto3):
         """Test query_flight returns error dict when flight not found"""
         # Mock empty response
@@ -70,7 +70,7 @@ class TestMaintenanceTools:
         assert result['flight_number'] == 'EY999'
         assert result['date'] == '2026-01-20'
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_flight_error_handling(self, mock_boto3):
         """Test query_flight handles errors gracefully"""
         # Mock error
@@ -86,7 +86,7 @@ class TestMaintenanceTools:
         assert 'error' in result
         assert result['flight_number'] == 'EY123'
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_maintenance_work_orders_success(self, mock_boto3):
         """Test query_maintenance_work_orders returns work orders"""
         # Mock DynamoDB response
@@ -123,7 +123,7 @@ class TestMaintenanceTools:
         call_kwargs = mock_table.query.call_args[1]
         assert call_kwargs['IndexName'] == 'aircraft-registration-index'
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_maintenance_work_orders_empty(self, mock_boto3):
         """Test query_maintenance_work_orders returns empty list when no work orders"""
         # Mock empty response
@@ -138,7 +138,7 @@ class TestMaintenanceTools:
         assert isinstance(result, list)
         assert len(result) == 0
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_maintenance_staff_success(self, mock_boto3):
         """Test query_maintenance_staff returns staff details"""
         # Mock DynamoDB response
@@ -163,7 +163,7 @@ class TestMaintenanceTools:
         assert result['name'] == 'John Smith'
         assert 'A380' in result['qualifications']
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_maintenance_staff_not_found(self, mock_boto3):
         """Test query_maintenance_staff returns error dict when staff not found"""
         # Mock empty response
@@ -179,7 +179,7 @@ class TestMaintenanceTools:
         assert result['error'] == 'STAFF_NOT_FOUND'
         assert result['staff_id'] == 'MAINT-999'
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_maintenance_roster_success(self, mock_boto3):
         """Test query_maintenance_roster returns staff assignments"""
         # Mock DynamoDB response
@@ -215,7 +215,7 @@ class TestMaintenanceTools:
         call_kwargs = mock_table.query.call_args[1]
         assert call_kwargs['IndexName'] == 'workorder-shift-index'
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_aircraft_availability_success(self, mock_boto3):
         """Test query_aircraft_availability returns MEL status"""
         # Mock DynamoDB response
@@ -249,7 +249,7 @@ class TestMaintenanceTools:
         assert result['airworthiness_status'] == 'AIRWORTHY_WITH_MEL'
         assert len(result['mel_items']) == 1
 
-    @patch('agents.maintenance.agent.boto3.resource')
+    @patch('agents.maintenance.agent.get_dynamodb_resource')
     def test_query_aircraft_availability_not_found(self, mock_boto3):
         """Test query_aircraft_availability returns error dict when not found"""
         # Mock empty response
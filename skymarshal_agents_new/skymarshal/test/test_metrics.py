@@ -0,0 +1,208 @@
+"""Unit tests for per-request token and latency accounting"""
+
+import asyncio
+import contextvars
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from main import handle_disruption
+from utils.metrics import (
+    RequestMetrics,
+    UsageMetricsCallback,
+    bind_request_metrics,
+    metric_labels,
+)
+from utils.tool_calling import clear_tool_caches, invoke_with_tools
+
+
+def reply(content="done", tool_calls=None, input_tokens=100, output_tokens=20, cache_read=0):
+    return AIMessage(
+        content=content,
+        tool_calls=tool_calls or [],
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "input_token_details": {"cache_read": cache_read, "cache_creation": 0},
+        },
+    )
+
+
+class FakeToolModel(FakeMessagesListChatModel):
+    """Fake chat model replaying responses, usable with invoke_with_tools"""
+
+    model_id: str = "fake-model"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+def fake_model(*responses):
+    return FakeToolModel(responses=list(responses), callbacks=[UsageMetricsCallback("fake-model")])
+
+
+@tool
+def lookup_flight(flight_number: str) -> str:
+    """Look up a flight"""
+    return json.dumps({"flight_number": flight_number})
+
+
+@pytest.fixture(autouse=True)
+def fresh_tool_caches():
+    clear_tool_caches()
+    yield
+    clear_tool_caches()
+
+
+class TestUsageMetricsCallback:
+    """Test recording of model calls"""
+
+    @pytest.mark.asyncio
+    async def test_usage_is_recorded_with_labels(self):
+        metrics = RequestMetrics("thread-1")
+        llm = fake_model(reply(cache_read=80))
+
+        async def call():
+            bind_request_metrics(metrics)
+            with metric_labels(agent="crew_compliance", phase="phase1"):
+                with metric_labels(iteration=2):
+                    await llm.ainvoke("hello")
+
+        await asyncio.create_task(call())
+
+        [record] = metrics.records()
+        assert record["agent"] == "crew_compliance"
+        assert record["phase"] == "phase1"
+        assert record["iteration"] == 2
+        assert record["model_id"] == "fake-model"
+        assert (record["input_tokens"], record["output_tokens"], record["cache_read_tokens"]) == (100, 20, 80)
+        assert record["error"] is None
+
+    @pytest.mark.asyncio
+    async def test_calls_outside_a_request_are_not_recorded(self):
+        metrics = RequestMetrics("thread-1")
+
+        await fake_model(reply()).ainvoke("hello")
+
+        assert metrics.records() == []
+
+
+class TestRequestMetrics:
+    """Test aggregation and export"""
+
+    def make_metrics(self):
+        metrics = RequestMetrics("thread-1")
+        callback = UsageMetricsCallback("sonnet")
+        for agent, phase, iteration in [
+            ("crew_compliance", "phase1", 1),
+            ("crew_compliance", "phase1", 2),
+            ("crew_compliance", "phase2", 1),
+            ("finance", "phase1", 1),
+        ]:
+            run_id = object()
+
+            def call():
+                bind_request_metrics(metrics)
+                with metric_labels(agent=agent, phase=phase, iteration=iteration):
+                    callback.on_chat_model_start({}, [], run_id=run_id)
+                callback.on_llm_end(Mock(generations=[[Mock(message=reply())]]), run_id=run_id)
+
+            contextvars.copy_context().run(call)
+        metrics.record_tools("crew_compliance", "phase1", calls=3, seconds=1.5)
+        return metrics
+
+    def test_summary_by_agent_phase_and_model(self):
+        summary = self.make_metrics().summary()
+
+        assert summary["totals"]["llm_calls"] == 4
+        assert summary["totals"]["input_tokens"] == 400
+        assert summary["totals"]["tool_calls"] == 3
+        assert summary["by_phase"]["phase1"]["output_tokens"] == 60
+        assert summary["by_agent"]["crew_compliance"]["llm_calls"] == 3
+        assert summary["by_model"]["sonnet"]["llm_calls"] == 4
+        crew_phase1 = summary["by_agent_phase"]["phase1"]["crew_compliance"]
+        assert crew_phase1["iterations"] == 2
+        assert crew_phase1["tool_seconds"] == 1.5
+
+    def test_emf_records(self):
+        emf_records = self.make_metrics().to_emf()
+
+        assert len(emf_records) == 3
+        emf = next(r for r in emf_records if (r["Agent"], r["Phase"]) == ("crew_compliance", "phase1"))
+        directive = emf["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Dimensions"] == [["Phase", "Agent"], ["Phase"]]
+        assert {m["Name"] for m in directive["Metrics"]} >= {"InputTokens", "OutputTokens", "LLMTime", "ToolTime"}
+        assert emf["InputTokens"] == 200
+        assert emf["ToolCalls"] == 3
+        assert emf["ThreadId"] == "thread-1"
+
+    def test_export_writes_json_lines(self):
+        metrics = self.make_metrics()
+
+        with patch("utils.metrics._emf_logger") as emf_logger:
+            assert metrics.export() == 3
+
+        for call in emf_logger.info.call_args_list:
+            assert "_aws" in json.loads(call.args[0])
+
+
+class TestToolCallingLoop:
+    """Test invoke_with_tools labelling"""
+
+    @pytest.mark.asyncio
+    async def test_iterations_and_tool_time_are_recorded(self):
+        metrics = RequestMetrics("thread-1")
+        llm = fake_model(
+            reply(tool_calls=[{"name": "lookup_flight", "args": {"flight_number": "EY123"}, "id": "t1"}]),
+            reply(input_tokens=300),
+        )
+
+        async def run():
+            bind_request_metrics(metrics)
+            with metric_labels(agent="network", phase="phase2"):
+                return await invoke_with_tools(llm, "system", "user", [lookup_flight])
+
+        result = await asyncio.create_task(run())
+
+        assert result["iterations"] == 2
+        assert [r["iteration"] for r in metrics.records()] == [1, 2]
+        network = metrics.summary()["by_agent_phase"]["phase2"]["network"]
+        assert network["input_tokens"] == 400
+        assert network["tool_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_response_includes_metrics():
+    """Test per-agent usage reaches the response and audit trail"""
+    llm = fake_model(reply(), reply())
+
+    async def agent(payload, agent_llm, tools):
+        await llm.ainvoke("analyze")
+        return {
+            "agent": "crew_compliance",
+            "recommendation": "Delay",
+            "confidence": 0.9,
+            "reasoning": "Crew rest",
+            "data_sources": ["test"],
+            "timestamp": datetime.now().isoformat(),
+            "status": "success",
+        }
+
+    with patch("main.resolve_flight_context", AsyncMock(return_value=None)), \
+         patch("main.phase3_arbitration", AsyncMock(return_value={"final_decision": "Delay"})), \
+         patch("main.SAFETY_AGENTS", [("crew_compliance", agent)]), \
+         patch("main.BUSINESS_AGENTS", []), \
+         patch("main.REVISION_FAST_PATH_ENABLED", False), \
+         patch("utils.metrics._emf_logger") as emf_logger:
+        response = await handle_disruption("Flight EY123 delayed", Mock(), [])
+
+    assert response["metrics"]["totals"]["llm_calls"] == 2
+    assert set(response["metrics"]["by_agent_phase"]) == {"phase1", "phase2"}
+    assert len(response["audit_trail"]["model_calls"]) == 2
+    assert emf_logger.info.call_count == 2
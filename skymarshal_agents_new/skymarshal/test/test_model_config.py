@@ -8,6 +8,8 @@ and arbitrator uses Sonnet 4.5 as per requirements 4.1, 4.2, 4.3.
 import pytest
 from model.load import (
     AGENT_MODEL_CONFIG,
+    clear_model_cache,
+    load_model,
     load_model_for_agent,
 )
 
@@ -146,5 +148,38 @@ class TestAgentModelConfig:
         )
 
 
+
+class TestModelClientCache:
+    """Test process-level caching of model clients."""
+
+    def setup_method(self):
+        clear_model_cache()
+
+    def test_same_agent_type_reuses_client(self):
+        """Repeated loads for the same agent type return the same client."""
+        assert load_model_for_agent("safety") is load_model_for_agent("safety")
+        assert load_model_for_agent("business") is load_model_for_agent("business")
+
+    def test_different_configs_get_different_clients(self):
+        """Safety and arbitrator share a model ID but differ in temperature."""
+        safety = load_model_for_agent("safety")
+        arbitrator = load_model_for_agent("arbitrator")
+
+        assert safety is not arbitrator
+        assert safety.temperature == 0.3
+        assert arbitrator.temperature == 0.2
+
+    def test_load_model_shares_cache_with_agent_models(self):
+        """load_model() returns the cached client matching its configuration."""
+        assert load_model() is load_model()
+
+    def test_clear_model_cache_creates_fresh_client(self):
+        """Clearing the cache forces a new client on the next load."""
+        first = load_model_for_agent("business")
+        clear_model_cache()
+
+        assert load_model_for_agent("business") is not first
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
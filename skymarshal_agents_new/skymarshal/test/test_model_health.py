@@ -0,0 +1,169 @@
+"""Unit tests for the model health registry"""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from agents.arbitrator.agent import OPUS_MODEL_ID, SONNET_MODEL_ID, _load_opus_model
+from model.health import (
+    REQUEST_ERROR,
+    STATUS_FAILING,
+    STATUS_THROTTLED,
+    STATUS_UNAVAILABLE,
+    ModelHealthCallback,
+    ModelHealthRegistry,
+    classify_error,
+    get_model_health_registry,
+)
+from model.load import MODEL_PRIORITY, clear_model_cache, get_cached_model, load_model
+
+
+THROTTLED = RuntimeError("An error occurred (ThrottlingException) when calling the InvokeModel operation")
+NOT_FOUND = RuntimeError("An error occurred (ValidationException): The provided model identifier is invalid")
+INPUT_TOO_LONG = RuntimeError("An error occurred (ValidationException): Input is too long for requested model.")
+
+
+@pytest.fixture
+def registry():
+    registry = get_model_health_registry()
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+class TestClassification:
+    """Test failure classification"""
+
+    def test_classify_error(self):
+        assert classify_error(THROTTLED) == STATUS_THROTTLED
+        assert classify_error(RuntimeError("Too many tokens, please wait")) == STATUS_THROTTLED
+        assert classify_error(NOT_FOUND) == STATUS_UNAVAILABLE
+        assert classify_error(RuntimeError("AccessDeniedException: You don't have access")) == STATUS_UNAVAILABLE
+        assert classify_error(INPUT_TOO_LONG) == REQUEST_ERROR
+        assert classify_error(RuntimeError("Tool config not found in request")) == STATUS_FAILING
+        assert classify_error(RuntimeError("Read timed out")) == STATUS_FAILING
+
+
+class TestModelHealthRegistry:
+    """Test rotation decisions"""
+
+    def test_unknown_models_are_in_rotation(self):
+        assert ModelHealthRegistry().select(["a", "b"]) == "a"
+
+    def test_throttle_rate_takes_model_out_of_rotation(self):
+        registry = ModelHealthRegistry()
+        for _ in range(3):
+            registry.record_success("a", 1.0)
+        registry.record_failure("a", THROTTLED)
+
+        # One throttle in four calls is tolerated
+        assert registry.is_available("a")
+
+        registry.record_failure("a", THROTTLED)
+        registry.record_failure("a", THROTTLED)
+
+        assert not registry.is_available("a")
+        assert registry.select(["a", "b"]) == "b"
+        assert registry.get_stats()["a"]["status"] == STATUS_THROTTLED
+
+    def test_unavailable_model_is_skipped(self):
+        registry = ModelHealthRegistry()
+        registry.record_failure("a", NOT_FOUND)
+
+        assert registry.select(["a", "b"]) == "b"
+
+    def test_request_errors_do_not_affect_rotation(self):
+        registry = ModelHealthRegistry()
+        for _ in range(5):
+            assert registry.record_failure("a", INPUT_TOO_LONG) == REQUEST_ERROR
+
+        assert registry.is_available("a")
+        assert registry.select(["a", "b"]) == "a"
+        assert registry.error_rate("a") == 0.0
+        assert registry.get_stats()["a"]["request_errors"] == 5
+        assert registry.get_stats()["a"]["consecutive_failures"] == 0
+
+    def test_repeated_failures_take_model_out_of_rotation(self):
+        registry = ModelHealthRegistry()
+        registry.record_failure("a", RuntimeError("boom"))
+        registry.record_failure("a", RuntimeError("boom"))
+        assert registry.is_available("a")
+
+        registry.record_failure("a", RuntimeError("boom"))
+        assert not registry.is_available("a")
+
+    def test_success_restores_rotation(self):
+        registry = ModelHealthRegistry()
+        registry.record_failure("a", NOT_FOUND)
+        registry.record_success("a", 2.0)
+
+        assert registry.is_available("a")
+        assert registry.get_stats()["a"]["latency_seconds"] == 2.0
+
+    def test_all_out_of_rotation_picks_earliest_recovery(self):
+        registry = ModelHealthRegistry()
+        registry.record_failure("a", NOT_FOUND)
+        registry.record_failure("b", THROTTLED)
+
+        assert registry.select(["a", "b"]) == "b"
+
+    def test_refresh_probes_only_models_without_recent_evidence(self):
+        registry = ModelHealthRegistry()
+        registry.watch(["a", "b"], "eu-west-1")
+        registry.record_success("a", 1.0)
+
+        with patch("model.health.ChatBedrock") as mock_chat:
+            mock_chat.return_value.invoke.side_effect = THROTTLED
+            results = registry.refresh(max_age_seconds=300)
+
+        assert results == {"b": False}
+        assert mock_chat.call_args.kwargs["region_name"] == "eu-west-1"
+        assert registry.get_stats()["b"]["throttle_rate"] == 1.0
+
+
+class TestModelHealthCallback:
+    """Test passive recording from real calls"""
+
+    def test_records_latency_and_failures(self):
+        registry = ModelHealthRegistry()
+        callback = ModelHealthCallback("a", registry)
+        ok, failed = uuid4(), uuid4()
+
+        callback.on_chat_model_start({}, [], run_id=ok)
+        callback.on_llm_end(None, run_id=ok)
+        callback.on_chat_model_start({}, [], run_id=failed)
+        callback.on_llm_error(NOT_FOUND, run_id=failed)
+
+        stats = registry.get_stats()["a"]
+        assert stats["latency_seconds"] is not None
+        assert stats["status"] == STATUS_UNAVAILABLE
+
+    def test_cached_clients_report_to_registry(self):
+        clear_model_cache()
+        client = get_cached_model(MODEL_PRIORITY[0]["id"], 0.3, 8192)
+
+        assert any(isinstance(cb, ModelHealthCallback) for cb in client.callbacks)
+
+
+class TestModelSelectionWithoutProbes:
+    """Test that model loading reads the registry instead of probing"""
+
+    def test_load_model_skips_model_out_of_rotation(self, registry):
+        registry.record_failure(MODEL_PRIORITY[0]["id"], NOT_FOUND)
+
+        with patch("model.health.ChatBedrock") as probe_client:
+            llm = load_model(skip_test=False)
+
+        probe_client.assert_not_called()
+        assert llm.model_id == MODEL_PRIORITY[1]["id"]
+
+    def test_arbitrator_falls_back_without_probe_calls(self, registry):
+        registry.record_failure(OPUS_MODEL_ID, THROTTLED)
+
+        with patch("agents.arbitrator.agent.ChatBedrock") as mock_chat:
+            _load_opus_model()
+
+        mock_chat.assert_called_once()
+        assert mock_chat.call_args.kwargs["model_id"] == SONNET_MODEL_ID
+        mock_chat.return_value.invoke.assert_not_called()
@@ -0,0 +1,209 @@
+"""Unit tests for routing agent model calls across equivalent models"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+import model.load as load
+from model.health import get_model_health_registry
+from model.load import (
+    RoutedChatModel,
+    TokenBucket,
+    clear_model_cache,
+    get_model_router,
+    load_model_for_agent,
+)
+
+
+THROTTLED = RuntimeError("An error occurred (ThrottlingException) when calling the InvokeModel operation")
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    registry = get_model_health_registry()
+    registry.clear()
+    load._router = None
+    clear_model_cache()
+    yield registry
+    registry.clear()
+    load._router = None
+    clear_model_cache()
+
+
+def make_client(reply=None, error=None, delay=0.0):
+    """Fake model client answering with reply (or raising error) after delay seconds"""
+    async def ainvoke(messages, stop=None, **kwargs):
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return AIMessage(content=reply)
+
+    client = Mock()
+    client.ainvoke = AsyncMock(side_effect=ainvoke)
+    if error is not None:
+        client.invoke.side_effect = error
+    else:
+        client.invoke.return_value = AIMessage(content=reply)
+    return client
+
+
+def routed(clients, hedge=False):
+    """RoutedChatModel over fake clients keyed by model id"""
+    model = RoutedChatModel(
+        model_id=list(clients)[0],
+        model_ids=list(clients),
+        temperature=0.3,
+        max_tokens=100,
+        hedge=hedge,
+    )
+    patcher = patch("model.load.get_cached_model", side_effect=lambda model_id, *args: clients[model_id])
+    patcher.start()
+    return model, patcher
+
+
+class TestTokenBucket:
+    """Test the adaptive request budget"""
+
+    def test_burst_then_empty(self):
+        bucket = TokenBucket(requests_per_minute=0.001, burst=2)
+
+        assert bucket.try_acquire()
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+    def test_throttle_halves_rate_and_success_restores_it(self):
+        bucket = TokenBucket(requests_per_minute=60, burst=5)
+
+        bucket.on_throttle()
+
+        assert bucket.rate == pytest.approx(0.5)
+        assert bucket.available() < 1
+        for _ in range(20):
+            bucket.on_success()
+        assert bucket.rate == pytest.approx(1.0)
+
+
+class TestModelRouter:
+    """Test candidate ranking"""
+
+    def test_configured_priority_by_default(self):
+        assert get_model_router().rank(["a", "b"]) == ["a", "b"]
+
+    def test_over_budget_model_is_ranked_last(self):
+        router = get_model_router()
+        router.bucket("a").on_throttle()
+
+        assert router.rank(["a", "b"]) == ["b", "a"]
+        assert router.acquire(["a", "b"]) == "b"
+
+    def test_slow_model_is_ranked_last(self, fresh_state):
+        for _ in range(5):
+            fresh_state.record_success("a", 10.0)
+            fresh_state.record_success("b", 2.0)
+
+        assert get_model_router().rank(["a", "b"]) == ["b", "a"]
+
+    def test_model_out_of_rotation_is_skipped(self, fresh_state):
+        for _ in range(3):
+            fresh_state.record_failure("a", THROTTLED)
+
+        assert get_model_router().rank(["a", "b"]) == ["b"]
+
+    def test_hedge_delay_follows_p95(self, fresh_state):
+        router = get_model_router()
+
+        assert router.hedge_delay("a") == load.HEDGE_DEFAULT_DELAY_SECONDS
+
+        for latency in [6.0] * 19 + [30.0]:
+            fresh_state.record_success("a", latency)
+        assert router.hedge_delay("a") == 30.0
+
+
+class TestRoutedChatModel:
+    """Test per-call routing"""
+
+    def test_throttled_call_moves_to_equivalent_model(self):
+        clients = {"a": make_client(error=THROTTLED), "b": make_client(reply="from b")}
+        model, patcher = routed(clients)
+        try:
+            assert model.invoke("hello").content == "from b"
+        finally:
+            patcher.stop()
+
+        assert get_model_router().bucket("a").available() < 1
+
+    def test_other_errors_are_not_rerouted(self):
+        clients = {"a": make_client(error=RuntimeError("Read timed out")), "b": make_client(reply="from b")}
+        model, patcher = routed(clients)
+        try:
+            with pytest.raises(RuntimeError, match="Read timed out"):
+                model.invoke("hello")
+        finally:
+            patcher.stop()
+
+        clients["b"].invoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_all_equivalents_throttled_raises(self):
+        clients = {"a": make_client(error=THROTTLED), "b": make_client(error=THROTTLED)}
+        model, patcher = routed(clients)
+        try:
+            with pytest.raises(RuntimeError, match="ThrottlingException"):
+                await model.ainvoke("hello")
+        finally:
+            patcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_primary_is_slow(self):
+        clients = {"a": make_client(reply="from a", delay=5), "b": make_client(reply="from b")}
+        model, patcher = routed(clients, hedge=True)
+        try:
+            with patch.object(load, "HEDGE_DEFAULT_DELAY_SECONDS", 0.01):
+                result = await model.ainvoke("hello")
+        finally:
+            patcher.stop()
+
+        assert result.content == "from b"
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        clients = {"a": make_client(reply="from a"), "b": make_client(reply="from b")}
+        model, patcher = routed(clients, hedge=True)
+        try:
+            result = await model.ainvoke("hello")
+        finally:
+            patcher.stop()
+
+        assert result.content == "from a"
+        clients["b"].ainvoke.assert_not_called()
+
+    def test_tools_are_bound_in_primary_model_format(self):
+        primary = Mock()
+        primary.bind_tools.return_value = Mock(kwargs={"tools": ["formatted"]})
+        model, patcher = routed({"a": primary, "b": Mock()})
+        try:
+            binding = model.bind_tools(["tool"])
+        finally:
+            patcher.stop()
+
+        assert binding.bound is model
+        assert binding.kwargs == {"tools": ["formatted"]}
+
+
+class TestAgentModels:
+    """Test load_model_for_agent with routing"""
+
+    def test_agent_models_are_routed_and_shared(self):
+        model = load_model_for_agent("safety")
+
+        assert isinstance(model, RoutedChatModel)
+        assert model.model_ids == [model.model_id] + load.EQUIVALENT_MODELS[model.model_id]
+        assert model.hedge is True
+        assert load_model_for_agent("business").hedge is False
+        assert load_model_for_agent("safety") is model
+
+    def test_routing_can_be_disabled(self):
+        with patch.object(load, "MODEL_ROUTING_ENABLED", False):
+            assert not isinstance(load_model_for_agent("safety"), RoutedChatModel)
@@ -131,8 +131,8 @@ class TestNetworkToolErrorHandling:
         from agents.network.agent import query_flight
         
         # Mock boto3 to raise exception
-        with patch('agents.network.agent.boto3') as mock_boto3:
-            mock_boto3.resource.side_effect = Exception("AWS connection error")
+        with patch('agents.network.agent.get_dynamodb_resource') as mock_boto3:
+            mock_boto3.side_effect = Exception("AWS connection error")
             
             result = query_flight.invoke({"flight_number": "EY123", "date": "2026-01-20"})
             
@@ -143,8 +143,8 @@ class TestNetworkToolErrorHandling:
         """Test that query_aircraft_rotation handles boto3 errors gracefully."""
         from agents.network.agent import query_aircraft_rotation
         
-        with patch('agents.network.agent.boto3') as mock_boto3:
-            mock_boto3.resource.side_effect = Exception("AWS connection error")
+        with patch('agents.network.agent.get_dynamodb_resource') as mock_boto3:
+            mock_boto3.side_effect = Exception("AWS connection error")
             
             result = query_aircraft_rotation.invoke({
                 "aircraft_registration": "A6-APX",
@@ -159,8 +159,8 @@ class TestNetworkToolErrorHandling:
         """Test that query_flights_by_aircraft handles boto3 errors gracefully."""
         from agents.network.agent import query_flights_by_aircraft
         
-        with patch('agents.network.agent.boto3') as mock_boto3:
-            mock_boto3.resource.side_effect = Exception("AWS connection error")
+        with patch('agents.network.agent.get_dynamodb_resource') as mock_boto3:
+            mock_boto3.side_effect = Exception("AWS connection error")
             
             result = query_flights_by_aircraft.invoke({"aircraft_registration": "A6-APX"})
             
@@ -171,8 +171,8 @@ class TestNetworkToolErrorHandling:
         """Test that query_aircraft_availability handles boto3 errors gracefully."""
         from agents.network.agent import query_aircraft_availability
         
-        with patch('agents.network.agent.boto3') as mock_boto3:
-            mock_boto3.resource.side_effect = Exception("AWS connection error")
+        with patch('agents.network.agent.get_dynamodb_resource') as mock_boto3:
+            mock_boto3.side_effect = Exception("AWS connection error")
             
             result = query_aircraft_availability.invoke({
                 "aircraft_registration": "A6-APX",
@@ -187,10 +187,10 @@ class TestNetworkToolErrorHandling:
         from agents.network.agent import query_flight
         
         # Mock boto3 to return empty results
-        with patch('agents.network.agent.boto3') as mock_boto3:
+        with patch('agents.network.agent.get_dynamodb_resource') as mock_boto3:
             mock_table = Mock()
             mock_table.query.return_value = {"Items": []}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result = query_flight.invoke({"flight_number": "EY999", "date": "2026-01-20"})
             
@@ -200,10 +200,10 @@ class TestNetworkToolErrorHandling:
         """Test that query_aircraft_rotation returns empty list when no flights found."""
         from agents.network.agent import query_aircraft_rotation
         
-        with patch('agents.network.agent.boto3') as mock_boto3:
+        with patch('agents.network.agent.get_dynamodb_resource') as mock_boto3:
             mock_table = Mock()
             mock_table.query.return_value = {"Items": []}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result = query_aircraft_rotation.invoke({
                 "aircraft_registration": "A6-XXX",
@@ -1,7 +1,7 @@
 """Test new batch tools for network, guest experience, and cargo agents"""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import ANY, Mock, patch, MagicMock
 from decimal import Decimal
 import json
 
@@ -44,7 +44,7 @@ class TestNetworkBatchTools:
         assert 'optimization' in result
         
         # Verify batch method was called
-        mock_db_client.batch_get_flights.assert_called_once_with(['FL001', 'FL002'])
+        mock_db_client.batch_get_flights.assert_called_once_with(['FL001', 'FL002'], projection=ANY)
 
     def test_query_multiple_flights_network_empty(self, mock_db_client):
         """Test query_multiple_flights_network with empty input"""
@@ -99,12 +99,13 @@ class TestGuestExperienceBatchTools:
         
         assert result['booking_count'] == 2
         assert result['query_count'] == 2
-        assert len(result['passengers']) == 2
+        assert [b['passenger_details']['name'] for b in result['bookings']] == ['Alice Brown', 'Bob Wilson']
+        assert 'passengers' not in result  # Records are only returned once, nested in bookings
         assert 'optimization' in result
         
         # Verify methods were called
-        mock_db_client.query_bookings_by_flight.assert_called_once_with('FL001', 'Confirmed')
-        mock_db_client.batch_get_passengers.assert_called_once_with(['P001', 'P002'])
+        mock_db_client.query_bookings_by_flight.assert_called_once_with('FL001', 'Confirmed', projection=ANY)
+        mock_db_client.batch_get_passengers.assert_called_once_with(['P001', 'P002'], projection=ANY)
 
     def test_query_flight_bookings_with_passengers_empty(self, mock_db_client):
         """Test query_flight_bookings_with_passengers with no bookings"""
@@ -121,7 +122,7 @@ class TestGuestExperienceBatchTools:
         
         assert result['booking_count'] == 0
         assert result['query_count'] == 1
-        assert len(result['passengers']) == 0
+        assert result['bookings'] == []
 
 
 class TestCargoBatchTools:
@@ -164,12 +165,13 @@ class TestCargoBatchTools:
         assert result['cargo_count'] == 2
         assert result['query_count'] == 2
         assert result['total_weight_kg'] == 350.5
-        assert len(result['shipments']) == 2
+        assert [c['shipment_details']['contents'] for c in result['cargo']] == ['Electronics', 'Textiles']
+        assert 'shipments' not in result
         assert 'optimization' in result
         
         # Verify methods were called
-        mock_db_client.query_cargo_by_flight.assert_called_once_with('FL001', 'LOADED')
-        mock_db_client.batch_get_cargo_shipments.assert_called_once_with(['SH001', 'SH002'])
+        mock_db_client.query_cargo_by_flight.assert_called_once_with('FL001', 'LOADED', projection=ANY)
+        mock_db_client.batch_get_cargo_shipments.assert_called_once_with(['SH001', 'SH002'], projection=ANY)
 
     def test_query_flight_cargo_manifest_with_shipments_empty(self, mock_db_client):
         """Test query_flight_cargo_manifest_with_shipments with no cargo"""
@@ -187,4 +189,4 @@ class TestCargoBatchTools:
         assert result['cargo_count'] == 0
         assert result['query_count'] == 1
         assert result['total_weight_kg'] == 0
-        assert len(result['shipments']) == 0
+        assert result['cargo'] == []
@@ -1060,7 +1060,10 @@ class TestProperty2AgentAutonomy:
         Property 2.4: Orchestrator does not import database modules
         
         The orchestrator should not import boto3 or DynamoDB-related modules
-        since it should not perform any database queries.
+        since it should not perform any database queries. The shared data work
+        it schedules around the agents (flight lookup, request cache, prefetch,
+        container-start warmups) goes through agents.flight_context and
+        agents.data_stage.
         
         Validates: Requirements 1.6, 2.7, 9.2
         """
@@ -1075,6 +1078,8 @@ class TestProperty2AgentAutonomy:
             "from boto3 import",
             "from database.dynamodb import",
             "from database.tools import",
+            "from database",
+            "import database",
         ]
         
         for pattern in forbidden_db_imports:
@@ -0,0 +1,116 @@
+"""Unit tests for paginating DynamoDB query/scan helpers"""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from database.dynamodb import DynamoDBClient
+from database.pagination import (
+    build_projection,
+    iter_query_pages,
+    query_all,
+    scan_all,
+)
+
+
+def paged_table(pages):
+    """Table mock whose query/scan return the given pages in order."""
+    table = MagicMock()
+    responses = [
+        {"Items": items, **({"LastEvaluatedKey": {"id": items[-1]["id"]}} if i < len(pages) - 1 else {})}
+        for i, items in enumerate(pages)
+    ]
+    table.query.side_effect = list(responses)
+    table.scan.side_effect = list(responses)
+    return table
+
+
+PAGES = [[{"id": 1}, {"id": 2}], [{"id": 3}], [{"id": 4}, {"id": 5}]]
+
+
+class TestPaginationHelpers:
+    """Test LastEvaluatedKey following, limits and projections"""
+
+    def test_query_all_follows_last_evaluated_key(self):
+        table = paged_table(PAGES)
+
+        items = query_all(table, KeyConditionExpression="flight_id = :f",
+                          ExpressionAttributeValues={":f": "1"})
+
+        assert [i["id"] for i in items] == [1, 2, 3, 4, 5]
+        calls = table.query.call_args_list
+        assert "ExclusiveStartKey" not in calls[0].kwargs
+        assert calls[1].kwargs["ExclusiveStartKey"] == {"id": 2}
+        assert calls[2].kwargs["ExclusiveStartKey"] == {"id": 3}
+
+    def test_limit_stops_paging_early(self):
+        table = paged_table(PAGES)
+
+        items = query_all(table, limit=3, KeyConditionExpression="flight_id = :f")
+
+        assert [i["id"] for i in items] == [1, 2, 3]
+        assert table.query.call_count == 2
+        assert table.query.call_args_list[0].kwargs["Limit"] == 3
+        assert table.query.call_args_list[1].kwargs["Limit"] == 1
+
+    def test_iter_query_pages_streams_pages(self):
+        table = paged_table(PAGES)
+
+        pages = iter_query_pages(table, page_size=2, KeyConditionExpression="flight_id = :f")
+        first = next(pages)
+
+        assert first == [{"id": 1}, {"id": 2}]
+        assert table.query.call_count == 1
+        assert list(pages) == [[{"id": 3}], [{"id": 4}, {"id": 5}]]
+        assert all(c.kwargs["Limit"] == 2 for c in table.query.call_args_list)
+
+    def test_projection_aliases_attributes(self):
+        table = paged_table([[{"id": 1}]])
+
+        scan_all(table, projection=["booking_id", "status"],
+                 ExpressionAttributeNames={"#s": "segment"})
+
+        kwargs = table.scan.call_args.kwargs
+        assert kwargs["ProjectionExpression"] == "#p0, #p1"
+        assert kwargs["ExpressionAttributeNames"] == {
+            "#s": "segment", "#p0": "booking_id", "#p1": "status"
+        }
+
+    def test_build_projection_deduplicates(self):
+        assert build_projection(["a", "b", "a"])["ProjectionExpression"] == "#p0, #p1"
+
+
+class TestPaginatedAccessors:
+    """Test DynamoDBClient accessors and agent tools return every page"""
+
+    @pytest.fixture
+    def client(self):
+        with patch("database.dynamodb.boto3") as mock_boto3:
+            mock_boto3.resource.return_value = Mock()
+            mock_boto3.client.return_value = Mock()
+            DynamoDBClient._instance = None
+            client = DynamoDBClient()
+            yield client
+            DynamoDBClient._instance = None
+
+    def test_query_bookings_by_flight_returns_all_pages(self, client):
+        client.bookings = paged_table(PAGES)
+
+        bookings = client.query_bookings_by_flight("FLT-1")
+
+        assert len(bookings) == 5
+        assert client.bookings.query.call_count == 3
+
+    def test_guest_tool_returns_all_pages(self):
+        from agents.guest_experience.agent import query_bookings_by_status
+
+        table = paged_table(PAGES)
+        resource = MagicMock()
+        resource.Table.return_value = table
+        with patch("agents.guest_experience.agent.dynamodb", resource):
+            result = json.loads(query_bookings_by_status.invoke(
+                {"flight_id": "FLT-1", "booking_status": "confirmed"}
+            ))
+
+        assert [b["id"] for b in result] == [1, 2, 3, 4, 5]
@@ -14,8 +14,13 @@ from main import (
     phase2_revision_round,
     phase3_arbitration,
     handle_disruption,
+    handle_disruption_stream,
+    invoke,
+    precheck_revision,
+    stream_orchestrator_events,
 )
 from agents.schemas import AgentResponse, Collation
+from agents.revision_logic import RevisionDecision
 
 
 @pytest.mark.asyncio
@@ -515,3 +520,389 @@ async def test_agent_completes_within_timeout():
     assert result["agent"] == "fast_agent"
     assert result["recommendation"] == "Quick recommendation"
     assert result["duration_seconds"] < 30  # Should complete well before timeout
+
+
+@pytest.mark.asyncio
+async def test_phase1_passes_shared_flight_context():
+    """Test phase 1 forwards the pre-resolved flight context to every agent"""
+    user_prompt = "Flight EY123 on Jan 20th had a mechanical failure"
+    flight_context = {
+        "flight_info": {
+            "flight_number": "EY123",
+            "date": "2026-01-20",
+            "disruption_event": "mechanical failure"
+        },
+        "flight": {"flight_id": "1", "flight_number": "EY123"}
+    }
+    
+    mock_response = {
+        "agent": "crew_compliance",
+        "recommendation": "Test rec",
+        "confidence": 0.95,
+        "reasoning": "Test reasoning",
+        "data_sources": ["test"],
+        "timestamp": datetime.now().isoformat(),
+        "status": "success"
+    }
+    agent = AsyncMock(return_value=mock_response)
+    
+    with patch("main.SAFETY_AGENTS", [("crew_compliance", agent)]):
+        with patch("main.BUSINESS_AGENTS", []):
+            await phase1_initial_recommendations(
+                user_prompt, Mock(), [], flight_context=flight_context
+            )
+    
+    payload = agent.call_args[0][0]
+    assert payload["flight_info"] == flight_context["flight_info"]
+    assert payload["flight"] == flight_context["flight"]
+
+
+@pytest.mark.asyncio
+async def test_handle_disruption_extracts_flight_context_once():
+    """Test handle_disruption resolves flight info once and shares it across phases"""
+    from agents.schemas import FlightInfo
+    
+    user_prompt = "Flight EY123 on Jan 20th had a mechanical failure"
+    flight_info = FlightInfo(
+        flight_number="EY123", date="2026-01-20", disruption_event="mechanical failure"
+    )
+    mock_response = {
+        "agent": "crew_compliance",
+        "recommendation": "Test rec",
+        "confidence": 0.95,
+        "reasoning": "Test reasoning",
+        "data_sources": ["test"],
+        "timestamp": datetime.now().isoformat(),
+        "status": "success"
+    }
+    agent = AsyncMock(return_value=mock_response)
+    mock_db = Mock()
+    mock_db.get_flight_by_number_and_date = AsyncMock(return_value={"flight_id": "1"})
+    
+    with patch("agents.flight_context.extract_with_fallback", AsyncMock(return_value=flight_info)) as mock_extract, \
+         patch("agents.flight_context.get_async_dynamodb_client", return_value=mock_db), \
+         patch("main.REVISION_FAST_PATH_ENABLED", False), \
+         patch("main.SAFETY_AGENTS", [("crew_compliance", agent)]), \
+         patch("main.BUSINESS_AGENTS", []):
+        result = await handle_disruption(user_prompt, Mock(), [])
+    
+    assert mock_extract.await_count == 1
+    mock_db.get_flight_by_number_and_date.assert_awaited_once_with("EY123", "2026-01-20")
+    # Phase 1 and Phase 2 both receive the shared context
+    assert agent.await_count == 2
+    for call in agent.call_args_list:
+        assert call[0][0]["flight_info"]["flight_number"] == "EY123"
+        assert call[0][0]["flight"] == {"flight_id": "1"}
+    assert result["audit_trail"]["flight_context"]["flight"] == {"flight_id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_handle_disruption_stream_yields_progress_events():
+    """Test the streaming orchestrator yields agent events as phases progress"""
+    user_prompt = "Flight EY123 on Jan 20th had a mechanical failure"
+    mock_response = {
+        "agent": "crew_compliance",
+        "recommendation": "Test rec",
+        "confidence": 0.95,
+        "reasoning": "Test reasoning",
+        "data_sources": ["test"],
+        "timestamp": datetime.now().isoformat(),
+        "status": "success"
+    }
+    agent = AsyncMock(return_value=mock_response)
+    mock_phase3 = AsyncMock(return_value={"final_decision": "Test decision"})
+    
+    with patch("main.resolve_flight_context", AsyncMock(return_value=None)), \
+         patch("main.phase3_arbitration", mock_phase3), \
+         patch("main.SAFETY_AGENTS", [("crew_compliance", agent)]), \
+         patch("main.BUSINESS_AGENTS", []):
+        events = [e async for e in handle_disruption_stream(user_prompt, Mock(), [])]
+    
+    types = [e["type"] for e in events]
+    assert types[:3] == ["start", "extraction_complete", "phase_start"]
+    assert types[-2:] == ["arbitration_start", "complete"]
+    assert types.count("phase_complete") == 2
+    assert types.count("agent_complete") == 2
+    agent_events = [e for e in events if e["type"] == "agent_complete"]
+    assert sorted(e["phase"] for e in agent_events) == ["phase1", "phase2"]
+    assert agent_events[0]["agent"] == "crew_compliance"
+    assert agent_events[0]["recommendation"] == "Test rec"
+    
+    final = events[-1]["data"]
+    assert final["status"] == "success"
+    assert final["thread_id"] == events[0]["thread_id"]
+    assert final["final_decision"] == {"final_decision": "Test decision"}
+
+
+@pytest.mark.asyncio
+async def test_stream_orchestrator_events_reports_errors():
+    """Test the entrypoint stream converts orchestrator failures into an error event"""
+    failing_phase1 = AsyncMock(side_effect=RuntimeError("Safety agent failed"))
+    
+    with patch("main.resolve_flight_context", AsyncMock(return_value=None)), \
+         patch("main.phase1_initial_recommendations", failing_phase1):
+        events = [
+            e async for e in stream_orchestrator_events(
+                "Flight EY123 delayed", Mock(), [], 0.0
+            )
+        ]
+    
+    assert events[-1]["type"] == "error"
+    assert events[-1]["error"]["message"] == "Safety agent failed"
+    assert events[-1]["error"]["error_type"] == "RuntimeError"
+
+
+@pytest.mark.asyncio
+async def test_stream_disconnect_cancels_running_agents():
+    """Test closing the stream early cancels agents that are still running"""
+    import asyncio
+    
+    mock_response = {
+        "agent": "crew_compliance",
+        "recommendation": "Test rec",
+        "confidence": 0.95,
+        "reasoning": "Test reasoning",
+        "data_sources": ["test"],
+        "timestamp": datetime.now().isoformat(),
+        "status": "success"
+    }
+    slow_cancelled = asyncio.Event()
+    
+    async def slow_agent(payload, llm, tools):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            slow_cancelled.set()
+            raise
+    
+    with patch("main.resolve_flight_context", AsyncMock(return_value=None)), \
+         patch("main.SAFETY_AGENTS", [("crew_compliance", AsyncMock(return_value=mock_response))]), \
+         patch("main.BUSINESS_AGENTS", [("finance", slow_agent)]):
+        stream = handle_disruption_stream("Flight EY123 delayed", Mock(), [])
+        async for event in stream:
+            if event["type"] == "agent_complete":
+                break
+        await stream.aclose()
+    
+    assert slow_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_entrypoint_is_buffered_by_default():
+    """Test the orchestrator returns buffered JSON unless streaming is requested"""
+    mcp_client = Mock()
+    mcp_client.get_tools = AsyncMock(return_value=[])
+    
+    with patch("main.load_model", return_value=Mock()), \
+         patch("main.get_streamable_http_mcp_client", return_value=mcp_client), \
+         patch("main.handle_disruption", AsyncMock(return_value={"status": "success"})):
+        buffered = await invoke({"prompt": "Flight EY123 delayed"})
+        streamed = await invoke({"prompt": "Flight EY123 delayed", "stream": True})
+    
+    assert buffered["status"] == "success"
+    assert hasattr(streamed, "__aiter__")
+
+
+@pytest.mark.asyncio
+async def test_phase2_starts_before_slow_business_agent_finishes_phase1():
+    """Test revisions start once safety results are in, without waiting for slow business agents"""
+    import asyncio
+    
+    user_prompt = "Flight EY123 on Jan 20th had a mechanical failure"
+    timeline = []
+    business_release = asyncio.Event()
+    
+    def make_result(name, phase):
+        return {
+            "agent": name,
+            "recommendation": f"{name} {phase} rec",
+            "confidence": 0.9,
+            "reasoning": "Test reasoning",
+            "data_sources": ["test"],
+            "timestamp": datetime.now().isoformat(),
+            "status": "success"
+        }
+    
+    async def safety_agent(payload, llm, mcp_tools):
+        timeline.append(("crew_compliance", payload["phase"]))
+        return make_result("crew_compliance", payload["phase"])
+    
+    async def slow_business_agent(payload, llm, mcp_tools):
+        timeline.append(("finance", payload["phase"]))
+        if payload["phase"] == "initial":
+            await business_release.wait()
+        return make_result("finance", payload["phase"])
+    
+    captured_payloads = {}
+    
+    async def capture_safety(payload, llm, mcp_tools):
+        if payload["phase"] == "revision":
+            captured_payloads["crew_compliance"] = payload
+            # Let the slow business agent finish only after the safety revision started
+            business_release.set()
+        return await safety_agent(payload, llm, mcp_tools)
+    
+    mock_phase3 = AsyncMock(return_value={"final_decision": "Test decision"})
+    
+    with patch("main.resolve_flight_context", AsyncMock(return_value=None)), \
+         patch("main.phase3_arbitration", mock_phase3), \
+         patch("main.REVISION_FAST_PATH_ENABLED", False), \
+         patch("main.SAFETY_AGENTS", [("crew_compliance", capture_safety)]), \
+         patch("main.BUSINESS_AGENTS", [("finance", slow_business_agent)]):
+        result = await asyncio.wait_for(handle_disruption(user_prompt, Mock(), []), timeout=10)
+    
+    # Safety revision ran before the business agent's Phase 1 result was available
+    revision_context = captured_payloads["crew_compliance"]["other_recommendations"]
+    assert revision_context["finance"]["status"] == "absent"
+    assert revision_context["crew_compliance"]["recommendation"] == "crew_compliance initial rec"
+    
+    # Business revision waited for its own Phase 1 result
+    assert timeline.index(("finance", "revision")) > timeline.index(("finance", "initial"))
+    assert result["status"] == "success"
+    assert set(result["audit_trail"]["phase1_initial"]["responses"]) == {"crew_compliance", "finance"}
+    assert set(result["audit_trail"]["phase2_revision"]["responses"]) == {"crew_compliance", "finance"}
+
+
+@pytest.mark.asyncio
+async def test_phase2_fast_path_carries_confirmed_recommendations_forward():
+    """Test agents whose pre-check is CONFIRM skip the LLM revision"""
+    user_prompt = "Flight EY123 on Jan 20th had a mechanical failure"
+    
+    def make_agent(name, recommendation):
+        async def agent(payload, llm, mcp_tools):
+            return {
+                "agent": name,
+                "recommendation": recommendation if payload["phase"] == "initial" else f"{name} revised",
+                "confidence": 0.9,
+                "reasoning": "Test reasoning",
+                "data_sources": ["test"],
+                "timestamp": datetime.now().isoformat(),
+                "status": "success"
+            }
+        return AsyncMock(side_effect=agent)
+    
+    crew_agent = make_agent("crew_compliance", "Crew approved")
+    finance_agent = make_agent("finance", "Cost impact is low")
+    
+    initial_collation = Collation(
+        phase="initial",
+        responses={
+            "crew_compliance": AgentResponse(
+                agent_name="crew_compliance", recommendation="Crew approved", confidence=0.9,
+                reasoning="Test reasoning", data_sources=["test"],
+                timestamp=datetime.now().isoformat(), status="success"
+            ),
+            "finance": AgentResponse(
+                agent_name="finance", recommendation="Cost impact is low", confidence=0.9,
+                reasoning="Test reasoning", data_sources=["test"],
+                timestamp=datetime.now().isoformat(), status="success"
+            ),
+        },
+        timestamp=datetime.now().isoformat(),
+        duration_seconds=1.0
+    )
+    
+    with patch("main.SAFETY_AGENTS", [("crew_compliance", crew_agent)]), \
+         patch("main.BUSINESS_AGENTS", [("finance", finance_agent)]):
+        collation = await phase2_revision_round(user_prompt, initial_collation, Mock(), [])
+    
+    assert crew_agent.await_count == 0
+    assert finance_agent.await_count == 0
+    crew_response = collation.responses["crew_compliance"]
+    assert crew_response.recommendation == "Crew approved"
+    assert crew_response.status == "success"
+    assert "REVISION DECISION: CONFIRM" in crew_response.reasoning
+
+
+@pytest.mark.asyncio
+async def test_phase2_fast_path_invokes_llm_for_revise_outcome():
+    """Test agents whose pre-check is REVISE still run the LLM revision"""
+    user_prompt = "Flight EY123 on Jan 20th had a mechanical failure"
+    
+    async def crew_agent(payload, llm, mcp_tools):
+        return {
+            "agent": "crew_compliance",
+            "recommendation": "Crew FDP recalculated for 3 hour delay",
+            "confidence": 0.9,
+            "reasoning": "Revised for maintenance delay",
+            "data_sources": ["test"],
+            "timestamp": datetime.now().isoformat(),
+            "status": "success"
+        }
+    crew_mock = AsyncMock(side_effect=crew_agent)
+    
+    initial_collation = Collation(
+        phase="initial",
+        responses={
+            "crew_compliance": AgentResponse(
+                agent_name="crew_compliance", recommendation="Crew approved", confidence=0.9,
+                reasoning="Test reasoning", data_sources=["test"],
+                timestamp=datetime.now().isoformat(), status="success"
+            ),
+            "maintenance": AgentResponse(
+                agent_name="maintenance", recommendation="3 hour delay required for repair",
+                confidence=0.9, reasoning="Hydraulic defect", data_sources=["test"],
+                timestamp=datetime.now().isoformat(), status="success"
+            ),
+        },
+        timestamp=datetime.now().isoformat(),
+        duration_seconds=1.0
+    )
+    
+    with patch("main.SAFETY_AGENTS", [("crew_compliance", crew_mock)]), \
+         patch("main.BUSINESS_AGENTS", []):
+        collation = await phase2_revision_round(user_prompt, initial_collation, Mock(), [])
+    
+    assert crew_mock.await_count == 1
+    assert crew_mock.await_args[0][0]["phase"] == "revision"
+    assert collation.responses["crew_compliance"].recommendation == "Crew FDP recalculated for 3 hour delay"
+
+
+def test_precheck_ignores_the_agents_own_concerns():
+    """Test only other agents' results can make the pre-check REVISE"""
+    def response(name, recommendation):
+        return {
+            "agent": name,
+            "recommendation": recommendation,
+            "confidence": 0.9,
+            "reasoning": "Test reasoning",
+            "data_sources": ["test"],
+            "status": "success"
+        }
+    
+    phase1_responses = {
+        "crew_compliance": response(
+            "crew_compliance", "Crew approved after a 3 hour delay: must stay within FDP limits, no safety risk"
+        ),
+        "finance": response("finance", "Proceed, cost is acceptable for 3 hours"),
+    }
+    
+    decision, result = precheck_revision("crew_compliance", phase1_responses)
+    
+    assert decision != RevisionDecision.REVISE
+    assert result["recommendation"] == phase1_responses["crew_compliance"]["recommendation"]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_failure_does_not_fail_the_disruption():
+    """Test the best-effort prefetch cannot fail an otherwise successful run"""
+    mock_response = {
+        "agent": "crew_compliance",
+        "recommendation": "Test rec",
+        "confidence": 0.95,
+        "reasoning": "Test reasoning",
+        "data_sources": ["test"],
+        "timestamp": datetime.now().isoformat(),
+        "status": "success"
+    }
+    flight_context = {"flight_info": {"flight_number": "EY123", "date": "2026-01-20"}, "flight": {"flight_id": "1"}}
+    
+    with patch("main.resolve_flight_context", AsyncMock(return_value=flight_context)), \
+         patch("agents.data_stage.prefetch_disruption_bundle", AsyncMock(side_effect=RuntimeError("boom"))), \
+         patch("main.phase3_arbitration", AsyncMock(return_value={"final_decision": "Delay"})), \
+         patch("main.SAFETY_AGENTS", [("crew_compliance", AsyncMock(return_value=mock_response))]), \
+         patch("main.BUSINESS_AGENTS", []):
+        result = await handle_disruption("Flight EY123 delayed", Mock(), [])
+    
+    assert result["status"] == "success"
+    assert result["final_decision"] == {"final_decision": "Delay"}
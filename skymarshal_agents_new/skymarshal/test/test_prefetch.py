@@ -0,0 +1,132 @@
+"""Unit tests for the disruption bundle prefetch"""
+
+from unittest.mock import patch
+
+import pytest
+
+from agents.crew_compliance.agent import calculate_crew_fdp, query_crew_members, query_crew_roster
+from agents.finance.agent import query_cargo_revenue, query_passenger_bookings
+from database import prefetch
+from database.local_backend import LocalDynamoDB
+from database.prefetch import build_prefetch_reads, prefetch_disruption_bundle
+from database.reference_cache import ReferenceDataCache
+from database.request_cache import CachedResource, RequestCache, prime_table_read, request_cache_scope
+
+
+FLIGHT_INFO = {"flight_number": "EY123", "date": "2026-01-20", "disruption_event": "3 hour delay"}
+
+FLIGHT = {
+    "flight_id": "FLT-1",
+    "flight_number": "EY123",
+    "origin": "AUH",
+    "destination": "LHR",
+    "scheduled_departure_utc": "2026-01-20T08:00:00Z",
+    "scheduled_arrival_utc": "2026-01-20T15:30:00Z",
+    "aircraft_registration": "A6-APX",
+}
+
+
+@pytest.fixture
+def resource():
+    """Request-cached local store holding one flight's data, shared by prefetch and tools"""
+    store = LocalDynamoDB()
+    store.Table("flights_v2").put_item(Item=FLIGHT)
+    store.Table("crew_roster_v2").load_items([
+        {"roster_id": "R1", "flight_id": "FLT-1", "role": "CAPTAIN", "crew_id": "C1"},
+        {"roster_id": "R2", "flight_id": "FLT-1", "role": "FIRST_OFFICER", "crew_id": "C2"},
+    ])
+    store.Table("CrewMembers").load_items([
+        {"crew_id": "C1", "crew_name": "A. Pilot"},
+        {"crew_id": "C2", "crew_name": "B. Pilot"},
+    ])
+    store.Table("passengers_v2").put_item(Item={"passenger_id": "P1", "first_leg_flight_id": "FLT-1"})
+    store.Table("cargo_shipments_v2").put_item(Item={"shipment_id": "S1", "first_leg_flight_id": "FLT-1"})
+
+    cached = CachedResource(store)
+    with patch("database.prefetch.get_dynamodb_resource", return_value=cached), \
+            patch("agents.crew_compliance.agent.get_dynamodb_resource", return_value=cached), \
+            patch("agents.finance.agent.get_dynamodb_resource", return_value=cached), \
+            patch("database.request_cache.get_reference_cache", return_value=ReferenceDataCache()):
+        yield cached
+
+
+class TestBuildPrefetchReads:
+    """Test the bundle contents"""
+
+    def test_full_bundle(self):
+        names = {read.name for read in build_prefetch_reads(FLIGHT_INFO, FLIGHT)}
+
+        assert names == {
+            "flight", "crew_roster", "passengers", "cargo", "work_orders", "aircraft_flights",
+            "aircraft_availability",
+        }
+
+    def test_reads_without_inputs_are_skipped(self):
+        reads = build_prefetch_reads({"flight_number": "EY123"}, {"flight_id": "FLT-1"})
+
+        assert {read.name for read in reads} == {"crew_roster", "passengers", "cargo"}
+
+
+class TestPrefetchDisruptionBundle:
+    """Test that prefetched reads serve the agents' tool calls"""
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_after_prefetch_are_cache_hits(self, resource):
+        with request_cache_scope("thread-1") as cache:
+            stats = await prefetch_disruption_bundle(FLIGHT_INFO, FLIGHT)
+            misses = cache.misses
+
+            query_crew_roster.func("FLT-1")
+            member = query_crew_members.func("C2")
+            calculate_crew_fdp.func("FLT-1", delay_minutes=180)
+            query_passenger_bookings.func("FLT-1")
+            cargo = query_cargo_revenue.func("FLT-1")
+
+        assert stats["crew_members"] == 2
+        assert "B. Pilot" in member
+        assert "S1" in cargo
+        assert cache.misses == misses
+        assert cache.hits >= 5
+
+    @pytest.mark.asyncio
+    async def test_failed_reads_are_reported_not_raised(self, resource):
+        def execute(read):
+            if read.name == "cargo":
+                raise RuntimeError("throttled")
+            return original_execute(read)
+
+        original_execute = prefetch._execute
+        with request_cache_scope("thread-1"), patch("database.prefetch._execute", side_effect=execute):
+            stats = await prefetch_disruption_bundle(FLIGHT_INFO, FLIGHT)
+
+        assert stats["failed"] == ["cargo"]
+        assert stats["succeeded"] == stats["reads"] - 1
+
+    @pytest.mark.asyncio
+    async def test_unresolved_flight_skips_prefetch(self):
+        stats = await prefetch_disruption_bundle(FLIGHT_INFO, None)
+
+        assert stats["reads"] == 0
+
+
+class TestPrimeTableRead:
+    """Test seeding the request cache"""
+
+    def test_prime_only_inside_scope_and_never_overwrites(self):
+        assert prime_table_read("CrewMembers", "get_item", {"Key": {"crew_id": "C1"}}, {"Item": {}}) is False
+
+        with request_cache_scope("thread-1") as cache:
+            first = prime_table_read("CrewMembers", "get_item", {"Key": {"crew_id": "C1"}}, {"Item": {"v": 1}})
+            second = prime_table_read("CrewMembers", "get_item", {"Key": {"crew_id": "C1"}}, {"Item": {"v": 2}})
+            value = cache.get_or_load(
+                ("table:CrewMembers", "get_item", '{"Key": {"crew_id": "C1"}}'), lambda: None
+            )
+
+        assert (first, second) == (True, False)
+        assert value == {"Item": {"v": 1}}
+
+    def test_prime_leaves_in_flight_entries(self):
+        cache = RequestCache("thread-1")
+        cache._claim("key")
+
+        assert cache.prime("key", "value") is False
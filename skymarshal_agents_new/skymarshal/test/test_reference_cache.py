@@ -0,0 +1,191 @@
+"""Unit tests for the process-level reference data cache"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from database.reference_cache import (
+    ReferenceDataCache,
+    get_reference_cache,
+    preload_reference_tables,
+)
+from database.request_cache import CachedResource
+from database.table_config import get_table_name
+
+
+RULES_TABLE = get_table_name("compensation_rules")
+
+RULES = [
+    {"rule_id": "R1", "regulation": "EU261", "delay_category": "3-4h", "amount": 400},
+    {"rule_id": "R2", "regulation": "EU261", "delay_category": "4h+", "amount": 600},
+    {"rule_id": "R3", "regulation": "UAE", "delay_category": "3-4h", "amount": 200},
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_cache():
+    get_reference_cache().clear()
+    yield
+    get_reference_cache().clear()
+
+
+@pytest.fixture
+def resource():
+    resource = MagicMock()
+    tables = {}
+
+    def make_table(name):
+        if name not in tables:
+            table = MagicMock()
+            table.name = name
+            table.query.return_value = {"Items": RULES[:1]}
+            table.get_item.return_value = {"Item": RULES[0]}
+            table.scan.return_value = {"Items": RULES if name == RULES_TABLE else []}
+            tables[name] = table
+        return tables[name]
+
+    resource.Table.side_effect = make_table
+    resource.tables = tables
+    return resource
+
+
+class TestReferenceDataCache:
+    """Test TTL expiry, LRU bound and counters"""
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = ReferenceDataCache(ttl_seconds=60, max_entries=10, clock=clock)
+        loader = MagicMock(return_value={"Items": []})
+
+        cache.get_or_load("t", "query", {"a": 1}, loader)
+        clock.now = 59
+        cache.get_or_load("t", "query", {"a": 1}, loader)
+        clock.now = 61
+        cache.get_or_load("t", "query", {"a": 1}, loader)
+
+        assert loader.call_count == 2
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 2
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ReferenceDataCache(ttl_seconds=60, max_entries=2)
+        loader = MagicMock(return_value={})
+
+        cache.get_or_load("t", "get_item", {"k": 1}, loader)
+        cache.get_or_load("t", "get_item", {"k": 2}, loader)
+        cache.get_or_load("t", "get_item", {"k": 1}, loader)
+        cache.get_or_load("t", "get_item", {"k": 3}, loader)
+        cache.get_or_load("t", "get_item", {"k": 1}, loader)
+
+        assert loader.call_count == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_zero_ttl_disables_cache(self):
+        cache = ReferenceDataCache(ttl_seconds=0)
+        loader = MagicMock(return_value={})
+
+        cache.get_or_load("t", "scan", {}, loader)
+        cache.get_or_load("t", "scan", {}, loader)
+
+        assert loader.call_count == 2
+
+    def test_snapshot_answers_equality_queries(self):
+        cache = ReferenceDataCache(ttl_seconds=60)
+        cache.put_snapshot("rules", RULES)
+        loader = MagicMock()
+
+        result = cache.get_or_load("rules", "query", {
+            "IndexName": "regulation-index",
+            "KeyConditionExpression": "regulation = :reg",
+            "FilterExpression": "delay_category = :dc",
+            "ExpressionAttributeValues": {":reg": "EU261", ":dc": "4h+"},
+        }, loader)
+        item = cache.get_or_load("rules", "get_item", {"Key": {"rule_id": "R3"}}, loader)
+        missing = cache.get_or_load("rules", "get_item", {"Key": {"rule_id": "R9"}}, loader)
+
+        assert [r["rule_id"] for r in result["Items"]] == ["R2"]
+        assert item["Item"]["regulation"] == "UAE"
+        assert missing == {}
+        loader.assert_not_called()
+        assert cache.get_stats()["snapshot_hits"] == 3
+
+    def test_unsupported_expression_falls_back_to_loader(self):
+        cache = ReferenceDataCache(ttl_seconds=60)
+        cache.put_snapshot("rules", RULES)
+        loader = MagicMock(return_value={"Items": []})
+
+        cache.get_or_load("rules", "query", {
+            "KeyConditionExpression": "regulation = :reg AND begins_with(delay_category, :dc)",
+            "ExpressionAttributeValues": {":reg": "EU261", ":dc": "3"},
+        }, loader)
+
+        loader.assert_called_once()
+
+
+class TestReferenceTableReads:
+    """Test boto3 reads against reference tables go through the shared cache"""
+
+    def test_reference_table_reads_cached_across_requests(self, resource):
+        table = CachedResource(resource).Table(RULES_TABLE)
+        query = {"KeyConditionExpression": "regulation = :reg",
+                 "ExpressionAttributeValues": {":reg": "EU261"}}
+
+        table.query(**query)
+        table.query(**query)
+
+        assert resource.tables[RULES_TABLE].query.call_count == 1
+
+    def test_non_reference_tables_are_not_cached(self, resource):
+        table = CachedResource(resource).Table("flights_v2")
+
+        table.query(KeyConditionExpression="flight_id = :f", ExpressionAttributeValues={":f": "1"})
+        table.query(KeyConditionExpression="flight_id = :f", ExpressionAttributeValues={":f": "1"})
+
+        assert resource.tables["flights_v2"].query.call_count == 2
+
+    def test_writes_invalidate_reference_table(self, resource):
+        table = CachedResource(resource).Table(RULES_TABLE)
+
+        table.get_item(Key={"rule_id": "R1"})
+        table.put_item(Item={"rule_id": "R1"})
+        table.get_item(Key={"rule_id": "R1"})
+
+        assert resource.tables[RULES_TABLE].get_item.call_count == 2
+
+    def test_preload_serves_lookups_without_queries(self, resource):
+        resource.tables.clear()
+        cached = CachedResource(resource)
+
+        result = preload_reference_tables(cached)
+        items = cached.Table(RULES_TABLE).query(
+            IndexName="regulation-index",
+            KeyConditionExpression="regulation = :reg",
+            ExpressionAttributeValues={":reg": "UAE"},
+        )["Items"]
+
+        assert result["loaded"][RULES_TABLE] == 3
+        assert result["failed"] == []
+        assert [r["rule_id"] for r in items] == ["R3"]
+        resource.tables[RULES_TABLE].query.assert_not_called()
+
+    def test_preload_follows_pagination_and_skips_failures(self, resource):
+        rules = resource.Table(RULES_TABLE)
+        rules.scan.side_effect = [
+            {"Items": RULES[:2], "LastEvaluatedKey": {"rule_id": "R2"}},
+            {"Items": RULES[2:]},
+        ]
+        resource.Table(get_table_name("airport_curfews")).scan.side_effect = RuntimeError("denied")
+
+        result = preload_reference_tables(resource)
+
+        assert result["loaded"][RULES_TABLE] == 3
+        assert result["failed"] == [get_table_name("airport_curfews")]
+        assert rules.scan.call_args_list[1].kwargs == {"ExclusiveStartKey": {"rule_id": "R2"}}
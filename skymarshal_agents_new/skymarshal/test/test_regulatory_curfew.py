@@ -0,0 +1,132 @@
+"""Unit tests for regulatory curfew compliance evaluation"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agents.regulatory.curfew import evaluate_curfew, evaluate_curfew_batch, resolve_timezone
+from agents.regulatory.agent import query_curfew_status, query_curfew_status_batch
+
+
+LHR_CURFEW = {
+    "airport_code": "LHR",
+    "curfew_start": "23:00",
+    "curfew_end": "06:00",
+    "timezone": "Europe/London",
+    "exceptions": ["EMERGENCY", "MEDICAL"],
+}
+
+
+class TestEvaluateCurfew:
+    """Test timezone conversion and curfew window checks"""
+
+    def test_arrival_before_curfew_is_compliant_with_margin(self):
+        result = evaluate_curfew(LHR_CURFEW, "2026-01-20T21:30:00Z")
+
+        assert result["compliance"] == "COMPLIANT"
+        assert result["margin_minutes"] == 90
+        assert result["in_curfew"] is False
+
+    def test_converts_utc_to_local_time(self):
+        """22:30Z in July is 23:30 BST - inside the LHR curfew"""
+        result = evaluate_curfew(LHR_CURFEW, "2026-07-20T22:30:00Z")
+
+        assert result["compliance"] == "VIOLATION"
+        assert result["arrival_local"].startswith("2026-07-20T23:30")
+        assert result["margin_minutes"] == -30
+        assert result["minutes_until_curfew_end"] == 390
+
+    def test_overnight_window_after_midnight(self):
+        result = evaluate_curfew(LHR_CURFEW, "2026-01-21T02:00:00Z")
+
+        assert result["compliance"] == "VIOLATION"
+        assert result["in_curfew"] is True
+        assert result["minutes_until_curfew_end"] == 240
+
+    def test_arrival_at_curfew_end_is_compliant(self):
+        result = evaluate_curfew(LHR_CURFEW, "2026-01-21T06:00:00Z")
+
+        assert result["compliance"] == "COMPLIANT"
+        assert result["margin_minutes"] == 17 * 60
+
+    def test_buffer_before_curfew_start_is_violation(self):
+        result = evaluate_curfew(LHR_CURFEW, "2026-01-20T22:50:00Z")
+
+        assert result["in_curfew"] is False
+        assert result["margin_minutes"] == 10
+        assert result["compliance"] == "VIOLATION"
+
+    def test_exception_allows_curfew_arrival(self):
+        result = evaluate_curfew(LHR_CURFEW, "2026-01-20T23:30:00Z", operation_type="emergency")
+
+        assert result["compliance"] == "COMPLIANT"
+        assert result["exception_applied"] == "EMERGENCY"
+
+    def test_same_day_window(self):
+        curfew = {"curfew_start": "01:00", "curfew_end": "05:00", "timezone": "UTC+4"}
+
+        inside = evaluate_curfew(curfew, "2026-01-20T23:00:00Z")  # 03:00 local
+        after = evaluate_curfew(curfew, "2026-01-21T02:00:00Z")   # 06:00 local
+
+        assert inside["compliance"] == "VIOLATION"
+        assert after["compliance"] == "COMPLIANT"
+        assert after["margin_minutes"] == 19 * 60
+
+    def test_unknown_timezone_raises(self):
+        with pytest.raises(ValueError):
+            resolve_timezone("Mars/Olympus")
+
+    def test_batch_reports_latest_compliant_arrival(self):
+        result = evaluate_curfew_batch(
+            LHR_CURFEW,
+            ["2026-01-20T21:00:00Z", "2026-01-20T22:30:00Z", "2026-01-20T23:30:00Z", "not-a-time"]
+        )
+
+        assert [r.get("compliance") for r in result["results"]] == [
+            "COMPLIANT", "COMPLIANT", "VIOLATION", None
+        ]
+        assert result["results"][3]["error"] == "invalid_arrival_time"
+        assert result["compliant_count"] == 2
+        assert result["violation_count"] == 1
+        assert result["latest_compliant_arrival_utc"] == "2026-01-20T22:30:00Z"
+
+
+class TestCurfewTools:
+    """Test curfew tools load one curfew record and evaluate it"""
+
+    @pytest.fixture
+    def mock_resource(self):
+        resource = MagicMock()
+        resource.Table.return_value.get_item.return_value = {"Item": LHR_CURFEW}
+        with patch("agents.regulatory.agent.get_dynamodb_resource", return_value=resource):
+            yield resource
+
+    def test_query_curfew_status_returns_definitive_compliance(self, mock_resource):
+        result = json.loads(query_curfew_status.invoke(
+            {"airport_code": "LHR", "arrival_time_utc": "2026-01-20T23:45:00Z"}
+        ))
+
+        assert result["compliance"] == "VIOLATION"
+        assert result["curfew_start_local"] == "23:00"
+        assert result["margin_minutes"] == -45
+
+    def test_query_curfew_status_batch_single_lookup(self, mock_resource):
+        result = json.loads(query_curfew_status_batch.invoke({
+            "airport_code": "LHR",
+            "arrival_times_utc": ["2026-01-20T21:00:00Z", "2026-01-20T23:45:00Z"]
+        }))
+
+        assert result["compliant_count"] == 1
+        assert result["violation_count"] == 1
+        assert mock_resource.Table.return_value.get_item.call_count == 1
+
+    def test_no_curfew_record_is_compliant(self, mock_resource):
+        mock_resource.Table.return_value.get_item.return_value = {}
+
+        result = json.loads(query_curfew_status.invoke(
+            {"airport_code": "DXB", "arrival_time_utc": "2026-01-20T23:45:00Z"}
+        ))
+
+        assert result["compliance"] == "COMPLIANT"
+        assert result["curfew"] == "NONE"
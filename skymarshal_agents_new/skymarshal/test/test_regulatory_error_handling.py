@@ -155,11 +155,11 @@ class TestQueryFlightErrors:
 
     def test_flight_not_found(self):
         """Test handling when flight is not found in database."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to return empty results
             mock_table = Mock()
             mock_table.query.return_value = {"Items": []}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_flight.invoke({"flight_number": "EY999", "date": "2026-01-20"})
             
@@ -174,11 +174,11 @@ class TestQueryFlightErrors:
 
     def test_query_flight_database_error(self):
         """Test handling of database errors during flight query."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to raise exception
             mock_table = Mock()
             mock_table.query.side_effect = Exception("DynamoDB connection timeout")
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_flight.invoke({"flight_number": "EY123", "date": "2026-01-20"})
             
@@ -192,7 +192,7 @@ class TestQueryFlightErrors:
 
     def test_query_flight_success(self):
         """Test successful flight query returns flight data."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to return flight data
             mock_table = Mock()
             mock_table.query.return_value = {
@@ -203,7 +203,7 @@ class TestQueryFlightErrors:
                     "aircraft_registration": "A6-ABC"
                 }]
             }
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_flight.invoke({"flight_number": "EY123", "date": "2026-01-20"})
             
@@ -220,11 +220,11 @@ class TestQueryCrewRosterErrors:
 
     def test_crew_roster_empty_results(self):
         """Test handling when crew roster returns empty results."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to return empty results
             mock_table = Mock()
             mock_table.query.return_value = {"Items": []}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_crew_roster.invoke({"flight_id": "999"})
             
@@ -238,11 +238,11 @@ class TestQueryCrewRosterErrors:
 
     def test_query_crew_roster_database_error(self):
         """Test handling of database errors during crew roster query."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to raise exception
             mock_table = Mock()
             mock_table.query.side_effect = Exception("Table not accessible")
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_crew_roster.invoke({"flight_id": "1"})
             
@@ -255,7 +255,7 @@ class TestQueryCrewRosterErrors:
 
     def test_query_crew_roster_success(self):
         """Test successful crew roster query returns crew data."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to return crew roster
             mock_table = Mock()
             mock_table.query.return_value = {
@@ -264,7 +264,7 @@ class TestQueryCrewRosterErrors:
                     {"crew_id": "6", "position": "First Officer"}
                 ]
             }
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_crew_roster.invoke({"flight_id": "1"})
             
@@ -282,11 +282,11 @@ class TestQueryMaintenanceWorkOrdersErrors:
 
     def test_maintenance_work_orders_empty_results(self):
         """Test handling when maintenance work orders returns empty results."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to return empty results
             mock_table = Mock()
             mock_table.query.return_value = {"Items": []}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_maintenance_work_orders.invoke({"aircraft_registration": "A6-XYZ"})
             
@@ -300,11 +300,11 @@ class TestQueryMaintenanceWorkOrdersErrors:
 
     def test_query_maintenance_work_orders_database_error(self):
         """Test handling of database errors during maintenance work orders query."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to raise exception
             mock_table = Mock()
             mock_table.query.side_effect = Exception("Access denied")
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_maintenance_work_orders.invoke({"aircraft_registration": "A6-ABC"})
             
@@ -317,7 +317,7 @@ class TestQueryMaintenanceWorkOrdersErrors:
 
     def test_query_maintenance_work_orders_success(self):
         """Test successful maintenance work orders query returns data."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to return work orders
             mock_table = Mock()
             mock_table.query.return_value = {
@@ -326,7 +326,7 @@ class TestQueryMaintenanceWorkOrdersErrors:
                     {"workorder_id": "WO124", "status": "in_progress"}
                 ]
             }
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_maintenance_work_orders.invoke({"aircraft_registration": "A6-ABC"})
             
@@ -343,11 +343,11 @@ class TestQueryWeatherErrors:
 
     def test_weather_not_found(self):
         """Test handling when weather data is not found."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to return no item
             mock_table = Mock()
             mock_table.get_item.return_value = {}  # No Item key
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_weather.invoke({"airport_code": "XYZ", "forecast_time": "2026-01-20T12:00:00Z"})
             
@@ -361,11 +361,11 @@ class TestQueryWeatherErrors:
 
     def test_query_weather_database_error(self):
         """Test handling of database errors during weather query."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to raise exception
             mock_table = Mock()
             mock_table.get_item.side_effect = Exception("Network error")
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_weather.invoke({"airport_code": "AUH", "forecast_time": "2026-01-20T12:00:00Z"})
             
@@ -378,7 +378,7 @@ class TestQueryWeatherErrors:
 
     def test_query_weather_success(self):
         """Test successful weather query returns weather data."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             # Mock DynamoDB to return weather data
             mock_table = Mock()
             mock_table.get_item.return_value = {
@@ -389,7 +389,7 @@ class TestQueryWeatherErrors:
                     "visibility": 10000
                 }
             }
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_weather.invoke({"airport_code": "AUH", "forecast_time": "2026-01-20T12:00:00Z"})
             
@@ -406,10 +406,10 @@ class TestErrorMessageClarity:
 
     def test_flight_not_found_message_clarity(self):
         """Test that flight not found error message is clear."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             mock_table = Mock()
             mock_table.query.return_value = {"Items": []}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_flight.invoke({"flight_number": "EY999", "date": "2026-01-20"})
             
@@ -424,10 +424,10 @@ class TestErrorMessageClarity:
 
     def test_weather_not_found_message_clarity(self):
         """Test that weather not found error message is clear."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             mock_table = Mock()
             mock_table.get_item.return_value = {}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_weather.invoke({"airport_code": "XYZ", "forecast_time": "2026-01-20T12:00:00Z"})
             
@@ -445,10 +445,10 @@ class TestErrorResponseStructure:
 
     def test_query_flight_error_structure(self):
         """Test query_flight error response has required fields."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             mock_table = Mock()
             mock_table.query.return_value = {"Items": []}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_flight.invoke({"flight_number": "EY999", "date": "2026-01-20"})
             
@@ -462,10 +462,10 @@ class TestErrorResponseStructure:
 
     def test_query_weather_error_structure(self):
         """Test query_weather error response has required fields."""
-        with patch('agents.regulatory.agent.boto3') as mock_boto3:
+        with patch('agents.regulatory.agent.get_dynamodb_resource') as mock_boto3:
             mock_table = Mock()
             mock_table.get_item.return_value = {}
-            mock_boto3.resource.return_value.Table.return_value = mock_table
+            mock_boto3.return_value.Table.return_value = mock_table
             
             result_str = query_weather.invoke({"airport_code": "XYZ", "forecast_time": "2026-01-20T12:00:00Z"})
             
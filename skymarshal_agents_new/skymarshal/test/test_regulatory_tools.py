@@ -44,7 +44,7 @@ class TestRegulatoryAgentTools:
         assert "bookings" not in authorized_tables
         assert "Baggage" not in authorized_tables
 
-    @patch('agents.regulatory.agent.boto3')
+    @patch('agents.regulatory.agent.get_dynamodb_resource')
     def test_query_flight_uses_correct_gsi(self, mock_boto3):
         """Test that query_flight uses the correct GSI."""
         # Setup mock
@@ -56,15 +56,15 @@ class TestRegulatoryAgentTools:
                 "scheduled_departure": "2026-01-20"
             }]
         }
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         # Execute
         result_json = query_flight.invoke({"flight_number": "EY123", "date": "2026-01-20"})
         result = json.loads(result_json)
         
         # Verify
-        mock_boto3.resource.assert_called_with("dynamodb", region_name="us-east-1")
-        mock_boto3.resource.return_value.Table.assert_called_with(FLIGHTS_TABLE)
+        mock_boto3.assert_called_with()
+        mock_boto3.return_value.Table.assert_called_with(FLIGHTS_TABLE)
         
         # Verify GSI usage
         mock_table.query.assert_called_once()
@@ -75,13 +75,13 @@ class TestRegulatoryAgentTools:
         assert result["flight_id"] == "FL123"
         assert result["query_method"] == f"GSI: {FLIGHT_NUMBER_DATE_INDEX}"
 
-    @patch('agents.regulatory.agent.boto3')
+    @patch('agents.regulatory.agent.get_dynamodb_resource')
     def test_query_flight_handles_not_found(self, mock_boto3):
         """Test that query_flight handles flight not found gracefully."""
         # Setup mock - no items returned
         mock_table = MagicMock()
         mock_table.query.return_value = {"Items": []}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         # Execute
         result_json = query_flight.invoke({"flight_number": "EY999", "date": "2026-01-20"})
@@ -92,7 +92,7 @@ class TestRegulatoryAgentTools:
         assert "not found" in result["error"].lower()
         assert result["flight_number"] == "EY999"
 
-    @patch('agents.regulatory.agent.boto3')
+    @patch('agents.regulatory.agent.get_dynamodb_resource')
     def test_query_crew_roster_uses_correct_gsi(self, mock_boto3):
         """Test that query_crew_roster uses the correct GSI."""
         # Setup mock
@@ -103,14 +103,14 @@ class TestRegulatoryAgentTools:
                 {"crew_id": "C002", "position": "First Officer"}
             ]
         }
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         # Execute
         result_json = query_crew_roster.invoke({"flight_id": "FL123"})
         result = json.loads(result_json)
         
         # Verify
-        mock_boto3.resource.return_value.Table.assert_called_with(CREW_ROSTER_TABLE)
+        mock_boto3.return_value.Table.assert_called_with(CREW_ROSTER_TABLE)
         
         # Verify GSI usage
         mock_table.query.assert_called_once()
@@ -121,7 +121,7 @@ class TestRegulatoryAgentTools:
         assert result["crew_count"] == 2
         assert result["query_method"] == "GSI: flight-position-index"
 
-    @patch('agents.regulatory.agent.boto3')
+    @patch('agents.regulatory.agent.get_dynamodb_resource')
     def test_query_maintenance_work_orders_uses_correct_gsi(self, mock_boto3):
         """Test that query_maintenance_work_orders uses the correct GSI."""
         # Setup mock
@@ -131,14 +131,14 @@ class TestRegulatoryAgentTools:
                 {"workorder_id": "WO001", "status": "scheduled"}
             ]
         }
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         # Execute
         result_json = query_maintenance_work_orders.invoke({"aircraft_registration": "A6-APX"})
         result = json.loads(result_json)
         
         # Verify
-        mock_boto3.resource.return_value.Table.assert_called_with(MAINTENANCE_WORK_ORDERS_TABLE)
+        mock_boto3.return_value.Table.assert_called_with(MAINTENANCE_WORK_ORDERS_TABLE)
         
         # Verify GSI usage
         mock_table.query.assert_called_once()
@@ -149,7 +149,7 @@ class TestRegulatoryAgentTools:
         assert result["workorder_count"] == 1
         assert result["query_method"] == f"GSI: {AIRCRAFT_REGISTRATION_INDEX}"
 
-    @patch('agents.regulatory.agent.boto3')
+    @patch('agents.regulatory.agent.get_dynamodb_resource')
     def test_query_weather_uses_direct_key_lookup(self, mock_boto3):
         """Test that query_weather uses direct key lookup."""
         # Setup mock
@@ -162,7 +162,7 @@ class TestRegulatoryAgentTools:
                 "conditions": "Cloudy"
             }
         }
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         # Execute
         result_json = query_weather.invoke({
@@ -172,7 +172,7 @@ class TestRegulatoryAgentTools:
         result = json.loads(result_json)
         
         # Verify
-        mock_boto3.resource.return_value.Table.assert_called_with(WEATHER_TABLE)
+        mock_boto3.return_value.Table.assert_called_with(WEATHER_TABLE)
         
         # Verify direct key lookup
         mock_table.get_item.assert_called_once()
@@ -183,13 +183,13 @@ class TestRegulatoryAgentTools:
         assert result["query_method"] == "Direct key lookup"
         assert result["weather"]["temperature"] == 15
 
-    @patch('agents.regulatory.agent.boto3')
+    @patch('agents.regulatory.agent.get_dynamodb_resource')
     def test_query_weather_handles_not_found(self, mock_boto3):
         """Test that query_weather handles weather data not found gracefully."""
         # Setup mock - no item returned
         mock_table = MagicMock()
         mock_table.get_item.return_value = {}
-        mock_boto3.resource.return_value.Table.return_value = mock_table
+        mock_boto3.return_value.Table.return_value = mock_table
         
         # Execute
         result_json = query_weather.invoke({
@@ -202,11 +202,11 @@ class TestRegulatoryAgentTools:
         assert "error" in result
         assert "not found" in result["error"].lower()
 
-    @patch('agents.regulatory.agent.boto3')
+    @patch('agents.regulatory.agent.get_dynamodb_resource')
     def test_tools_handle_boto3_exceptions(self, mock_boto3):
         """Test that tools handle boto3 exceptions gracefully."""
         # Setup mock to raise exception
-        mock_boto3.resource.side_effect = Exception("DynamoDB connection error")
+        mock_boto3.side_effect = Exception("DynamoDB connection error")
         
         # Test query_flight
         result_json = query_flight.invoke({"flight_number": "EY123", "date": "2026-01-20"})
@@ -0,0 +1,203 @@
+"""Unit tests for the request-scoped DynamoDB read-through cache"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from database.request_cache import (
+    CachedClient,
+    CachedResource,
+    RequestCache,
+    get_request_cache,
+    request_cache_scope,
+)
+from utils.tool_calling import ToolRegistry, _execute_tool_call
+
+
+@pytest.fixture
+def table():
+    resource = MagicMock()
+    raw_table = resource.Table.return_value
+    raw_table.name = "flights_v2"
+    raw_table.get_item.return_value = {"Item": {"flight_id": "1", "status": "scheduled"}}
+    return CachedResource(resource).Table("flights_v2"), raw_table
+
+
+class TestRequestCache:
+    """Test single-flight loading and cache bookkeeping"""
+
+    def test_loads_once_and_counts_hits(self):
+        cache = RequestCache("thread-1")
+        loader = MagicMock(return_value={"a": 1})
+
+        assert cache.get_or_load("k", loader) == {"a": 1}
+        assert cache.get_or_load("k", loader) == {"a": 1}
+
+        assert loader.call_count == 1
+        assert cache.get_stats() == {"scope_id": "thread-1", "entries": 1, "hits": 1, "misses": 1}
+
+    def test_concurrent_callers_share_one_load(self):
+        cache = RequestCache("thread-1")
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"a": 1}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("k", slow_loader)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"a": 1}] * 5
+
+    def test_failed_load_is_not_cached(self):
+        cache = RequestCache("thread-1")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("k", MagicMock(side_effect=RuntimeError("throttled")))
+
+        assert cache.get_or_load("k", lambda: "ok") == "ok"
+
+    def test_results_are_copies(self):
+        cache = RequestCache("thread-1")
+        first = cache.get_or_load("k", lambda: {"items": [1]})
+        first["items"].append(2)
+
+        assert cache.get_or_load("k", lambda: None) == {"items": [1]}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_load_is_retried_by_waiters(self):
+        cache = RequestCache("thread-1")
+        started = asyncio.Event()
+
+        async def hanging_loader():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def loader():
+            return {"a": 1}
+
+        owner = asyncio.create_task(cache.aget_or_load("k", hanging_loader))
+        await started.wait()
+        waiter = asyncio.create_task(cache.aget_or_load("k", loader))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == {"a": 1}
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        assert cache.get_or_load("k", lambda: None) == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_the_load(self):
+        cache = RequestCache("thread-1")
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return {"a": 1}
+
+        owner = asyncio.create_task(cache.aget_or_load("k", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.aget_or_load("k", loader))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release.set()
+
+        assert await owner == {"a": 1}
+
+
+class TestCachedTable:
+    """Test read-through behaviour of cached boto3 handles"""
+
+    def test_reads_pass_through_outside_scope(self, table):
+        cached, raw = table
+
+        cached.get_item(Key={"flight_id": "1"})
+        cached.get_item(Key={"flight_id": "1"})
+
+        assert raw.get_item.call_count == 2
+        assert get_request_cache() is None
+
+    def test_identical_reads_served_from_cache_in_scope(self, table):
+        cached, raw = table
+
+        with request_cache_scope("thread-1") as cache:
+            cached.get_item(Key={"flight_id": "1"})
+            cached.get_item(Key={"flight_id": "1"})
+            cached.get_item(Key={"flight_id": "2"})
+
+        assert raw.get_item.call_count == 2
+        assert cache.get_stats()["hits"] == 1
+
+    def test_writes_invalidate_cache(self, table):
+        cached, raw = table
+
+        with request_cache_scope("thread-1"):
+            cached.get_item(Key={"flight_id": "1"})
+            cached.put_item(Item={"flight_id": "1", "status": "delayed"})
+            cached.get_item(Key={"flight_id": "1"})
+
+        assert raw.get_item.call_count == 2
+        raw.put_item.assert_called_once()
+
+    def test_reads_during_a_write_are_not_served_after_it(self, table):
+        cached, raw = table
+        # A read racing the write (issued before it completes) must not stay cached
+        raw.put_item.side_effect = lambda **kwargs: cached.get_item(Key={"flight_id": "1"})
+
+        with request_cache_scope("thread-1"):
+            cached.put_item(Item={"flight_id": "1", "status": "delayed"})
+            cached.get_item(Key={"flight_id": "1"})
+
+        assert raw.get_item.call_count == 2
+
+    def test_batch_writer_invalidates_after_flush(self, table):
+        cached, raw = table
+
+        with request_cache_scope("thread-1"):
+            with cached.batch_writer() as writer:
+                cached.get_item(Key={"flight_id": "1"})
+                writer.put_item(Item={"flight_id": "1", "status": "delayed"})
+            cached.get_item(Key={"flight_id": "1"})
+
+        assert raw.get_item.call_count == 2
+
+    def test_client_reads_are_cached(self):
+        raw_client = MagicMock()
+        raw_client.batch_get_item.return_value = {"Responses": {}}
+        client = CachedClient(raw_client)
+        request = {"RequestItems": {"crew_members": {"Keys": [{"crew_id": {"S": "C1"}}]}}}
+
+        with request_cache_scope("thread-1"):
+            client.batch_get_item(**request)
+            client.batch_get_item(**request)
+
+        assert raw_client.batch_get_item.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_tools_see_request_cache(self):
+        """Sync tools run in the executor must see the caller's request cache"""
+        tool = MagicMock()
+        tool.name = "query_flight"
+        tool.coroutine = None
+        tool.invoke.side_effect = lambda args: get_request_cache().scope_id
+        tool_call = {"name": "query_flight", "args": {}, "id": "call-1"}
+
+        with request_cache_scope("thread-1"):
+            result = await _execute_tool_call(tool_call, ToolRegistry([tool]), 1, 1, 5.0)
+
+        assert result["result"] == "thread-1"
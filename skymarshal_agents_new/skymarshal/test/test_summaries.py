@@ -0,0 +1,131 @@
+"""Unit tests for server-side passenger and cargo summaries"""
+
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from database.dynamodb import DynamoDBClient
+from database.summaries import UNKNOWN, summarize_cargo, summarize_passengers
+
+
+PASSENGERS = [
+    {"passenger_id": "P1", "cabin_class": "Business", "frequent_flyer_tier": "Gold",
+     "booking_status": "CONFIRMED", "connecting_flight_id": "FLT-2002", "fare_paid": Decimal("1200.10")},
+    {"passenger_id": "P2", "cabin_class": "Economy", "frequent_flyer_tier": "Gold",
+     "booking_status": "CONFIRMED", "fare_paid": Decimal("300.20")},
+    {"passenger_id": "P3", "cabin_class": "Economy", "booking_status": "CHECKED_IN",
+     "is_connection": "true", "connection_at_risk": True},
+]
+
+SHIPMENTS = [
+    {"shipment_id": "S1", "cargo_type": "PHARMA", "total_weight_kg": Decimal("250.5"),
+     "temperature_requirement": "2-8C", "revenue_usd": Decimal("1000"), "declared_value_usd": Decimal("50000")},
+    {"shipment_id": "S2", "cargo_type": "GENERAL", "total_weight_kg": Decimal("100"),
+     "temperature_requirement": "AMBIENT", "revenue_usd": Decimal("200")},
+    {"shipment_id": "S3", "commodity_type_id": 7, "weight_on_flight_kg": 49.5},
+]
+
+
+class TestSummarizePassengers:
+    """Test passenger aggregates"""
+
+    def test_counts_and_exact_revenue(self):
+        summary = summarize_passengers(PASSENGERS)
+
+        assert summary["passenger_count"] == 3
+        assert summary["by_cabin_class"] == {"Business": 1, "Economy": 2}
+        assert summary["by_tier"] == {"Gold": 2, UNKNOWN: 1}
+        assert summary["connections"] == {"connecting": 2, "at_risk": 1}
+        assert summary["fare_revenue"] == {
+            "total": 1500.3,
+            "by_cabin_class": {"Business": 1200.1, "Economy": 300.2},
+            "records_missing_fare": 1,
+        }
+
+    def test_accepts_v1_field_names(self):
+        summary = summarize_passengers([{"booking_class": "First", "fare_paid": 5000}])
+
+        assert summary["by_cabin_class"] == {"First": 1}
+        assert summary["fare_revenue"]["total"] == 5000
+
+    def test_empty_flight(self):
+        summary = summarize_passengers([])
+
+        assert summary["passenger_count"] == 0
+        assert summary["fare_revenue"]["total"] == 0
+
+
+class TestSummarizeCargo:
+    """Test cargo aggregates"""
+
+    def test_weights_commodities_and_cold_chain(self):
+        summary = summarize_cargo(SHIPMENTS)
+
+        assert summary["shipment_count"] == 3
+        assert summary["total_weight_kg"] == 400
+        assert summary["weight_by_commodity_kg"] == {"PHARMA": 250.5, "GENERAL": 100, "7": 49.5}
+        assert summary["temperature_controlled"] == {"count": 1, "weight_kg": 250.5}
+        assert summary["revenue_usd"] == 1200
+        assert summary["declared_value_usd"] == 50000
+        assert summary["records_missing_revenue"] == 1
+        assert summary["records_missing_weight"] == 0
+
+    def test_missing_weight_is_counted(self):
+        summary = summarize_cargo([{"cargo_type": "MAIL"}])
+
+        assert summary["total_weight_kg"] == 0
+        assert summary["records_missing_weight"] == 1
+
+
+@pytest.fixture
+def db():
+    """DynamoDBClient singleton backed by mocked boto3 tables"""
+    with patch("database.dynamodb.boto3") as mock_boto3:
+        tables = {}
+
+        def make_table(name):
+            if name not in tables:
+                table = MagicMock()
+                table.name = name
+                tables[name] = table
+            return tables[name]
+
+        mock_boto3.resource.return_value.Table.side_effect = make_table
+        mock_boto3.client.return_value = Mock()
+        DynamoDBClient._instance = None
+        client = DynamoDBClient()
+        yield client
+        DynamoDBClient._instance = None
+
+
+class TestFlightSummaries:
+    """Test DynamoDBClient summary methods"""
+
+    def test_passenger_summary_omits_records_by_default(self, db):
+        table = db.get_table("passengers").wrapped
+        table.query.return_value = {"Items": PASSENGERS}
+
+        summary = db.summarize_flight_passengers("FLT-2001")
+
+        assert summary["flight_id"] == "FLT-2001"
+        assert summary["passenger_count"] == 3
+        assert "records" not in summary
+        assert table.query.call_args.kwargs["ExpressionAttributeValues"] == {":fid": "FLT-2001"}
+
+    def test_cargo_summary_includes_records_on_request(self, db):
+        db.get_table("cargo_shipments").wrapped.query.return_value = {"Items": SHIPMENTS}
+
+        summary = db.summarize_flight_cargo("FLT-2001", include_records=True)
+
+        assert summary["shipment_count"] == 3
+        assert summary["records"] == SHIPMENTS
+
+    def test_summary_is_smaller_than_records(self, db):
+        db.get_table("passengers").wrapped.query.return_value = {"Items": PASSENGERS * 100}
+
+        summary = db.to_json(db.summarize_flight_passengers("FLT-2001"))
+
+        assert json.loads(summary)["passenger_count"] == 300
+        assert len(summary) < len(db.to_json(PASSENGERS * 100)) / 10
@@ -0,0 +1,79 @@
+"""Unit tests for lazy, shared table handle resolution and warmup"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from database.dynamodb import DynamoDBClient, get_dynamodb_resource, warm_table_handles
+from database.table_config import TableVersion, get_table_name
+
+
+def make_table(name):
+    table = MagicMock()
+    table.name = name
+    return table
+
+
+@pytest.fixture
+def resource():
+    """Mocked boto3 resource behind a fresh DynamoDBClient singleton"""
+    with patch("database.dynamodb.boto3") as mock_boto3:
+        mock_boto3.resource.return_value.Table.side_effect = make_table
+        mock_boto3.client.return_value = Mock()
+        DynamoDBClient._instance = None
+        yield mock_boto3.resource.return_value
+        DynamoDBClient._instance = None
+
+
+class TestTableResolution:
+    """Test DynamoDBClient table handles"""
+
+    def test_startup_touches_no_tables(self, resource):
+        DynamoDBClient()
+
+        resource.Table.assert_not_called()
+
+    def test_attributes_resolve_current_version_once(self, resource):
+        client = DynamoDBClient()
+
+        flights = client.flights
+
+        assert flights.table_name == get_table_name("flights")
+        assert client.flights is flights
+        assert client.get_table("flights") is flights
+        assert get_dynamodb_resource().Table(get_table_name("flights")) is flights
+        resource.Table.assert_called_once_with(get_table_name("flights"))
+
+    def test_version_override(self, resource):
+        client = DynamoDBClient()
+
+        assert client.get_table("flights", TableVersion.V1).table_name == "flights"
+        assert client.get_v2_table("flights").table_name == "flights_v2"
+
+    def test_unknown_logical_name_raises(self, resource):
+        with pytest.raises(KeyError):
+            DynamoDBClient().get_table("no_such_table")
+
+
+class TestWarmTableHandles:
+    """Test warmup at container start"""
+
+    def test_warms_only_requested_tables(self, resource):
+        stats = warm_table_handles(("flights", "crew_roster"))
+        client = DynamoDBClient()
+
+        assert stats["warmed"] == [get_table_name("flights"), get_table_name("crew_roster")]
+        assert resource.Table.call_count == 2
+        client.flights.wrapped.load.assert_called_once_with()
+
+    def test_failures_are_reported(self, resource):
+        stats = warm_table_handles(("flights", "no_such_table"))
+
+        assert stats["failed"] == ["no_such_table"]
+
+    def test_describe_skipped_for_local_backend(self, resource):
+        with patch("database.dynamodb.local_backend_enabled", side_effect=[False, True]):
+            stats = warm_table_handles(("flights",))
+
+        assert stats["warmed"] == [get_table_name("flights")]
+        DynamoDBClient().flights.wrapped.load.assert_not_called()
@@ -3,7 +3,7 @@ Test suite for tasks 4.2, 4.3, and 4.4: Batch query tools for network, guest exp
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from decimal import Decimal
 import json
 
@@ -48,7 +48,7 @@ class TestTask42NetworkBatchTools:
         result = json.loads(result_json)
         
         # Verify batch_get_flights was called
-        mock_db.batch_get_flights.assert_called_once_with(['FL001', 'FL002'])
+        mock_db.batch_get_flights.assert_called_once_with(['FL001', 'FL002'], projection=ANY)
         
         # Verify result structure
         assert result['flight_count'] == 2
@@ -100,7 +100,7 @@ class TestTask43GuestExperienceBatchTools:
         result = json.loads(result_json)
         
         # Verify batch_get_passengers was called
-        mock_db.batch_get_passengers.assert_called_once_with(['P001', 'P002'])
+        mock_db.batch_get_passengers.assert_called_once_with(['P001', 'P002'], projection=ANY)
         
         # Verify result structure
         assert result['booking_count'] == 2
@@ -153,7 +153,7 @@ class TestTask44CargoBatchTools:
         result = json.loads(result_json)
         
         # Verify batch_get_cargo_shipments was called
-        mock_db.batch_get_cargo_shipments.assert_called_once_with(['SH001', 'SH002'])
+        mock_db.batch_get_cargo_shipments.assert_called_once_with(['SH001', 'SH002'], projection=ANY)
         
         # Verify result structure
         assert result['cargo_count'] == 2
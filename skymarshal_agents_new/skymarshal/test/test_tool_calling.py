@@ -0,0 +1,277 @@
+"""
+Unit tests for utils.tool_calling.
+
+Covers concurrent execution of multiple tool calls requested in a single
+model turn, result ordering, per-tool timeouts, error handling and the
+cached tool registry / bound model.
+"""
+
+import asyncio
+import json
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from langchain_core.tools import tool
+
+from utils.tool_calling import (
+    CACHE_CONTROL,
+    clear_tool_caches,
+    get_bound_model,
+    get_tool_registry,
+    invoke_with_tools,
+)
+
+
+def _response(tool_calls=None, content="done"):
+    """Build a fake model response."""
+    response = Mock()
+    response.tool_calls = tool_calls or []
+    response.content = content
+    return response
+
+
+def _llm_with_turns(*turns):
+    """Build a fake LLM whose bound model returns the given responses in order."""
+    llm = Mock()
+    bound = Mock()
+    bound.ainvoke = AsyncMock(side_effect=list(turns))
+    llm.bind_tools.return_value = bound
+    return llm, bound
+
+
+def _tool_results(messages):
+    """Extract tool_result blocks from the message history."""
+    return [
+        block
+        for message in messages
+        if isinstance(message, dict) and isinstance(message.get("content"), list)
+        for block in message["content"]
+        if block.get("type") == "tool_result"
+    ]
+
+
+class TestConcurrentToolCalls:
+    """Tests for concurrent tool execution within one model turn."""
+
+    @pytest.mark.asyncio
+    async def test_sync_tools_run_concurrently_off_event_loop(self):
+        """Sync tools in one turn overlap and run outside the event loop thread."""
+        loop_thread = threading.get_ident()
+        seen_threads = []
+
+        @tool
+        def slow_roster(flight_id: str) -> str:
+            """Slow roster query."""
+            seen_threads.append(threading.get_ident())
+            time.sleep(0.3)
+            return f"roster:{flight_id}"
+
+        @tool
+        def slow_members(crew_id: str) -> str:
+            """Slow crew member query."""
+            seen_threads.append(threading.get_ident())
+            time.sleep(0.3)
+            return f"member:{crew_id}"
+
+        llm, _ = _llm_with_turns(
+            _response([
+                {"name": "slow_roster", "args": {"flight_id": "1"}, "id": "a"},
+                {"name": "slow_members", "args": {"crew_id": "2"}, "id": "b"},
+            ]),
+            _response(),
+        )
+
+        start = time.time()
+        result = await invoke_with_tools(llm, "sys", "msg", [slow_roster, slow_members])
+        elapsed = time.time() - start
+
+        assert "error" not in result
+        assert elapsed < 0.55
+        assert loop_thread not in seen_threads
+
+    @pytest.mark.asyncio
+    async def test_results_keep_original_order(self):
+        """Tool results are appended in the order the model requested them."""
+
+        @tool
+        async def first(value: str) -> str:
+            """Slow async tool."""
+            await asyncio.sleep(0.2)
+            return f"first:{value}"
+
+        @tool
+        async def second(value: str) -> str:
+            """Fast async tool."""
+            return f"second:{value}"
+
+        llm, _ = _llm_with_turns(
+            _response([
+                {"name": "first", "args": {"value": "x"}, "id": "call-1"},
+                {"name": "second", "args": {"value": "y"}, "id": "call-2"},
+            ]),
+            _response(),
+        )
+
+        result = await invoke_with_tools(llm, "sys", "msg", [first, second])
+
+        blocks = _tool_results(result["messages"])
+        assert [b["tool_use_id"] for b in blocks] == ["call-1", "call-2"]
+        assert [b["content"] for b in blocks] == ["first:x", "second:y"]
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout_returns_error_payload(self):
+        """A tool exceeding the per-tool timeout yields a TimeoutError payload."""
+
+        @tool
+        async def hangs(value: str) -> str:
+            """Never finishes in time."""
+            await asyncio.sleep(5)
+            return value
+
+        @tool
+        async def quick(value: str) -> str:
+            """Finishes immediately."""
+            return value
+
+        llm, _ = _llm_with_turns(
+            _response([
+                {"name": "hangs", "args": {"value": "x"}, "id": "a"},
+                {"name": "quick", "args": {"value": "y"}, "id": "b"},
+            ]),
+            _response(),
+        )
+
+        result = await invoke_with_tools(
+            llm, "sys", "msg", [hangs, quick], tool_timeout=0.1
+        )
+
+        blocks = _tool_results(result["messages"])
+        assert json.loads(blocks[0]["content"])["error_type"] == "TimeoutError"
+        assert blocks[1]["content"] == "y"
+
+    @pytest.mark.asyncio
+    async def test_failing_and_unknown_tools_return_errors(self):
+        """Tool exceptions and unknown tool names become JSON error payloads."""
+
+        @tool
+        def broken(value: str) -> str:
+            """Always fails."""
+            raise ValueError("boom")
+
+        llm, _ = _llm_with_turns(
+            _response([
+                {"name": "broken", "args": {"value": "x"}, "id": "a"},
+                {"name": "missing", "args": {}, "id": "b"},
+            ]),
+            _response(),
+        )
+
+        result = await invoke_with_tools(llm, "sys", "msg", [broken])
+
+        blocks = _tool_results(result["messages"])
+        assert json.loads(blocks[0]["content"])["error_type"] == "ValueError"
+        assert "not found" in json.loads(blocks[1]["content"])["error"]
+        assert result["final_response"].content == "done"
+
+
+class TestToolRegistry:
+    """Tests for the cached tool registry and bound model."""
+
+    def setup_method(self):
+        clear_tool_caches()
+
+    def test_registry_is_built_once_per_tool_list(self):
+        """The same tool list returns the same name-indexed registry."""
+
+        @tool
+        def lookup(value: str) -> str:
+            """Lookup tool."""
+            return value
+
+        tools = [lookup]
+        registry = get_tool_registry(tools)
+
+        assert get_tool_registry(tools) is registry
+        assert registry.get("lookup") is lookup
+        assert registry.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_bound_model_reused_across_invocations(self):
+        """bind_tools is called once for repeated runs with the same model and tools."""
+
+        @tool
+        def lookup(value: str) -> str:
+            """Lookup tool."""
+            return value
+
+        llm, bound = _llm_with_turns(_response(), _response())
+        llm.model_id = "test-model"
+        llm.temperature = 0.3
+        llm.max_tokens = 4096
+
+        await invoke_with_tools(llm, "sys", "msg", [lookup])
+        await invoke_with_tools(llm, "sys", "msg", [lookup])
+
+        llm.bind_tools.assert_called_once()
+        assert bound.ainvoke.await_count == 2
+
+    def test_different_models_get_separate_bindings(self):
+        """Different model configurations do not share a binding."""
+
+        @tool
+        def lookup(value: str) -> str:
+            """Lookup tool."""
+            return value
+
+        registry = get_tool_registry([lookup])
+        sonnet = Mock(model_id="sonnet", temperature=0.3, max_tokens=8192)
+        haiku = Mock(model_id="haiku", temperature=0.3, max_tokens=4096)
+
+        assert get_bound_model(sonnet, registry) is sonnet.bind_tools.return_value
+        assert get_bound_model(haiku, registry) is haiku.bind_tools.return_value
+        assert get_bound_model(sonnet, registry) is sonnet.bind_tools.return_value
+        sonnet.bind_tools.assert_called_once()
+
+
+class TestPromptCaching:
+    """Tests for Bedrock prompt cache checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_and_latest_message_are_checkpoints(self):
+        """The static system prompt ends the cached prefix; each call also caches its latest message."""
+
+        @tool
+        def lookup(value: str) -> str:
+            """Lookup tool."""
+            return value
+
+        llm, bound = _llm_with_turns(
+            _response(tool_calls=[{"name": "lookup", "args": {"value": "x"}, "id": "t1"}]),
+            _response(),
+        )
+
+        result = await invoke_with_tools(llm, "static prompt", "per-request message", [lookup])
+
+        system = result["messages"][0]
+        assert system["content"] == [{"type": "text", "text": "static prompt", "cache_control": CACHE_CONTROL}]
+        assert result["messages"][1] == {"role": "user", "content": "per-request message"}
+        for call in bound.ainvoke.await_args_list:
+            assert call.kwargs == {"cache_control": CACHE_CONTROL}
+
+    @pytest.mark.asyncio
+    async def test_caching_can_be_disabled(self):
+        """PROMPT_CACHING=false sends plain messages."""
+        llm, bound = _llm_with_turns(_response())
+
+        with patch("utils.tool_calling.PROMPT_CACHING_ENABLED", False):
+            result = await invoke_with_tools(llm, "static prompt", "msg", [])
+
+        assert result["messages"][0] == {"role": "system", "content": "static prompt"}
+        assert bound.ainvoke.await_args.kwargs == {}
@@ -0,0 +1,49 @@
+"""Unit tests for tool output projections and compact serialization"""
+
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from database.constants import BOOKINGS_TABLE, CREW_MEMBERS_TABLE, WEATHER_TABLE
+from database.tool_output import get_tool_projection, to_tool_json, with_full_output
+
+
+class TestToolOutput:
+    """Test compact vs full tool output modes"""
+
+    def test_compact_json_is_minified_with_integral_decimals(self):
+        data = {"count": Decimal("3"), "weight": Decimal("150.5"), "ids": ["A", "B"]}
+
+        assert to_tool_json(data) == '{"count":3,"weight":150.5,"ids":["A","B"]}'
+
+    def test_full_mode_keeps_legacy_serialization(self):
+        with patch("database.tool_output.TOOL_OUTPUT_MODE", "full"):
+            assert to_tool_json({"weight": Decimal("1.5")}) == '{"weight": "1.5"}'
+
+    def test_projection_per_agent_and_table(self):
+        projection = get_tool_projection("crew_compliance", CREW_MEMBERS_TABLE)
+
+        assert "crew_id" in projection
+        assert "date_of_birth" not in projection
+        assert get_tool_projection("crew_compliance", BOOKINGS_TABLE) is None
+        assert get_tool_projection("regulatory", WEATHER_TABLE) is None
+
+    def test_full_mode_disables_projection_and_keeps_duplicates(self):
+        with patch("database.tool_output.TOOL_OUTPUT_MODE", "full"):
+            assert get_tool_projection("crew_compliance", CREW_MEMBERS_TABLE) is None
+            assert with_full_output({"roster": []}, crew_members=[]) == {"roster": [], "crew_members": []}
+
+        assert with_full_output({"roster": []}, crew_members=[]) == {"roster": []}
+
+    def test_agent_tool_output_is_compact(self):
+        from agents.cargo.agent import query_cargo_manifest
+
+        table = MagicMock()
+        table.query.return_value = {"Items": [{"shipment_id": "S1", "total_pieces": Decimal("12")}]}
+        resource = MagicMock()
+        resource.Table.return_value = table
+        with patch("agents.cargo.agent.get_dynamodb_resource", return_value=resource):
+            result = query_cargo_manifest.invoke({"flight_id": "FLT-1"})
+
+        assert result == '[{"shipment_id":"S1","total_pieces":12}]'
+        assert json.loads(result)[0]["total_pieces"] == 12